@@ -1,5 +1,7 @@
 from typing import Any, Dict, List
 
+from season_stats_store import as_stats_store
+
 
 def _to_int(value: Any, default: int = 0) -> int:
     try:
@@ -46,7 +48,40 @@ def _norm_wins(wins: float, cap: float, gamma: float = 2.0) -> float:
 
 ALL_STAR_LOGIC_VERSION = "all_star_gp_thresholds_v4_hotfix_20260810"
 
+def _normalize_store_rows(store) -> List[Dict[str, Any]]:
+    # Columnar season stats: totals are already numeric and aliased.
+    cols = store.columns
+    rows: List[Dict[str, Any]] = []
+    for i, (player_name, team_name) in enumerate(zip(store.players, store.teams)):
+        if not player_name or not team_name:
+            continue
+        rows.append({
+            "player": player_name,
+            "team": team_name,
+            "gp": int(cols["gp"][i]),
+            "pts_total": cols["pts"][i],
+            "reb_total": cols["reb"][i],
+            "ast_total": cols["ast"][i],
+            "stl_total": cols["stl"][i],
+            "blk_total": cols["blk"][i],
+            "started": int(cols["started"][i]),
+            "sixth": int(cols["sixth"][i]),
+            "fgm": cols["fgm"][i],
+            "fga": cols["fga"][i],
+            "tpm": cols["tpm"][i],
+            "tpa": cols["tpa"][i],
+            "ftm": cols["ftm"][i],
+            "fta": cols["fta"][i],
+            "def_rating": 0.0,
+        })
+    return rows
+
+
 def _normalize_player_stats(player_stats: Any) -> List[Dict[str, Any]]:
+    store = as_stats_store(player_stats)
+    if store is not None:
+        return _normalize_store_rows(store)
+
     rows: List[Dict[str, Any]] = []
 
     if isinstance(player_stats, dict):
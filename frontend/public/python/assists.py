@@ -1,9 +1,10 @@
-import json
 import math
 import random
 import bisect
 from typing import List
 
+from rating_distributions import RatingTable, rating_distribution
+
 # ------------------------------------------------------------
 # assists.py — percentile-based mapping using global Passing distribution
 # ------------------------------------------------------------
@@ -43,59 +44,24 @@ def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
 
-def _load_passing_distribution(path: str = "30.json") -> List[float]:
-    """
-    Build global list of Passing ratings from 30.json.
-
-    Mirrors the GUI helper:
-        attrs = p.get("attrs"); idx 5 = Passing.
-    Falls back to p["Passing"] if present.
-    If anything fails, returns a simple [25..99] range so the
-    module still works instead of crashing.
-    """
-    vals: List[float] = []
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        conferences = data.get("conferences", {})
-        for conf_teams in conferences.values():
-            for team in conf_teams:
-                for p in team.get("players", []):
-                    attrs = p.get("attrs")
-                    if isinstance(attrs, list) and len(attrs) > 5:
-                        v = attrs[5]
-                        if isinstance(v, (int, float)):
-                            vals.append(float(v))
-                            continue
-                    # fallback: flat Passing field
-                    if isinstance(p.get("Passing"), (int, float)):
-                        vals.append(float(p["Passing"]))
-    except Exception:
-        # Fallback: assume roughly uniform 25–99 distribution
-        vals = [float(x) for x in range(25, 100)]
-
-    if not vals:
-        vals = [50.0]
-
-    vals.sort()
-    return vals
+# Passing distribution and table versioning: rating_distributions.py.
+PASSING_ATTR_INDEX = 5
 
 
-# Global empirical distribution (on import)
-ALL_PASSING: List[float] = _load_passing_distribution()
+def _passing_distribution() -> List[float]:
+    return rating_distribution(PASSING_ATTR_INDEX, "Passing")
 
 
 def passing_to_percentile(passing: float) -> float:
     """
     Empirical CDF: map a Passing rating to a 0–100 percentile
-    based on ALL_PASSING, **with interpolation between neighbors**.
+    based on the shared rating distribution, **with interpolation between neighbors**.
 
     If a rating falls between two players' Passing values, its
     percentile is interpolated between their percentiles instead of
     snapping to one step.
     """
-    arr = ALL_PASSING
+    arr = _passing_distribution()
     if not arr:
         return 50.0
 
@@ -173,6 +139,14 @@ def passing_to_game_assists(passing_rating: float, minutes: float) -> float:
     return ast36 * (minutes / 36.0)
 
 
+def _ast36_exact(passing: float) -> float:
+    return percentile_to_ast36(passing_to_percentile(passing))
+
+
+# Dense rating -> AST36 table, rebuilt when the distribution changes.
+_AST36_TABLE = RatingTable(_ast36_exact)
+
+
 # ------------------------------------------------------------
 # Public API used by game_sim.py
 # ------------------------------------------------------------
@@ -189,11 +163,10 @@ def assists_per36(pos, passing, off_iq, overall) -> float:
         # If something weird comes in, just treat as league-average passer.
         passing_val = 50.0
 
-    pct = passing_to_percentile(passing_val)
-    return percentile_to_ast36(pct)
+    return _AST36_TABLE.lookup(passing_val)
 
 
-def noisy_assists(expected: float) -> int:
+def noisy_assists(expected: float, rng=None) -> int:
     """
     Add game-to-game variance around an expected assist count for a single game.
 
@@ -212,7 +185,7 @@ def noisy_assists(expected: float) -> int:
     base_stdev = max(0.4, math.sqrt(expected) * 0.8)
     stdev = base_stdev * STATLINE_VARIANCE_BOOST
 
-    val = random.gauss(expected, stdev)
+    val = (rng or random).gauss(expected, stdev)
     if val < 0:
         return 0
     return int(round(val))
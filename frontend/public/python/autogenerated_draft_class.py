@@ -13,6 +13,8 @@ import math
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
+from overall_evaluator import OverallEvaluator
+
 AUTOGENERATED_DRAFT_CLASS_VERSION = "2026-08-21_autogenerated_draft_class_deflated_realistic_v12"
 
 FIRST_NAMES = [
@@ -716,13 +718,15 @@ def _calibrate_attrs_to_source_overall(
     # The source formula cannot represent OVR below 60, so generated prospects
     # should not pretend to be 55-59 and then jump when progression recalculates.
     target = int(_clamp(target_overall, 54, 99))
-    current_attrs = _normalize_attrs_for_overall(attrs)
+    params = OVERALL_POS_PARAMS.get(str(pos or "SF").upper(), OVERALL_POS_PARAMS["SF"])
+    evaluator = OverallEvaluator(_normalize_attrs_for_overall(attrs), params, half_up = False)
+    current_attrs = evaluator.attrs
+    current = evaluator.overall()
 
     best_attrs = list(current_attrs)
-    best_dist = abs(_calc_overall_from_attrs(best_attrs, pos) - target)
+    best_dist = abs(current - target)
 
     for _ in range(900):
-        current = _calc_overall_from_attrs(current_attrs, pos)
         current_dist = abs(current - target)
 
         if current_dist < best_dist:
@@ -742,25 +746,25 @@ def _calibrate_attrs_to_source_overall(
         if not candidates:
             break
 
-        chosen_attrs: Optional[List[int]] = None
+        chosen_idx = -1
+        chosen_overall = current
         chosen_dist = 999
         chosen_overshoots = True
 
         for idx in candidates:
-            trial = list(current_attrs)
-            trial[idx] = int(_clamp(trial[idx] + direction, 25, 99))
-            trial_overall = _calc_overall_from_attrs(trial, pos)
+            trial_overall = evaluator.overall_after(idx, direction)
             trial_dist = abs(trial_overall - target)
             overshoots = (direction > 0 and trial_overall > target) or (direction < 0 and trial_overall < target)
 
             if trial_dist < chosen_dist or (
                 trial_dist == chosen_dist and chosen_overshoots and not overshoots
             ):
-                chosen_attrs = trial
+                chosen_idx = idx
+                chosen_overall = trial_overall
                 chosen_dist = trial_dist
                 chosen_overshoots = overshoots
 
-        if chosen_attrs is None:
+        if chosen_idx < 0:
             break
 
         # Allow flat steps because the sigmoid formula often needs several
@@ -768,7 +772,8 @@ def _calibrate_attrs_to_source_overall(
         if chosen_dist > current_dist and current_dist <= best_dist and current_dist <= 1:
             break
 
-        current_attrs = chosen_attrs
+        evaluator.apply(chosen_idx, direction)
+        current = chosen_overall
 
     return best_attrs
 
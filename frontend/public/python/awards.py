@@ -2,16 +2,32 @@
 
 from typing import Any, Dict, List, Optional
 
+from season_stats_store import as_stats_store
+
 AWARDS_PY_VERSION = "2026-08-10_all_rookie_gp_fill_v5"
 
 # ---------------------------------------------------------------------------
 # UTILITIES
 # ---------------------------------------------------------------------------
 
-def _to_py_players(players_js) -> List[Dict[str, Any]]:
+def _to_py_players(players_js, player_meta=None) -> List[Dict[str, Any]]:
     if players_js is None:
         return []
 
+    # Columnar season stats: one row dict per key, plus per-key roster meta
+    # (def_rating, rookie fields) that the totals themselves do not carry.
+    store = as_stats_store(players_js)
+    if store is not None:
+        meta = player_meta if isinstance(player_meta, dict) else {}
+        rows = []
+        for key in store:
+            row = store[key]
+            extra = meta.get(key)
+            if isinstance(extra, dict):
+                row.update(extra)
+            rows.append(row)
+        return rows
+
     out = []
     try:
         iterable = list(players_js)
@@ -524,10 +540,11 @@ def compute_finals_mvp(finals_players_js, champion_team=None, season_js=None):
 # MAIN ENTRY
 # ---------------------------------------------------------------------------
 
-def compute_awards(players_js, teams_js, season_js=None):
-    # --- DEBUG: what did we receive? ---
+def compute_awards(players_js, teams_js, season_js=None, player_meta_js=None):
+    # players_js: totals rows, or a SeasonStatsStore / its columnar payload
+    # with player_meta_js = {"Player__Team": {extra row fields}}.
 
-    players = _to_py_players(players_js)
+    players = _to_py_players(players_js, player_meta_js)
 
     # ✅ GUARDRAIL:
     # If teams_js is actually the season year (int), Calendar is calling compute_awards wrong.
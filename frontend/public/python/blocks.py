@@ -2,12 +2,13 @@
 # Block model using percentile-based per-36 curves and Gaussian noise
 # Aligned with the Tk "Blocks View" logic.
 
-import json
 import math
 import random
 import bisect
 from typing import List
 
+from rating_distributions import RatingTable, rating_distribution
+
 STATLINE_VARIANCE_BOOST = 1.35  # same swinginess as UI
 
 
@@ -19,48 +20,12 @@ def clamp(x: float, lo: float, hi: float) -> float:
 #     BLOCK RATING → PERCENTILE → BLK36 → GAME BLOCKS
 # ============================================================
 
-def _load_block_distribution(path: str = "30.json") -> List[float]:
-    """
-    Build global list of Block ratings from 30.json.
-
-    Matches the Tk UI helper:
-      attrs = p.get("attrs"); index 10 = Block.
-    Falls back to p["Block"] if present.
-
-    If loading fails, returns a synthetic 25–99 range so the
-    sim can still run.
-    """
-    vals: List[float] = []
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        conferences = data.get("conferences", {})
-        for conf_teams in conferences.values():
-            for team in conf_teams:
-                for p in team.get("players", []):
-                    attrs = p.get("attrs")
-                    if isinstance(attrs, list) and len(attrs) > 10:
-                        v = attrs[10]
-                        if isinstance(v, (int, float)):
-                            vals.append(float(v))
-                            continue
-                    # fallback: flat Block field if present
-                    if isinstance(p.get("Block"), (int, float)):
-                        vals.append(float(p["Block"]))
-    except Exception:
-        vals = [float(x) for x in range(25, 100)]
-
-    if not vals:
-        vals = [50.0]
+# Block distribution: rating_distributions.py.
+BLOCK_ATTR_INDEX = 10
 
-    vals.sort()
-    return vals
 
-
-# Global empirical distribution
-ALL_BLOCKS: List[float] = _load_block_distribution()
+def _block_distribution() -> List[float]:
+    return rating_distribution(BLOCK_ATTR_INDEX, "Block")
 
 
 def block_rating_from_player(p) -> float:
@@ -75,15 +40,15 @@ def block_rating_from_player(p) -> float:
     if isinstance(p.get("Block"), (int, float)):
         return float(p["Block"])
     # default to global average
-    return sum(ALL_BLOCKS) / len(ALL_BLOCKS)
+    return sum(_block_distribution()) / len(_block_distribution())
 
 
 def block_to_percentile(block_rating: float) -> float:
     """
     Empirical CDF: map a Block rating to a 0–100 percentile
-    based on ALL_BLOCKS, with interpolation between neighbors.
+    based on the shared rating distribution, with interpolation between neighbors.
     """
-    arr = ALL_BLOCKS
+    arr = _block_distribution()
     if not arr:
         return 50.0
 
@@ -169,13 +134,21 @@ def percentile_to_blk36(pct: float) -> float:
     return curve[-1][1]
 
 
+def _block_per36_from_rating_exact(block_rating: float) -> float:
+    pct = block_to_percentile(block_rating)
+    return percentile_to_blk36(pct)
+
+
+# Dense rating -> BLK36 table, rebuilt when the distribution changes.
+_BLK36_TABLE = RatingTable(_block_per36_from_rating_exact)
+
+
 def block_per36_from_rating(block_rating: float) -> float:
     """
     Convert a block rating to expected BLK per 36 using the
     percentile -> BLK36 curve.
     """
-    pct = block_to_percentile(block_rating)
-    return percentile_to_blk36(pct)
+    return _BLK36_TABLE.lookup(float(block_rating))
 
 
 def block_to_game_blocks(block_rating: float, minutes: float) -> float:
@@ -205,7 +178,7 @@ def blocks_per36(pos, block_rating, height, overall) -> float:
     return block_per36_from_rating(val)
 
 
-def noisy_blocks(expected: float) -> int:
+def noisy_blocks(expected: float, rng=None) -> int:
     """
     Add game-to-game variance around an expected block count
     for a single game.
@@ -224,7 +197,7 @@ def noisy_blocks(expected: float) -> int:
     base_stdev = max(0.20, math.sqrt(expected) * 0.7)
     stdev = base_stdev * STATLINE_VARIANCE_BOOST
 
-    val = random.gauss(expected, stdev)
+    val = (rng or random).gauss(expected, stdev)
     if val < 0:
         return 0
     return int(round(val))
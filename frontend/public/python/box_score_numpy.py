@@ -0,0 +1,342 @@
+# box_score_numpy.py
+#
+# Array-backed box-score backend for game_sim.build_box.
+#
+# The pure-Python build_box stays the reference implementation. This module
+# computes the same line for every active player at once: points split,
+# shot distribution, attempts, makes, FT, TOV/PF and the AST/REB/STL/BLK
+# draws. The per-stat curves are the exact ones from shooting_model,
+# bm_scoring, assists, rebounds, steals and blocks, sampled on the integer
+# rating grid, so only the random draws differ from the scalar path.
+# frontend/scripts/box-score-numpy-equivalence.py checks the two engines
+# against each other with fixed seeds.
+
+import random
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - NumPy is optional (Pyodide loads it on demand)
+    np = None
+
+from bm_scoring import SCORING_PCT_TABLE, PTS36_CURVE
+from assists import assists_per36, STATLINE_VARIANCE_BOOST as AST_VARIANCE_BOOST
+from rebounds import rebound_per36, STATLINE_VARIANCE_BOOST as REB_VARIANCE_BOOST
+from steals import steals_per36, STATLINE_VARIANCE_BOOST as STL_VARIANCE_BOOST
+from blocks import blocks_per36, STATLINE_VARIANCE_BOOST as BLK_VARIANCE_BOOST
+from rating_distributions import distributions_version
+import shooting_model
+
+NUMPY_AVAILABLE = np is not None
+
+RATING_GRID_MAX = 120
+
+_rng = None
+_tables = None
+
+
+def seed_box_score_rng(seed=None):
+    """Reseed the backend's Generator (benchmarks / equivalence checks)."""
+    global _rng
+    if np is None:
+        return
+    _rng = np.random.default_rng(seed)
+
+
+def _get_rng():
+    global _rng
+    if _rng is None:
+        _rng = np.random.default_rng()
+    return _rng
+
+
+def _build_tables():
+    """Sample every scalar rating curve once on the integer grid."""
+    grid = np.arange(0, RATING_GRID_MAX + 1, dtype=float)
+    ratings = range(0, RATING_GRID_MAX + 1)
+    return {
+        "grid": grid,
+        "p3": np.array([shooting_model.p3_curve(r) for r in ratings]),
+        "pMid": np.array([shooting_model.pMid_curve(r) for r in ratings]),
+        "pClose": np.array([shooting_model.pClose_curve(r) for r in ratings]),
+        "pFT": np.array([shooting_model.pFT_curve(r) for r in ratings]),
+        "ast36": np.array([assists_per36(None, r, None, None) for r in ratings]),
+        "reb36": np.array([rebound_per36(r) for r in ratings]),
+        "stl36": np.array([steals_per36(None, r, None, None) for r in ratings]),
+        "blk36": np.array([blocks_per36(None, r, None, None) for r in ratings]),
+        "distributionVersion": distributions_version(),
+        "scoreX": np.array([v for _, v in SCORING_PCT_TABLE], dtype=float),
+        "scoreP": np.array([p for p, _ in SCORING_PCT_TABLE], dtype=float),
+        "pts36X": np.array([p for p, _ in reversed(PTS36_CURVE)], dtype=float),
+        "pts36Y": np.array([v for _, v in reversed(PTS36_CURVE)], dtype=float),
+    }
+
+
+def _get_tables():
+    global _tables
+    if _tables is None or _tables["distributionVersion"] != distributions_version():
+        _tables = _build_tables()
+    return _tables
+
+
+def reset_box_score_tables():
+    """Drop cached curve tables (after editing a curve or distribution)."""
+    global _tables
+    _tables = None
+
+
+def _curve(name, ratings):
+    tables = _get_tables()
+    return np.interp(ratings, tables["grid"], tables[name])
+
+
+def _expected_points(scoring, minutes):
+    tables = _get_tables()
+    pct = np.interp(scoring, tables["scoreX"], tables["scoreP"])
+    return np.interp(pct, tables["pts36X"], tables["pts36Y"]) * (minutes / 36.0)
+
+
+def _split_team_points(expected, team_points, rng):
+    raw = np.maximum(0.0, rng.normal(expected, np.maximum(1.2, np.sqrt(expected) * 0.9)))
+    pts = np.rint(raw).astype(np.int64)
+    diff = int(team_points) - int(pts.sum())
+    if diff > 0:
+        pts += rng.multinomial(diff, np.full(len(pts), 1.0 / len(pts)))
+    else:
+        # Trim one point at a time from a uniformly chosen scorer, like the
+        # reference loop, but in whole-roster multinomial rounds.
+        take = min(-diff, int(pts.sum()))
+        while take > 0:
+            scorers = pts > 0
+            cut = np.minimum(pts, rng.multinomial(take, scorers / scorers.sum()))
+            pts -= cut
+            take -= int(cut.sum())
+    return pts
+
+
+def _noisy_counts(expected, floor, k, boost, rng):
+    expected = np.maximum(expected, 0.0)
+    stdev = np.maximum(floor, np.sqrt(expected) * k) * boost
+    vals = np.rint(rng.normal(expected, stdev))
+    vals[vals < 0] = 0
+    vals[expected <= 0.0] = 0
+    return vals.astype(np.int64)
+
+
+def _shooting_lines(attrs, off, minutes, target, rng):
+    r3 = attrs[:, 0]
+    rMid = attrs[:, 1]
+    rClose = attrs[:, 2]
+    rFT = attrs[:, 3]
+
+    p3r = _curve("p3", r3)
+    pMr = _curve("pMid", rMid)
+    pCr = _curve("pClose", rClose)
+    pFTr = _curve("pFT", rFT)
+
+    # shot_dist, vectorized
+    w3 = np.maximum(0, r3 - 40) * 1.7
+    wMid = np.maximum(0, rMid - 40) * 0.8
+    wClose = (np.maximum(1, rClose - 50) + 18) * 0.95
+    S = w3 + wMid + wClose
+    f3 = w3 / S
+    fMid = wMid / S
+    rim_only = (rClose >= 97) & (r3 <= 75)
+    f3 = np.where(rim_only, np.minimum(f3, 0.15), f3)
+    f3 = np.where(r3 <= 40, 0.0, f3)
+    fMid = np.where(rMid <= 40, 0.0, fMid)
+    no_jumpers = (r3 <= 40) & (rMid <= 40)
+    f3 = np.where(no_jumpers, 0.0, f3)
+    fMid = np.where(no_jumpers, 0.0, fMid)
+
+    E = np.clip(rng.normal(1.0, 0.08, len(target)), 0.80, 1.20)
+    two_norm = (0.60 * rClose + 0.40 * rMid - 75.0) / 18.0
+    off_norm = (off - shooting_model.LEAGUE_OFF_AVG) / 20.0
+    exp_pp_fga = np.clip(1.28 + 0.12 * two_norm + 0.02 * off_norm, 1.00, 1.65)
+
+    rawFGA = target / (exp_pp_fga * E) * rng.normal(1.0, 0.02, len(target))
+    FGA = np.maximum(1, np.floor(rawFGA)).astype(np.int64)
+
+    tr = np.clip(0.12 + 0.25 * ((rClose - 50) / 50), 0.05, 0.45)
+
+    def free_throws(fga):
+        fta = np.maximum(0, np.rint(fga * tr)).astype(np.int64)
+        return fta + ((fta % 2 == 1) & (target > 1))
+
+    FTA = free_throws(FGA)
+    while True:
+        threeA = np.rint(FGA * f3).astype(np.int64)
+        midA = np.rint(FGA * fMid).astype(np.int64)
+        closeA = FGA - threeA - midA
+        short = (3 * threeA + 2 * (midA + closeA) + FTA < target) & (FGA <= 80)
+        if not short.any():
+            break
+        FGA = FGA + short
+        FTA = np.where(short, free_throws(FGA), FTA)
+
+    threeM = rng.binomial(threeA, p3r)
+    midM = rng.binomial(midA, pMr)
+    closeM = rng.binomial(closeA, pCr)
+    FTM = rng.binomial(FTA, pFTr)
+
+    # Reconcile makes to the assigned points: twos first, then threes,
+    # free throws absorb whatever parity is left (same order as reconcile()).
+    total2 = np.where(rMid + rClose > 0, rMid + rClose, 1)
+    pmid_w = rMid / total2
+
+    def split_twos(count, mid_room, close_room):
+        mid = np.minimum(mid_room, rng.binomial(count, pmid_w))
+        close = np.minimum(close_room, count - mid)
+        mid = np.minimum(mid_room, count - close)
+        return mid, close
+
+    diff = target - (2 * (midM + closeM) + 3 * threeM + FTM)
+
+    up = np.maximum(diff, 0)
+    add2 = np.minimum(up // 2, (midA - midM) + (closeA - closeM))
+    mid_add, close_add = split_twos(add2, midA - midM, closeA - closeM)
+    midM = midM + mid_add
+    closeM = closeM + close_add
+    up = up - 2 * (mid_add + close_add)
+    add3 = np.minimum(up // 3, threeA - threeM)
+    threeM = threeM + add3
+    up = up - 3 * add3
+    FTA = FTA + up
+    FTM = FTM + up
+
+    down = np.maximum(-diff, 0)
+    rem2 = np.minimum(down // 2, midM + closeM)
+    mid_rem, close_rem = split_twos(rem2, midM, closeM)
+    midM = midM - mid_rem
+    closeM = closeM - close_rem
+    down = down - 2 * (mid_rem + close_rem)
+    rem3 = np.minimum(down // 3, threeM)
+    threeM = threeM - rem3
+    down = down - 3 * rem3
+    ft_rem = np.minimum(down, FTM)
+    FTM = FTM - ft_rem
+    FTA = np.maximum(0, FTA - ft_rem)
+    down = down - ft_rem
+
+    # Odd leftovers with no free throw to remove: drop one more field goal
+    # and hand the overshoot back at the line.
+    drop_mid = (down > 0) & (midM > 0)
+    drop_close = (down > 0) & ~drop_mid & (closeM > 0)
+    drop_three = (down > 0) & ~drop_mid & ~drop_close & (threeM > 0)
+    midM = midM - drop_mid
+    closeM = closeM - drop_close
+    threeM = threeM - drop_three
+    refund = np.maximum(0, 2 * (drop_mid | drop_close) + 3 * drop_three - down)
+    refund = np.where(down > 0, refund, 0)
+    FTA = FTA + refund
+    FTM = FTM + refund
+
+    FGM = threeM + midM + closeM
+    return FGM, FGA, threeM, threeA, FTM, FTA
+
+
+def _attrs15(player):
+    attrs = list((player.get("attrs") or [70] * 15)[:15])
+    return attrs + [70] * (15 - len(attrs))
+
+
+def _generator_for(game_rng):
+    # A game's random.Random stream seeds a Generator for this box only, so
+    # per-game streams stay per-game on the array backend too.
+    if isinstance(game_rng, random.Random):
+        return np.random.default_rng(game_rng.getrandbits(64))
+    return _get_rng()
+
+
+def build_box_numpy(team, mins, team_points, ratings=None, game_rng=None):
+    """Vectorized equivalent of game_sim.build_box (same row schema/order)."""
+    if np is None:
+        raise RuntimeError("NumPy is not available for the array box-score backend")
+
+    rng = _generator_for(game_rng)
+    players = team["players"]
+
+    active = []
+    inactive = []
+    for order, p in enumerate(players):
+        m = mins.get(p["name"], 0)
+        if m > 0:
+            active.append((order, p, m))
+        else:
+            inactive.append((order, p))
+
+    rows = []
+    if active:
+        attrs = np.array([_attrs15(p) for _, p, _ in active], dtype=float)
+        minutes = np.array([m for _, _, m in active], dtype=float)
+        scoring = np.array([p.get("scoringRating", 0) for _, p, _ in active], dtype=float)
+        off = np.array([p.get("offRating", 75) for _, p, _ in active], dtype=float)
+        player_attrs = [p.get("attrs") or [] for _, p, _ in active]
+        off_iq = np.array(
+            [a[13] if len(a) > 13 else p.get("offensiveIQ", p.get("offIq", 75))
+             for a, (_, p, _) in zip(player_attrs, active)],
+            dtype=float,
+        )
+        def_iq = np.array(
+            [a[14] if len(a) > 14 else p.get("defensiveIQ", p.get("defIq", 75))
+             for a, (_, p, _) in zip(player_attrs, active)],
+            dtype=float,
+        )
+
+        pts = _split_team_points(_expected_points(scoring, minutes), team_points, rng)
+        FGM, FGA, threeM, threeA, FTM, FTA = _shooting_lines(attrs, off, minutes, pts, rng)
+
+        per36_scale = minutes / 36.0
+        tov_mean = (0.1 + (95.0 - np.clip(off_iq, 60.0, 95.0)) / 35.0 * 4.4) * per36_scale
+        pf_mean = (0.1 + (95.0 - np.clip(def_iq, 60.0, 95.0)) / 35.0 * 5.9) * per36_scale
+        turnovers = np.minimum(rng.poisson(tov_mean), 29)
+        fouls = np.minimum(rng.poisson(pf_mean), 6)
+
+        reb = _noisy_counts(_curve("reb36", attrs[:, 12]) * per36_scale, 0.5, 0.7, REB_VARIANCE_BOOST, rng)
+        ast = _noisy_counts(_curve("ast36", attrs[:, 5]) * per36_scale, 0.4, 0.8, AST_VARIANCE_BOOST, rng)
+        stl = _noisy_counts(_curve("stl36", attrs[:, 11]) * per36_scale, 0.25, 0.7, STL_VARIANCE_BOOST, rng)
+        blk = _noisy_counts(_curve("blk36", attrs[:, 10]) * per36_scale, 0.20, 0.7, BLK_VARIANCE_BOOST, rng)
+
+        for i, (order, p, m) in enumerate(active):
+            rows.append({
+                "player": p["name"],
+                "min": m,
+                "pts": int(pts[i]),
+                "fg": f"{int(FGM[i])}/{int(FGA[i])}",
+                "3p": f"{int(threeM[i])}/{int(threeA[i])}",
+                "ft": f"{int(FTM[i])}/{int(FTA[i])}",
+                "reb": int(reb[i]),
+                "ast": int(ast[i]),
+                "stl": int(stl[i]),
+                "blk": int(blk[i]),
+                "to": int(turnovers[i]),
+                "pf": int(fouls[i]),
+                "_box_order": order,
+            })
+
+    for order, p in inactive:
+        rows.append({
+            "player": p["name"],
+            "min": 0,
+            "pts": 0,
+            "fg": "0/0",
+            "3p": "0/0",
+            "ft": "0/0",
+            "reb": 0,
+            "ast": 0,
+            "stl": 0,
+            "blk": 0,
+            "to": 0,
+            "pf": 0,
+            "_box_order": order,
+        })
+
+    rows.sort(key=lambda r: (
+        int(r.get("min", 0) or 0) <= 0,
+        -int(r.get("min", 0) or 0),
+        int(r.get("_box_order", 9999) or 9999),
+    ))
+
+    for r in rows:
+        r.pop("_box_order", None)
+
+    return rows
@@ -12,19 +12,23 @@ one source of truth.
 """
 from __future__ import annotations
 
-import copy
 import json
 import math
+from contextlib import nullcontext
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from contract_extension_acceptance import evaluate_extension_offer
 from cpu_contract_extensions import build_cpu_extension_offer
+from league_clone import clone_league_sharing_cold, own_child
 
 try:
-    from league_financials import get_financial_rules
+    from league_financials import financial_rules_scope, get_financial_rules
 except Exception:  # pragma: no cover
     get_financial_rules = None
 
+    def financial_rules_scope(league_data=None):
+        return nullcontext()
+
 try:
     from free_agency_logic import estimate_market_value, classify_team_direction
 except Exception:  # pragma: no cover
@@ -805,11 +809,12 @@ def _append_mood_event(
 
 
 def _append_player_transaction(player: Dict[str, Any], row: Dict[str, Any]) -> None:
-    history = player.setdefault("history", {})
-    transactions = history.setdefault("transactions", [])
+    # history is shared with the caller's league until written; replace it.
+    history = own_child(player, "history")
     tx_id = str(row.get("id") or "")
-    transactions[:] = [item for item in transactions if str(item.get("id") or "") != tx_id]
+    transactions = [item for item in history.get("transactions") or [] if str(item.get("id") or "") != tx_id]
     transactions.append(row)
+    history["transactions"] = transactions
 
 
 def _apply_accepted_extension(
@@ -1016,7 +1021,7 @@ def submit_contract_extension_offer(
     offer: Dict[str, Any],
     payload: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     team = _find_team(updated, user_team_name)
     if not team:
         return {"ok": False, "reason": "Selected team could not be found."}
@@ -1104,7 +1109,7 @@ def process_cpu_contract_extensions(
     phase: str = "opening",
     payload: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     state = _extension_state(updated, payload)
     phase_key = f"{state['seasonYear']}:{phase}"
     if phase_key in state["cpuPhasesProcessed"]:
@@ -1225,7 +1230,7 @@ def close_contract_extension_window(
     raw_phase = str(payload.get("phase") or "deadline")
     phase = _normalize_extension_close_phase(league_data, payload, raw_phase)
     cpu_result = process_cpu_contract_extensions(league_data, user_team_name, phase=phase, payload=payload)
-    updated = cpu_result.get("leagueData") if isinstance(cpu_result.get("leagueData"), dict) else copy.deepcopy(league_data)
+    updated = cpu_result.get("leagueData") if isinstance(cpu_result.get("leagueData"), dict) else clone_league_sharing_cold(league_data)
     state = _extension_state(updated, payload)
     closed_types = set(state.get("closedTypes") or [])
     if phase in {"rookie_deadline", "rookie", "opening"}:
@@ -1258,6 +1263,14 @@ def close_contract_extension_window(
 
 def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
     request = request or {}
+    league_data = request.get("leagueData") if isinstance(request.get("leagueData"), dict) else None
+    # Memoized financial rules for the request; binding the league's economy
+    # also prices the free-agency market helpers used for extension asks.
+    with financial_rules_scope(league_data):
+        return _dispatch_request(request)
+
+
+def _dispatch_request(request: Dict[str, Any]) -> Dict[str, Any]:
     action = str(request.get("action") or "")
     league_data = request.get("leagueData") if isinstance(request.get("leagueData"), dict) else {}
     payload = request.get("payload") if isinstance(request.get("payload"), dict) else {}
@@ -28,6 +28,12 @@ except Exception:  # pragma: no cover - patch fallback
 import math
 from typing import Any, Dict, Optional
 
+try:
+    from league_financials import bound_financial_rules
+except Exception:  # pragma: no cover
+    def bound_financial_rules():
+        return None
+
 from contract_extension_acceptance import evaluate_extension_offer
 
 
@@ -39,6 +45,12 @@ def _num(value: Any, fallback: float = 0.0) -> float:
         return float(fallback)
 
 
+def _request_salary_cap() -> float:
+    """Cap of the league contract_extension_logic bound for this request."""
+    rules = bound_financial_rules() or {}
+    return _num(rules.get("salaryCap"), 154_647_000.0)
+
+
 def _round_money(value: float) -> int:
     return int(round(float(value or 0) / 1000.0) * 1000)
 
@@ -263,7 +275,7 @@ def _v10_cpu_extension_evaluation(
     salary_cap = _num(eligibility.get("salaryCapAtExtensionStart"), 0)
     first_apron = _num(eligibility.get("firstApronAtExtensionStart"), salary_cap * 1.27)
     if salary_cap <= 0:
-        salary_cap = max(1.0, first_apron / 1.27) if first_apron > 0 else 154_647_000.0
+        salary_cap = max(1.0, first_apron / 1.27) if first_apron > 0 else _request_salary_cap()
     if first_apron <= 0:
         first_apron = salary_cap * 1.27
     payroll = _team_payroll_for_year(team, extension_start) if extension_start else 0
@@ -16,19 +16,25 @@ import copy
 import math
 import random
 import re
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional, Tuple
 
+from league_clone import clone_league_sharing_cold
+
 try:
     from autogenerated_draft_class import generate_draft_class
 except Exception:
     generate_draft_class = None
 
 try:
-    from league_financials import ensure_league_financials, get_rookie_salary_for_pick
+    from league_financials import ensure_league_financials, financial_rules_scope, get_rookie_salary_for_pick
 except Exception:
     ensure_league_financials = None
     get_rookie_salary_for_pick = None
 
+    def financial_rules_scope(league_data=None):
+        return nullcontext()
+
 DRAFT_LOGIC_VERSION = "2026-08-21_draft_logic_deflated_realistic_v22"
 EXPECTED_AUTOGEN_DRAFT_RATING_MODEL = "deflated_realistic_100_player_v4"
 
@@ -59,6 +65,14 @@ def _plain(value: Any) -> Any:
     return value
 
 
+def _clone_league_request(league_data: Any) -> Dict[str, Any]:
+    # Plain dicts are cloned sharing their cold subtrees; proxies go through _plain, which
+    # already builds a fresh copy.
+    if isinstance(league_data, dict):
+        return clone_league_sharing_cold(league_data)
+    return _plain(league_data) or {}
+
+
 def _safe_int(value: Any, default: int = 0) -> int:
     try:
         if value is None:
@@ -1360,7 +1374,7 @@ def _normalize_draft_order(draft_order: List[Dict[str, Any]]) -> List[Dict[str,
 
 
 def initialize_draft(league_data: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-    league = copy.deepcopy(_plain(league_data) or {})
+    league = _clone_league_request(league_data)
     payload = _plain(payload) or {}
     season_year = _get_season_year(league, payload)
 
@@ -1511,7 +1525,7 @@ def make_pick(
     _copy_inputs: bool = True,
 ) -> Dict[str, Any]:
     if _copy_inputs:
-        league = copy.deepcopy(_plain(league_data) or {})
+        league = _clone_league_request(league_data)
         payload = _plain(payload) or {}
         state = copy.deepcopy(payload.get("draftState") or (league.get("draftState") or {}).get("draft") or {})
     else:
@@ -1650,7 +1664,7 @@ def make_pick(
 
 
 def sim_until_user_pick(league_data: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-    league = copy.deepcopy(_plain(league_data) or {})
+    league = _clone_league_request(league_data)
     payload = _plain(payload) or {}
     user_team_name = payload.get("userTeamName")
     season_year = _get_season_year(league, payload)
@@ -1726,7 +1740,7 @@ def sim_until_user_pick(league_data: Dict[str, Any], payload: Dict[str, Any]) ->
 
 
 def sim_rest_of_draft(league_data: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-    league = copy.deepcopy(_plain(league_data) or {})
+    league = _clone_league_request(league_data)
     payload = _plain(payload) or {}
     user_team_name = payload.get("userTeamName")
 
@@ -1770,7 +1784,12 @@ def sim_rest_of_draft(league_data: Dict[str, Any], payload: Dict[str, Any]) -> D
 
 
 def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
-    req = _plain(request) or {}
+    # Financial rules (rookie scale for every pick) are memoized for the request.
+    with financial_rules_scope():
+        return _dispatch_request(_plain(request) or {})
+
+
+def _dispatch_request(req: Dict[str, Any]) -> Dict[str, Any]:
     action = req.get("action") or "initialize_draft"
     league_data = req.get("leagueData") or req.get("league") or {}
     payload = req.get("payload") or {}
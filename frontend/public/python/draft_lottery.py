@@ -18,7 +18,7 @@ import random
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
-DRAFT_LOTTERY_VERSION = "2026-06-18_lottery_clean_display_rank_v6"
+DRAFT_LOTTERY_VERSION = "2026-10-17_lottery_exact_odds_v7"
 
 # Legacy 14-team NBA lottery odds by combinations.
 # Top 4 picks are drawn, picks 5-14 fall by inverse record.
@@ -43,6 +43,16 @@ LOTTERY_COMBINATIONS = [
 # snappy while the page generates hidden lottery data before reveal.
 ODDS_SIMULATION_COUNT = 8000
 
+# Odds matrices are exact by default. Monte Carlo stays available as a
+# validation mode (payload.oddsMode = "monte_carlo" or "validate").
+ODDS_MODE_EXACT = "exact"
+ODDS_MODE_MONTE_CARLO = "monte_carlo"
+ODDS_MODE_VALIDATE = "validate"
+
+EXACT_ODDS_CACHE_MAX = 32
+_exact_odds_cache: Dict[Tuple[Any, ...], List[List[float]]] = {}
+_exact_odds_cache_stats = {"hits": 0, "misses": 0}
+
 
 # ------------------------------------------------------------
 # Small helpers
@@ -446,24 +456,32 @@ def _select_78_losers(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return _dedupe_by_team(losers)[:2]
 
 
+def _has_no_first_restriction(team: Dict[str, Any]) -> bool:
+    return bool(
+        team.get("noConsecutiveFirstPick")
+        or team.get("cannotPickFirst")
+        or team.get("wonFirstPickLastDraft")
+    )
+
+
+def _has_no_top_five_restriction(team: Dict[str, Any]) -> bool:
+    return bool(
+        team.get("noThirdStraightTopFive")
+        or team.get("cannotPickTopFive")
+        or team.get("topFiveLastTwoDrafts")
+    )
+
+
+def _has_pick_restrictions(teams: List[Dict[str, Any]]) -> bool:
+    return any(_has_no_first_restriction(team) or _has_no_top_five_restriction(team) for team in teams)
+
+
 def _apply_pick_restrictions(order: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     # This supports the new rule when save data carries restriction flags.
     # If the data is not present, it is a no-op.
     order = list(order)
-
-    def no_first(team: Dict[str, Any]) -> bool:
-        return bool(
-            team.get("noConsecutiveFirstPick")
-            or team.get("cannotPickFirst")
-            or team.get("wonFirstPickLastDraft")
-        )
-
-    def no_top_five(team: Dict[str, Any]) -> bool:
-        return bool(
-            team.get("noThirdStraightTopFive")
-            or team.get("cannotPickTopFive")
-            or team.get("topFiveLastTwoDrafts")
-        )
+    no_first = _has_no_first_restriction
+    no_top_five = _has_no_top_five_restriction
 
     if order and no_first(order[0]):
         for i in range(1, len(order)):
@@ -631,6 +649,154 @@ def _attach_pick_context(picks: List[Dict[str, Any]], odds_rows: List[Dict[str,
     return out
 
 
+# ------------------------------------------------------------
+# Exact odds engine
+# ------------------------------------------------------------
+# A weighted draw without replacement only depends on which teams are already
+# out of the hopper, so the draw is walked as a DP over drawn-team states and
+# each state's probability is summed once. Results are per team index and are
+# cached by the weight vector plus whatever else decides the order (record
+# order for legacy picks 5-14, the relegation set for 3-2-1).
+def _normalize_odds_mode(value: Any) -> str:
+    mode = str(value or "").strip().lower().replace("-", "_")
+    if mode in {"monte_carlo", "mc", "simulate", "simulation", "sampled"}:
+        return ODDS_MODE_MONTE_CARLO
+    if mode in {"validate", "validation", "compare"}:
+        return ODDS_MODE_VALIDATE
+    return ODDS_MODE_EXACT
+
+
+def _draw_weights(weights: List[int], count: int) -> Tuple[int, ...]:
+    # Same clamp as _weighted_draw_without_replacement.
+    return tuple(max(1, _safe_int(weights[i], 1)) for i in range(count))
+
+
+def _cached_exact_odds(key: Tuple[Any, ...], build) -> List[List[float]]:
+    cached = _exact_odds_cache.get(key)
+    if cached is not None:
+        _exact_odds_cache_stats["hits"] += 1
+        return cached
+
+    _exact_odds_cache_stats["misses"] += 1
+    result = build()
+    if len(_exact_odds_cache) >= EXACT_ODDS_CACHE_MAX:
+        _exact_odds_cache.pop(next(iter(_exact_odds_cache)))
+    _exact_odds_cache[key] = result
+    return result
+
+
+def get_exact_odds_cache_stats() -> Dict[str, int]:
+    return {**_exact_odds_cache_stats, "size": len(_exact_odds_cache)}
+
+
+def _matrix_row_from_probabilities(
+    team: Dict[str, Any],
+    probabilities: Dict[int, float],
+    max_pick: int,
+    projected_pick: int,
+    final_pick: Optional[int] = None,
+) -> Dict[str, Any]:
+    # A probability map is a count map over a total of one draw.
+    row = _matrix_row_from_counts(team, probabilities, 1, max_pick, projected_pick, final_pick)
+    row["simulationCount"] = 0
+    row["oddsMode"] = ODDS_MODE_EXACT
+    return row
+
+
+def _exact_legacy_pick_probabilities(weights: Tuple[int, ...], rest_order: Tuple[int, ...]) -> List[List[float]]:
+    """probabilities[i][k] is the chance team index i lands on pick k + 1.
+
+    Top-four permutations are enumerated through a DP over the drawn-team
+    bitmask (at most C(14, 4) states per layer); picks 5-14 follow rest_order.
+    """
+    count = len(weights)
+    draws = min(4, count)
+    probabilities = [[0.0] * count for _ in range(count)]
+
+    layer: Dict[int, Tuple[float, int]] = {0: (1.0, sum(weights))}
+    for pick_index in range(draws):
+        next_layer: Dict[int, Tuple[float, int]] = {}
+        for mask, (chance, remaining_weight) in layer.items():
+            for i in range(count):
+                bit = 1 << i
+                if mask & bit:
+                    continue
+                drawn = chance * weights[i] / remaining_weight
+                probabilities[i][pick_index] += drawn
+                previous = next_layer.get(mask | bit)
+                next_layer[mask | bit] = (
+                    drawn + (previous[0] if previous else 0.0),
+                    remaining_weight - weights[i],
+                )
+        layer = next_layer
+
+    for mask, (chance, _) in layer.items():
+        pick_index = draws
+        for i in rest_order:
+            if not mask & (1 << i):
+                probabilities[i][pick_index] += chance
+                pick_index += 1
+
+    return probabilities
+
+
+def _exact_legacy_odds(lottery_teams: List[Dict[str, Any]], weights: List[int]) -> List[Dict[str, Any]]:
+    count = len(lottery_teams)
+    draw_weights = _draw_weights(weights, count)
+    # Stable index sort matches the per-draw sort of the remaining teams.
+    rest_order = tuple(sorted(range(count), key=lambda i: _record_sort_key_worst_first(lottery_teams[i])))
+    probabilities = _cached_exact_odds(
+        ("legacy_14", draw_weights, rest_order),
+        lambda: _exact_legacy_pick_probabilities(draw_weights, rest_order),
+    )
+
+    rows = []
+    for i, team in enumerate(lottery_teams):
+        by_pick = {pick_index + 1: probabilities[i][pick_index] for pick_index in range(count)}
+        rows.append(_matrix_row_from_probabilities(team, by_pick, 14, i + 1))
+    return rows
+
+
+def _compare_odds_rows(exact_rows: List[Dict[str, Any]], sampled_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    sampled_by_name = {_team_name(row): row.get("oddsByPick") or {} for row in sampled_rows}
+    max_diff = 0.0
+    max_team = ""
+    max_pick = ""
+    for row in exact_rows:
+        name = _team_name(row)
+        sampled = sampled_by_name.get(name) or {}
+        for pick, pct in (row.get("oddsByPick") or {}).items():
+            diff = abs(_safe_float(pct) - _safe_float(sampled.get(pick)))
+            if diff > max_diff:
+                max_diff, max_team, max_pick = diff, name, pick
+    return {
+        "simulationCount": ODDS_SIMULATION_COUNT,
+        "maxAbsDiffPct": _round_pct(max_diff),
+        "maxDiffTeam": max_team,
+        "maxDiffPick": max_pick,
+    }
+
+
+def _resolve_odds_rows(odds_mode: str, exact_rows, sampled_rows) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Return (rows, odds meta). exact_rows may return None when the exact
+    engine does not model the league's rules; sampling is used instead."""
+    rows = exact_rows() if odds_mode != ODDS_MODE_MONTE_CARLO else None
+    if rows is None:
+        meta = {"oddsMode": ODDS_MODE_MONTE_CARLO, "oddsSimulationCount": ODDS_SIMULATION_COUNT}
+        if odds_mode != ODDS_MODE_MONTE_CARLO:
+            meta["exactOddsUnavailable"] = "pick_restrictions"
+        return sampled_rows(), meta
+
+    meta = {
+        "oddsMode": ODDS_MODE_EXACT,
+        "oddsSimulationCount": 0,
+        "exactOddsCache": get_exact_odds_cache_stats(),
+    }
+    if odds_mode == ODDS_MODE_VALIDATE:
+        meta["oddsValidation"] = _compare_odds_rows(rows, sampled_rows())
+    return rows, meta
+
+
 def _simulate_legacy_odds(
     lottery_teams: List[Dict[str, Any]],
     weights: List[int],
@@ -653,7 +819,9 @@ def _simulate_legacy_odds(
     rows = []
     for i, team in enumerate(lottery_teams):
         projected = i + 1
-        rows.append(_matrix_row_from_counts(team, counts[_team_name(team)], simulations, 14, projected))
+        row = _matrix_row_from_counts(team, counts[_team_name(team)], simulations, 14, projected)
+        row["oddsMode"] = ODDS_MODE_MONTE_CARLO
+        rows.append(row)
     return rows, counts
 
 
@@ -848,10 +1016,142 @@ def _simulate_321_odds(
         name = _team_name(display_team)
         base_team = {**(team_by_name.get(name) or display_team), **display_team}
         projected = projected_by_name.get(name, 0)
-        rows.append(_matrix_row_from_counts(base_team, counts[name], simulations, 16, projected))
+        row = _matrix_row_from_counts(base_team, counts[name], simulations, 16, projected)
+        row["oddsMode"] = ODDS_MODE_MONTE_CARLO
+        rows.append(row)
     return rows, counts
 
 
+def _relegated_floor_index(position: int, relegated_mask: int, count: int) -> int:
+    """Final index of the team drawn at `position` once the relegated floor is applied."""
+    order = [{"teamName": str(i)} for i in range(count)]
+    relegated = {str(i) for i in range(count) if relegated_mask & (1 << i)}
+    floored = _enforce_321_relegated_floor(order, relegated)
+    return next(index for index, team in enumerate(floored) if team["teamName"] == str(position))
+
+
+def _exact_321_class_distribution(
+    class_weights: List[int],
+    class_relegated: List[bool],
+    class_sizes: List[int],
+    tracked_class: int,
+    count: int,
+) -> List[float]:
+    """Final-pick distribution for one team of `tracked_class`.
+
+    The floor rule only looks at where relegated teams were drawn, so the DP
+    state is (teams drawn per class, tracked team's draw slot, relegated draw
+    slots). Teams of other classes with equal weight are interchangeable.
+    Relegated slots are only recorded while they can still move the tracked
+    team, which keeps the state space small:
+      - a non-relegated team drawn at 1-12 can be swapped out by relegated
+        teams drawn after it; drawn at 13+ it never moves.
+      - a relegated team drawn at 1-12 never moves; drawn at 13+ it takes a
+        slot decided by relegated teams drawn before it.
+    For a non-relegated team only the number of relegated teams drawn after it
+    inside the top 12 matters, so those slots are packed right behind it. For
+    a relegated team only slots 8-12 can be the one it is swapped into.
+    """
+    other_sizes = list(class_sizes)
+    other_sizes[tracked_class] -= 1
+    tracked_weight = class_weights[tracked_class]
+    tracked_relegated = class_relegated[tracked_class]
+    total_weight = sum(weight * size for weight, size in zip(class_weights, class_sizes))
+
+    layer: Dict[Tuple[Tuple[int, ...], int, int], float] = {((0,) * len(class_sizes), -1, 0): 1.0}
+    for position in range(count):
+        next_layer: Dict[Tuple[Tuple[int, ...], int, int], float] = {}
+        for (drawn, tracked_position, relegated_mask), chance in layer.items():
+            remaining_weight = total_weight - sum(weight * n for weight, n in zip(class_weights, drawn))
+            if tracked_position >= 0:
+                remaining_weight -= tracked_weight
+                record = not tracked_relegated and tracked_position <= 11
+            else:
+                tracked_mask = relegated_mask if tracked_relegated and position > 11 else 0
+                key = (drawn, position, tracked_mask)
+                next_layer[key] = next_layer.get(key, 0.0) + chance * tracked_weight / remaining_weight
+                record = tracked_relegated
+            for class_index, size in enumerate(other_sizes):
+                left = size - drawn[class_index]
+                if left <= 0:
+                    continue
+                next_drawn = drawn[:class_index] + (drawn[class_index] + 1,) + drawn[class_index + 1:]
+                next_mask = relegated_mask
+                if record and class_relegated[class_index]:
+                    if tracked_relegated:
+                        if position >= 7:
+                            next_mask |= 1 << position
+                    elif position <= 11:
+                        packed = tracked_position + 1 + bin(relegated_mask & 0xFFF).count("1")
+                        next_mask |= 1 << packed
+                    else:
+                        next_mask |= 1 << position
+                key = (next_drawn, tracked_position, next_mask)
+                next_layer[key] = next_layer.get(key, 0.0) + chance * left * class_weights[class_index] / remaining_weight
+        layer = next_layer
+
+    distribution = [0.0] * count
+    floor_index: Dict[Tuple[int, int], int] = {}
+    for (_, tracked_position, relegated_mask), chance in layer.items():
+        if tracked_relegated:
+            relegated_mask |= 1 << tracked_position
+        key = (tracked_position, relegated_mask)
+        if key not in floor_index:
+            floor_index[key] = _relegated_floor_index(tracked_position, relegated_mask, count)
+        distribution[floor_index[key]] += chance
+    return distribution
+
+
+def _exact_321_pick_probabilities(weights: Tuple[int, ...], relegated: Tuple[int, ...]) -> List[List[float]]:
+    relegated_set = set(relegated)
+    members: Dict[Tuple[int, bool], List[int]] = {}
+    for i, weight in enumerate(weights):
+        members.setdefault((weight, i in relegated_set), []).append(i)
+
+    class_keys = list(members)
+    class_weights = [weight for weight, _ in class_keys]
+    class_relegated = [is_relegated for _, is_relegated in class_keys]
+    class_sizes = [len(members[key]) for key in class_keys]
+
+    probabilities: List[List[float]] = [[] for _ in weights]
+    for class_index, key in enumerate(class_keys):
+        distribution = _exact_321_class_distribution(
+            class_weights, class_relegated, class_sizes, class_index, len(weights)
+        )
+        for i in members[key]:
+            probabilities[i] = list(distribution)
+    return probabilities
+
+
+def _exact_321_odds(
+    lottery_teams: List[Dict[str, Any]],
+    weights: List[int],
+    draft_relegated_names: set,
+) -> Optional[List[Dict[str, Any]]]:
+    # Restriction swaps depend on per-team save flags the DP does not track.
+    if _has_pick_restrictions(lottery_teams):
+        return None
+
+    teams = lottery_teams[:16]
+    draw_weights = _draw_weights(weights, len(teams))
+    relegated = tuple(i for i, team in enumerate(teams) if _team_name(team) in draft_relegated_names)
+    probabilities = _cached_exact_odds(
+        ("three_two_one", draw_weights, relegated),
+        lambda: _exact_321_pick_probabilities(draw_weights, relegated),
+    )
+    index_by_name = {_team_name(team): i for i, team in enumerate(teams)}
+
+    rows = []
+    team_by_name = {_team_name(team): team for team in lottery_teams}
+    for display_team in _clean_321_display_rows(lottery_teams):
+        name = _team_name(display_team)
+        base_team = {**(team_by_name.get(name) or display_team), **display_team}
+        team_probabilities = probabilities[index_by_name[name]] if name in index_by_name else []
+        by_pick = {pick_index + 1: chance for pick_index, chance in enumerate(team_probabilities)}
+        rows.append(_matrix_row_from_probabilities(base_team, by_pick, 16, _safe_int(display_team.get("projectedPick"), 0)))
+    return rows
+
+
 # ------------------------------------------------------------
 # Lottery systems
 # ------------------------------------------------------------
@@ -861,6 +1161,7 @@ def _run_legacy_14_lottery(
     season_year: int,
     seed_number: int,
     rng: random.Random,
+    odds_mode: str = ODDS_MODE_EXACT,
 ) -> Dict[str, Any]:
     lottery_teams = [row for row in records if not bool(row.get("madePlayoffs"))]
     if len(lottery_teams) != 14:
@@ -905,7 +1206,11 @@ def _run_legacy_14_lottery(
     all_teams_inverse = sorted(records, key=_record_sort_key_worst_first)[:30]
 
     final_pick_by_team = {_team_name(team): index + 1 for index, team in enumerate(first_round_order[:14])}
-    odds_rows, _ = _simulate_legacy_odds(lottery_teams, weights, seed_number)
+    odds_rows, odds_meta = _resolve_odds_rows(
+        odds_mode,
+        lambda: _exact_legacy_odds(lottery_teams, weights),
+        lambda: _simulate_legacy_odds(lottery_teams, weights, seed_number)[0],
+    )
     enriched_odds = []
     for row in odds_rows:
         name = _team_name(row)
@@ -972,7 +1277,8 @@ def _run_legacy_14_lottery(
         "preLotteryOdds": enriched_odds,
         "lotteryOdds": enriched_odds,
         "oddsMatrix": enriched_odds,
-        "oddsSimulationCount": ODDS_SIMULATION_COUNT,
+        "oddsSimulationCount": odds_meta["oddsSimulationCount"],
+        "oddsMode": odds_meta["oddsMode"],
         "topFourDrawn": drawn_summary,
         "firstRoundOrder": first_round_picks,
         "secondRoundOrder": second_round_picks,
@@ -982,7 +1288,7 @@ def _run_legacy_14_lottery(
             "systemLabel": "2026 legacy NBA lottery",
             "rules": "Legacy NBA lottery: 14 teams, top 4 picks drawn, picks 5-14 by inverse record. Round 2 uses league-wide inverse record.",
             "lotteryCombinations": LOTTERY_COMBINATIONS,
-            "oddsSimulationCount": ODDS_SIMULATION_COUNT,
+            **odds_meta,
             "seed": str(seed_number),
         },
     }
@@ -994,6 +1300,7 @@ def _run_three_two_one_lottery(
     season_year: int,
     seed_number: int,
     rng: random.Random,
+    odds_mode: str = ODDS_MODE_EXACT,
 ) -> Dict[str, Any]:
     context = _build_321_lottery_context(records)
     lottery_teams = context["lotteryTeams"]
@@ -1020,7 +1327,11 @@ def _run_three_two_one_lottery(
     second_round_order = second_round_order[:30]
 
     final_pick_by_team = {_team_name(team): index + 1 for index, team in enumerate(drawn_16[:16])}
-    odds_rows, _ = _simulate_321_odds(lottery_teams, weights, draft_relegated_names, seed_number)
+    odds_rows, odds_meta = _resolve_odds_rows(
+        odds_mode,
+        lambda: _exact_321_odds(lottery_teams, weights, draft_relegated_names),
+        lambda: _simulate_321_odds(lottery_teams, weights, draft_relegated_names, seed_number)[0],
+    )
     enriched_odds = []
     for row in odds_rows:
         name = _team_name(row)
@@ -1085,7 +1396,8 @@ def _run_three_two_one_lottery(
         "preLotteryOdds": enriched_odds,
         "lotteryOdds": enriched_odds,
         "oddsMatrix": enriched_odds,
-        "oddsSimulationCount": ODDS_SIMULATION_COUNT,
+        "oddsSimulationCount": odds_meta["oddsSimulationCount"],
+        "oddsMode": odds_meta["oddsMode"],
         "topFourDrawn": drawn_summary[:4],
         "topSixteenDrawn": drawn_summary,
         "firstRoundOrder": first_round_picks,
@@ -1098,7 +1410,7 @@ def _run_three_two_one_lottery(
             "lotteryBalls": "3-2-1",
             "draftRelegatedTeams": sorted(list(draft_relegated_names)),
             "sevenEightLosers": sorted(list(context.get("sevenEightLoserNames") or [])),
-            "oddsSimulationCount": ODDS_SIMULATION_COUNT,
+            **odds_meta,
             "seed": str(seed_number),
         },
     }
@@ -1139,10 +1451,12 @@ def run_draft_lottery(league_data: Dict[str, Any], payload: Dict[str, Any]) -> D
     # and conferences. Keep 30 by best-first league rank for stability.
     records = sorted(_dedupe_by_team(records), key=_record_sort_key_best_first)[:30]
 
+    odds_mode = _normalize_odds_mode(payload.get("oddsMode"))
+
     if lottery_system == "three_two_one":
-        result = _run_three_two_one_lottery(records, source, season_year, seed_number, rng)
+        result = _run_three_two_one_lottery(records, source, season_year, seed_number, rng, odds_mode)
     else:
-        result = _run_legacy_14_lottery(records, source, season_year, seed_number, rng)
+        result = _run_legacy_14_lottery(records, source, season_year, seed_number, rng, odds_mode)
 
     result["meta"] = {
         **(result.get("meta") or {}),
@@ -3,8 +3,13 @@ import json
 import random
 import sys
 import time
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional, Tuple
 
+from league_clone import clone_league_sharing_cold, cold_subtree_memo
+from free_agent_index import free_agent_index_scope, index_for, offer_book_for
+from module_registry import league_id_of
+
 # BM_PATCH32_ECONOMIC_IMPORT
 try:
     from deflated_trade_scale import economic_player_copy, player_economic_overall, player_economic_potential, economy_ovr, TRADE_TIER
@@ -31,30 +36,40 @@ except Exception:  # pragma: no cover - patch fallback
 
 try:
     from league_financials import (
+        bind_financial_rules,
+        bound_financial_rules,
         ensure_league_financials,
-        get_financial_rules as _raw_get_financial_rules,
+        financial_rules_scope,
+        get_financial_rules,
         get_rookie_salary_for_pick,
     )
 except Exception:
     ensure_league_financials = None
-    _raw_get_financial_rules = None
+    get_financial_rules = None
     get_rookie_salary_for_pick = None
+    def bind_financial_rules(league_data):
+        return None
+    def bound_financial_rules():
+        return None
+    def financial_rules_scope(league_data=None):
+        return nullcontext()
 
-# Result-preserving, call-scoped cache for immutable league financial rules.
-# CPU offer generation asks for the same league-level rules thousands of times.
-# The active cache is scoped by object identity and restored after each board build,
-# so no gameplay state is written into the save and no cross-call values go stale.
-_ACTIVE_FINANCIAL_RULES_CONTEXT: Optional[Dict[str, Any]] = None
 _FA_TEAM_POWER_CONTEXT_CACHE: Dict[str, Any] = {}
 
-if _raw_get_financial_rules is not None:
-    def get_financial_rules(league_data: Dict[str, Any]) -> Dict[str, Any]:
-        context = _ACTIVE_FINANCIAL_RULES_CONTEXT
-        if context is not None and context.get("leagueData") is league_data:
-            return context["rules"]
-        return _raw_get_financial_rules(league_data)
-else:
-    get_financial_rules = None
+# Incremental CPU offer board. Team roster profiles, (team, player) fit scores
+# and rights-relation facts are kept between FA days and reused while the
+# team's roster and the player's market signature are unchanged. Entries are
+# keyed by content signatures, never object identity, so a stale entry can
+# only be hit by a team/player whose inputs are identical.
+CPU_OFFER_BOARD_MAX_PAIRS = 24000
+_CPU_OFFER_BOARD: Dict[str, Any] = {
+    "leagueId": None,
+    "teams": {},
+    "players": {},
+    "relations": {},
+    "fits": {},
+    "lastRun": {},
+}
 
 
 DEFAULT_SALARY_CAP = 154_647_000
@@ -105,85 +120,87 @@ PLAYER_MINIMUM_BASE_SCALE = {
 
 
 def sync_financial_constants(league_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Synchronize legacy module constants with the current league economy.
+    """Bind the current league economy to the request's financial rules scope.
 
-    This preserves the existing free-agency code paths while letting the same
-    logic run against inflated cap/min/max/MLE/apron values.
+    The MIN_DEAL / MAX_SALARY / DEFAULT_* constants stay base-season defaults;
+    free-agency code reads the bound cap/min/max/MLE/apron values through
+    _bound_rule(), so one league's inflated economy is never left behind in
+    module state for the next request. Outside a scope this only ensures the
+    league's financials block.
     """
-    global DEFAULT_SALARY_CAP, TWO_WAY_SALARY, MIN_DEAL, DEFAULT_MINIMUM_EXCEPTION
-    global MAX_SALARY, DEFAULT_ROOM_EXCEPTION, DEFAULT_NON_TAXPAYER_MLE
-    global DEFAULT_TAXPAYER_MLE, DEFAULT_LUXURY_TAX_LINE, DEFAULT_FIRST_APRON
-    global DEFAULT_SECOND_APRON
-
     if not isinstance(league_data, dict) or get_financial_rules is None:
         return league_data
 
     try:
         if ensure_league_financials is not None:
             ensure_league_financials(league_data)
-        rules = get_financial_rules(league_data)
+        bind_financial_rules(league_data)
     except Exception:
-        return league_data
-
-    DEFAULT_SALARY_CAP = int(rules.get("salaryCap") or DEFAULT_SALARY_CAP)
-    TWO_WAY_SALARY = int(rules.get("twoWaySalary") or TWO_WAY_SALARY)
-    MIN_DEAL = int(rules.get("minimumSalary") or MIN_DEAL)
-    DEFAULT_MINIMUM_EXCEPTION = int(rules.get("minimumException") or DEFAULT_MINIMUM_EXCEPTION)
-    MAX_SALARY = int(rules.get("maxSalary") or MAX_SALARY)
-    DEFAULT_ROOM_EXCEPTION = int(rules.get("roomException") or DEFAULT_ROOM_EXCEPTION)
-    DEFAULT_NON_TAXPAYER_MLE = int(rules.get("nonTaxpayerMLE") or rules.get("midLevelException") or DEFAULT_NON_TAXPAYER_MLE)
-    DEFAULT_TAXPAYER_MLE = int(rules.get("taxpayerMLE") or DEFAULT_TAXPAYER_MLE)
-    DEFAULT_LUXURY_TAX_LINE = int(rules.get("luxuryTaxLine") or DEFAULT_LUXURY_TAX_LINE)
-    DEFAULT_FIRST_APRON = int(rules.get("firstApron") or DEFAULT_FIRST_APRON)
-    DEFAULT_SECOND_APRON = int(rules.get("secondApron") or DEFAULT_SECOND_APRON)
+        pass
     return league_data
 
 
+def _bound_rule(key: str, default: int) -> int:
+    """`key` from the bound request economy, else the module default."""
+    rules = bound_financial_rules()
+    if not rules:
+        return int(default)
+    return int(rules.get(key) or default)
+
+
+def current_min_deal() -> int:
+    return _bound_rule("minimumSalary", MIN_DEAL)
+
+
+def current_max_salary() -> int:
+    return _bound_rule("maxSalary", MAX_SALARY)
+
+
 def get_room_exception_amount(league_data: Dict[str, Any]) -> int:
     if get_financial_rules is not None:
         try:
-            return int(get_financial_rules(league_data).get("roomException") or DEFAULT_ROOM_EXCEPTION)
+            return int(get_financial_rules(league_data).get("roomException") or _bound_rule("roomException", DEFAULT_ROOM_EXCEPTION))
         except Exception:
             pass
-    return int(league_data.get("roomException") or league_data.get("roomExceptionAmount") or DEFAULT_ROOM_EXCEPTION)
+    return int(league_data.get("roomException") or league_data.get("roomExceptionAmount") or _bound_rule("roomException", DEFAULT_ROOM_EXCEPTION))
 
 
 def get_non_taxpayer_mle_amount(league_data: Dict[str, Any]) -> int:
     if get_financial_rules is not None:
         try:
             rules = get_financial_rules(league_data)
-            return int(rules.get("nonTaxpayerMLE") or rules.get("midLevelException") or DEFAULT_NON_TAXPAYER_MLE)
+            return int(rules.get("nonTaxpayerMLE") or rules.get("midLevelException") or _bound_rule("nonTaxpayerMLE", _bound_rule("midLevelException", DEFAULT_NON_TAXPAYER_MLE)))
         except Exception:
             pass
-    return int(league_data.get("midLevelException") or league_data.get("nonTaxpayerMLE") or league_data.get("nonTaxpayerMidLevelException") or DEFAULT_NON_TAXPAYER_MLE)
+    return int(league_data.get("midLevelException") or league_data.get("nonTaxpayerMLE") or league_data.get("nonTaxpayerMidLevelException") or _bound_rule("nonTaxpayerMLE", _bound_rule("midLevelException", DEFAULT_NON_TAXPAYER_MLE)))
 
 
 def get_taxpayer_mle_amount(league_data: Dict[str, Any]) -> int:
     if get_financial_rules is not None:
         try:
-            return int(get_financial_rules(league_data).get("taxpayerMLE") or DEFAULT_TAXPAYER_MLE)
+            return int(get_financial_rules(league_data).get("taxpayerMLE") or _bound_rule("taxpayerMLE", DEFAULT_TAXPAYER_MLE))
         except Exception:
             pass
-    return int(league_data.get("taxpayerMLE") or league_data.get("taxpayerMidLevelException") or DEFAULT_TAXPAYER_MLE)
+    return int(league_data.get("taxpayerMLE") or league_data.get("taxpayerMidLevelException") or _bound_rule("taxpayerMLE", DEFAULT_TAXPAYER_MLE))
 
 
 def get_minimum_salary_amount(league_data: Dict[str, Any]) -> int:
     if get_financial_rules is not None:
         try:
-            return int(get_financial_rules(league_data).get("minimumSalary") or MIN_DEAL)
+            return int(get_financial_rules(league_data).get("minimumSalary") or current_min_deal())
         except Exception:
             pass
-    return int(league_data.get("minimumSalary") or league_data.get("veteranMinimum") or MIN_DEAL)
+    return int(league_data.get("minimumSalary") or league_data.get("veteranMinimum") or current_min_deal())
 
 
 def get_minimum_exception_amount(league_data: Dict[str, Any]) -> int:
     if get_financial_rules is not None:
         try:
             rules = get_financial_rules(league_data)
-            return int(max(rules.get("minimumSalary") or MIN_DEAL, rules.get("minimumException") or DEFAULT_MINIMUM_EXCEPTION))
+            return int(max(rules.get("minimumSalary") or current_min_deal(), rules.get("minimumException") or _bound_rule("minimumException", DEFAULT_MINIMUM_EXCEPTION)))
         except Exception:
             pass
-    return int(max(MIN_DEAL, league_data.get("minimumException") or league_data.get("minimumSalary") or league_data.get("veteranMinimum") or DEFAULT_MINIMUM_EXCEPTION))
+    return int(max(current_min_deal(), league_data.get("minimumException") or league_data.get("minimumSalary") or league_data.get("veteranMinimum") or _bound_rule("minimumException", DEFAULT_MINIMUM_EXCEPTION)))
 OFFSEASON_MIN_ROSTER = REGULAR_SEASON_MIN_ROSTER
 
 # BM_PATCH46_QUALITY_FA_SWEEP_EXTENSION_FLOW: deflated rosters use 71+ as the pre-sim quality FA sweep line.
@@ -295,37 +312,37 @@ def get_completed_contract_year(offseason_contract_year: int) -> int:
 def get_salary_cap(league_data: Dict[str, Any]) -> int:
     if get_financial_rules is not None:
         try:
-            return int(get_financial_rules(league_data).get("salaryCap") or DEFAULT_SALARY_CAP)
+            return int(get_financial_rules(league_data).get("salaryCap") or _bound_rule("salaryCap", DEFAULT_SALARY_CAP))
         except Exception:
             pass
-    return int(league_data.get("salaryCap") or league_data.get("capLimit") or DEFAULT_SALARY_CAP)
+    return int(league_data.get("salaryCap") or league_data.get("capLimit") or _bound_rule("salaryCap", DEFAULT_SALARY_CAP))
 
 
 def get_luxury_tax_line(league_data: Dict[str, Any]) -> int:
     if get_financial_rules is not None:
         try:
-            return int(get_financial_rules(league_data).get("luxuryTaxLine") or DEFAULT_LUXURY_TAX_LINE)
+            return int(get_financial_rules(league_data).get("luxuryTaxLine") or _bound_rule("luxuryTaxLine", DEFAULT_LUXURY_TAX_LINE))
         except Exception:
             pass
-    return int(league_data.get("luxuryTaxLine") or league_data.get("taxLine") or DEFAULT_LUXURY_TAX_LINE)
+    return int(league_data.get("luxuryTaxLine") or league_data.get("taxLine") or _bound_rule("luxuryTaxLine", DEFAULT_LUXURY_TAX_LINE))
 
 
 def get_first_apron(league_data: Dict[str, Any]) -> int:
     if get_financial_rules is not None:
         try:
-            return int(get_financial_rules(league_data).get("firstApron") or DEFAULT_FIRST_APRON)
+            return int(get_financial_rules(league_data).get("firstApron") or _bound_rule("firstApron", DEFAULT_FIRST_APRON))
         except Exception:
             pass
-    return int(league_data.get("firstApron") or league_data.get("apron1") or DEFAULT_FIRST_APRON)
+    return int(league_data.get("firstApron") or league_data.get("apron1") or _bound_rule("firstApron", DEFAULT_FIRST_APRON))
 
 
 def get_second_apron(league_data: Dict[str, Any]) -> int:
     if get_financial_rules is not None:
         try:
-            return int(get_financial_rules(league_data).get("secondApron") or DEFAULT_SECOND_APRON)
+            return int(get_financial_rules(league_data).get("secondApron") or _bound_rule("secondApron", DEFAULT_SECOND_APRON))
         except Exception:
             pass
-    return int(league_data.get("secondApron") or league_data.get("apron2") or DEFAULT_SECOND_APRON)
+    return int(league_data.get("secondApron") or league_data.get("apron2") or _bound_rule("secondApron", DEFAULT_SECOND_APRON))
 
 
 def get_payroll_zone_for_amount(league_data: Dict[str, Any], payroll: int) -> str:
@@ -515,7 +532,7 @@ def get_previous_salary_reference(
             return int(num(salary_by_year[-1], 0))
 
     market_value = player.get("marketValue") or estimate_market_value(player, league_data)
-    return int(num(market_value.get("expectedYear1Salary"), MIN_DEAL))
+    return int(num(market_value.get("expectedYear1Salary"), current_min_deal()))
 
 
 def get_bird_rights_salary_ceiling(
@@ -571,16 +588,16 @@ def get_legacy_bird_rights_salary_ceiling(
     previous_salary = get_previous_salary_reference(league_data, player)
 
     if bird_level == "bird":
-        return int(MAX_SALARY)
+        return int(current_max_salary())
     if bird_level == "early_bird":
-        return int(min(MAX_SALARY, max(
-            MIN_DEAL,
+        return int(min(current_max_salary(), max(
+            current_min_deal(),
             get_non_taxpayer_mle_amount(league_data),
             previous_salary * EARLY_BIRD_RAISE_MULT,
         )))
     if bird_level == "non_bird":
-        return int(min(MAX_SALARY, max(
-            MIN_DEAL,
+        return int(min(current_max_salary(), max(
+            current_min_deal(),
             previous_salary * NON_BIRD_RAISE_MULT,
         )))
     return 0
@@ -747,7 +764,7 @@ def get_qualifying_offer_amount(
     player: Dict[str, Any],
 ) -> int:
     previous_salary = get_previous_salary_reference(league_data, player)
-    amount = max(MIN_DEAL, int(round(previous_salary * 1.25)))
+    amount = max(current_min_deal(), int(round(previous_salary * 1.25)))
     return int(round_to_nearest(amount, base = 1_000))
 
 
@@ -1323,7 +1340,7 @@ def get_player_max_salary_amount(
     league_data: Optional[Dict[str, Any]],
     player: Dict[str, Any],
 ) -> int:
-    cap = get_salary_cap(league_data or {}) if isinstance(league_data, dict) else int(DEFAULT_SALARY_CAP)
+    cap = get_salary_cap(league_data or {}) if isinstance(league_data, dict) else _bound_rule("salaryCap", DEFAULT_SALARY_CAP)
     pct = get_player_max_salary_percentage(player, league_data)
     return int(round_to_nearest(cap * pct, base = 1_000))
 
@@ -1347,7 +1364,7 @@ def get_player_minimum_salary_amount(
     else:
         base_amount = PLAYER_MINIMUM_BASE_SCALE[0]
 
-    cap = get_salary_cap(league_data or {}) if isinstance(league_data, dict) else int(DEFAULT_SALARY_CAP)
+    cap = get_salary_cap(league_data or {}) if isinstance(league_data, dict) else _bound_rule("salaryCap", DEFAULT_SALARY_CAP)
     inflation_index = max(0.1, float(cap) / float(OFFICIAL_2026_27_SALARY_CAP))
     return int(round_to_nearest(base_amount * inflation_index, base = 1_000))
 
@@ -1425,10 +1442,10 @@ def build_decision_contract_from_actual(
         # This prevents a higher veteran minimum or lower 25%/30% max from
         # changing offer strength, while the signed contract remains legal.
         tolerance = 2_000
-        if player_minimum > MIN_DEAL and actual_year1 <= player_minimum + tolerance:
-            year1 = MIN_DEAL
-        elif player_maximum < MAX_SALARY and actual_year1 >= player_maximum - tolerance:
-            year1 = MAX_SALARY
+        if player_minimum > current_min_deal() and actual_year1 <= player_minimum + tolerance:
+            year1 = current_min_deal()
+        elif player_maximum < current_max_salary() and actual_year1 >= player_maximum - tolerance:
+            year1 = current_max_salary()
 
     decision_years = int(clamp(len(normalized["salaryByYear"]), 1, 4))
     option = None
@@ -2259,18 +2276,18 @@ def get_player_cap_hold_amount(
     ):
         qo_amount = int(num(qualifying_offer.get("amount"), 0))
         if qo_amount > 0:
-            return int(round_to_nearest(max(MIN_DEAL, qo_amount), base = 1_000))
+            return int(round_to_nearest(max(current_min_deal(), qo_amount), base = 1_000))
 
     previous_salary = get_previous_salary_reference(league_data, player)
     market_value = player.get("marketValue") or estimate_market_value(player, league_data)
-    market_year_one = int(num(market_value.get("expectedYear1Salary"), MIN_DEAL))
+    market_year_one = int(num(market_value.get("expectedYear1Salary"), current_min_deal()))
 
     if bird_level == "bird":
-        hold = max(previous_salary, market_year_one, MIN_DEAL)
+        hold = max(previous_salary, market_year_one, current_min_deal())
     elif bird_level == "early_bird":
-        hold = max(previous_salary * 1.30, MIN_DEAL)
+        hold = max(previous_salary * 1.30, current_min_deal())
     elif bird_level == "non_bird":
-        hold = max(previous_salary * 1.20, MIN_DEAL)
+        hold = max(previous_salary * 1.20, current_min_deal())
     else:
         hold = 0
 
@@ -2595,6 +2612,10 @@ def _team_current_power_score(profile: Dict[str, Any]) -> float:
     return clamp(roster_score * 0.74 + history_score * 0.26, 0.0, 1.0)
 
 
+def reset_fa_team_power_cache() -> None:
+    _FA_TEAM_POWER_CONTEXT_CACHE.clear()
+
+
 def get_fa_team_power_context(
     league_data: Dict[str, Any],
     team_name: Optional[str],
@@ -3211,18 +3232,18 @@ def estimate_market_value(player: Dict[str, Any], league_data: Optional[Dict[str
     scoring_rating = num(player.get("scoringRating"), 50)
     player_minimum = get_player_minimum_salary_amount(league_data, player)
     player_maximum = get_player_max_salary_amount(league_data, player)
-    cap_scale = float(MAX_SALARY) / 54_000_000.0
+    cap_scale = float(current_max_salary()) / 54_000_000.0
     minimum_bucket = (visible_overall <= 63 or (visible_overall <= 65 and age >= 28 and visible_upside <= 1) or (visible_overall <= 67 and age >= 32 and visible_upside <= 1))
     years = get_realistic_expected_contract_years(player)
     if minimum_bucket:
-        legacy_base_salary = MIN_DEAL
-        if visible_overall >= 66 and age <= 26 and visible_upside >= 2: legacy_base_salary = max(MIN_DEAL, int(round(2_000_000 * cap_scale)))
-        elif visible_overall >= 66: legacy_base_salary = max(MIN_DEAL, int(round(DEFAULT_MINIMUM_EXCEPTION)))
+        legacy_base_salary = current_min_deal()
+        if visible_overall >= 66 and age <= 26 and visible_upside >= 2: legacy_base_salary = max(current_min_deal(), int(round(2_000_000 * cap_scale)))
+        elif visible_overall >= 66: legacy_base_salary = max(current_min_deal(), int(round(_bound_rule("minimumException", DEFAULT_MINIMUM_EXCEPTION))))
         legacy_year1 = int(round_to_nearest(legacy_base_salary, base=1_000))
         legacy_salary_by_year = build_salary_by_year(legacy_year1, years)
         actual_year1 = int(round_to_nearest(clamp(legacy_year1, player_minimum, player_maximum), base=1_000))
         salary_by_year = build_legal_salary_by_year(actual_year1, years, STANDARD_FREE_AGENT_RAISE_PCT)
-        return {"expectedYears": years, "salaryByYear": legacy_salary_by_year, "expectedYear1Salary": legacy_salary_by_year[0], "expectedAAV": int(sum(legacy_salary_by_year)/len(legacy_salary_by_year)), "minAcceptableAAV": MIN_DEAL, "contractExpectedYears": years, "contractExpectedYear1Salary": salary_by_year[0], "contractExpectedAAV": int(sum(salary_by_year)/len(salary_by_year)), "contractMinAcceptableAAV": int(clamp(MIN_DEAL, player_minimum, player_maximum)), "playerMinimumSalary": player_minimum, "playerMaximumSalary": player_maximum, "maxSalaryPercent": get_player_max_salary_percentage(player, league_data), "visibleOverall": visible_overall, "economicOverall": round(overall,3), "contractScaleVersion": "patch33_contract_market_parity_v1"}
+        return {"expectedYears": years, "salaryByYear": legacy_salary_by_year, "expectedYear1Salary": legacy_salary_by_year[0], "expectedAAV": int(sum(legacy_salary_by_year)/len(legacy_salary_by_year)), "minAcceptableAAV": current_min_deal(), "contractExpectedYears": years, "contractExpectedYear1Salary": salary_by_year[0], "contractExpectedAAV": int(sum(salary_by_year)/len(salary_by_year)), "contractMinAcceptableAAV": int(clamp(current_min_deal(), player_minimum, player_maximum)), "playerMinimumSalary": player_minimum, "playerMaximumSalary": player_maximum, "maxSalaryPercent": get_player_max_salary_percentage(player, league_data), "visibleOverall": visible_overall, "economicOverall": round(overall,3), "contractScaleVersion": "patch33_contract_market_parity_v1"}
     if overall <= 75: base_salary = 3_100_000 + max(0.0, overall - 74.0) * 1_250_000
     elif overall <= 78: base_salary = 4_800_000 + (overall - 76.0) * 2_050_000
     elif overall <= 81: base_salary = 10_800_000 + (overall - 79.0) * 3_000_000
@@ -3257,7 +3278,7 @@ def estimate_market_value(player: Dict[str, Any], league_data: Optional[Dict[str
     if visible_overall >= 69 and overall >= 75 and age <= 27 and visible_potential >= 74: base_salary = max(base_salary, 4_800_000 * cap_scale)
     elif visible_overall >= 69 and overall >= 75 and age <= 29: base_salary = max(base_salary, 4_200_000 * cap_scale)
     if visible_overall >= 68 and overall >= 74 and age <= 33: base_salary = max(base_salary, 3_400_000 * cap_scale)
-    legacy_year1_salary = int(round_to_nearest(clamp(base_salary, MIN_DEAL, MAX_SALARY), base=1_000))
+    legacy_year1_salary = int(round_to_nearest(clamp(base_salary, current_min_deal(), current_max_salary()), base=1_000))
     actual_year1_salary = int(round_to_nearest(clamp(legacy_year1_salary, player_minimum, player_maximum), base=1_000))
     legacy_salary_by_year = build_salary_by_year(legacy_year1_salary, years)
     salary_by_year = build_legal_salary_by_year(actual_year1_salary, years, STANDARD_FREE_AGENT_RAISE_PCT)
@@ -3275,12 +3296,12 @@ def estimate_market_value(player: Dict[str, Any], league_data: Optional[Dict[str
     if visible_overall >= 75: min_accept_mult = max(min_accept_mult, 0.92)
     if visible_overall >= 80: min_accept_mult = max(min_accept_mult, 0.95)
     min_accept_mult = clamp(min_accept_mult, 0.78, 0.995)
-    legacy_min_acceptable_aav = int(round_to_nearest(max(MIN_DEAL, legacy_year1_salary * min_accept_mult), base=1_000))
+    legacy_min_acceptable_aav = int(round_to_nearest(max(current_min_deal(), legacy_year1_salary * min_accept_mult), base=1_000))
     actual_min_acceptable_aav = int(round_to_nearest(clamp(legacy_min_acceptable_aav, player_minimum, player_maximum), base=1_000))
     return {"expectedYears": years, "salaryByYear": legacy_salary_by_year, "expectedYear1Salary": legacy_salary_by_year[0], "expectedAAV": int(sum(legacy_salary_by_year)/len(legacy_salary_by_year)), "minAcceptableAAV": legacy_min_acceptable_aav, "contractExpectedYears": years, "contractExpectedYear1Salary": salary_by_year[0], "contractExpectedAAV": int(sum(salary_by_year)/len(salary_by_year)), "contractMinAcceptableAAV": actual_min_acceptable_aav, "playerMinimumSalary": player_minimum, "playerMaximumSalary": player_maximum, "maxSalaryPercent": get_player_max_salary_percentage(player, league_data), "visibleOverall": visible_overall, "economicOverall": round(overall,3), "contractScaleVersion": "patch33_contract_market_parity_v1"}
 
 def add_market_values_to_free_agents(league_data: Dict[str, Any]) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     free_agents = updated.get("freeAgents", [])
 
     for player in free_agents:
@@ -3294,6 +3315,9 @@ def add_market_values_to_free_agents(league_data: Dict[str, Any]) -> Dict[str, A
 def refresh_free_agent_market_values(league_data: Dict[str, Any]) -> None:
     for player in league_data.get("freeAgents", []):
         player["marketValue"] = estimate_market_value(player, league_data)
+    index = get_free_agent_index(league_data.get("freeAgents"))
+    if index is not None:
+        index.invalidate_buckets()
 
 
 def build_contract_from_offer(league_data: Dict[str, Any], offer: Dict[str, Any]) -> Dict[str, Any]:
@@ -3587,7 +3611,7 @@ def finalize_cpu_min_roster_cleanup(
                         matched_rfa = False,
                     )
 
-                    league_data["freeAgents"].pop(player_idx)
+                    pop_free_agent(league_data["freeAgents"], player_idx)
                     live_team.setdefault("players", []).append(signed_player)
 
                     signed_this_round = _record_cleanup_signing(
@@ -4151,7 +4175,7 @@ def get_team_exception_room(
 
         if zone == "second_apron":
             usable_room = (
-                MIN_DEAL
+                current_min_deal()
                 if decision_mode or player is None
                 else get_player_minimum_salary_amount(league_data, player)
             )
@@ -4200,7 +4224,7 @@ def validate_offer_spending_rules(
         else get_player_minimum_salary_amount(league_data, player)
     )
     player_maximum_salary = (
-        MAX_SALARY
+        current_max_salary()
         if decision_mode
         else get_player_max_salary_amount(league_data, player)
     )
@@ -4827,7 +4851,7 @@ def decide_player_option(
         }
 
     option_salary = int(active_option["salary"])
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
     expected_years = get_realistic_expected_contract_years(player)
 
     age = int(num(player.get("age"), 27))
@@ -4905,7 +4929,7 @@ def decide_cpu_team_option(
         }
 
     option_salary = int(active_option["salary"])
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
 
     age = int(num(player.get("age"), 27))
     overall = num(player.get("overall"), 75)
@@ -5140,6 +5164,12 @@ def remove_existing_free_agent_match(
     player_id: Optional[Any],
     player_name: Optional[str]
 ) -> None:
+    index = get_free_agent_index(free_agents)
+    if index is not None:
+        if index.position(player_id, player_name) != -1:
+            index.remove_matching(player_id, player_name)
+        return
+
     keep = []
     for p in free_agents:
         same_id = player_id not in [None, ""] and p.get("id") == player_id
@@ -5171,7 +5201,7 @@ def add_player_to_free_agency(
         reason = reason,
         league_data = updated,
     )
-    free_agents.append(fa_player)
+    append_free_agent(free_agents, fa_player)
     return fa_player
 
 
@@ -5433,7 +5463,7 @@ def build_rookie_salary_for_pick(round_num: int, pick_num: int, league_data: Opt
         except Exception:
             pass
 
-    scale = float(MAX_SALARY) / 54_000_000.0
+    scale = float(current_max_salary()) / 54_000_000.0
     if round_num == 1:
         base_salary = max(2_400_000, int(11_800_000 - (pick_num - 1) * 315_000))
     else:
@@ -6309,7 +6339,7 @@ def apply_offseason_contract_decisions(
                 "preview": preview,
             }
 
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     decision_log = []
     teams_affected = set()
 
@@ -7626,7 +7656,7 @@ def _story_is_minimum_deal(contract_info: Dict[str, Any], spending_type: Any, ex
     raw = f"{spending_type or ''} {exception_type or ''}".lower()
     first_year = int(num(contract_info.get("currentYearSalary"), 0))
     aav = int(num(contract_info.get("aav"), 0))
-    return "minimum" in raw or (first_year > 0 and first_year <= int(MIN_DEAL * 1.15)) or (aav > 0 and aav <= int(MIN_DEAL * 1.25))
+    return "minimum" in raw or (first_year > 0 and first_year <= int(current_min_deal() * 1.15)) or (aav > 0 and aav <= int(current_min_deal() * 1.25))
 
 
 def _story_spending_line(spending_type: Any, exception_type: Any, payroll_zone: Any, exception_usage: Optional[Dict[str, Any]]) -> str:
@@ -8706,7 +8736,7 @@ def record_exception_usage_for_signing(
     exception_type = normalize_exception_type(spending_res.get("exceptionType"))
     amount = int(num(current_year_salary, 0))
 
-    if not exception_type or amount <= MIN_DEAL:
+    if not exception_type or amount <= current_min_deal():
         return None
 
     usage = get_exception_usage_ledger(league_data)
@@ -8744,10 +8774,17 @@ def record_exception_usage_for_signing(
 
 def get_active_offers_for_player(state: Dict[str, Any], player_key: str) -> List[Dict[str, Any]]:
     offers = state.setdefault("offersByPlayer", {}).setdefault(player_key, [])
+    book = offer_book_for(state["offersByPlayer"])
+    if book is not None:
+        return book.active_for_player(player_key)
     return [o for o in offers if o.get("status", "active") == "active"]
 
 
 def get_active_offer_count_for_team(state: Dict[str, Any], team_name: str) -> int:
+    book = offer_book_for(state.get("offersByPlayer"))
+    if book is not None:
+        return len(book.active_for_team(team_name))
+
     count = 0
     for offers in state.get("offersByPlayer", {}).values():
         for offer in offers:
@@ -8886,6 +8923,14 @@ def get_outstanding_offer_year1_total(
     team_name: str,
     exclude_offer_id: Optional[str] = None
 ) -> int:
+    book = offer_book_for(state.get("offersByPlayer"))
+    if book is not None:
+        return sum(
+            int(num(offer.get("currentYearSalary"), 0))
+            for offer in book.active_for_team(team_name)
+            if not (exclude_offer_id and offer.get("offerId") == exclude_offer_id)
+        )
+
     total = 0
     for offers in state.get("offersByPlayer", {}).values():
         for offer in offers:
@@ -8905,6 +8950,9 @@ def find_existing_offer_for_team_player(
     team_name: str
 ) -> Optional[Dict[str, Any]]:
     offers = state.setdefault("offersByPlayer", {}).setdefault(player_key, [])
+    book = offer_book_for(state["offersByPlayer"])
+    if book is not None:
+        return book.active_for_team_player(team_name, player_key)
     for offer in offers:
         if offer.get("status", "active") == "active" and offer.get("teamName") == team_name:
             return offer
@@ -8939,6 +8987,9 @@ def upsert_offer_record(
 
     kept_offers.append(offer_record)
     offers_by_player[player_key] = kept_offers
+    book = offer_book_for(offers_by_player)
+    if book is not None:
+        book.add(player_key, offer_record)
 
     if replaced_any:
         state.setdefault("dailyLog", []).append({
@@ -9216,7 +9267,7 @@ def process_pending_rfa_match_decision(
     decision: str = "decline",
     rights_decisions: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     normalize_all_player_rights(updated)
     state = ensure_free_agency_state(updated)
 
@@ -9793,7 +9844,7 @@ def process_pending_user_decisions(
     rights_decisions: Optional[Dict[str, Any]] = None,
     declined_player_keys: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     normalize_all_player_rights(updated)
     state = ensure_free_agency_state(updated)
 
@@ -9918,7 +9969,7 @@ def process_pending_user_decisions(
     declined_set = {str(x) for x in (declined_player_keys or [])}
     rights_decisions = rights_decisions or {}
 
-    preview = copy.deepcopy(updated)
+    preview = clone_league_sharing_cold(updated)
     preview_state = ensure_free_agency_state(preview)
     current_day = int(num(preview_state.get("currentDay"), 1))
     max_days = int(num(preview_state.get("maxDays"), DEFAULT_FREE_AGENCY_DAYS))
@@ -10570,8 +10621,8 @@ def evaluate_market_offer_submission(
     decision_years = len(decision_salaries)
     decision_aav = int(sum(decision_salaries) / max(1, decision_years))
     expected_years = get_realistic_expected_contract_years(player)
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
-    min_acceptable_aav = int(num(market_value.get("minAcceptableAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
+    min_acceptable_aav = int(num(market_value.get("minAcceptableAAV"), current_min_deal()))
 
     salary_ratio = decision_aav / max(1, expected_aav)
     year_penalty = abs(decision_years - expected_years) * 0.06
@@ -10648,7 +10699,7 @@ def score_offer_for_player_with_fit(
     fit: Optional[Dict[str, Any]] = None,
 ) -> float:
     market_value = player.get("marketValue") or estimate_market_value(player, league_data)
-    expected_aav = int(max(MIN_DEAL, num(market_value.get("expectedAAV"), MIN_DEAL)))
+    expected_aav = int(max(current_min_deal(), num(market_value.get("expectedAAV"), current_min_deal())))
     expected_years = get_realistic_expected_contract_years(player)
 
     offered_aav = int(num(offer.get("decisionAAV"), num(offer.get("aav"), 0)))
@@ -10882,8 +10933,8 @@ def is_cpu_serious_offer_for_player(
         return False
 
     market_value = player.get("marketValue") or estimate_market_value(player, league_data)
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
-    min_acceptable_aav = int(num(market_value.get("minAcceptableAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
+    min_acceptable_aav = int(num(market_value.get("minAcceptableAAV"), current_min_deal()))
     salary_by_year = contract.get("salaryByYear", [])
     offered_years = len(salary_by_year)
     offered_aav = int(sum(salary_by_year) / max(1, offered_years))
@@ -10891,8 +10942,8 @@ def is_cpu_serious_offer_for_player(
 
     # Minimum offers are serious only for true depth/fringe players. This blocks
     # apron teams from fake-bidding on star or starter-level free agents.
-    if offered_aav <= int(MIN_DEAL * 1.25):
-        if expected_aav > int(MIN_DEAL * 1.55) and get_fa_market_equivalent_ovr(player) >= 75:
+    if offered_aav <= int(current_min_deal() * 1.25):
+        if expected_aav > int(current_min_deal() * 1.55) and get_fa_market_equivalent_ovr(player) >= 75:
             return False
         if current_day <= 2 and target_tier != "depth" and not incumbent_priority:
             return False
@@ -10904,7 +10955,7 @@ def is_cpu_serious_offer_for_player(
         max_days = max_days,
         incumbent_priority = incumbent_priority,
     )
-    serious_floor = max(MIN_DEAL, int(expected_aav * floor_ratio))
+    serious_floor = max(current_min_deal(), int(expected_aav * floor_ratio))
 
     if overall >= 84:
         serious_floor = max(serious_floor, int(min_acceptable_aav * 0.90))
@@ -10922,7 +10973,7 @@ def get_cpu_rights_hold_value_score(
 ) -> Dict[str, Any]:
     rights = get_player_rights(player)
     market_value = player.get("marketValue") or estimate_market_value(player, league_data)
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
     cap_hold = int(get_player_cap_hold_amount(
         league_data = league_data,
         player = player,
@@ -11345,7 +11396,7 @@ def classify_cpu_target_tier(
     potential = int(round(num(player.get("potential"), overall)))
     upside = max(0, potential - overall)
     market_value = player.get("marketValue") or estimate_market_value(player, league_data)
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
     need_score = float(num(fit.get("needScore"), 0.0))
     rights = get_player_rights(player)
 
@@ -11367,10 +11418,10 @@ def classify_cpu_target_tier(
     if market_ovr >= 75 and (need_score >= 0.38 or age <= 26 or upside >= 2):
         return "backup"
 
-    if market_ovr >= 72 and (need_score >= 0.30 or age <= 27 or upside >= 2 or expected_aav > int(MIN_DEAL * 1.55)):
+    if market_ovr >= 72 and (need_score >= 0.30 or age <= 27 or upside >= 2 or expected_aav > int(current_min_deal() * 1.55)):
         return "value"
 
-    if expected_aav <= int(MIN_DEAL * 1.55) or market_ovr <= 71:
+    if expected_aav <= int(current_min_deal() * 1.55) or market_ovr <= 71:
         return "depth"
 
     return "value"
@@ -11499,7 +11550,7 @@ def build_cpu_offer_contract(
     def_rating = int(round(num(player.get("defRating"), overall)))
     scoring_rating = int(round(num(player.get("scoringRating"), overall)))
 
-    expected_year1 = int(num(market_value.get("expectedYear1Salary"), MIN_DEAL))
+    expected_year1 = int(num(market_value.get("expectedYear1Salary"), current_min_deal()))
     expected_years = get_realistic_expected_contract_years(player)
     team_name = team.get("name")
     if snapshot is None:
@@ -11567,7 +11618,7 @@ def build_cpu_offer_contract(
         )
         return normalize_contract({
             "startYear": get_operating_season_year(league_data),
-            "salaryByYear": build_salary_by_year(MIN_DEAL, years),
+            "salaryByYear": build_salary_by_year(current_min_deal(), years),
             "option": option,
         })
 
@@ -11717,7 +11768,7 @@ def build_cpu_offer_contract(
 
     year1_salary = int(
         round_to_nearest(
-            clamp(expected_year1 * multiplier, MIN_DEAL, MAX_SALARY),
+            clamp(expected_year1 * multiplier, current_min_deal(), current_max_salary()),
             base = 1_000,
         )
     )
@@ -11743,13 +11794,13 @@ def build_cpu_offer_contract(
 
     # Cap offer at actual possible spending. If that makes it unserious, the
     # serious-bidder filter will drop the offer instead of creating fake bids.
-    if available_room <= MIN_DEAL:
-        year1_salary = MIN_DEAL
+    if available_room <= current_min_deal():
+        year1_salary = current_min_deal()
         years = 1 if age >= 29 else min(2, years)
     else:
         affordable_year1 = int(
             round_to_nearest(
-                clamp(available_room, MIN_DEAL, MAX_SALARY),
+                clamp(available_room, current_min_deal(), current_max_salary()),
                 base = 1_000,
             )
         )
@@ -11826,6 +11877,11 @@ def get_team_controlled_player_count(team: Dict[str, Any]) -> int:
     )
 
 
+# Lowest market OVR at which a player with no rights/previous-team tie to the
+# team can pass is_priority_offseason_overfill_candidate.
+PRIORITY_OVERFILL_UNRELATED_MIN_MARKET_OVR = 76
+
+
 def is_priority_offseason_overfill_candidate(
     player: Dict[str, Any],
     team_name: Optional[str],
@@ -11853,7 +11909,7 @@ def is_priority_offseason_overfill_candidate(
     potential = int(round(num(player.get("potential"), overall)))
     upside = max(0, potential - overall)
     market_value = player.get("marketValue") or estimate_market_value(player, league_data)
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
 
     if matched_rfa:
         return market_ovr >= 74 or potential >= 78 or age <= 25
@@ -12204,26 +12260,187 @@ def _materialize_cpu_offer_candidate(
     return True
 
 
+def _cpu_board_team_signature(team: Dict[str, Any], league_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    # Everything build_team_roster_profile reads: roster ratings/positions and
+    # the team's own recent season history rows.
+    history_rows = get_team_history_rows(league_data, get_team_name_from_team(team), max_seasons = 3)
+    return (
+        get_current_season_year(league_data),
+        json.dumps(history_rows, sort_keys = True, default = str),
+        tuple(
+            (p.get("overall"), p.get("age"), p.get("potential"), p.get("pos"), p.get("position"))
+            for p in team.get("players", [])
+        ),
+    )
+
+
+def _cpu_board_player_signature(player: Dict[str, Any]) -> Tuple[Any, ...]:
+    # Fields behind the fit score and rights relation.
+    rights = player.get("rights")
+    meta = player.get("freeAgencyMeta")
+    market_value = player.get("marketValue")
+    return (
+        player.get("name"),
+        player.get("overall"),
+        player.get("ovr"),
+        player.get("age"),
+        player.get("potential"),
+        player.get("pos"),
+        player.get("position"),
+        bool(player.get("rightsRenounced")),
+        repr(sorted(rights.items())) if isinstance(rights, dict) else None,
+        meta.get("fromTeam") if isinstance(meta, dict) else None,
+        market_value.get("expectedAAV") if isinstance(market_value, dict) else None,
+    )
+
+
+def _cpu_board_version(bucket: Dict[str, Any], key: str, signature: Tuple[Any, ...]) -> Tuple[int, bool]:
+    """Return (version, dirty) for a team/player, bumping the version on change."""
+    entry = bucket.get(key)
+    if entry is not None and entry["signature"] == signature:
+        return entry["version"], False
+    version = (entry["version"] + 1) if entry is not None else 0
+    bucket[key] = {"signature": signature, "version": version, "profile": None}
+    return version, True
+
+
+def _cpu_board_team_profile(team: Dict[str, Any], team_name: str, league_data: Dict[str, Any]) -> Tuple[Dict[str, Any], int, bool]:
+    version, dirty = _cpu_board_version(
+        _CPU_OFFER_BOARD["teams"],
+        team_name,
+        _cpu_board_team_signature(team, league_data),
+    )
+    entry = _CPU_OFFER_BOARD["teams"][team_name]
+    if entry["profile"] is None:
+        entry["profile"] = build_team_roster_profile(team, league_data = league_data)
+    # The board's copy stays private; callers store theirs in the save.
+    return copy.deepcopy(entry["profile"]), version, dirty
+
+
+def _cpu_board_player_row(player: Dict[str, Any], league_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Team-independent candidate facts, computed once per player per day."""
+    player_key = get_player_key_from_player(player)
+    version, dirty = _cpu_board_version(
+        _CPU_OFFER_BOARD["players"],
+        player_key,
+        _cpu_board_player_signature(player),
+    )
+    overall = int(round(num(player.get("overall"), 0)))
+    potential = int(round(num(player.get("potential"), overall)))
+    market_value = player.get("marketValue") or estimate_market_value(player, league_data)
+    previous_team = None
+    if isinstance(player.get("freeAgencyMeta"), dict):
+        previous_team = player["freeAgencyMeta"].get("fromTeam")
+    return {
+        "player": player,
+        "playerKey": player_key,
+        "version": version,
+        "dirty": dirty,
+        "overall": overall,
+        "age": int(num(player.get("age"), 27)),
+        "potential": potential,
+        "upside": max(0, potential - overall),
+        "expectedAAV": int(num(market_value.get("expectedAAV"), current_min_deal())),
+        "rights": get_player_rights(player),
+        "rightsTeam": get_rights_team(player),
+        "previousTeam": previous_team,
+    }
+
+
+def _cpu_board_relation(row: Dict[str, Any], team_name: str) -> Dict[str, Any]:
+    """Rights/incumbent facts for (player, team).
+
+    These only depend on whether the team holds the player's rights or was his
+    last team, so every unrelated team shares one cached entry per player.
+    """
+    related = team_name if team_name in (row["rightsTeam"], row["previousTeam"]) else None
+    key = (row["playerKey"], row["version"], related)
+    relations = _CPU_OFFER_BOARD["relations"]
+    relation = relations.get(key)
+    if relation is None:
+        player = row["player"]
+        relation = {
+            "ownRights": is_rights_team(player, team_name),
+            "previousTeamPlayer": bool(row["previousTeam"] and row["previousTeam"] == team_name),
+            "incumbentPriority": is_incumbent_retention_priority(player, team_name),
+            "debug": is_rfa_debug_target(player, team_name),
+            "related": related is not None,
+        }
+        relations[key] = relation
+    return relation
+
+
+def _cpu_board_fit(
+    team: Dict[str, Any],
+    team_name: str,
+    team_version: int,
+    profile: Dict[str, Any],
+    row: Dict[str, Any],
+    counters: Dict[str, int],
+) -> Dict[str, Any]:
+    key = (team_name, team_version, row["playerKey"], row["version"])
+    fits = _CPU_OFFER_BOARD["fits"]
+    fit = fits.get(key)
+    if fit is None:
+        counters["pairsScored"] += 1
+        fit = estimate_team_free_agent_fit_from_profile(
+            team = team,
+            player = row["player"],
+            profile = profile,
+        )
+        fits[key] = fit
+    else:
+        counters["pairsReused"] += 1
+    return {**fit, "weakestPositions": list(fit.get("weakestPositions", []) or [])}
+
+
+def _prune_cpu_offer_board(team_versions: Dict[str, int], player_versions: Dict[str, int]) -> None:
+    """Drop entries for old team/player versions and players no longer on the market."""
+    fits = _CPU_OFFER_BOARD["fits"]
+    stale = [
+        key for key in fits
+        if team_versions.get(key[0]) != key[1] or player_versions.get(key[2]) != key[3]
+    ]
+    for key in stale:
+        fits.pop(key, None)
+    if len(fits) > CPU_OFFER_BOARD_MAX_PAIRS:
+        fits.clear()
+
+    relations = _CPU_OFFER_BOARD["relations"]
+    for key in [key for key in relations if player_versions.get(key[0]) != key[1]]:
+        relations.pop(key, None)
+
+    players = _CPU_OFFER_BOARD["players"]
+    for key in [key for key in players if key not in player_versions]:
+        players.pop(key, None)
+
+
+def reset_cpu_offer_board() -> None:
+    for bucket in ("teams", "players", "relations", "fits"):
+        _CPU_OFFER_BOARD[bucket].clear()
+    _CPU_OFFER_BOARD["lastRun"] = {}
+    _CPU_OFFER_BOARD["leagueId"] = None
+
+
+def get_cpu_offer_board_stats() -> Dict[str, Any]:
+    return {
+        **_CPU_OFFER_BOARD["lastRun"],
+        "cachedPairs": len(_CPU_OFFER_BOARD["fits"]),
+        "cachedTeams": len(_CPU_OFFER_BOARD["teams"]),
+    }
+
+
 def generate_cpu_offers_for_day(
     league_data: Dict[str, Any],
     user_team_name: Optional[str] = None
 ) -> List[Dict[str, Any]]:
-    global _ACTIVE_FINANCIAL_RULES_CONTEXT
-
-    previous_context = _ACTIVE_FINANCIAL_RULES_CONTEXT
-    if _raw_get_financial_rules is not None:
-        _ACTIVE_FINANCIAL_RULES_CONTEXT = {
-            "leagueData": league_data,
-            "rules": _raw_get_financial_rules(league_data),
-        }
-
-    try:
+    # Board builds ask for the same league rules thousands of times; inside a
+    # request this joins the request's financial rules scope.
+    with financial_rules_scope():
         return _generate_cpu_offers_for_day_impl(
             league_data = league_data,
             user_team_name = user_team_name,
         )
-    finally:
-        _ACTIVE_FINANCIAL_RULES_CONTEXT = previous_context
 
 
 def _generate_cpu_offers_for_day_impl(
@@ -12237,6 +12454,13 @@ def _generate_cpu_offers_for_day_impl(
     season_year = get_current_season_year(league_data)
     offseason_min_target = get_free_agency_min_roster_target(league_data)
 
+    # Callers outside the registry skip its league reset; never carry a
+    # board from one league into another.
+    league_id = league_id_of(league_data)
+    if league_id != _CPU_OFFER_BOARD["leagueId"]:
+        reset_cpu_offer_board()
+        _CPU_OFFER_BOARD["leagueId"] = league_id
+
     generated = []
     refreshed_offer_ids = set()
 
@@ -12249,11 +12473,20 @@ def _generate_cpu_offers_for_day_impl(
         user_team_name = user_team_name,
     )
 
-    state["teamNeedProfiles"] = {
-        team.get("name"): build_team_roster_profile(team, league_data = league_data)
-        for _, _, team in iter_teams(league_data)
-        if team.get("name")
-    }
+    # Only teams whose roster changed since the last board rebuild their
+    # profile, and only dirty teams/players get their pair fits rescored.
+    board_counters = {"pairsScored": 0, "pairsReused": 0}
+    team_versions: Dict[str, int] = {}
+    dirty_teams = 0
+    team_need_profiles = {}
+    for _, _, team in iter_teams(league_data):
+        if not team.get("name"):
+            continue
+        profile, version, dirty = _cpu_board_team_profile(team, team.get("name"), league_data)
+        team_need_profiles[team.get("name")] = profile
+        team_versions[team.get("name")] = version
+        dirty_teams += int(dirty)
+    state["teamNeedProfiles"] = team_need_profiles
 
     free_agents = list(league_data.get("freeAgents", []))
     pending_user_player_keys = {
@@ -12261,6 +12494,38 @@ def _generate_cpu_offers_for_day_impl(
         for row in state.get("pendingUserDecisions", [])
         if isinstance(row, dict)
     }
+    player_rows = [_cpu_board_player_row(player, league_data) for player in free_agents]
+    player_versions = {row["playerKey"]: row["version"] for row in player_rows}
+    _prune_cpu_offer_board(team_versions, player_versions)
+
+    # Late retention only applies to the rights-holding team.
+    late_rights_retention_teams = {
+        row["rightsTeam"]
+        for row in player_rows
+        if row["rightsTeam"] and is_late_rights_retention_candidate(row["player"], row["rightsTeam"], current_day, max_days)
+    }
+    roster_limit = get_roster_limit(league_data)
+
+    # Teams at the roster limit only consider priority-overfill candidates:
+    # players tied to the team, unrelated players from the market-OVR floor up
+    # (a range query on the free-agent index), and debug targets, whose
+    # rejections are logged. Rows keep free-agent list order.
+    row_order = {id(row["player"]): pos for pos, row in enumerate(player_rows)}
+    rows_by_team: Dict[str, List[Dict[str, Any]]] = {}
+    for row in player_rows:
+        for tied_team in {row["rightsTeam"], row["previousTeam"]} - {None, ""}:
+            rows_by_team.setdefault(tied_team, []).append(row)
+    overfill_rows = None
+    free_agent_index = get_free_agent_index(league_data.get("freeAgents"))
+    if free_agent_index is not None:
+        overfill_rows = {
+            id(row["player"]): row
+            for row in player_rows
+            if is_rfa_debug_target(row["player"])
+        }
+        for player in free_agent_index.by_market_ovr(PRIORITY_OVERFILL_UNRELATED_MIN_MARKET_OVR):
+            if id(player) in row_order:
+                overfill_rows[id(player)] = player_rows[row_order[id(player)]]
 
     for _, _, team in iter_teams(league_data):
         team_name = team.get("name")
@@ -12275,10 +12540,7 @@ def _generate_cpu_offers_for_day_impl(
             team_name = team_name,
             state = None,
         )
-        has_late_rights_retention_candidate = any(
-            is_late_rights_retention_candidate(debug_player, team_name, current_day, max_days)
-            for debug_player in free_agents
-        )
+        has_late_rights_retention_candidate = team_name in late_rights_retention_teams
 
         if remaining_roster_slots <= 0 and not has_late_rights_retention_candidate:
             for debug_player in free_agents:
@@ -12381,36 +12643,49 @@ def _generate_cpu_offers_for_day_impl(
             continue
 
         active_offer_count = get_active_offer_count_for_team(state, team_name)
+        team_version = team_versions.get(team_name, -1)
+        over_standard_limit = actual_roster_count >= roster_limit
         candidates = []
 
-        for player in free_agents:
-            player_key = get_player_key_from_player(player)
+        team_rows = player_rows
+        if over_standard_limit and overfill_rows is not None:
+            scoped = dict(overfill_rows)
+            scoped.update((id(row["player"]), row) for row in rows_by_team.get(team_name, []))
+            team_rows = sorted(scoped.values(), key = lambda row: row_order[id(row["player"])])
+
+        for row in team_rows:
+            player = row["player"]
+            player_key = row["playerKey"]
             if player_key in pending_user_player_keys:
                 continue
 
-            overall = int(round(num(player.get("overall"), 0)))
-            age = int(num(player.get("age"), 27))
-            potential = int(round(num(player.get("potential"), overall)))
-            upside = max(0, potential - overall)
-            market_value = player.get("marketValue") or estimate_market_value(player, league_data)
-            expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
+            overall = row["overall"]
+            age = row["age"]
+            upside = row["upside"]
+            expected_aav = row["expectedAAV"]
+            rights = row["rights"]
+
+            relation = _cpu_board_relation(row, team_name)
+            own_rights = relation["ownRights"]
+            previous_team_player = relation["previousTeamPlayer"]
+            incumbent_priority = relation["incumbentPriority"]
+            late_rights_retention_candidate = bool(
+                relation["related"]
+                and is_late_rights_retention_candidate(player, team_name, current_day, max_days)
+            )
+            debug_this_candidate = relation["debug"]
 
-            rights = get_player_rights(player)
-            previous_team = None
-            if isinstance(player.get("freeAgencyMeta"), dict):
-                previous_team = player["freeAgencyMeta"].get("fromTeam")
-            own_rights = is_rights_team(player, team_name)
-            previous_team_player = bool(previous_team and previous_team == team_name)
-            incumbent_priority = is_incumbent_retention_priority(player, team_name)
-            late_rights_retention_candidate = is_late_rights_retention_candidate(player, team_name, current_day, max_days)
-            debug_this_candidate = is_rfa_debug_target(player, team_name)
-            over_standard_limit = actual_roster_count >= get_roster_limit(league_data)
-
-            if over_standard_limit and not late_rights_retention_candidate and not is_priority_offseason_overfill_candidate(
-                player = player,
-                team_name = team_name,
-                league_data = league_data,
-                matched_rfa = False,
+            # Not cached on the relation: it also reads the day's market value
+            # and the league minimum deal.
+            if (
+                over_standard_limit
+                and not late_rights_retention_candidate
+                and not is_priority_offseason_overfill_candidate(
+                    player = player,
+                    team_name = team_name,
+                    league_data = league_data,
+                    matched_rfa = False,
+                )
             ):
                 if debug_this_candidate:
                     record_fa_debug(
@@ -12421,8 +12696,8 @@ def _generate_cpu_offers_for_day_impl(
                         team_name = team_name,
                         payload = {
                             "actualRosterCount": actual_roster_count,
-                            "rosterLimit": get_roster_limit(league_data),
-                            "rightsTeam": get_player_rights(player).get("heldByTeam"),
+                            "rosterLimit": roster_limit,
+                            "rightsTeam": rights.get("heldByTeam"),
                             "ownRights": own_rights,
                             "previousTeamPlayer": previous_team_player,
                             "incumbentPriority": incumbent_priority,
@@ -12430,11 +12705,7 @@ def _generate_cpu_offers_for_day_impl(
                     )
                 continue
 
-            fit = estimate_team_free_agent_fit_from_profile(
-                team = team,
-                player = player,
-                profile = profile,
-            )
+            fit = _cpu_board_fit(team, team_name, team_version, profile, row, board_counters)
             fit_score = float(num(fit.get("interestScore"), 0.0))
             need_score = float(num(fit.get("needScore"), 0.0))
             position_bucket = fit.get("positionBucket")
@@ -12934,6 +13205,14 @@ def _generate_cpu_offers_for_day_impl(
                 "rightsTeamName": get_player_rights(player).get("heldByTeam"),
             })
 
+    _CPU_OFFER_BOARD["lastRun"] = {
+        "day": current_day,
+        "teams": len(team_versions),
+        "dirtyTeams": dirty_teams,
+        "players": len(player_rows),
+        "dirtyPlayers": sum(1 for row in player_rows if row["dirty"]),
+        **board_counters,
+    }
     return generated
 
 
@@ -13003,7 +13282,7 @@ def submit_user_free_agent_offer(
     player_name: Optional[str] = None,
     offer: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     normalize_all_player_rights(updated)
     state = ensure_free_agency_state(updated)
 
@@ -13204,7 +13483,7 @@ def should_match_restricted_free_agent_offer(
     offered_years = len(contract.get("salaryByYear", []))
     offered_aav = int(sum(contract.get("salaryByYear", [])) / max(1, offered_years))
 
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
     overall = int(round(num(player.get("overall"), 0)))
     age = int(num(player.get("age"), 24))
     potential = int(round(num(player.get("potential"), overall)))
@@ -13610,7 +13889,7 @@ def finalize_free_agent_signing_from_offer(
         contract = contract,
     )
 
-    free_agents.pop(player_idx)
+    pop_free_agent(free_agents, player_idx)
     team.setdefault("players", []).append(signed_player)
     record_rfa_debug(
         league_data,
@@ -13841,7 +14120,7 @@ def preview_rfa_offer_sheet_can_finalize_after_decline(
     if not chosen_offer or not chosen_offer.get("teamName"):
         return {"ok": False, "reason": "Offer sheet is missing an offering team."}
 
-    preview_league = copy.deepcopy(league_data)
+    preview_league = clone_league_sharing_cold(league_data)
     preview_free_agents = preview_league.setdefault("freeAgents", [])
     player_idx = find_free_agent_index(
         preview_free_agents,
@@ -14100,7 +14379,7 @@ def initialize_free_agency_period(
     user_team_name: Optional[str] = None,
     max_days: int = DEFAULT_FREE_AGENCY_DAYS
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
 
     season_year = get_current_season_year(updated)
     pre_fa_audit = audit_pre_free_agency_roster_contract_cleanup_needed(updated, season_year)
@@ -14263,8 +14542,11 @@ def advance_free_agency_day(
         return result
 
     stage_started = time.perf_counter()
-    updated = copy.deepcopy(league_data)
+    memo = cold_subtree_memo(league_data)
+    shared_cold_subtrees = len(memo)
+    updated = copy.deepcopy(league_data, memo)
     mark("deepCopyMs", stage_started)
+    perf["sharedColdSubtrees"] = shared_cold_subtrees
 
     stage_started = time.perf_counter()
     normalize_all_player_rights(updated)
@@ -14439,6 +14721,7 @@ def advance_free_agency_day(
         user_team_name = user_team_name,
     )
     mark("generateOffersMs", stage_started)
+    perf["cpuOfferBoard"] = get_cpu_offer_board_stats()
 
     state["dailyLog"].append({
         "day": state["currentDay"],
@@ -14487,7 +14770,7 @@ def get_market_acceptance_threshold(
     contract = normalize_contract(contract)
     if not contract:
         return {
-            "requiredAAV": MAX_SALARY,
+            "requiredAAV": current_max_salary(),
             "autoAccept": False,
             "offerCount": 0,
             "bestLiveAAV": 0,
@@ -14501,7 +14784,7 @@ def get_market_acceptance_threshold(
         or contract
     )
 
-    min_acceptable_aav = int(num(market_value.get("minAcceptableAAV"), MIN_DEAL))
+    min_acceptable_aav = int(num(market_value.get("minAcceptableAAV"), current_min_deal()))
     offered_years = len(decision_contract["salaryByYear"])
     offered_aav = int(sum(decision_contract["salaryByYear"]) / max(1, offered_years))
 
@@ -14538,18 +14821,18 @@ def get_market_acceptance_threshold(
         fringe_player
         and offer_count == 0
         and offered_years <= 2
-        and offered_aav >= MIN_DEAL
+        and offered_aav >= current_min_deal()
         and current_day >= max(5, int(max_days * 0.50))
     ):
         return {
-            "requiredAAV": MIN_DEAL,
+            "requiredAAV": current_min_deal(),
             "autoAccept": True,
             "offerCount": offer_count,
             "bestLiveAAV": best_live_aav,
             "fringePlayer": True,
         }
 
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
     option_mult = get_option_required_aav_multiplier(decision_contract)
 
     if offer_count == 0:
@@ -14569,7 +14852,7 @@ def get_market_acceptance_threshold(
 
         market_floor_mult = clamp(market_floor_mult, 0.72, 1.02)
         required_aav = max(
-            MIN_DEAL,
+            current_min_deal(),
             int(round(max(min_acceptable_aav, expected_aav * market_floor_mult) * option_mult)),
         )
     else:
@@ -14587,7 +14870,7 @@ def get_market_acceptance_threshold(
             market_floor_mult -= 0.03
 
         required_aav = max(
-            MIN_DEAL,
+            current_min_deal(),
             int(round(max(
                 best_live_aav * best_offer_mult,
                 expected_aav * market_floor_mult,
@@ -14673,8 +14956,8 @@ def evaluate_offer(
     offered_years = len(decision_contract["salaryByYear"])
     offered_aav = int(sum(decision_contract["salaryByYear"]) / max(1, offered_years))
     expected_years = get_realistic_expected_contract_years(player)
-    expected_aav = int(num(market_value.get("expectedAAV"), MIN_DEAL))
-    min_acceptable_aav = int(num(market_value.get("minAcceptableAAV"), MIN_DEAL))
+    expected_aav = int(num(market_value.get("expectedAAV"), current_min_deal()))
+    min_acceptable_aav = int(num(market_value.get("minAcceptableAAV"), current_min_deal()))
 
     market_threshold = get_market_acceptance_threshold(
         league_data = league_data,
@@ -14729,11 +15012,55 @@ def evaluate_offer(
     }
 
 
+def get_free_agent_index(free_agents: Any) -> Optional[Any]:
+    """FreeAgentIndex for this list inside a request scope, else None."""
+    return index_for(
+        free_agents,
+        key_fn = get_player_key_from_player,
+        ovr_fn = get_fa_market_equivalent_ovr,
+        position_fn = get_player_position_bucket,
+        salary_fn = lambda p: int(num((p.get("marketValue") or {}).get("expectedAAV"), current_min_deal())),
+    )
+
+
+def free_agents_at_or_above_overall(free_agents: Any, min_overall: int) -> List[Dict[str, Any]]:
+    """Free agents with visible OVR >= min_overall, in list order.
+
+    Market-equivalent OVR rises with visible OVR, so inside a request scope a
+    market-OVR range query narrows the pool before the exact filter.
+    """
+    index = get_free_agent_index(free_agents)
+    if index is not None:
+        pool = index.by_market_ovr(get_fa_market_equivalent_ovr({"overall": min_overall}))
+    else:
+        pool = free_agents or []
+    return [p for p in pool if int(num(p.get("overall"), 0)) >= min_overall]
+
+
+def pop_free_agent(free_agents: List[Dict[str, Any]], player_idx: int) -> Dict[str, Any]:
+    index = get_free_agent_index(free_agents)
+    if index is not None:
+        return index.pop(player_idx)
+    return free_agents.pop(player_idx)
+
+
+def append_free_agent(free_agents: List[Dict[str, Any]], player: Dict[str, Any]) -> None:
+    index = get_free_agent_index(free_agents)
+    if index is not None:
+        index.append(player)
+    else:
+        free_agents.append(player)
+
+
 def find_free_agent_index(
     free_agents: List[Dict[str, Any]],
     player_id: Optional[str],
     player_name: Optional[str]
 ) -> int:
+    index = get_free_agent_index(free_agents)
+    if index is not None:
+        return index.position(player_id, player_name)
+
     for idx, player in enumerate(free_agents):
         if player_id and player.get("id") == player_id:
             return idx
@@ -14749,7 +15076,7 @@ def sign_free_agent(
     player_name: Optional[str] = None,
     offer: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     normalize_all_player_rights(updated)
     free_agents = updated.setdefault("freeAgents", [])
 
@@ -14821,7 +15148,7 @@ def sign_free_agent(
         contract = signed_player.get("contract"),
     )
 
-    free_agents.pop(player_idx)
+    pop_free_agent(free_agents, player_idx)
     team.setdefault("players", []).append(signed_player)
 
     return {
@@ -14840,7 +15167,7 @@ def release_player(
     player_id: Optional[str] = None,
     player_name: Optional[str] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     season_year = get_current_season_year(updated)
     _, _, team = find_team_entry(updated, team_name)
 
@@ -14892,7 +15219,7 @@ def release_player(
         "reason": "released",
     }
 
-    updated.setdefault("freeAgents", []).append(released_player)
+    append_free_agent(updated.setdefault("freeAgents", []), released_player)
 
     return {
         "ok": True,
@@ -14909,7 +15236,7 @@ def preview_rights_management(
     league_data: Dict[str, Any],
     team_name: Optional[str] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     normalize_all_player_rights(updated)
     refresh_free_agent_market_values(updated)
 
@@ -15005,7 +15332,7 @@ def apply_rights_management(
     team_name: Optional[str] = None,
     rights_decisions: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     normalize_all_player_rights(updated)
     refresh_free_agent_market_values(updated)
 
@@ -15080,7 +15407,7 @@ def apply_rights_management(
 
             player["qualifyingOffer"] = {
                 "teamName": team_name,
-                "amount": int(round_to_nearest(max(MIN_DEAL, amount), base = 1_000)),
+                "amount": int(round_to_nearest(max(current_min_deal(), amount), base = 1_000)),
                 "seasonYear": int(num((eligible or {}).get("seasonYear"), get_current_season_year(updated) + 1)),
                 "status": "extended",
             }
@@ -15452,7 +15779,7 @@ def _build_pre_sim_one_year_offer(
     market = player.get("marketValue") if isinstance(player.get("marketValue"), dict) else estimate_market_value(player, league_data)
     expected = int(num(
         market.get("expectedYear1Salary"),
-        num(market.get("expectedAAV"), MIN_DEAL),
+        num(market.get("expectedAAV"), current_min_deal()),
     ))
     max_offer = int(num(capacity.get("maxOffer"), 0))
     if offer_cap_override is not None:
@@ -15570,7 +15897,7 @@ def _sign_high_value_free_agent_for_sim_start(
         contract = signed_player.get("contract"),
     )
 
-    free_agents.pop(player_idx)
+    pop_free_agent(free_agents, player_idx)
     team.setdefault("players", []).append(signed_player)
 
     current_salary = get_contract_salary_for_year(contract, season_year)
@@ -15687,9 +16014,8 @@ def sign_high_value_free_agents_before_simulation(
     def high_value_pool() -> List[Dict[str, Any]]:
         return sorted(
             [
-                p for p in (league_data.get("freeAgents") or [])
-                if int(num(p.get("overall"), 0)) >= PRE_SIM_QUALITY_FA_MIN_OVR
-                and get_player_key_from_player(p) not in unplaceable
+                p for p in free_agents_at_or_above_overall(league_data.get("freeAgents"), PRE_SIM_QUALITY_FA_MIN_OVR)
+                if get_player_key_from_player(p) not in unplaceable
             ],
             key = lambda p: (
                 int(num(p.get("overall"), 0)),
@@ -15791,10 +16117,14 @@ def sign_high_value_free_agents_before_simulation(
             two_way_assignments.extend(trim_actions.get("twoWayAssignments", []))
             two_way_drops.extend(trim_actions.get("twoWayDrops", []))
 
-        still_unsigned = any(
-            get_player_key_from_player(fa) == player_key
-            for fa in (league_data.get("freeAgents") or [])
-        )
+        fa_index = get_free_agent_index(league_data.get("freeAgents"))
+        if fa_index is not None:
+            still_unsigned = fa_index.contains(player_key)
+        else:
+            still_unsigned = any(
+                get_player_key_from_player(fa) == player_key
+                for fa in (league_data.get("freeAgents") or [])
+            )
         if still_unsigned:
             unplaceable.add(player_key)
         else:
@@ -15806,8 +16136,7 @@ def sign_high_value_free_agents_before_simulation(
             "playerName": p.get("name"),
             "overall": p.get("overall"),
         }
-        for p in (league_data.get("freeAgents") or [])
-        if int(num(p.get("overall"), 0)) >= PRE_SIM_QUALITY_FA_MIN_OVR
+        for p in free_agents_at_or_above_overall(league_data.get("freeAgents"), PRE_SIM_QUALITY_FA_MIN_OVR)
     ]
 
     return {
@@ -16058,7 +16387,7 @@ def repair_cpu_teams_to_min_roster(
     # The worker request already owns an isolated structured-clone/Pyodide copy.
     # A second Python deepcopy of the entire 2MB+ league is pure overhead for the
     # targeted post-trade path. The legacy/full path keeps its old copy semantics.
-    updated = league_data if targeted_mode else copy.deepcopy(league_data)
+    updated = league_data if targeted_mode else clone_league_sharing_cold(league_data)
     rating_freeze_snapshot = build_regular_season_rating_freeze_snapshot(updated)
 
     target_scope = set(scoped_team_names)
@@ -16267,6 +16596,13 @@ def repair_cpu_teams_to_min_roster(
     return result
 
 def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    # Free-agent / offer-book indexes and memoized financial rules live for
+    # exactly one request.
+    with free_agent_index_scope(), financial_rules_scope():
+        return _dispatch_request(request)
+
+
+def _dispatch_request(request: Dict[str, Any]) -> Dict[str, Any]:
     action = request.get("action")
     league_data = request.get("leagueData", {})
     payload = request.get("payload", {}) or {}
@@ -0,0 +1,318 @@
+"""
+free_agent_index.py
+Request-scoped indexes over the free-agent pool and the live offer book.
+
+free_agency_logic used to answer "where is this player", "how many active
+offers does this team have" and "which free agents are 80+" by walking
+league_data["freeAgents"] or every offersByPlayer list. Inside a
+free_agent_index_scope() the first lookup against a list builds a
+FreeAgentIndex for it:
+
+  - hash lookup by player key, id and name (first list position wins, same as
+    the linear scans)
+  - sorted buckets by market-equivalent OVR and asking salary, plus position
+    buckets, for range queries
+  - offers-by-team and offers-by-(team, player) reverse indexes over
+    freeAgencyState.offersByPlayer
+
+Writers keep the index in sync through pop()/append()/remove_matching().
+Every hit is re-checked against the live list (identity plus id/name), and a
+miss falls back to the linear scan, so a mutation that bypasses the index
+costs a rebuild instead of returning a wrong answer. Outside a scope the
+lookups return None and callers keep their original scans.
+"""
+from __future__ import annotations
+
+import bisect
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+FREE_AGENT_INDEX_VERSION = "2026-10-17_fa_index_v2"
+
+_ACTIVE_SCOPE: Optional[Dict[str, Dict[int, Any]]] = None
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class FreeAgentIndex:
+    """Lookup tables for one free-agent list object."""
+
+    def __init__(
+        self,
+        free_agents: List[Dict[str, Any]],
+        key_fn: Callable[[Dict[str, Any]], str],
+        ovr_fn: Callable[[Dict[str, Any]], float],
+        position_fn: Callable[[Dict[str, Any]], str],
+        salary_fn: Callable[[Dict[str, Any]], int],
+    ) -> None:
+        self.players = free_agents
+        self.key_fn = key_fn
+        self.ovr_fn = ovr_fn
+        self.position_fn = position_fn
+        self.salary_fn = salary_fn
+        self.rebuilds = 0
+        self.hits = 0
+        self.fallbacks = 0
+        self._size = -1
+        self._buckets: Optional[Dict[str, Any]] = None
+        self._rebuild()
+
+    # -- maintenance -------------------------------------------------
+    def _rebuild(self) -> None:
+        self.by_key: Dict[str, int] = {}
+        self.first_by_id: Dict[Any, int] = {}
+        self.first_by_name: Dict[Any, int] = {}
+        for pos, player in enumerate(self.players):
+            if isinstance(player, dict):
+                self._register(pos, player)
+        self._size = len(self.players)
+        self._buckets = None
+        self.rebuilds += 1
+
+    def _register(self, pos: int, player: Dict[str, Any]) -> None:
+        self.by_key.setdefault(self.key_fn(player), pos)
+        player_id = player.get("id")
+        if player_id not in (None, "") and _hashable(player_id):
+            self.first_by_id.setdefault(player_id, pos)
+        name = player.get("name")
+        if name not in (None, "") and _hashable(name):
+            self.first_by_name.setdefault(name, pos)
+
+    def _ensure_fresh(self) -> None:
+        if self._size != len(self.players):
+            self._rebuild()
+
+    def invalidate_buckets(self) -> None:
+        """Call after asking salaries (marketValue) are refreshed."""
+        self._buckets = None
+
+    # -- mutations ---------------------------------------------------
+    def append(self, player: Dict[str, Any]) -> None:
+        self._ensure_fresh()
+        self.players.append(player)
+        if isinstance(player, dict):
+            self._register(len(self.players) - 1, player)
+        self._size = len(self.players)
+        self._buckets = None
+
+    def pop(self, pos: int) -> Dict[str, Any]:
+        player = self.players.pop(pos)
+        # Positions after `pos` shift; rebuild lazily on the next lookup.
+        self._size = -1
+        return player
+
+    def remove_matching(self, player_id: Optional[Any], player_name: Optional[str]) -> None:
+        """In-place filter with remove_existing_free_agent_match semantics."""
+        self.players[:] = [
+            p for p in self.players
+            if not (
+                (player_id not in [None, ""] and p.get("id") == player_id)
+                or (player_name not in [None, ""] and p.get("name") == player_name)
+            )
+        ]
+        self._size = -1
+
+    # -- lookups -----------------------------------------------------
+    def _verified(self, table: Dict[Any, int], field: str, value: Any) -> Optional[int]:
+        if not _hashable(value):
+            return None
+        pos = table.get(value)
+        if pos is None:
+            return None
+        if pos < len(self.players) and isinstance(self.players[pos], dict) and self.players[pos].get(field) == value:
+            return pos
+        # Stale position: something mutated the list behind our back.
+        self._rebuild()
+        table = self.first_by_name if field == "name" else self.first_by_id
+        return table.get(value)
+
+    def position(self, player_id: Optional[Any], player_name: Optional[str]) -> int:
+        """find_free_agent_index semantics: first list position matching id or name."""
+        self._ensure_fresh()
+        found = []
+        if player_id:
+            pos = self._verified(self.first_by_id, "id", player_id)
+            if pos is not None:
+                found.append(pos)
+        if player_name:
+            pos = self._verified(self.first_by_name, "name", player_name)
+            if pos is not None:
+                found.append(pos)
+        if found:
+            self.hits += 1
+            return min(found)
+
+        self.fallbacks += 1
+        for pos, player in enumerate(self.players):
+            if player_id and player.get("id") == player_id:
+                return pos
+            if player_name and player.get("name") == player_name:
+                return pos
+        return -1
+
+    def get(self, player_key: str) -> Optional[Dict[str, Any]]:
+        self._ensure_fresh()
+        pos = self.by_key.get(player_key)
+        if pos is not None and pos < len(self.players):
+            player = self.players[pos]
+            if isinstance(player, dict) and self.key_fn(player) == player_key:
+                self.hits += 1
+                return player
+        self.fallbacks += 1
+        for player in self.players:
+            if isinstance(player, dict) and self.key_fn(player) == player_key:
+                self._rebuild()
+                return player
+        return None
+
+    def contains(self, player_key: str) -> bool:
+        return self.get(player_key) is not None
+
+    # -- range queries -----------------------------------------------
+    def _ensure_buckets(self) -> Dict[str, Any]:
+        self._ensure_fresh()
+        if self._buckets is None:
+            by_ovr: List[Tuple[float, int]] = []
+            by_salary: List[Tuple[int, int]] = []
+            by_position: Dict[str, List[int]] = {}
+            for pos, player in enumerate(self.players):
+                if not isinstance(player, dict):
+                    continue
+                by_ovr.append((float(self.ovr_fn(player)), pos))
+                by_salary.append((int(self.salary_fn(player)), pos))
+                by_position.setdefault(self.position_fn(player), []).append(pos)
+            by_ovr.sort()
+            by_salary.sort()
+            self._buckets = {
+                "ovr": by_ovr,
+                "ovrKeys": [value for value, _ in by_ovr],
+                "salary": by_salary,
+                "salaryKeys": [value for value, _ in by_salary],
+                "position": by_position,
+            }
+        return self._buckets
+
+    def _range(self, kind: str, low: Optional[float], high: Optional[float]) -> List[Dict[str, Any]]:
+        buckets = self._ensure_buckets()
+        keys = buckets[kind + "Keys"]
+        start = 0 if low is None else bisect.bisect_left(keys, low)
+        stop = len(keys) if high is None else bisect.bisect_right(keys, high)
+        positions = sorted(pos for _, pos in buckets[kind][start:stop])
+        return [self.players[pos] for pos in positions]
+
+    def by_market_ovr(self, low: Optional[float] = None, high: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Free agents with low <= market-equivalent OVR <= high, in list order."""
+        return self._range("ovr", low, high)
+
+    def by_asking_salary(self, low: Optional[int] = None, high: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Free agents with low <= asking AAV <= high, in list order."""
+        return self._range("salary", low, high)
+
+    def by_position(self, bucket: str) -> List[Dict[str, Any]]:
+        positions = self._ensure_buckets()["position"].get(bucket, [])
+        return [self.players[pos] for pos in positions]
+
+
+class OfferBook:
+    """Offers-by-team and by-(team, player) indexes over one offersByPlayer dict.
+
+    Entries are references to the offer dicts. An entry only counts while the
+    offer is still in its player's list and its status/team still match, so
+    withdrawals, replacements and deletions need no bookkeeping here.
+    """
+
+    def __init__(self, offers_by_player: Dict[str, List[Dict[str, Any]]]) -> None:
+        self.offers_by_player = offers_by_player
+        self.by_team: Dict[str, Dict[int, Tuple[str, Dict[str, Any]]]] = {}
+        self.by_pair: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for player_key, offers in offers_by_player.items():
+            for offer in offers or []:
+                self.add(player_key, offer)
+
+    def add(self, player_key: str, offer: Dict[str, Any]) -> None:
+        if not isinstance(offer, dict):
+            return
+        team_name = offer.get("teamName")
+        if not team_name:
+            return
+        self.by_team.setdefault(team_name, {})[id(offer)] = (player_key, offer)
+        self.by_pair.setdefault((team_name, player_key), []).append(offer)
+
+    def _is_live(self, player_key: str, offer: Dict[str, Any]) -> bool:
+        offers = self.offers_by_player.get(player_key)
+        return bool(offers) and any(row is offer for row in offers)
+
+    def active_for_team(self, team_name: str) -> List[Dict[str, Any]]:
+        entries = self.by_team.get(team_name)
+        if not entries:
+            return []
+        active = []
+        for key, (player_key, offer) in list(entries.items()):
+            if offer.get("teamName") != team_name or not self._is_live(player_key, offer):
+                del entries[key]
+                continue
+            if offer.get("status", "active") == "active":
+                active.append(offer)
+        return active
+
+    def active_for_player(self, player_key: str) -> List[Dict[str, Any]]:
+        """Active offers for one player, in list order."""
+        return [o for o in self.offers_by_player.get(player_key) or [] if o.get("status", "active") == "active"]
+
+    def active_for_team_player(self, team_name: str, player_key: str) -> Optional[Dict[str, Any]]:
+        """First active offer from team_name in player_key's list, or None."""
+        entries = self.by_pair.get((team_name, player_key))
+        if not entries:
+            return None
+        entries[:] = [o for o in entries if o.get("teamName") == team_name and self._is_live(player_key, o)]
+        active = [o for o in entries if o.get("status", "active") == "active"]
+        if len(active) <= 1:
+            return active[0] if active else None
+        ids = {id(o) for o in active}
+        return next(o for o in self.offers_by_player[player_key] if id(o) in ids)
+
+
+@contextmanager
+def free_agent_index_scope() -> Iterator[None]:
+    """Enable index lookups for the duration of one request."""
+    global _ACTIVE_SCOPE
+    previous = _ACTIVE_SCOPE
+    _ACTIVE_SCOPE = {"players": {}, "offers": {}}
+    try:
+        yield
+    finally:
+        _ACTIVE_SCOPE = previous
+
+
+def index_for(
+    free_agents: Any,
+    key_fn: Callable[[Dict[str, Any]], str],
+    ovr_fn: Callable[[Dict[str, Any]], float],
+    position_fn: Callable[[Dict[str, Any]], str],
+    salary_fn: Callable[[Dict[str, Any]], int],
+) -> Optional[FreeAgentIndex]:
+    scope = _ACTIVE_SCOPE
+    if scope is None or not isinstance(free_agents, list):
+        return None
+    index = scope["players"].get(id(free_agents))
+    if index is None or index.players is not free_agents:
+        index = FreeAgentIndex(free_agents, key_fn, ovr_fn, position_fn, salary_fn)
+        scope["players"][id(free_agents)] = index
+    return index
+
+
+def offer_book_for(offers_by_player: Any) -> Optional[OfferBook]:
+    scope = _ACTIVE_SCOPE
+    if scope is None or not isinstance(offers_by_player, dict):
+        return None
+    book = scope["offers"].get(id(offers_by_player))
+    if book is None or book.offers_by_player is not offers_by_player:
+        book = OfferBook(offers_by_player)
+        scope["offers"][id(offers_by_player)] = book
+    return book
@@ -3,6 +3,7 @@
 # FULL, CLEAN, FINAL VERSION — Pyodide safe, no duplication, no broken indentation
 #
 import asyncio
+import hashlib
 import math
 import random
 BM_SIM_DEBUG_LOGS = False
@@ -13,6 +14,11 @@ BM_SIM_DEBUG_LOGS = False
 # and random-number calls/order are unchanged.
 BM_GAME_COOPERATIVE_YIELDS = False
 
+# Box-score backend: "python" is the reference per-player engine below;
+# "numpy" uses box_score_numpy (whole-roster array draws). Falls back to
+# "python" automatically when NumPy is not loaded.
+BM_BOX_SCORE_BACKEND = "python"
+
 async def _bm_game_cooperative_yield():
     if BM_GAME_COOPERATIVE_YIELDS:
         await asyncio.sleep(0)
@@ -24,6 +30,12 @@ from steals import steals_per36, noisy_steals
 from blocks import blocks_per36, noisy_blocks
 from shooting_model import simulate_one_game
 
+try:
+    from box_score_numpy import NUMPY_AVAILABLE, build_box_numpy
+except Exception:  # pragma: no cover - optional backend
+    NUMPY_AVAILABLE = False
+    build_box_numpy = None
+
 from efficiency import (
     fatigue_penalty, coverage_penalty, empty_minutes_penalty,
     star_boost, scale_range,
@@ -38,8 +50,8 @@ from efficiency import (
 def clamp(x, lo, hi):
     return max(lo, min(hi, x))
 
-def gauss(mu, sigma):
-    return random.gauss(mu, sigma)
+def gauss(mu, sigma, rng=None):
+    return (rng or random).gauss(mu, sigma)
 
 
 def _iq_based_rate_per36(iq_value, floor=0.1, spread=4.4):
@@ -55,8 +67,9 @@ def _iq_based_rate_per36(iq_value, floor=0.1, spread=4.4):
     iq = clamp(iq, 60.0, 95.0)
     return floor + ((95.0 - iq) / 35.0) * spread
 
-def _poisson_sample(expected):
+def _poisson_sample(expected, rng=None):
     """Small dependency-free Poisson sampler for box-score counting stats."""
+    rng = rng or random
     try:
         lam = float(expected)
     except Exception:
@@ -69,7 +82,7 @@ def _poisson_sample(expected):
     product = 1.0
     while product > limit and k < 30:
         k += 1
-        product *= random.random()
+        product *= rng.random()
     return max(0, k - 1)
 
 def expected_turnovers_per36(offensive_iq):
@@ -78,7 +91,7 @@ def expected_turnovers_per36(offensive_iq):
 def expected_fouls_per36(defensive_iq):
     return _iq_based_rate_per36(defensive_iq, floor=0.1, spread=5.9)
 
-def generate_turnovers_and_fouls(player, minutes):
+def generate_turnovers_and_fouls(player, minutes, rng=None):
     attrs = player.get("attrs") or []
     offensive_iq = attrs[13] if len(attrs) > 13 else player.get("offensiveIQ", player.get("offIq", 75))
     defensive_iq = attrs[14] if len(attrs) > 14 else player.get("defensiveIQ", player.get("defIq", 75))
@@ -91,16 +104,129 @@ def generate_turnovers_and_fouls(player, minutes):
     tov_mean = expected_turnovers_per36(offensive_iq) * mins / 36.0
     pf_mean = expected_fouls_per36(defensive_iq) * mins / 36.0
 
-    turnovers = _poisson_sample(tov_mean)
-    fouls = min(_poisson_sample(pf_mean), 6)
+    turnovers = _poisson_sample(tov_mean, rng)
+    fouls = min(_poisson_sample(pf_mean, rng), 6)
 
     return turnovers, fouls
 
+# ------------------------------------------------------------
+# PER-GAME RNG STREAMS
+# ------------------------------------------------------------
+
+# simulate_game(home, away, rng) draws everything for one game (score,
+# quarters, minutes, box score, stat noise) from a single random.Random, so
+# the result depends only on that game's stream: not on game order, on which
+# pool worker ran it, or on what that worker simulated before. Streams are
+# keyed by (master seed, season, game id); an explicit seed wins. The game id
+# must be the schedule's stable id, never a per-process or per-message
+# counter. Without a stream the global random module is used exactly as
+# before. The worker sets the master seed on every sim request, so one
+# request's seed never carries over to the next.
+GAME_RNG_MASTER_SEED = None
+
+
+def set_game_rng_master_seed(seed):
+    """Master seed for game-id keyed streams (None = global random module)."""
+    global GAME_RNG_MASTER_SEED
+    GAME_RNG_MASTER_SEED = None if seed is None else int(seed)
+    return GAME_RNG_MASTER_SEED
+
+
+def game_rng_seed(game_id, season=None, master_seed=None):
+    """Stable 64-bit seed for one game (hash() is salted per process)."""
+    key = f"{master_seed if master_seed is not None else ''}|{season if season is not None else ''}|{game_id}"
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big")
+
+
+def make_game_rng(seed=None, game_id=None, season=None, master_seed=None):
+    """random.Random for one game, or None to keep the global stream."""
+    if seed is not None:
+        return random.Random(int(seed))
+    master = GAME_RNG_MASTER_SEED if master_seed is None else master_seed
+    if master is None or game_id is None:
+        return None
+    return random.Random(game_rng_seed(game_id, season, master))
+
 # ------------------------------------------------------------
 # TEAM RATINGS
 # ------------------------------------------------------------
 
+# Team ratings only depend on the rotation: who plays, their ratings and
+# stamina, and the minutes map. That rarely changes between games, so results
+# are memoized by a rotation signature. Injuries, trades and gameplan edits
+# change the signature and miss naturally; invalidate_team_ratings() is there
+# for callers that edit rosters in place. Cached results are shared: treat
+# them as read-only.
+TEAM_RATING_CACHE_MAX = 256
+_team_rating_cache = {}
+_team_rating_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def _team_rating_signature(team, mins):
+    rows = []
+    for p in team["players"]:
+        m = mins.get(p["name"], 0)
+        if m <= 0:
+            continue
+        rows.append((
+            p.get("id"),
+            p.get("name", "Unknown"),
+            m,
+            p.get("pos", "SG"),
+            p.get("secondaryPos"),
+            p.get("overall", 75),
+            p.get("offRating", 75),
+            p.get("defRating", 75),
+            p.get("stamina", 75),
+        ))
+    return (team.get("name"), tuple(rows))
+
+
 def compute_team_ratings(team, mins):
+    try:
+        key = _team_rating_signature(team, mins)
+        cached = _team_rating_cache.get(key)
+    except TypeError:  # unhashable rating values; skip the cache
+        return _compute_team_ratings_uncached(team, mins)
+
+    if cached is not None:
+        _team_rating_cache_stats["hits"] += 1
+        return cached
+
+    _team_rating_cache_stats["misses"] += 1
+    result = _compute_team_ratings_uncached(team, mins)
+    if len(_team_rating_cache) >= TEAM_RATING_CACHE_MAX:
+        _team_rating_cache.pop(next(iter(_team_rating_cache)))
+    _team_rating_cache[key] = result
+    return result
+
+
+def invalidate_team_ratings(team_name=None):
+    """Drop cached ratings for one team (by name) or for every team."""
+    if team_name is None:
+        dropped = len(_team_rating_cache)
+        _team_rating_cache.clear()
+    else:
+        stale = [key for key in _team_rating_cache if key[0] == team_name]
+        for key in stale:
+            del _team_rating_cache[key]
+        dropped = len(stale)
+    _team_rating_cache_stats["invalidations"] += dropped
+    return dropped
+
+
+def get_team_rating_cache_stats():
+    hits = _team_rating_cache_stats["hits"]
+    misses = _team_rating_cache_stats["misses"]
+    lookups = hits + misses
+    return {
+        **_team_rating_cache_stats,
+        "size": len(_team_rating_cache),
+        "hitRate": round(hits / lookups, 4) if lookups else 0.0,
+    }
+
+
+def _compute_team_ratings_uncached(team, mins):
     roster = []
     pos_min = {"PG": 0, "SG": 0, "SF": 0, "PF": 0, "C": 0}
     total_minutes = 0
@@ -215,12 +341,13 @@ def sigma_total(d):
 # QUARTER / OT / MINUTES HELPERS
 # ------------------------------------------------------------
 
-def _weighted_pick(items, weights):
+def _weighted_pick(items, weights, rng=None):
+    rng = rng or random
     total = sum(max(0, w) for w in weights)
     if total <= 0:
-        return random.choice(items)
+        return rng.choice(items)
 
-    roll = random.random() * total
+    roll = rng.random() * total
     running = 0
     for item, weight in zip(items, weights):
         running += max(0, weight)
@@ -229,7 +356,8 @@ def _weighted_pick(items, weights):
 
     return items[-1]
 
-def _split_total_by_weights(total, weights):
+def _split_total_by_weights(total, weights, rng=None):
+    rng = rng or random
     if total <= 0:
         return [0, 0, 0, 0]
 
@@ -239,38 +367,40 @@ def _split_total_by_weights(total, weights):
 
     while diff != 0:
         if diff > 0:
-            i = random.randrange(4)
+            i = rng.randrange(4)
             scaled[i] += 1
             diff -= 1
         else:
             eligible = [i for i, value in enumerate(scaled) if value > 0]
             if not eligible:
                 break
-            i = random.choice(eligible)
+            i = rng.choice(eligible)
             scaled[i] -= 1
             diff += 1
 
     return scaled
 
-def qsplit(total):
+def qsplit(total, rng=None):
+    rng = rng or random
     # Fallback single-team splitter. The paired splitter below is used for games.
-    weights = [max(0.12, random.gauss(0.25, 0.055)) for _ in range(4)]
-    return _split_total_by_weights(total, weights)
+    weights = [max(0.12, rng.gauss(0.25, 0.055)) for _ in range(4)]
+    return _split_total_by_weights(total, weights, rng)
 
-def split_regulation_quarters(home_total, away_total):
+def split_regulation_quarters(home_total, away_total, rng=None):
+    rng = rng or random
     # Shared pace creates game-flow quarters where both teams can run hot/cold.
-    shared_pace = [max(0.15, random.gauss(1.0, 0.12)) for _ in range(4)]
+    shared_pace = [max(0.15, rng.gauss(1.0, 0.12)) for _ in range(4)]
 
     # Team noise creates individual quarter swings and comebacks.
-    home_weights = [max(0.10, shared_pace[i] * random.gauss(1.0, 0.14)) for i in range(4)]
-    away_weights = [max(0.10, shared_pace[i] * random.gauss(1.0, 0.14)) for i in range(4)]
+    home_weights = [max(0.10, shared_pace[i] * rng.gauss(1.0, 0.14)) for i in range(4)]
+    away_weights = [max(0.10, shared_pace[i] * rng.gauss(1.0, 0.14)) for i in range(4)]
 
     return (
-        _split_total_by_weights(home_total, home_weights),
-        _split_total_by_weights(away_total, away_weights),
+        _split_total_by_weights(home_total, home_weights, rng),
+        _split_total_by_weights(away_total, away_weights, rng),
     )
 
-def simulate_ot_period(total_mu, margin_mu, dOvr):
+def simulate_ot_period(total_mu, margin_mu, dOvr, rng=None):
     ot_scale = 5.0 / 48.0
 
     ot_total_mu = clamp(total_mu * ot_scale, 16, 34)
@@ -279,8 +409,8 @@ def simulate_ot_period(total_mu, margin_mu, dOvr):
     sigmaT = clamp(sigma_total(dOvr) * 0.35, 2.8, 5.8)
     sigmaM = clamp(sigma_margin(dOvr) * 0.30, 2.8, 5.8)
 
-    sampled_total = clamp(round(gauss(ot_total_mu, sigmaT)), 10, 44)
-    sampled_margin = gauss(ot_margin_mu, sigmaM)
+    sampled_total = clamp(round(gauss(ot_total_mu, sigmaT, rng)), 10, 44)
+    sampled_margin = gauss(ot_margin_mu, sigmaM, rng)
 
     otH = clamp(round((sampled_total + sampled_margin) / 2), 4, 24)
     otA = clamp(round(sampled_total - otH), 4, 24)
@@ -302,7 +432,7 @@ def _minute_variance(base_minutes):
         return 2
     return 1
 
-def vary_game_minutes(team, base_mins, ot_count):
+def vary_game_minutes(team, base_mins, ot_count, rng=None):
     """Create legal box-score minutes from a coach gameplan.
 
     Regulation games cannot give any player more than 48 minutes. Overtime
@@ -310,6 +440,7 @@ def vary_game_minutes(team, base_mins, ot_count):
     when the game actually went to OT. The team total is still balanced to the
     real game length by pushing leftover minutes to other eligible players.
     """
+    rng = rng or random
     ot_count = int(ot_count or 0)
     target_total = 240 + 25 * ot_count
     max_player_minutes = 48 + 5 * ot_count
@@ -372,7 +503,7 @@ def vary_game_minutes(team, base_mins, ot_count):
             continue
 
         ot_bonus = 5 * ot_count if name in starters else 0
-        delta = random.randint(-_minute_variance(base), _minute_variance(base))
+        delta = rng.randint(-_minute_variance(base), _minute_variance(base))
         actual[name] = int(clamp(base + ot_bonus + delta, 1, max_player_minutes))
 
     diff = target_total - sum(actual[name] for name in active_names)
@@ -392,7 +523,7 @@ def vary_game_minutes(team, base_mins, ot_count):
                 break
 
             weights = [max(1, base_by_name.get(name, 0), actual.get(name, 0)) for name in eligible]
-            name = _weighted_pick(eligible, weights)
+            name = _weighted_pick(eligible, weights, rng)
             actual[name] += 1
             diff -= 1
             continue
@@ -414,7 +545,7 @@ def vary_game_minutes(team, base_mins, ot_count):
         ]
         pool = preferred or removable
         weights = [max(1, actual.get(name, 0)) for name in pool]
-        name = _weighted_pick(pool, weights)
+        name = _weighted_pick(pool, weights, rng)
         actual[name] -= 1
         diff += 1
 
@@ -430,10 +561,11 @@ def lin(x, x1, y1, x2, y2):
         return y2
     return y1 + (y2 - y1) * ((x - x1) / (x2 - x1))
 
-def bino(n, p):
+def bino(n, p, rng=None):
+    rng = rng or random
     c = 0
     for _ in range(n):
-        if random.random() < p:
+        if rng.random() < p:
             c += 1
     return c
 
@@ -551,7 +683,8 @@ def shot_dist(r3, rMid, rClose):
 
     return f3, fMid, fClose
 
-def reconcile_line(stats, target_pts, player):
+def reconcile_line(stats, target_pts, player, rng=None):
+    rng = rng or random
     r3, rMid, rClose, _ = player["attrs"][:4]
     off = player["offRating"]
 
@@ -585,7 +718,7 @@ def reconcile_line(stats, target_pts, player):
             for _ in range(max(0, need2)):
                 if diff <= 0:
                     break
-                roll = random.random()
+                roll = rng.random()
                 if midM < midA and roll < pmid_w:
                     midM += 1
                     diff -= 2
@@ -608,7 +741,7 @@ def reconcile_line(stats, target_pts, player):
             if diff == 1 and threeM < threeA and (midM > 0 or closeM > 0):
                 threeM += 1
                 diff -= 3
-                if midM > 0 and random.random() < pmid_w:
+                if midM > 0 and rng.random() < pmid_w:
                     midM -= 1
                     diff += 2
                 elif closeM > 0:
@@ -620,7 +753,7 @@ def reconcile_line(stats, target_pts, player):
                 if diff >= 0:
                     break
                 if midM > 0 or closeM > 0:
-                    roll = random.random()
+                    roll = rng.random()
                     if midM > 0 and roll < pmid_w:
                         midM -= 1
                         diff += 2
@@ -643,7 +776,7 @@ def reconcile_line(stats, target_pts, player):
             if diff == -1 and threeM > 0 and (midM < midA or closeM < closeA):
                 threeM -= 1
                 diff += 3
-                roll = random.random()
+                roll = rng.random()
                 if midM < midA and roll < pmid_w:
                     midM += 1
                     diff -= 2
@@ -655,7 +788,7 @@ def reconcile_line(stats, target_pts, player):
 
     if diff > 0:
         while diff > 0 and (midM < midA or closeM < closeA or threeM < threeA):
-            if midM < midA and random.random() < pmid_w:
+            if midM < midA and rng.random() < pmid_w:
                 midM += 1
                 diff -= 2
                 continue
@@ -674,7 +807,7 @@ def reconcile_line(stats, target_pts, player):
             diff = 0
     elif diff < 0:
         while diff < 0 and (midM > 0 or closeM > 0 or threeM > 0):
-            if midM > 0 and random.random() < pmid_w:
+            if midM > 0 and rng.random() < pmid_w:
                 midM -= 1
                 diff += 2
                 continue
@@ -700,7 +833,8 @@ def reconcile_line(stats, target_pts, player):
 
     return threeM, midM, closeM, FTM, FTA
 
-def simulate_player_line(player, minutes, target_pts, league_off_avg, league_ft_avg):
+def simulate_player_line(player, minutes, target_pts, league_off_avg, league_ft_avg, rng=None):
+    rng = rng or random
     r3, rMid, rClose, rFT = player["attrs"][:4]
     off = player["offRating"]
 
@@ -713,11 +847,11 @@ def simulate_player_line(player, minutes, target_pts, league_off_avg, league_ft_
 
     exp_pts = PP36(off) * (minutes / 36.0)
     ratio = target_pts / exp_pts if exp_pts > 0 else 1.0
-    E = clamp(random.gauss(ratio, 0.15), 0.55, 1.55)
+    E = clamp(rng.gauss(ratio, 0.15), 0.55, 1.55)
 
     exp_pp_fga = clamp(1.20 + 0.15 * ((off - league_off_avg) / 20.0), 0.9, 1.5)
     rawFGA = target_pts / (exp_pp_fga * E)
-    rawFGA *= random.gauss(1.0, 0.05)
+    rawFGA *= rng.gauss(1.0, 0.05)
     FGA = max(1, int(rawFGA))
 
     tr = FTr(rClose)
@@ -737,10 +871,10 @@ def simulate_player_line(player, minutes, target_pts, league_off_avg, league_ft_
         if FTA % 2 == 1 and target_pts > 1:
             FTA += 1
 
-    threeM = bino(threeA, p3r)
-    midM = bino(midA, pMr)
-    closeM = bino(closeA, pCr)
-    FTM = bino(FTA, pFTr)
+    threeM = bino(threeA, p3r, rng)
+    midM = bino(midA, pMr, rng)
+    closeM = bino(closeA, pCr, rng)
+    FTM = bino(FTA, pFTr, rng)
 
     stats = {
         "FGA": FGA,
@@ -755,7 +889,7 @@ def simulate_player_line(player, minutes, target_pts, league_off_avg, league_ft_
         "minutes": minutes,
     }
 
-    threeM, midM, closeM, FTM, FTA = reconcile_line(stats, target_pts, player)
+    threeM, midM, closeM, FTM, FTA = reconcile_line(stats, target_pts, player, rng)
     FGM = threeM + midM + closeM
     pts = FTM + threeM * 3 + (midM + closeM) * 2
 
@@ -821,7 +955,20 @@ def simulate_player_line(player, minutes, target_pts, league_off_avg, league_ft_
 # BOX SCORE GENERATION (FULL FUNCTION)
 # ------------------------------------------------------------
 
-async def build_box(team, mins, team_points, ratings):
+def set_box_score_backend(backend):
+    """Select the box-score backend; returns the backend actually in use."""
+    global BM_BOX_SCORE_BACKEND
+    if backend == "numpy" and NUMPY_AVAILABLE and build_box_numpy is not None:
+        BM_BOX_SCORE_BACKEND = "numpy"
+    else:
+        BM_BOX_SCORE_BACKEND = "python"
+    return BM_BOX_SCORE_BACKEND
+
+async def build_box(team, mins, team_points, ratings, rng=None):
+    if BM_BOX_SCORE_BACKEND == "numpy" and build_box_numpy is not None:
+        return build_box_numpy(team, mins, team_points, ratings, rng)
+    rng = rng or random
+
     players = team["players"]
 
     active = []
@@ -839,12 +986,12 @@ async def build_box(team, mins, team_points, ratings):
         sr = p.get("scoringRating", 0)
         expected.append(scoring_to_game_points(sr, p["minutes"]))
 
-    raw = [max(0, gauss(exp, max(1.2, math.sqrt(exp)*0.9))) for exp in expected]
+    raw = [max(0, gauss(exp, max(1.2, math.sqrt(exp)*0.9), rng)) for exp in expected]
     pts = [round(x) for x in raw]
 
     diff = team_points - sum(pts)
     while diff != 0:
-        i = random.randrange(len(pts))
+        i = rng.randrange(len(pts))
         if diff > 0:
             pts[i] += 1
             diff -= 1
@@ -869,9 +1016,9 @@ async def build_box(team, mins, team_points, ratings):
         P = pts[i]
 
         # 🔥 Use grail shooting model for this player
-        stats = simulate_one_game(p, p["minutes"], P)
+        stats = simulate_one_game(p, p["minutes"], P, rng)
 
-        turnovers, fouls = generate_turnovers_and_fouls(p, p["minutes"])
+        turnovers, fouls = generate_turnovers_and_fouls(p, p["minutes"], rng)
 
         rows.append({
             "player": p["name"],
@@ -886,7 +1033,7 @@ async def build_box(team, mins, team_points, ratings):
             "blk": 0,
             "to": turnovers,
             "pf": fouls,
-            "_box_order": p.get("_box_order", i)
+            "_box_order": p.get("_box_order", i),
         })
 
 
@@ -906,7 +1053,7 @@ async def build_box(team, mins, team_points, ratings):
             "pos": p.get("pos","SG")
         })
 
-    total_reb = get_rebounds(simple, team_reb_rate=1.0)
+    total_reb = get_rebounds(simple, team_reb_rate=1.0, rng=rng)
     ast = []
     stl = []
     blk = []
@@ -915,13 +1062,13 @@ async def build_box(team, mins, team_points, ratings):
         m = sp["minutes"]
 
         per36_ast = assists_per36(sp["pos"], sp["passing"], sp["offiq"], sp["overall"])
-        ast.append(noisy_assists(per36_ast*m/36))
+        ast.append(noisy_assists(per36_ast*m/36, rng))
 
         per36_stl = steals_per36(sp["pos"], sp["stl"], sp["overall"], sp["overall"])
-        stl.append(noisy_steals(per36_stl * m / 36))
+        stl.append(noisy_steals(per36_stl * m / 36, rng))
 
         per36_blk = blocks_per36(sp["pos"], sp["blk"], sp["height"], sp["overall"])
-        blk.append(noisy_blocks(per36_blk * m / 36))
+        blk.append(noisy_blocks(per36_blk * m / 36, rng))
 
     for i, r in enumerate(rows):
         r["reb"] = total_reb[i]
@@ -962,7 +1109,13 @@ async def build_box(team, mins, team_points, ratings):
 # MAIN ENTRYPOINT — simulate_game
 # ------------------------------------------------------------
 
-async def simulate_game(home, away):
+async def simulate_game(home, away, rng=None):
+    """Simulate one game.
+
+    rng: the game's random.Random stream (make_game_rng); None draws from
+        the global random module.
+    """
+    rng = rng or random
     if BM_SIM_DEBUG_LOGS:
         print("🔍 PY starting simulate_game:", home["name"], "vs", away["name"])
     await _bm_game_cooperative_yield()
@@ -1010,13 +1163,13 @@ async def simulate_game(home, away):
         0.02,
         0.055,
     )
-    if random.random() < upset_chance:
+    if rng.random() < upset_chance:
         # flip the sign and shrink margin when upset happens
-        margin_mu *= -1.0 * (0.60 + 0.80 * random.random())
+        margin_mu *= -1.0 * (0.60 + 0.80 * rng.random())
 
     # sample final total + margin
-    sampled_total  = gauss(total_mu,  sigmaT)
-    sampled_margin = gauss(margin_mu, sigmaM)
+    sampled_total  = gauss(total_mu,  sigmaT, rng)
+    sampled_margin = gauss(margin_mu, sigmaM, rng)
 
     Hscore = clamp(round((sampled_total + sampled_margin) / 2), 85, 150)
     Ascore = clamp(round(sampled_total - Hscore), 85, 150)
@@ -1025,12 +1178,12 @@ async def simulate_game(home, away):
     Hscore = clamp(round((sampled_total + sampled_margin) / 2), 85, 150)
     Ascore = clamp(round(sampled_total - Hscore), 85, 150)
 
-    HQ, AQ = split_regulation_quarters(Hscore, Ascore)
+    HQ, AQ = split_regulation_quarters(Hscore, Ascore, rng)
     ot_count = 0
 
     while sum(HQ) == sum(AQ):
         await _bm_game_cooperative_yield()
-        otH, otA = simulate_ot_period(total_mu, margin_mu, dOvr)
+        otH, otA = simulate_ot_period(total_mu, margin_mu, dOvr, rng)
         HQ.append(otH)
         AQ.append(otA)
         ot_count += 1
@@ -1046,11 +1199,11 @@ async def simulate_game(home, away):
     finalH = sum(HQ)
     finalA = sum(AQ)
 
-    actualMinsH = vary_game_minutes(home, minsH, ot_count)
-    actualMinsA = vary_game_minutes(away, minsA, ot_count)
+    actualMinsH = vary_game_minutes(home, minsH, ot_count, rng)
+    actualMinsA = vary_game_minutes(away, minsA, ot_count, rng)
 
-    home_box = await build_box(home, actualMinsH, finalH, rateH)
-    away_box = await build_box(away, actualMinsA, finalA, rateA)
+    home_box = await build_box(home, actualMinsH, finalH, rateH, rng)
+    away_box = await build_box(away, actualMinsA, finalA, rateA, rng)
 
     if BM_SIM_DEBUG_LOGS:
         print("✅ PY finished:", home["name"], "vs", away["name"])
@@ -1066,3 +1219,86 @@ async def simulate_game(home, away):
         "ot": int(ot_count)
     }
 
+
+# ------------------------------------------------------------
+# BATCH ENTRYPOINT — simulate_games_batch
+# ------------------------------------------------------------
+
+def _run_game_coroutine_sync(coro):
+    """Drive a game coroutine to completion without an event loop.
+
+    With cooperative yields disabled nothing in the game stack awaits a real
+    future, so the coroutine finishes on its first step.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as finished:
+        return finished.value
+    coro.close()
+    raise RuntimeError("simulate_game suspended inside a synchronous batch")
+
+
+def _team_for_matchup(teams_by_name, team_name, minutes_override):
+    team = teams_by_name.get(team_name)
+    if team is None:
+        raise KeyError(f"Unknown team in batch matchup: {team_name}")
+    if minutes_override is None:
+        return team
+    # Shallow view: the resident roster is shared, only the gameplan differs.
+    return {**team, "minutes": minutes_override}
+
+
+def _compact_game_result(result):
+    """Drop the per-team rating rosters; the calendar only reads scores/boxes."""
+    return {
+        "score": result["score"],
+        "quarters_home": result["quarters_home"],
+        "quarters_away": result["quarters_away"],
+        "box_home": result["box_home"],
+        "box_away": result["box_away"],
+        "ot": result["ot"],
+    }
+
+
+def simulate_games_batch(teams_by_name, matchups, compact=True):
+    """Simulate a whole slate of games in one synchronous Python call.
+
+    teams_by_name: {team name: team dict with "players" and "minutes"}.
+        Rosters are read-only during the batch, so each team is converted
+        across the worker bridge once no matter how many games it plays.
+    matchups: [{"id", "home", "away", "homeMinutes"?, "awayMinutes"?,
+        "seed"?, "season"?}, ...] in schedule order. Optional minutes
+        override the team's default gameplan for that game only
+        (injury-safe rotations per date).
+
+    Games run in list order through the same simulate_game code path, so
+    RNG consumption is identical to simulating them one message at a time.
+    A game with a "seed" (or any game once a master seed is set) runs on
+    its own make_game_rng stream and does not depend on the rest of the
+    slate.
+    A failing game reports {"id", "error"} and does not abort the slate.
+    """
+    global BM_GAME_COOPERATIVE_YIELDS
+
+    previous_yields = BM_GAME_COOPERATIVE_YIELDS
+    BM_GAME_COOPERATIVE_YIELDS = False
+    out = []
+    try:
+        for matchup in matchups or []:
+            game_id = matchup.get("id")
+            try:
+                home = _team_for_matchup(teams_by_name, matchup.get("home"), matchup.get("homeMinutes"))
+                away = _team_for_matchup(teams_by_name, matchup.get("away"), matchup.get("awayMinutes"))
+                rng = make_game_rng(matchup.get("seed"), game_id, matchup.get("season"))
+                result = _run_game_coroutine_sync(simulate_game(home, away, rng))
+                out.append({
+                    "id": game_id,
+                    "result": _compact_game_result(result) if compact else result,
+                })
+            except Exception as exc:
+                out.append({"id": game_id, "error": str(exc)})
+    finally:
+        BM_GAME_COOPERATIVE_YIELDS = previous_yields
+
+    return out
+
@@ -0,0 +1,90 @@
+"""
+league_clone.py
+League clones for the offseason engines that share the cold subtrees.
+
+Free agency, extensions, roster and retirement requests work on a copy of
+the league so a failed request leaves the caller's league untouched. Most of
+a full deepcopy's cost is cold data the engines only read: per-player career
+history and league-level logs such as draftPicks, tradeHistory and
+seasonHistory.
+
+clone_league_sharing_cold() deep-copies the rest of the league (teams,
+rosters, contracts, free agents, free-agency state) and points the clone at
+the original cold subtrees. It is still a full copy of the hot league; there
+is no per-team or per-player tracking. Shared subtrees follow one rule:
+writers replace them instead of mutating them in place, e.g.
+
+    history = own_child(player, "history")
+    history["transactions"] = [*history.get("transactions", []), row]
+
+own_child() swaps in a private shallow copy of the container, so the
+original league is never modified.
+"""
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, Iterator
+
+LEAGUE_CLONE_VERSION = "2026-10-17_shared_cold_clone_v1"
+
+# League-level keys the offseason engines only read.
+COLD_LEAGUE_KEYS = ("draftPicks", "tradeHistory", "seasonHistory", "leagueHistory")
+
+# Player-level keys the offseason engines only read or append to via own_child.
+COLD_PLAYER_KEYS = ("history", "careerHistory")
+
+TEAM_PLAYER_LIST_KEYS = ("players", "twoWayPlayers", "stashPlayers")
+
+
+def iter_league_players(league: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    conferences = league.get("conferences") if isinstance(league.get("conferences"), dict) else {}
+    for teams in conferences.values():
+        for team in teams or []:
+            if not isinstance(team, dict):
+                continue
+            for list_key in TEAM_PLAYER_LIST_KEYS:
+                for player in team.get(list_key) or []:
+                    if isinstance(player, dict):
+                        yield player
+    for player in league.get("freeAgents") or []:
+        if isinstance(player, dict):
+            yield player
+
+
+def own_child(container: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return container[key] as a dict private to `container`.
+
+    The child is shallow-copied, so a subtree shared with the pre-transaction
+    league is never mutated. Nested lists must be replaced, not appended to.
+    """
+    current = container.get(key)
+    owned = dict(current) if isinstance(current, dict) else {}
+    container[key] = owned
+    return owned
+
+
+def cold_subtree_memo(
+    league: Dict[str, Any],
+    cold_league_keys: tuple = COLD_LEAGUE_KEYS,
+    cold_player_keys: tuple = COLD_PLAYER_KEYS,
+) -> Dict[int, Any]:
+    """deepcopy memo mapping every cold subtree of `league` to itself."""
+    memo: Dict[int, Any] = {}
+    for key in cold_league_keys:
+        value = league.get(key)
+        if isinstance(value, (dict, list)):
+            memo[id(value)] = value
+    for player in iter_league_players(league):
+        for key in cold_player_keys:
+            value = player.get(key)
+            if isinstance(value, (dict, list)):
+                memo[id(value)] = value
+    return memo
+
+
+def clone_league_sharing_cold(league: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep copy of `league` whose cold subtrees are the original objects."""
+    league = league if isinstance(league, dict) else {}
+    # deepcopy returns memo hits as-is, so pre-seeding the memo with the
+    # cold subtrees makes the clone point at the same objects.
+    return copy.deepcopy(league, cold_subtree_memo(league))
@@ -5,13 +5,21 @@ Central financial rules and 6.5% annual league inflation helpers.
 Existing signed contracts should stay fixed. These helpers update only league
 rules used for future contracts, cap holds, exceptions, rookie deals, and UI
 cap values.
+
+Inside a financial_rules_scope() get_financial_rules() is memoized for the
+rest of the request. Entries are keyed by every league input the rules read
+(the financials block, the season context and the legacy alias keys) plus
+the requested season year, so a league whose economy changes mid-request just
+misses the cache. A scope can also bind the request league's rules, which
+engines read through bound_financial_rules() instead of module constants.
 """
 from __future__ import annotations
 
 import copy
 import math
 import datetime as _dt
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 LEAGUE_FINANCIALS_VERSION = "2026-07-31_fa_contract_rules_v2"
 DEFAULT_ANNUAL_INFLATION_RATE = 0.065
@@ -81,6 +89,26 @@ def _num(value: Any, fallback: float = 0.0) -> float:
         return float(fallback)
 
 
+# Everything get_financial_rules() reads from a league, for the scope cache key.
+_RULES_LEAGUE_KEYS: Tuple[str, ...] = (
+    "seasonYear", "currentSeasonYear", "seasonStartYear", "currentFinancialSeasonYear",
+    "salaryCap", "capLimit", "luxuryTaxLine", "taxLine",
+    "minimumTeamSalary", "salaryFloor", "minimumTeamPayroll",
+    "firstApron", "apron1", "secondApron", "apron2", "hardCap", "hardCapLimit",
+    "minimumSalary", "minimumException", "veteranMinimum", "twoWaySalary",
+    "maxSalary", "maxContract", "maxContractAmount", "roomException", "roomExceptionAmount",
+    "nonTaxpayerMLE", "nonTaxpayerMidLevelException", "midLevelException",
+    "taxpayerMLE", "taxpayerMidLevelException",
+)
+_RULES_FINANCIALS_KEYS: Tuple[str, ...] = (
+    "baseSeasonYear", "annualInflationRate", "currentSeasonYear", "currentFinancialSeasonYear",
+    "appliedThroughSeasonYear", "appliedInflationThroughSeason",
+)
+FINANCIAL_RULES_SCOPE_MAX_ENTRIES = 64
+
+_ACTIVE_RULES_SCOPE: Optional[Dict[str, Any]] = None
+
+
 def _season_year(value: Any, fallback: int = DEFAULT_BASE_SEASON_YEAR) -> int:
     try:
         y = int(float(value))
@@ -168,7 +196,82 @@ def _inflation_index(base_season_year: int, season_year: int, annual_rate: float
     return math.pow(1.0 + float(annual_rate), years)
 
 
+def _rules_cache_key(league_data: Optional[Dict[str, Any]], season_year: Optional[int]) -> Optional[Tuple[Any, ...]]:
+    league_data = league_data or {}
+    if not isinstance(league_data, dict):
+        return None
+    financials = league_data.get("financials") if isinstance(league_data.get("financials"), dict) else {}
+    base_rules = financials.get("baseRules")
+    return (
+        season_year,
+        tuple(map(league_data.get, _RULES_LEAGUE_KEYS)),
+        tuple(map(financials.get, _RULES_FINANCIALS_KEYS)),
+        tuple(base_rules.items()) if isinstance(base_rules, dict) else None,
+    )
+
+
 def get_financial_rules(league_data: Optional[Dict[str, Any]], season_year: Optional[int] = None) -> Dict[str, Any]:
+    """The league's cap, apron, exception and salary rules for a season.
+
+    Inside a financial_rules_scope() the result is memoized and shared, so
+    callers must treat it as read-only.
+    """
+    scope = _ACTIVE_RULES_SCOPE
+    key = _rules_cache_key(league_data, season_year) if scope is not None else None
+    if key is None:
+        return _build_financial_rules(league_data, season_year)
+    try:
+        rules = scope["cache"].get(key)
+    except TypeError:  # unhashable values in the league; build uncached
+        return _build_financial_rules(league_data, season_year)
+    if rules is None:
+        if len(scope["cache"]) >= FINANCIAL_RULES_SCOPE_MAX_ENTRIES:
+            scope["cache"].clear()
+        rules = scope["cache"][key] = _build_financial_rules(league_data, season_year)
+        scope["stats"]["misses"] += 1
+    else:
+        scope["stats"]["hits"] += 1
+    return rules
+
+
+@contextmanager
+def financial_rules_scope(league_data: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """Memoize get_financial_rules for one request, optionally binding league_data.
+
+    Nested scopes share the outer cache; a binding made inside a scope ends
+    with it. Yields the scope ({"cache", "stats", "bound"}) for diagnostics.
+    """
+    global _ACTIVE_RULES_SCOPE
+    previous = _ACTIVE_RULES_SCOPE
+    if previous is None:
+        scope = {"cache": {}, "stats": {"hits": 0, "misses": 0}, "bound": None}
+    else:
+        scope = {**previous}
+    _ACTIVE_RULES_SCOPE = scope
+    try:
+        if league_data is not None:
+            bind_financial_rules(league_data)
+        yield scope
+    finally:
+        _ACTIVE_RULES_SCOPE = previous
+
+
+def bind_financial_rules(league_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Make league_data's current rules the active scope's request economy."""
+    scope = _ACTIVE_RULES_SCOPE
+    if scope is None or not isinstance(league_data, dict):
+        return None
+    scope["bound"] = get_financial_rules(league_data)
+    return scope["bound"]
+
+
+def bound_financial_rules() -> Optional[Dict[str, Any]]:
+    """Rules bound to the active scope, or None outside a bound scope."""
+    scope = _ACTIVE_RULES_SCOPE
+    return scope["bound"] if scope is not None else None
+
+
+def _build_financial_rules(league_data: Optional[Dict[str, Any]], season_year: Optional[int] = None) -> Dict[str, Any]:
     league_data = league_data or {}
     financials = league_data.get("financials") if isinstance(league_data.get("financials"), dict) else {}
     base_season_year = _season_year(financials.get("baseSeasonYear") or get_league_season_year(league_data))
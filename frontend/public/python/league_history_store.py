@@ -0,0 +1,213 @@
+"""
+league_history_store.py
+Hot/cold split of a league: per-player career history kept out of the engines.
+
+player.history (seasons, accolades, awards, transactions) is most of each
+player's size, but game_sim, free agency, the draft, roster and trade engines
+never read it. The resident league session (league_session.py) keeps only the
+hot core (ratings, contracts, rights) on its players and moves the history
+into a PlayerHistoryStore keyed by player:
+
+  - engines that read history ask for slices: attach(league, sections) puts
+    just those sections back on the players for the length of one request
+  - collect(league, sent_sections) takes history off again and folds anything
+    an engine wrote into the sections it was not sent (transaction rows from
+    roster or extension moves) into the store; sent sections are read-only
+  - the store is append-only: written rows are appended, replacing an
+    existing row with the same id, and are reported back so the JS copy can
+    apply the same appends (utils/leagueHistorySplit.js mergePlayerHistory)
+
+utils/leagueHistorySplit.js does the same split for the one-shot worker
+requests, so both paths follow the same merge rules.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from league_clone import COLD_PLAYER_KEYS, iter_league_players
+
+LEAGUE_HISTORY_STORE_VERSION = "2026-10-17_hot_cold_history_v1"
+
+# History sections each session engine reads; engines not listed get none.
+# player_mood_logic reads the live season row, consecutive team seasons and
+# title history; contract_extension_logic reads locker-room moods.
+ENGINE_HISTORY_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    "player_mood": ("seasons", "awards"),
+    "contract_extension": ("seasons", "awards"),
+}
+
+
+def history_key(player: Any) -> str:
+    if not isinstance(player, dict):
+        return ""
+    pid = player.get("id")
+    if pid not in (None, ""):
+        return f"id:{pid}"
+    return f"name:{player.get('name', '')}"
+
+
+def _row_id(row: Any) -> Optional[str]:
+    if isinstance(row, dict) and row.get("id") not in (None, ""):
+        return str(row["id"])
+    return None
+
+
+def _upsert_rows(cold_rows: Any, written_rows: List[Any]) -> List[Any]:
+    rows = list(cold_rows) if isinstance(cold_rows, list) else []
+    index_by_id = {}
+    for i, row in enumerate(rows):
+        rid = _row_id(row)
+        if rid is not None:
+            index_by_id[rid] = i
+    for row in written_rows:
+        rid = _row_id(row)
+        i = index_by_id.get(rid) if rid is not None else None
+        if i is None:
+            if rid is not None:
+                index_by_id[rid] = len(rows)
+            rows.append(row)
+        else:
+            rows[i] = row
+    return rows
+
+
+def merge_history(cold: Any, written: Any, sent_sections: Iterable[str] = ()) -> Any:
+    """Cold history plus whatever an engine wrote into the sections it was not sent."""
+    if not isinstance(written, dict):
+        return cold
+    if not isinstance(cold, dict):
+        return written
+    sent = set(sent_sections)
+    merged = cold
+    for section, value in written.items():
+        if section in sent:
+            continue
+        if merged is cold:
+            merged = dict(cold)
+        merged[section] = _upsert_rows(cold.get(section), value) if isinstance(value, list) else value
+    return merged
+
+
+def _slice(history: Any, sections: Optional[Iterable[str]], since_year: Optional[int]) -> Any:
+    if not isinstance(history, dict):
+        return history
+    keys = list(history) if sections is None else [s for s in sections if s in history]
+    out = {}
+    for section in keys:
+        value = history[section]
+        if since_year is not None and isinstance(value, list):
+            value = [
+                row for row in value
+                if not isinstance(row, dict) or int(row.get("seasonYear") or 0) >= since_year
+            ]
+        out[section] = value
+    return out
+
+
+def strip_league_history(league: Dict[str, Any]) -> int:
+    """Drop history off every player in `league` (in place) without keeping it."""
+    stripped = 0
+    for player in iter_league_players(league):
+        for key in COLD_PLAYER_KEYS:
+            if key in player:
+                del player[key]
+                stripped += 1
+    return stripped
+
+
+class PlayerHistoryStore:
+    """Cold career history by player key; entries hold history/careerHistory."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @classmethod
+    def from_league(cls, league: Dict[str, Any]) -> "PlayerHistoryStore":
+        """Move every player's history out of `league` (in place) into a store."""
+        store = cls()
+        store.absorb_league(league)
+        return store
+
+    def absorb_league(self, league: Dict[str, Any]) -> int:
+        """Strip history off all players in `league`; players new to the store
+        keep theirs as their entry. Returns the number of players stripped."""
+        stripped = 0
+        for player in iter_league_players(league):
+            entry = {key: player.pop(key) for key in COLD_PLAYER_KEYS if key in player}
+            if not entry:
+                continue
+            stripped += 1
+            self._entries.setdefault(history_key(player), entry)
+        return stripped
+
+    def history(self, key: str) -> Dict[str, Any]:
+        entry = self._entries.get(key) or {}
+        history = entry.get("history")
+        if not history:
+            history = entry.get("careerHistory")
+        return history if isinstance(history, dict) else {}
+
+    def slice(self, key: str, sections: Optional[Iterable[str]] = None, since_year: Optional[int] = None) -> Dict[str, Any]:
+        """The sections of a player's history (all by default), optionally only
+        rows from since_year on. Lists are shared with the store; do not mutate."""
+        return _slice(self.history(key), sections, since_year)
+
+    def attach(self, league: Dict[str, Any], sections: Iterable[str], since_year: Optional[int] = None) -> int:
+        sections = tuple(sections)
+        attached = 0
+        for player in iter_league_players(league):
+            key = history_key(player)
+            if key in self._entries:
+                player["history"] = self.slice(key, sections, since_year)
+                attached += 1
+        return attached
+
+    def collect(self, league: Dict[str, Any], sent_sections: Iterable[str] = ()) -> Dict[str, Dict[str, Any]]:
+        """Strip history off `league` again and keep what the engine appended.
+
+        Returns {player key: {section: rows written}} for the rows folded into
+        the store (whole histories for players the store had not seen).
+        """
+        sent = tuple(sent_sections)
+        appends: Dict[str, Dict[str, Any]] = {}
+        for player in iter_league_players(league):
+            written = {key: player.pop(key) for key in COLD_PLAYER_KEYS if key in player}
+            if not written:
+                continue
+            key = history_key(player)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = written
+                if isinstance(written.get("history"), dict) and written["history"]:
+                    appends[key] = written["history"]
+                continue
+            history = written.get("history")
+            if not isinstance(history, dict):
+                continue
+            new_rows = {section: value for section, value in history.items() if section not in sent}
+            if not new_rows:
+                continue
+            entry["history"] = merge_history(entry.get("history"), new_rows)
+            appends[key] = new_rows
+        return appends
+
+    def fill_retired_records(self, records: Any) -> int:
+        """Give retired-player records built from hot players their history."""
+        filled = 0
+        for record in records or []:
+            if not isinstance(record, dict) or record.get("history"):
+                continue
+            history = self.history(history_key(record))
+            if history:
+                record["history"] = history
+                filled += 1
+        return filled
+
+    def stats(self) -> Dict[str, Any]:
+        return {"players": len(self._entries)}
@@ -0,0 +1,861 @@
+"""
+league_runner.py
+Headless multi-season league runner for offline simulation and balancing.
+
+Chains the same Python engines the browser drives through the Pyodide worker,
+without React or the worker, so balance changes can be checked over many
+seasons in one command:
+
+    cd frontend/public/python
+    python -m league_runner ../../../2027_roster_FINAL_core_awards_DIVISIONS.json \\
+        --seasons 5 --replicas 8 --out ../../../league-runs
+
+One season is the CPU contract-extension passes, the regular season
+(round-robin schedule, game_sim batches whose box scores are totalled in a
+SeasonStatsStore), playoffs,
+awards and Finals MVP, then the offseason in
+the order OffseasonHub's dev full-offseason sim uses: retirements, financial
+inflation, draft lottery, draft, rookie signings, options/expiring contracts,
+free agency to the end, roster finalization and progression.
+
+The page-side glue is reduced to what the engines need: rotations are the ten
+best players on a fixed minutes ladder (not the coach gameplan), the schedule
+is a balanced round robin without divisions or dates, the playoff field is the
+top eight per conference (no play-in), and every team is run as CPU.
+
+Replicas are independent copies of the league with their own seeds (seed + i,
+which also seeds each draft class); they run in a process pool and each writes
+one JSON summary per season.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+LEAGUE_RUNNER_VERSION = "2026-10-17_headless_seasons_v1"
+
+DEFAULT_GAMES_PER_TEAM = 82
+# The reference plan by default. --progression-backend numpy opts into the
+# array plan, which matches it only in distribution
+# (scripts/progression-numpy-distribution.py).
+DEFAULT_PROGRESSION_BACKEND = "python"
+PLAYOFF_TEAMS_PER_CONFERENCE = 8
+PLAYOFF_SERIES_WINS = 4
+ROTATION_MINUTES = (36, 34, 32, 30, 28, 24, 20, 16, 12, 8)
+FREE_AGENCY_MAX_DAYS = 10
+# freeAgencyState fields kept once the market is complete.
+FREE_AGENCY_STATE_KEPT_KEYS = (
+    "seasonYear", "contractSeasonYear", "targetSeasonYear", "isActive", "currentDay", "maxDays",
+    "marketComplete", "freeAgencyComplete", "completed", "isComplete", "status",
+)
+# 2-2-1-1-1: games the higher seed hosts, by game number in the series.
+SERIES_HOME_GAMES = (True, True, False, False, True, False, True)
+
+# The app runs its CPU extension passes at the rookie-scale deadline (before
+# opening night) and the veteran deadline. Both come before the free agency
+# that follows the season, so the runner plays them ahead of the games.
+CONTRACT_EXTENSION_PHASES = ("rookie_deadline", "veteran_deadline")
+
+OFFSEASON_PHASES = (
+    "retirements",
+    "league_inflation",
+    "draft_lottery",
+    "draft",
+    "rookie_signings",
+    "options_and_rights",
+    "free_agency",
+    "roster_finalization",
+    "progression",
+)
+
+
+class RunnerError(RuntimeError):
+    """An engine step returned ok: False."""
+
+
+# ------------------------------------------------------------
+# League helpers
+# ------------------------------------------------------------
+def iter_teams(league: Dict[str, Any]):
+    for conference, teams in (league.get("conferences") or {}).items():
+        for team in teams or []:
+            if isinstance(team, dict):
+                yield conference, team
+
+
+def get_season_year(league: Dict[str, Any]) -> int:
+    for key in ("seasonYear", "currentSeasonYear", "seasonStartYear"):
+        try:
+            year = int(league.get(key))
+        except (TypeError, ValueError):
+            continue
+        if 2020 <= year <= 2100:
+            return year
+    return 2026
+
+
+def with_season_context(league: Dict[str, Any], season_year: int) -> Dict[str, Any]:
+    """Year fields for `season_year`, as utils/seasonContext.js withOffseasonSeasonContext sets them."""
+    display_year = season_year + 1
+    for key in (
+        "seasonYear", "currentSeasonYear", "seasonStartYear", "contractSeasonYear",
+        "payrollSeasonYear", "currentPayrollSeasonYear", "salarySeasonYear",
+        "currentSalarySeasonYear", "draftYear", "currentDraftYear",
+    ):
+        league[key] = season_year
+    for key in ("displaySeasonYear", "seasonEndYear", "financialSeasonYear", "currentFinancialSeasonYear"):
+        league[key] = display_year
+    return league
+
+
+def roll_draft_pick_assets(league: Dict[str, Any], draft_year: int) -> None:
+    """Drop used `draft_year` picks and add every team's own picks one year
+    past the window (utils/draftPicks.js rollDraftPickAssetsForCompletedSeason)."""
+    picks = [row for row in league.get("draftPicks") or [] if int(row.get("year") or 0) > draft_year]
+    next_year = max([int(row.get("year") or 0) for row in picks] + [draft_year + 6]) + 1
+    for _, team in iter_teams(league):
+        name = team.get("name")
+        for round_num in (1, 2):
+            picks.append({
+                "id": f"{next_year}_{name}_R{round_num}_auto",
+                "type": "pick",
+                "assetType": "pick",
+                "year": next_year,
+                "round": round_num,
+                "originalTeam": name,
+                "ownerTeam": name,
+                "protections": "Unprotected",
+                "protectionType": "unprotected",
+                "swapWithTeam": "",
+                "status": "active",
+            })
+    league["draftPicks"] = picks
+    league.setdefault("draftPickMeta", {})["lastRolledCompletedSeasonYear"] = draft_year
+
+
+# ------------------------------------------------------------
+# Engines
+# ------------------------------------------------------------
+@contextlib.contextmanager
+def quiet_engines(verbose: bool = False):
+    """Engines print diagnostics for the browser console; drop them here."""
+    if verbose:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def engine(name: str) -> Any:
+    from module_registry import load_engine
+
+    return load_engine(name)
+
+
+def run_engine(name: str, action: str, league: Dict[str, Any], payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    from module_registry import handle_engine_request
+
+    result = handle_engine_request(name, {"action": action, "leagueData": league, "payload": payload or {}})
+    if not isinstance(result, dict) or not result.get("ok"):
+        reason = result.get("reason") if isinstance(result, dict) else result
+        raise RunnerError(f"{name}.{action}: {reason}")
+    return result
+
+
+# ------------------------------------------------------------
+# Regular season and playoffs
+# ------------------------------------------------------------
+def build_rotation(team: Dict[str, Any]) -> Dict[str, Any]:
+    players = [p for p in team.get("players") or [] if isinstance(p, dict) and p.get("name")]
+    ranked = sorted(players, key=lambda p: -float(p.get("overall") or 0))[: len(ROTATION_MINUTES)]
+    ladder = ROTATION_MINUTES[: len(ranked)]
+    scale = 240.0 / sum(ladder) if ladder else 0.0
+    minutes = {p["name"]: round(m * scale) for p, m in zip(ranked, ladder)}
+    if minutes:
+        # Rounding drift goes to the starter so the rotation is exactly 240.
+        minutes[ranked[0]["name"]] += 240 - sum(minutes.values())
+    return {"name": team.get("name"), "players": players, "minutes": minutes}
+
+
+def build_schedule(team_names: List[str], games_per_team: int, rng: random.Random) -> List[List[Tuple[str, str]]]:
+    """Rounds of (home, away) games; every team plays once per round.
+
+    Circle-method round robin repeated until each team has games_per_team
+    games; home and away flip on every pass through the league.
+    """
+    names = list(team_names)
+    rng.shuffle(names)
+    if len(names) % 2:
+        names.append(None)
+    fixed, rotating = names[0], names[1:]
+    rounds = []
+    cycle = 0
+    while len(rounds) < games_per_team:
+        for r in range(len(names) - 1):
+            if len(rounds) >= games_per_team:
+                break
+            pairs = [(fixed, rotating[0]) if r % 2 == 0 else (rotating[0], fixed)]
+            half = len(names) // 2
+            pairs += [(rotating[i], rotating[-i]) for i in range(1, half)]
+            if cycle % 2:
+                pairs = [(away, home) for home, away in pairs]
+            rounds.append([(home, away) for home, away in pairs if home and away])
+            rotating = rotating[-1:] + rotating[:-1]
+        cycle += 1
+    return rounds
+
+
+def simulate_games(teams: Dict[str, Dict[str, Any]], games: List[Tuple[str, str, str]], season_year: int, seed: int, stats_store=None) -> List[Dict[str, Any]]:
+    game_sim = engine("game_sim")
+    matchups = [
+        {"id": game_id, "home": home, "away": away, "seed": game_sim.game_rng_seed(game_id, season_year, seed)}
+        for game_id, home, away in games
+    ]
+    rows = game_sim.simulate_games_batch(teams, matchups, compact=True)
+    failed = [row for row in rows if "error" in row]
+    if failed:
+        raise RunnerError(f"game_sim: {failed[0]['id']}: {failed[0]['error']}")
+    if stats_store is not None:
+        for (_, home, away), row in zip(games, rows):
+            stats_store.record_game(home, away, row["result"])
+    return rows
+
+
+def _score(row: Dict[str, Any]) -> Tuple[int, int]:
+    score = row["result"]["score"]
+    if isinstance(score, dict):
+        return int(score.get("home") or 0), int(score.get("away") or 0)
+    return int(score[0]), int(score[1])
+
+
+def run_regular_season(league: Dict[str, Any], seed: int, games_per_team: int) -> Dict[str, Any]:
+    from season_stats_store import SeasonStatsStore
+
+    season_year = get_season_year(league)
+    teams = {team["name"]: build_rotation(team) for _, team in iter_teams(league)}
+    rounds = build_schedule(sorted(teams), games_per_team, random.Random(f"{seed}|{season_year}|schedule"))
+    games = [
+        (f"{season_year}-R{r:03d}-G{g:02d}", home, away)
+        for r, pairs in enumerate(rounds)
+        for g, (home, away) in enumerate(pairs)
+    ]
+    store = SeasonStatsStore()
+    rows = simulate_games(teams, games, season_year, seed, store)
+
+    records = {name: {"wins": 0, "losses": 0, "pointDifferential": 0} for name in teams}
+    for (_, home, away), row in zip(games, rows):
+        home_pts, away_pts = _score(row)
+        winner, loser = (home, away) if home_pts > away_pts else (away, home)
+        records[winner]["wins"] += 1
+        records[loser]["losses"] += 1
+        records[home]["pointDifferential"] += home_pts - away_pts
+        records[away]["pointDifferential"] += away_pts - home_pts
+
+    standings = []
+    for conference, team in iter_teams(league):
+        standings.append({"teamName": team["name"], "conference": conference, **records[team["name"]]})
+    standings.sort(key=lambda row: (-row["wins"], -row["pointDifferential"], row["teamName"]))
+    for rank, row in enumerate(standings, start=1):
+        row["leagueRank"] = rank
+    for conference in {row["conference"] for row in standings}:
+        seeded = [row for row in standings if row["conference"] == conference]
+        for seed_num, row in enumerate(seeded, start=1):
+            row["conferenceSeed"] = seed_num
+            row["madePlayoffs"] = seed_num <= PLAYOFF_TEAMS_PER_CONFERENCE
+    return {"teams": teams, "games": len(games), "stats": store, "standings": standings}
+
+
+def run_series(teams, high: str, low: str, label: str, season_year: int, seed: int, stats_store) -> Dict[str, Any]:
+    wins = {high: 0, low: 0}
+    game_num = 0
+    while max(wins.values()) < PLAYOFF_SERIES_WINS:
+        home, away = (high, low) if SERIES_HOME_GAMES[game_num] else (low, high)
+        game_num += 1
+        row = simulate_games(teams, [(f"{season_year}-{label}-G{game_num}", home, away)], season_year, seed, stats_store)[0]
+        home_pts, away_pts = _score(row)
+        wins[home if home_pts > away_pts else away] += 1
+    winner = high if wins[high] == PLAYOFF_SERIES_WINS else low
+    return {"winner": winner, "loser": low if winner == high else high, "result": f"{wins[winner]}-{wins[high if winner == low else low]}"}
+
+
+def run_playoffs(regular: Dict[str, Any], season_year: int, seed: int) -> Dict[str, Any]:
+    from season_stats_store import SeasonStatsStore
+
+    teams = regular["teams"]
+    stats = SeasonStatsStore()
+    finals_stats = SeasonStatsStore()
+    result_by_team = {row["teamName"]: "missed_playoffs" for row in regular["standings"]}
+    champions = []
+    for conference in sorted({row["conference"] for row in regular["standings"]}):
+        seeds = [row["teamName"] for row in regular["standings"] if row["conference"] == conference][:PLAYOFF_TEAMS_PER_CONFERENCE]
+        bracket = [seeds[i] for i in (0, 7, 3, 4, 2, 5, 1, 6) if i < len(seeds)]
+        round_num = 1
+        while len(bracket) > 1:
+            winners = []
+            for i in range(0, len(bracket) - 1, 2):
+                high, low = bracket[i], bracket[i + 1]
+                if seeds.index(low) < seeds.index(high):
+                    high, low = low, high
+                series = run_series(teams, high, low, f"{conference}-R{round_num}-S{i // 2}", season_year, seed, stats)
+                result_by_team[series["loser"]] = f"lost_round_{round_num}"
+                winners.append(series["winner"])
+            bracket = winners
+            round_num += 1
+        champions.append(bracket[0])
+
+    wins = {row["teamName"]: (row["wins"], row["pointDifferential"]) for row in regular["standings"]}
+    high, low = sorted(champions, key=lambda name: wins[name], reverse=True)
+    finals = run_series(teams, high, low, "Finals", season_year, seed, finals_stats)
+    result_by_team[finals["winner"]] = "champion"
+    result_by_team[finals["loser"]] = "finals"
+    stats.merge(finals_stats)
+    return {"finals": finals, "resultByTeam": result_by_team, "stats": stats, "finalsStats": finals_stats}
+
+
+def _history_production(row: Dict[str, Any]) -> float:
+    return (
+        float(row.get("ppg") or 0) + 0.55 * float(row.get("rpg") or 0) + 0.65 * float(row.get("apg") or 0)
+        + 1.35 * float(row.get("spg") or 0) + 1.35 * float(row.get("bpg") or 0)
+    )
+
+
+def _history_meta(player: Dict[str, Any], display_year: int) -> Dict[str, Any]:
+    """Prior-career fields awards reads for ROTY/MIP (Calendar.jsx
+    getPriorAwardCareerActivity / getPreviousAwardSeasonFromHistory)."""
+    rows = [
+        row for row in ((player.get("history") or {}).get("seasons") or [])
+        if isinstance(row, dict) and row.get("rowType") != "total" and 0 < int(row.get("seasonYear") or 0) < display_year
+    ]
+    active = [row for row in rows if float(row.get("games") or row.get("gp") or 0) > 0 and _history_production(row) > 0.05]
+    games = sum(float(row.get("games") or row.get("gp") or 0) for row in active)
+    production = sum(float(row.get("games") or row.get("gp") or 0) * _history_production(row) for row in active)
+    meta: Dict[str, Any] = {
+        "priorCareerGames": games,
+        "priorCareerProduction": production,
+        "priorCareerSeasons": len(active),
+        "hasPriorNbaMinutes": games > 0 and production > 0.05,
+    }
+    if rows:
+        latest_year = max(int(row["seasonYear"]) for row in rows)
+        latest = [row for row in rows if int(row["seasonYear"]) == latest_year]
+        latest_games = sum(float(row.get("games") or row.get("gp") or 0) for row in latest)
+        prev = {"seasonYear": latest_year, "games": latest_games}
+        for key in ("ppg", "rpg", "apg", "spg", "bpg", "fgPct", "threePct", "ftPct"):
+            prev[key] = round(sum(float(row.get(key) or 0) * float(row.get("games") or row.get("gp") or 0) for row in latest) / (latest_games or 1), 1)
+        meta["mip_prev"] = meta["mipPrev"] = meta["previousSeasonStats"] = prev
+    return meta
+
+
+def award_player_meta(league: Dict[str, Any], season_year: int) -> Dict[str, Dict[str, Any]]:
+    # Calendar.jsx buildAwardRosterMetaLookup
+    meta = {}
+    for _, team in iter_teams(league):
+        for player in team.get("players") or []:
+            row = {
+                key: player.get(key)
+                for key in (
+                    "age", "overall", "potential", "offRating", "defRating", "draftYear",
+                    "rookieYear", "rookieSeason", "rookieSeasonYear", "isRookie", "rookie",
+                    "yearsPro", "contractType", "rosterStatus", "contract", "meta",
+                )
+                if key in player
+            }
+            row.update(_history_meta(player, season_year + 1))
+            row["def_rating"] = player.get("defRating", 110)
+            meta[f"{player.get('name')}__{team.get('name')}"] = row
+    return meta
+
+
+def archive_season(league: Dict[str, Any], stats, season_year: int) -> None:
+    """Add the finished season to each rostered player's history.seasons, in
+    the display-year row shape the player cards use."""
+    display_year = season_year + 1
+    for _, team in iter_teams(league):
+        for player in team.get("players") or []:
+            row = stats.lookup(player.get("name"), team.get("name"))
+            games = float((row or {}).get("gp") or 0)
+            if games <= 0:
+                continue
+
+            def per_game(field: str) -> float:
+                return round(float(row.get(field) or 0) / games, 1)
+
+            def pct(made: str, attempted: str) -> float:
+                return round(100.0 * float(row.get(made) or 0) / float(row.get(attempted) or 0), 1) if row.get(attempted) else 0.0
+
+            history = player.setdefault("history", {})
+            history["seasons"] = list(history.get("seasons") or []) + [{
+                "seasonYear": display_year,
+                "teamName": team.get("name"),
+                "rowType": "team",
+                "games": int(games),
+                "mpg": per_game("min"),
+                "ppg": per_game("pts"),
+                "rpg": per_game("reb"),
+                "apg": per_game("ast"),
+                "spg": per_game("stl"),
+                "bpg": per_game("blk"),
+                "fgPct": pct("fgm", "fga"),
+                "threePct": pct("tpm", "tpa"),
+                "ftPct": pct("ftm", "fta"),
+            }]
+
+
+def _award_name(row: Any) -> Optional[str]:
+    if isinstance(row, dict):
+        return row.get("player") or row.get("name")
+    return None
+
+
+def run_awards(league: Dict[str, Any], regular: Dict[str, Any], playoffs: Dict[str, Any], season_year: int) -> Dict[str, Any]:
+    awards = engine("awards")
+    teams_with_wins = [{"team": row["teamName"], "wins": row["wins"]} for row in regular["standings"]]
+    season_awards = awards.compute_awards(regular["stats"], teams_with_wins, season_year, award_player_meta(league, season_year))
+    finals_mvp = awards.compute_finals_mvp(playoffs["finalsStats"].rows(), playoffs["finals"]["winner"], season_year)
+    summary = {key: _award_name(season_awards.get(key)) for key in ("mvp", "dpoy", "roty", "sixth_man", "mip")}
+    summary["finals_mvp"] = _award_name(finals_mvp.get("finals_mvp"))
+    summary["all_nba_first"] = [_award_name(row) for row in season_awards.get("all_nba_first") or []]
+    return summary
+
+
+# ------------------------------------------------------------
+# Offseason
+# ------------------------------------------------------------
+def _auto_rookie_decisions(rows: List[Dict[str, Any]]) -> Dict[str, str]:
+    # OffseasonHub.jsx buildAutoRookieDecisions
+    decisions = {}
+    for row in rows or []:
+        key = row.get("playerId", row.get("id"))
+        if key in (None, ""):
+            continue
+        decision = row.get("recommendedDecision") or row.get("recommendation") or row.get("defaultDecision") or "two_way"
+        if decision == "draft_rights":
+            decision = "stash"
+        decisions[str(key)] = decision if decision in ("standard", "two_way", "stash", "release") else "stash"
+    return decisions
+
+
+def _auto_option_decisions(rows: List[Dict[str, Any]]) -> Dict[str, bool]:
+    # OffseasonHub.jsx buildAutoTeamOptionDecisions
+    decisions = {}
+    for row in rows or []:
+        recommendation = str(
+            row.get("recommendedDecision") or row.get("recommendation")
+            or row.get("teamRecommendation") or row.get("defaultDecision") or ""
+        ).lower()
+        explicit = next(
+            (row.get(key) for key in ("recommendedExercise", "shouldExercise", "exerciseRecommended", "teamShouldExercise") if row.get(key) is not None),
+            None,
+        )
+        exercise = bool(explicit) if explicit is not None else not ("decline" in recommendation or "reject" in recommendation)
+        if row.get("playerId") not in (None, ""):
+            decisions[str(row["playerId"])] = exercise
+        name = str(row.get("playerName") or row.get("name") or "")
+        if name:
+            decisions[name] = exercise
+    return decisions
+
+
+def _clean_free_agency_state(season_year: int) -> Dict[str, Any]:
+    # OffseasonHub.jsx buildCleanFreeAgencyStateForDev, with no user team.
+    return {
+        "seasonYear": season_year,
+        "contractSeasonYear": season_year,
+        "payrollSeasonYear": season_year,
+        "currentPayrollSeasonYear": season_year,
+        "salarySeasonYear": season_year,
+        "targetSeasonYear": season_year,
+        "isActive": False,
+        "currentDay": 0,
+        "maxDays": FREE_AGENCY_MAX_DAYS,
+        "offersByPlayer": {},
+        "dailyLog": [],
+        "signedPlayersLog": [],
+        "offerHistory": [],
+        "userOfferOutcomeLog": [],
+        "pendingUserDecisions": [],
+        "pendingRfaMatchDecisions": [],
+        "exceptionUsageByTeam": {},
+        "teamNeedProfiles": {},
+        "pendingUserTeamName": None,
+        "pendingUserTeamSnapshot": None,
+        "latestResults": None,
+        "marketComplete": False,
+        "freeAgencyComplete": False,
+        "completed": False,
+        "isComplete": False,
+        "status": "not_started",
+    }
+
+
+def _free_agency_done(state: Dict[str, Any]) -> bool:
+    return bool(
+        state.get("marketComplete") or state.get("freeAgencyComplete") or state.get("completed")
+        or state.get("isComplete") or state.get("status") == "complete"
+    )
+
+
+def run_offseason(league: Dict[str, Any], season: Dict[str, Any], seed: int, timings: Dict[str, float], verbose: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Offseason after `season` (results of the year just played); `league`
+    already carries the next season's year context."""
+    season_year = get_season_year(league)
+    stats = season["regular"]["stats"]
+    out: Dict[str, Any] = {}
+
+    def phase(name: str, step: Callable[[], Dict[str, Any]]) -> None:
+        nonlocal league
+        started = time.perf_counter()
+        with quiet_engines(verbose):
+            league = step()
+        timings[name] = round(time.perf_counter() - started, 3)
+
+    def retirements():
+        res = run_engine("retirement_logic", "run_player_retirements", league, {
+            "statsByKey": stats, "seed": season_year, "seasonYear": season_year,
+        })
+        retired = res.get("retiredPlayers") or []
+        out["retirements"] = {
+            "count": len(retired),
+            "averageAge": round(sum(float(p.get("age") or 0) for p in retired) / len(retired), 2) if retired else 0.0,
+        }
+        return with_season_context(res["leagueData"], season_year)
+
+    def inflation():
+        return engine("league_financials").apply_league_inflation_for_offseason(league, season_year + 1)
+
+    def lottery():
+        records = [
+            {**row, "playoffResult": season["playoffs"]["resultByTeam"].get(row["teamName"], "missed_playoffs")}
+            for row in season["regular"]["standings"]
+        ]
+        res = run_engine("draft_lottery", "run_draft_lottery", league, {
+            "seasonYear": season_year,
+            "teamRecords": records,
+            "lotterySystem": "three_two_one" if season_year >= 2027 else "legacy_14",
+            "forceLotterySystem": "three_two_one" if season_year >= 2027 else "legacy_14",
+            "seed": f"{season_year}_{seed}_headless",
+        })
+        order = res.get("fullDraftOrder") or []
+        out["lottery"] = {"firstPick": (order[0] or {}).get("teamName") if order else None}
+        return {**league, "draftState": {
+            **(league.get("draftState") or {}),
+            "seasonYear": season_year, "lottery": res, "draftOrder": order, "draftLotteryComplete": True,
+        }}
+
+    def draft():
+        # The app lets each draft class take a fresh random seed; a replica
+        # seeds it so the same --seed replays the same classes.
+        payload = {
+            "seasonYear": season_year, "userTeamName": None, "draftOrder": league["draftState"]["draftOrder"],
+            "classSeed": seed * 10000 + season_year,
+        }
+        init = run_engine("draft_logic", "initialize_draft", league, payload)
+        done = run_engine("draft_logic", "sim_rest_of_draft", init.get("leagueData") or league, {
+            "seasonYear": season_year, "userTeamName": None, "draftState": init.get("draftState"),
+        })
+        picks = (done.get("draftState") or {}).get("draftedPicks") or []
+        out["draft"] = {
+            "picks": len(picks),
+            "firstPick": picks[0].get("playerName") if picks else None,
+            "firstPickOverall": picks[0].get("overall") if picks else None,
+        }
+        nxt = done.get("leagueData") or league
+        roll_draft_pick_assets(nxt, season_year)
+        return nxt
+
+    def rookie_signings():
+        payload = {"seasonYear": season_year, "userTeamName": None}
+        preview = run_engine("team_roster_logic", "preview_rookie_signings", league, payload)
+        res = run_engine("team_roster_logic", "apply_rookie_signings", preview.get("leagueData") or league, {
+            **payload, "decisions": _auto_rookie_decisions(preview.get("userPendingRookies") or []),
+        })
+        return res.get("leagueData") or league
+
+    def options_and_rights():
+        preview = run_engine("free_agency_logic", "preview_offseason_contracts", league, {"userTeamName": None})
+        rows = []
+        for key in ("pendingUserTeamOptions", "teamOptions", "pendingTeamOptions", "cpuTeamOptions", "pendingCpuTeamOptions", "expiredContracts"):
+            rows += preview.get(key) or []
+        res = run_engine("free_agency_logic", "apply_offseason_contract_decisions", preview.get("leagueData") or league, {
+            "userTeamName": None, "teamOptionDecisions": _auto_option_decisions(rows),
+        })
+        return res["leagueData"]
+
+    def free_agency():
+        start = {**league, "freeAgencyState": _clean_free_agency_state(season_year)}
+        nxt = run_engine("free_agency_logic", "initialize_free_agency_period", start, {
+            "userTeamName": None, "maxDays": FREE_AGENCY_MAX_DAYS,
+        })["leagueData"]
+        for _ in range(FREE_AGENCY_MAX_DAYS + 10):
+            state = nxt.get("freeAgencyState") or {}
+            if not state.get("isActive") or _free_agency_done(state):
+                break
+            nxt = run_engine("free_agency_logic", "advance_free_agency_day", nxt, {"userTeamName": None})["leagueData"]
+        state = nxt.get("freeAgencyState") or {}
+        if not _free_agency_done(state):
+            raise RunnerError(f"free agency did not complete (day {state.get('currentDay')} of {state.get('maxDays')})")
+        out["freeAgency"] = {"signings": len(state.get("signedPlayersLog") or []), "days": int(state.get("currentDay") or 0)}
+        # The day logs and offer boards run to tens of MB and only free agency
+        # reads them; every later engine deep-copies the league.
+        nxt["freeAgencyState"] = {key: state.get(key) for key in FREE_AGENCY_STATE_KEPT_KEYS if key in state}
+        return nxt
+
+    def roster_finalization():
+        res = run_engine("team_roster_logic", "apply_roster_finalization", league, {"seasonYear": season_year, "userTeamName": None})
+        return res.get("leagueData") or league
+
+    def progression():
+        prog = engine("progression")
+        res = prog.apply_end_of_season_progression_with_deltas(
+            league=league, stats_by_key=stats, settings=None, seed=seed * 10000 + season_year, season_year=season_year,
+        )
+        shaped = prog.apply_final_league_shape_lock(league=res["league"], settings=None, seed=seed * 10000 + season_year)
+        nxt = shaped.get("league") or res["league"]
+        return with_season_context(nxt, season_year)
+
+    steps = {
+        "retirements": retirements,
+        "league_inflation": inflation,
+        "draft_lottery": lottery,
+        "draft": draft,
+        "rookie_signings": rookie_signings,
+        "options_and_rights": options_and_rights,
+        "free_agency": free_agency,
+        "roster_finalization": roster_finalization,
+        "progression": progression,
+    }
+    for name in OFFSEASON_PHASES:
+        phase(name, steps[name])
+    return league, out
+
+
+# ------------------------------------------------------------
+# Seasons and replicas
+# ------------------------------------------------------------
+def league_summary(league: Dict[str, Any]) -> Dict[str, Any]:
+    rosters = [team.get("players") or [] for _, team in iter_teams(league)]
+    players = [p for roster in rosters for p in roster]
+    overalls = sorted(float(p.get("overall") or 0) for p in players)
+    payrolls = []
+    season_year = get_season_year(league)
+    for roster in rosters:
+        payroll = 0.0
+        for p in roster:
+            contract = p.get("contract") or {}
+            salaries = contract.get("salaryByYear") or []
+            offset = season_year - int(contract.get("startYear") or season_year)
+            if 0 <= offset < len(salaries):
+                payroll += float(salaries[offset] or 0)
+        payrolls.append(payroll)
+    return {
+        "players": len(players),
+        "freeAgents": len(league.get("freeAgents") or []),
+        "avgOverall": round(sum(overalls) / len(overalls), 2) if overalls else 0.0,
+        "overall80Plus": sum(1 for ovr in overalls if ovr >= 80),
+        "avgAge": round(sum(float(p.get("age") or 0) for p in players) / len(players), 2) if players else 0.0,
+        "avgRosterSize": round(len(players) / len(rosters), 2) if rosters else 0.0,
+        "avgPayroll": round(sum(payrolls) / len(payrolls)) if payrolls else 0,
+        "maxPayroll": round(max(payrolls)) if payrolls else 0,
+    }
+
+
+def run_contract_extensions(league: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Every team's CPU extension pass for each deadline of the season."""
+    signed = {}
+    for phase in CONTRACT_EXTENSION_PHASES:
+        res = run_engine("contract_extension_logic", "process_cpu_contract_extensions", league, {
+            "userTeamName": None, "phase": phase,
+        })
+        league = res.get("leagueData") or league
+        signed[phase] = sum(1 for row in res.get("results") or [] if isinstance(row, dict) and row.get("transaction"))
+    return league, {"signed": sum(signed.values()), "byPhase": signed}
+
+
+def run_season(league: Dict[str, Any], seed: int, games_per_team: int = DEFAULT_GAMES_PER_TEAM, verbose: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Play one season and its offseason; returns (next league, summary)."""
+    season_year = get_season_year(league)
+    timings: Dict[str, float] = {}
+    summary: Dict[str, Any] = {"seasonYear": season_year, "seed": seed, "before": league_summary(league)}
+
+    started = time.perf_counter()
+    with quiet_engines(verbose):
+        league, summary["contractExtensions"] = run_contract_extensions(league)
+    timings["contract_extensions"] = round(time.perf_counter() - started, 3)
+
+    started = time.perf_counter()
+    with quiet_engines(verbose):
+        regular = run_regular_season(league, seed, games_per_team)
+    timings["regular_season"] = round(time.perf_counter() - started, 3)
+
+    started = time.perf_counter()
+    with quiet_engines(verbose):
+        playoffs = run_playoffs(regular, season_year, seed)
+        awards = run_awards(league, regular, playoffs, season_year)
+    timings["playoffs_and_awards"] = round(time.perf_counter() - started, 3)
+
+    standings = regular["standings"]
+    summary.update({
+        "games": regular["games"],
+        "champion": playoffs["finals"]["winner"],
+        "finals": playoffs["finals"],
+        "awards": awards,
+        "bestRecord": {k: standings[0][k] for k in ("teamName", "wins", "losses")},
+        "worstRecord": {k: standings[-1][k] for k in ("teamName", "wins", "losses")},
+        "standings": [{k: row[k] for k in ("teamName", "conference", "wins", "losses", "pointDifferential")} for row in standings],
+    })
+
+    archive_season(league, regular["stats"], season_year)
+    next_league = with_season_context(league, season_year + 1)
+    next_league["draftState"] = None
+    next_league, offseason = run_offseason(next_league, {"regular": regular, "playoffs": playoffs}, seed, timings, verbose)
+    summary["offseason"] = offseason
+    summary["after"] = league_summary(next_league)
+    summary["timings"] = timings
+    return next_league, summary
+
+
+def run_replica(job: Dict[str, Any]) -> Dict[str, Any]:
+    """One independent league copy through job["seasons"] seasons."""
+    seed = int(job["seed"])
+    random.seed(seed)
+    from module_registry import configure_engine, reset_league_state
+
+    # Replicas share a process (and the fixture's league name): start clean.
+    reset_league_state()
+    engine("game_sim").set_box_score_backend(job.get("boxScoreBackend") or "python")
+    configure_engine("progression", "set_progression_plan_backend", job.get("progressionBackend") or DEFAULT_PROGRESSION_BACKEND)
+    league = job.get("league")
+    if league is None:
+        with open(job["leaguePath"], encoding="utf-8") as handle:
+            league = json.load(handle)
+    out_dir = job.get("outDir")
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    seasons = []
+    for _ in range(int(job["seasons"])):
+        started = time.perf_counter()
+        league, summary = run_season(league, seed, int(job.get("gamesPerTeam") or DEFAULT_GAMES_PER_TEAM), bool(job.get("verbose")))
+        summary["replica"] = job.get("replica", 0)
+        summary["elapsedSeconds"] = round(time.perf_counter() - started, 3)
+        seasons.append(summary)
+        if out_dir:
+            with open(os.path.join(out_dir, f"season-{summary['seasonYear']}.json"), "w", encoding="utf-8") as handle:
+                json.dump(summary, handle, indent=2)
+
+    if out_dir and job.get("saveLeague"):
+        with open(os.path.join(out_dir, "final-league.json"), "w", encoding="utf-8") as handle:
+            json.dump(league, handle)
+    return {"replica": job.get("replica", 0), "seed": seed, "seasons": seasons}
+
+
+def run_replicas(league_path: str, seasons: int, replicas: int = 1, workers: Optional[int] = None, seed: int = 2027,
+                 out_dir: Optional[str] = None, games_per_team: int = DEFAULT_GAMES_PER_TEAM,
+                 save_league: bool = False, verbose: bool = False,
+                 box_score_backend: str = "python",
+                 progression_backend: str = DEFAULT_PROGRESSION_BACKEND) -> List[Dict[str, Any]]:
+    jobs = [
+        {
+            "replica": i,
+            "seed": seed + i,
+            "leaguePath": league_path,
+            "seasons": seasons,
+            "gamesPerTeam": games_per_team,
+            "outDir": os.path.join(out_dir, f"replica-{i:02d}") if out_dir else None,
+            "saveLeague": save_league,
+            "verbose": verbose,
+            "boxScoreBackend": box_score_backend,
+            "progressionBackend": progression_backend,
+        }
+        for i in range(replicas)
+    ]
+    workers = max(1, min(workers or os.cpu_count() or 1, replicas))
+    if workers == 1:
+        return [run_replica(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_replica, jobs))
+
+
+def aggregate(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Per season year, the spread of the balance numbers across replicas."""
+    by_year: Dict[int, List[Dict[str, Any]]] = {}
+    for result in results:
+        for season in result["seasons"]:
+            by_year.setdefault(season["seasonYear"], []).append(season)
+
+    def spread(values: List[float]) -> Dict[str, float]:
+        return {"min": min(values), "mean": round(sum(values) / len(values), 2), "max": max(values)}
+
+    out = {}
+    for year, seasons in sorted(by_year.items()):
+        champions: Dict[str, int] = {}
+        for season in seasons:
+            champions[season["champion"]] = champions.get(season["champion"], 0) + 1
+        out[str(year)] = {
+            "replicas": len(seasons),
+            "champions": dict(sorted(champions.items(), key=lambda kv: -kv[1])),
+            "bestWins": spread([s["bestRecord"]["wins"] for s in seasons]),
+            "worstWins": spread([s["worstRecord"]["wins"] for s in seasons]),
+            "retirements": spread([s["offseason"].get("retirements", {}).get("count", 0) for s in seasons]),
+            "freeAgentSignings": spread([s["offseason"].get("freeAgency", {}).get("signings", 0) for s in seasons]),
+            "avgOverallAfter": spread([s["after"]["avgOverall"] for s in seasons]),
+            "overall80PlusAfter": spread([s["after"]["overall80Plus"] for s in seasons]),
+            "avgPayrollAfter": spread([s["after"]["avgPayroll"] for s in seasons]),
+            "elapsedSeconds": spread([s["elapsedSeconds"] for s in seasons]),
+        }
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m league_runner", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("league", help="league JSON file (e.g. 2027_roster_FINAL_core_awards_DIVISIONS.json)")
+    parser.add_argument("--seasons", type=int, default=1, help="seasons per replica (default 1)")
+    parser.add_argument("--replicas", type=int, default=1, help="independent league copies (default 1)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=2027, help="base seed; replica i uses seed + i")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES_PER_TEAM, help="regular-season games per team")
+    parser.add_argument("--out", default=None, help="directory for per-season summaries and summary.json")
+    parser.add_argument("--save-league", action="store_true", help="also write each replica's final league JSON")
+    parser.add_argument("--verbose", action="store_true", help="keep engine console output")
+    parser.add_argument("--box-score-backend", choices=("python", "numpy"), default="python",
+                        help="game_sim box-score engine (numpy falls back to python without NumPy)")
+    parser.add_argument("--progression-backend", choices=("python", "numpy"), default=DEFAULT_PROGRESSION_BACKEND,
+                        help="progression raw-plan engine (default python; numpy falls back to python without NumPy)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = run_replicas(
+        args.league, args.seasons, args.replicas, args.workers, args.seed, args.out,
+        args.games, args.save_league, args.verbose, args.box_score_backend,
+        args.progression_backend,
+    )
+    report = {
+        "version": LEAGUE_RUNNER_VERSION,
+        "league": os.path.basename(args.league),
+        "seasons": args.seasons,
+        "replicas": args.replicas,
+        "boxScoreBackend": args.box_score_backend,
+        "progressionBackend": args.progression_backend,
+        "elapsedSeconds": round(time.perf_counter() - started, 3),
+        "bySeason": aggregate(results),
+    }
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        with open(os.path.join(args.out, "summary.json"), "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    sys.exit(main())
@@ -0,0 +1,389 @@
+"""Resident league session for the Pyodide simulation worker.
+
+The worker used to push the whole leagueData through pyodide.toPy for every
+free-agency, mood, draft, roster and retirement request, and Python answered
+with json.dumps of the full league. A session keeps the league resident in
+Python instead:
+
+- load_league(league) is called once per save/phase.
+- apply_league_patch(ops) applies JSON-patch-style edits made on the JS side
+  (add / remove / replace with RFC 6901 paths).
+- run_session_action(engine, action, payload) calls the engine's existing
+  handle_request against the resident league and returns the result without
+  its league copy, plus a delta holding only the teams, players and
+  top-level state keys that changed.
+
+Deltas are computed against a private baseline that handlers never see, so
+engines that mutate leagueData in place and engines that return a fresh copy
+both diff correctly. Actions listed in SESSION_ACTION_TOUCHES only diff the
+league keys they can write; any other action diffs the whole league. Player
+lists are keyed by player id; a player without one is keyed by its position
+in the list, so two id-less players never merge.
+
+Scope: the page runs only free-agency days (advanceFreeAgencyDay in
+simEnginePy.js) through the session. Mood, draft, roster, extension and
+retirement requests still send the full league through
+handle_engine_request; SESSION_ENGINES lists them so they can move over once
+each has a touched-keys entry and a parity check.
+
+The resident league is the hot core only: load_league moves player career
+history into a PlayerHistoryStore (league_history_store.py). Engines that
+read history get the sections they need attached for one action; history
+rows an engine appends come back in delta["historyAppends"]. Patches cannot
+address player history.
+"""
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from league_history_store import ENGINE_HISTORY_SECTIONS, PlayerHistoryStore, strip_league_history
+from module_registry import handle_engine_request
+
+LEAGUE_SESSION_VERSION = "2026-10-17_resident_league_v1"
+
+SESSION_ENGINES = {
+    "free_agency": "free_agency_logic",
+    "contract_extension": "contract_extension_logic",
+    "player_mood": "player_mood_logic",
+    "retirement": "retirement_logic",
+    "draft_lottery": "draft_lottery",
+    "draft": "draft_logic",
+    "team_roster": "team_roster_logic",
+}
+
+# (engine, action) -> the top-level league keys the action can write
+# ("conferences" and "freeAgents" included). Checked against the
+# full-payload path by scripts/league-session-parity-regression.mjs.
+SESSION_ACTION_TOUCHES: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    ("free_agency", "advance_free_agency_day"): ("conferences", "freeAgents", "freeAgencyState", "deadCapByTeam"),
+}
+
+RESULT_LEAGUE_KEYS = ("leagueData", "league")
+TEAM_PLAYER_LIST_KEYS = ("players", "twoWayPlayers", "stashPlayers")
+CONFERENCE_NAMES = ("East", "West")
+
+_SESSION: Dict[str, Any] = {
+    "league": None,
+    "baseline": None,
+    "history": None,
+    "revision": 0,
+}
+
+
+# ------------------------------------------------------------
+# Keys / indexing
+# ------------------------------------------------------------
+
+def list_key(player: Any, index: int) -> str:
+    """Key of a player within one roster/free-agent list (see leagueSessionDelta.js)."""
+    pid = player.get("id") if isinstance(player, dict) else None
+    if pid not in (None, ""):
+        return f"id:{pid}"
+    return f"idx:{index}"
+
+
+def _teams_by_name(league: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    conferences = league.get("conferences") or {}
+    for conf_name in CONFERENCE_NAMES:
+        for team in conferences.get(conf_name) or []:
+            if isinstance(team, dict) and team.get("name"):
+                out[team["name"]] = team
+    return out
+
+
+def _team_order(league: Dict[str, Any]) -> Dict[str, List[str]]:
+    conferences = league.get("conferences") or {}
+    return {
+        conf_name: [team.get("name") for team in conferences.get(conf_name) or [] if isinstance(team, dict)]
+        for conf_name in CONFERENCE_NAMES
+    }
+
+
+# ------------------------------------------------------------
+# Diffing
+# ------------------------------------------------------------
+
+def _diff_player_list(old: Any, new: Any) -> Optional[Dict[str, Any]]:
+    """Return {"order"?, "upserts"} for a player list, or None if unchanged."""
+    if old is new or old == new:
+        return None
+    old_rows = old if isinstance(old, list) else []
+    new_rows = new if isinstance(new, list) else []
+    old_order = [list_key(p, i) for i, p in enumerate(old_rows)]
+    old_by_key = dict(zip(old_order, old_rows))
+
+    order = [list_key(p, i) for i, p in enumerate(new_rows)]
+    upserts = {}
+    for key, player in zip(order, new_rows):
+        if old_by_key.get(key) != player:
+            upserts[key] = player
+
+    delta: Dict[str, Any] = {"upserts": upserts}
+    if order != old_order:
+        delta["order"] = order
+    return delta
+
+
+def _diff_team(old: Dict[str, Any], new: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if old is new or old == new:
+        return None
+    delta: Dict[str, Any] = {}
+    fields = {}
+    for key, value in new.items():
+        if key in TEAM_PLAYER_LIST_KEYS:
+            continue
+        if key not in old or old[key] != value:
+            fields[key] = value
+    removed = [key for key in old if key not in new and key not in TEAM_PLAYER_LIST_KEYS]
+    if fields:
+        delta["fields"] = fields
+    if removed:
+        delta["removedFields"] = removed
+    for list_name in TEAM_PLAYER_LIST_KEYS:
+        if list_name not in old and list_name not in new:
+            continue
+        list_delta = _diff_player_list(old.get(list_name), new.get(list_name))
+        if list_delta is not None:
+            delta[list_name] = list_delta
+    return delta or None
+
+
+def diff_leagues(old: Dict[str, Any], new: Dict[str, Any], keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Describe how `new` differs from `old` in session-delta form.
+
+    keys limits the diff to those top-level keys (None diffs everything).
+    Keys added or removed at the top level are always reported.
+    """
+    delta: Dict[str, Any] = {"teams": {}, "state": {}, "removedStateKeys": []}
+    touched = None if keys is None else set(keys)
+
+    if touched is None or "conferences" in touched:
+        old_teams = _teams_by_name(old)
+        new_teams = _teams_by_name(new)
+        for name, team in new_teams.items():
+            previous = old_teams.get(name)
+            if previous is None:
+                delta["teams"][name] = {"replace": team}
+                continue
+            team_delta = _diff_team(previous, team)
+            if team_delta is not None:
+                delta["teams"][name] = team_delta
+
+        order = _team_order(new)
+        if order != _team_order(old):
+            delta["teamOrder"] = order
+
+    if touched is None or "freeAgents" in touched:
+        fa_delta = _diff_player_list(old.get("freeAgents"), new.get("freeAgents"))
+        if fa_delta is not None:
+            delta["freeAgents"] = fa_delta
+
+    state_keys = new.keys() if touched is None else (touched | (new.keys() - old.keys()))
+    for key in state_keys:
+        if key in ("conferences", "freeAgents") or key not in new:
+            continue
+        if key not in old or old[key] != new[key]:
+            delta["state"][key] = new[key]
+    delta["removedStateKeys"] = [
+        key for key in old
+        if key not in new and key not in ("conferences", "freeAgents")
+    ]
+    return delta
+
+
+def is_empty_delta(delta: Dict[str, Any]) -> bool:
+    return not (
+        delta.get("historyAppends")
+        or delta.get("teams")
+        or delta.get("state")
+        or delta.get("removedStateKeys")
+        or delta.get("teamOrder")
+        or delta.get("freeAgents")
+    )
+
+
+def _refresh_baseline(delta: Dict[str, Any], league: Dict[str, Any]) -> None:
+    """Bring the private baseline up to `league`, copying only what changed."""
+    baseline = _SESSION["baseline"]
+    if delta.get("teamOrder") or any("replace" in row for row in delta.get("teams", {}).values()):
+        _SESSION["baseline"] = copy.deepcopy(league)
+        return
+
+    baseline_teams = _teams_by_name(baseline)
+    league_teams = _teams_by_name(league)
+    for name in delta.get("teams", {}):
+        target = baseline_teams.get(name)
+        if target is None:
+            continue
+        target.clear()
+        target.update(copy.deepcopy(league_teams[name]))
+
+    if "freeAgents" in delta:
+        baseline["freeAgents"] = copy.deepcopy(league.get("freeAgents"))
+    for key in delta.get("state", {}):
+        baseline[key] = copy.deepcopy(league[key])
+    for key in delta.get("removedStateKeys", []):
+        baseline.pop(key, None)
+
+
+# ------------------------------------------------------------
+# JSON patch
+# ------------------------------------------------------------
+
+def _pointer_tokens(path: str) -> List[str]:
+    if path in ("", "/"):
+        return []
+    if not path.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {path!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")]
+
+
+def _resolve_parent(doc: Any, tokens: List[str]) -> Tuple[Any, str]:
+    node = doc
+    for token in tokens[:-1]:
+        node = node[int(token)] if isinstance(node, list) else node[token]
+    return node, tokens[-1]
+
+
+def _apply_op(doc: Dict[str, Any], op: Dict[str, Any]) -> None:
+    kind = op.get("op")
+    tokens = _pointer_tokens(str(op.get("path", "")))
+    if not tokens:
+        raise ValueError("Patching the league root is not supported; use load_league.")
+    parent, last = _resolve_parent(doc, tokens)
+
+    if kind in ("add", "replace"):
+        value = op.get("value")
+        if isinstance(parent, list):
+            if last == "-":
+                parent.append(value)
+            elif kind == "add":
+                parent.insert(int(last), value)
+            else:
+                parent[int(last)] = value
+        else:
+            if kind == "replace" and last not in parent:
+                raise KeyError(f"replace target does not exist: {op.get('path')}")
+            parent[last] = value
+        return
+
+    if kind == "remove":
+        if isinstance(parent, list):
+            parent.pop(int(last))
+        else:
+            del parent[last]
+        return
+
+    raise ValueError(f"Unsupported patch op: {kind!r}")
+
+
+# ------------------------------------------------------------
+# Public API
+# ------------------------------------------------------------
+
+def load_league(league: Dict[str, Any]) -> Dict[str, Any]:
+    _SESSION["league"] = league if isinstance(league, dict) else {}
+    _SESSION["history"] = PlayerHistoryStore.from_league(_SESSION["league"])
+    _SESSION["baseline"] = copy.deepcopy(_SESSION["league"])
+    _SESSION["revision"] = 1
+    return {
+        "ok": True,
+        "version": LEAGUE_SESSION_VERSION,
+        "revision": _SESSION["revision"],
+        "teamCount": len(_teams_by_name(_SESSION["league"])),
+        "freeAgentCount": len(_SESSION["league"].get("freeAgents") or []),
+        "historyPlayers": len(_SESSION["history"]),
+    }
+
+
+def has_resident_league() -> bool:
+    return isinstance(_SESSION.get("league"), dict)
+
+
+def get_resident_league() -> Optional[Dict[str, Any]]:
+    return _SESSION.get("league")
+
+
+def get_history_store() -> Optional[PlayerHistoryStore]:
+    return _SESSION.get("history")
+
+
+def clear_league() -> Dict[str, Any]:
+    _SESSION["league"] = None
+    _SESSION["baseline"] = None
+    _SESSION["history"] = None
+    _SESSION["revision"] = 0
+    return {"ok": True}
+
+
+def apply_league_patch(ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if not has_resident_league():
+        return {"ok": False, "reason": "No resident league loaded."}
+    applied = 0
+    for op in ops or []:
+        # The JS side already holds these values, so the baseline takes them
+        # as well and they never come back in a delta.
+        _apply_op(_SESSION["league"], op)
+        _apply_op(_SESSION["baseline"], {**op, "value": copy.deepcopy(op.get("value"))})
+        applied += 1
+    # Players added by a patch bring their history along; keep it cold.
+    _SESSION["history"].absorb_league(_SESSION["league"])
+    strip_league_history(_SESSION["baseline"])
+    _SESSION["revision"] += 1
+    return {"ok": True, "revision": _SESSION["revision"], "applied": applied}
+
+
+def run_session_action(engine: str, action: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run engine.handle_request against the resident league.
+
+    Returns {"ok", "revision", "result", "delta"}; "result" is the engine's
+    normal response minus its league copy.
+    """
+    if not has_resident_league():
+        return {"ok": False, "reason": "No resident league loaded."}
+    module_name = SESSION_ENGINES.get(engine)
+    if module_name is None:
+        return {"ok": False, "reason": f"Unknown session engine '{engine}'."}
+
+    history = _SESSION["history"]
+    sections = ENGINE_HISTORY_SECTIONS.get(engine, ())
+    if sections:
+        history.attach(_SESSION["league"], sections)
+
+    result = handle_engine_request(module_name, {
+        "action": action,
+        "leagueData": _SESSION["league"],
+        "payload": payload or {},
+    })
+
+    updated = _SESSION["league"]
+    if isinstance(result, dict):
+        for key in RESULT_LEAGUE_KEYS:
+            if isinstance(result.get(key), dict):
+                updated = result[key]
+                result = {k: v for k, v in result.items() if k != key}
+                break
+
+    if updated is not _SESSION["league"]:
+        strip_league_history(_SESSION["league"])
+    appends = history.collect(updated, sections)
+    if isinstance(result, dict):
+        history.fill_retired_records(result.get("retiredPlayers"))
+    history.fill_retired_records(updated.get("retiredPlayersHistory"))
+
+    delta = diff_leagues(_SESSION["baseline"], updated, SESSION_ACTION_TOUCHES.get((engine, action)))
+    if appends:
+        delta["historyAppends"] = appends
+    _SESSION["league"] = updated
+    if not is_empty_delta(delta):
+        _refresh_baseline(delta, updated)
+        _SESSION["revision"] += 1
+
+    return {
+        "ok": True,
+        "revision": _SESSION["revision"],
+        "result": result,
+        "delta": delta,
+    }
@@ -0,0 +1,242 @@
+"""
+module_registry.py
+Warm engine-module registry for the Pyodide simulation worker.
+
+Worker requests used to importlib.reload() their engine on every call, which
+recompiled free_agency_logic.py / progression.py and re-ran module top level
+(including the stat modules' 30.json distribution loads) each time. The
+registry imports each engine once and keeps its module state. A module is
+reloaded only when the content hash of its source file changes, and a reload
+of a dependency also reloads the engines that list it.
+
+Keeping module state means caches built for one league (the CPU offer board,
+trade values, the FA power table, the game RNG master seed) would otherwise
+answer for the next league the worker sees. handle_engine_request() tracks
+the league id of each request and, when it changes, runs LEAGUE_STATE_RESETS
+on every loaded module. Worker settings made through configure_engine() (the
+progression plan backend) are re-applied after a reset or a reload.
+
+Per-module cold (first import / reload) and warm (cached lookup) load times
+are kept for diagnostics. handle_engine_request() is the one way worker and
+session code call an engine's handle_request, so opt-in profiling
+(request_profiler.py) covers every entry point.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib
+import os
+import sys
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from request_profiler import run_engine_request
+
+MODULE_REGISTRY_VERSION = "2026-10-17_warm_modules_v2"
+
+# Engines whose sibling modules must be current before the engine itself.
+ENGINE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "contract_extension_logic": ("contract_extension_acceptance", "cpu_contract_extensions"),
+    "draft_logic": ("autogenerated_draft_class",),
+    "trade_negotiation_logic": ("trade_value_model", "trade_team_ai"),
+}
+
+# Module state that belongs to one league: (function, args) called on every
+# loaded module when the league id changes.
+LEAGUE_STATE_RESETS: Dict[str, Tuple[Tuple[str, Tuple[Any, ...]], ...]] = {
+    "free_agency_logic": (("reset_cpu_offer_board", ()), ("reset_fa_team_power_cache", ())),
+    "trade_value_model": (("clear_trade_value_cache", ()),),
+    "game_sim": (("set_game_rng_master_seed", (None,)),),
+    "progression": (("set_progression_plan_backend", ("python",)),),
+}
+
+# League id fields, in the order the frontend assigns them.
+LEAGUE_ID_FIELDS = ("__leagueStorageId", "leagueId", "saveId", "leagueName")
+
+_ENTRIES: Dict[str, Dict[str, Any]] = {}
+_SETTINGS: Dict[str, Dict[str, Tuple[Any, ...]]] = {}
+_LEAGUE: Dict[str, Any] = {"id": None, "resets": 0}
+
+
+def _source_path(module: Any) -> Optional[str]:
+    path = getattr(module, "__file__", None)
+    return path if path and os.path.exists(path) else None
+
+
+def _file_signature(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (int(stat.st_mtime_ns), int(stat.st_size))
+
+
+def _file_hash(path: Optional[str]) -> Optional[str]:
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as handle:
+            return hashlib.sha1(handle.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _new_entry() -> Dict[str, Any]:
+    return {
+        "path": None,
+        "hash": None,
+        "signature": None,
+        "coldLoads": 0,
+        "lastColdLoadMs": 0.0,
+        "firstColdLoadMs": 0.0,
+        "warmHits": 0,
+        "warmLoadMsTotal": 0.0,
+    }
+
+
+def _record_cold(entry: Dict[str, Any], module: Any, started: float) -> None:
+    elapsed = (time.perf_counter() - started) * 1000.0
+    entry["path"] = _source_path(module)
+    entry["signature"] = _file_signature(entry["path"])
+    entry["hash"] = _file_hash(entry["path"])
+    entry["coldLoads"] += 1
+    entry["lastColdLoadMs"] = elapsed
+    if entry["coldLoads"] == 1:
+        entry["firstColdLoadMs"] = elapsed
+
+
+def _source_changed(entry: Dict[str, Any]) -> bool:
+    # stat() is cheap; only hash the file when its size or mtime moved.
+    signature = _file_signature(entry.get("path"))
+    if signature == entry.get("signature"):
+        return False
+    entry["signature"] = signature
+    current = _file_hash(entry.get("path"))
+    return current is not None and current != entry.get("hash")
+
+
+def _load(name: str, force_reload: bool = False) -> Tuple[Any, bool]:
+    """Return (module, reloaded)."""
+    started = time.perf_counter()
+    entry = _ENTRIES.get(name)
+
+    if entry is None:
+        entry = _new_entry()
+        _ENTRIES[name] = entry
+        module = sys.modules.get(name)
+        # Modules imported before the registry existed are adopted as warm;
+        # the first registry load still counts as their cold load.
+        module = importlib.import_module(name) if module is None else module
+        _record_cold(entry, module, started)
+        return module, True
+
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        _record_cold(entry, module, started)
+        return module, True
+
+    if force_reload or _source_changed(entry):
+        importlib.invalidate_caches()
+        module = importlib.reload(module)
+        _record_cold(entry, module, started)
+        _apply_settings(name, module)
+        return module, True
+
+    entry["warmHits"] += 1
+    entry["warmLoadMsTotal"] += (time.perf_counter() - started) * 1000.0
+    return module, False
+
+
+def load_engine(name: str, dependencies: Optional[Sequence[str]] = None) -> Any:
+    """Import `name` once and return it, reloading only on source changes."""
+    deps = tuple(dependencies) if dependencies is not None else ENGINE_DEPENDENCIES.get(name, ())
+    dependency_reloaded = False
+    for dep in deps:
+        _, reloaded = _load(dep)
+        dependency_reloaded = dependency_reloaded or reloaded
+    # A freshly imported engine already sees its freshly imported dependencies.
+    first_load = name not in _ENTRIES
+    module, _ = _load(name, force_reload=dependency_reloaded and not first_load)
+    return module
+
+
+def _apply_settings(name: str, module: Any) -> None:
+    for setter, args in _SETTINGS.get(name, {}).items():
+        getattr(module, setter)(*args)
+
+
+def configure_engine(name: str, setter: str, *args: Any) -> Any:
+    """Call load_engine(name).<setter>(*args) and keep it across resets and reloads."""
+    module = load_engine(name)
+    _SETTINGS.setdefault(name, {})[setter] = args
+    return getattr(module, setter)(*args)
+
+
+def league_id_of(league_data: Any) -> Optional[str]:
+    if not isinstance(league_data, dict):
+        return None
+    for field in LEAGUE_ID_FIELDS:
+        value = league_data.get(field)
+        if value not in (None, ""):
+            return f"{field}:{value}"
+    return None
+
+
+def reset_league_state() -> None:
+    """Run LEAGUE_STATE_RESETS on every loaded module, then re-apply settings."""
+    for name, resets in LEAGUE_STATE_RESETS.items():
+        module = sys.modules.get(name)
+        if module is None:
+            continue
+        for function, args in resets:
+            getattr(module, function)(*args)
+        _apply_settings(name, module)
+    _LEAGUE["resets"] += 1
+
+
+def enter_league(league_data: Any) -> bool:
+    """Reset league state when league_data is not the league last seen; True if reset."""
+    league_id = league_id_of(league_data)
+    if league_id is None or league_id == _LEAGUE["id"]:
+        return False
+    _LEAGUE["id"] = league_id
+    reset_league_state()
+    return True
+
+
+def handle_engine_request(name: str, request: Any) -> Any:
+    """load_engine(name).handle_request(request), profiled when opted in."""
+    if isinstance(request, dict):
+        enter_league(request.get("leagueData"))
+    return run_engine_request(name, load_engine(name).handle_request, request)
+
+
+def invalidate_engine(name: str) -> None:
+    """Force the next load_engine(name) to re-execute the module."""
+    entry = _ENTRIES.get(name)
+    if entry is not None:
+        entry["signature"] = None
+        entry["hash"] = None
+
+
+def get_module_load_stats() -> Dict[str, Any]:
+    modules = {}
+    for name, entry in sorted(_ENTRIES.items()):
+        warm_hits = entry["warmHits"]
+        modules[name] = {
+            "coldLoads": entry["coldLoads"],
+            "firstColdLoadMs": round(entry["firstColdLoadMs"], 3),
+            "lastColdLoadMs": round(entry["lastColdLoadMs"], 3),
+            "warmHits": warm_hits,
+            "avgWarmLoadMs": round(entry["warmLoadMsTotal"] / warm_hits, 4) if warm_hits else 0.0,
+            "hash": (entry["hash"] or "")[:12],
+        }
+    return {
+        "version": MODULE_REGISTRY_VERSION,
+        "modules": modules,
+        "leagueId": _LEAGUE["id"],
+        "leagueResets": _LEAGUE["resets"],
+    }
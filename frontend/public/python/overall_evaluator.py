@@ -0,0 +1,130 @@
+"""
+overall_evaluator.py
+Incremental overall for one-attribute-at-a-time searches.
+
+The attribute movers in progression.py (_move_attrs_toward_target_overall,
+_force_overall_at_most, _apply_small_attribute_churn), the draft-class
+calibrator in autogenerated_draft_class.py and draft_logic's prospect
+calibration all try +/-1 on every candidate attribute per step and score each
+trial with a full calc_overall_from_attrs over a fresh 15-item list.
+
+OverallEvaluator keeps the pieces of that formula that a single +/-1 can
+change:
+
+  - the weighted sum W, held exactly in hundredths (weights are 2-decimal)
+  - the primary-attribute peak
+  - the count of attributes at or above 90
+
+so overall_after(idx, delta) is O(1) and allocates nothing. The result is
+exactly the reference formula: the integer W only differs from the
+reference's sequential float sum by ~1e-14, and when the unrounded overall
+lands that close to a .5 boundary the evaluator recomputes it the reference
+way before rounding.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List
+
+OVERALL_MIN = 54
+OVERALL_MAX = 99
+SIGMOID_SLOPE = 0.135
+SIGMOID_MIDPOINT = 77.4
+ATTR_MIN = 25
+ATTR_MAX = 99
+
+# How close the unrounded overall may get to a .5 boundary before the exact
+# float path is used. The integer/float W gap is many orders smaller.
+_ROUNDING_GUARD = 1e-9
+
+
+class OverallEvaluator:
+    """Mutable attrs + cached overall terms for one player/position.
+
+    `params` is the caller's position entry ({"weights", "prim", "alpha"}) so
+    every module keeps scoring against its own table. `half_up` picks the
+    tie rule of the caller's reference formula: progression uses
+    floor(x + 0.5), the draft modules use round().
+    """
+
+    __slots__ = (
+        "attrs", "weights", "weights_100", "prim", "prim_set", "alpha",
+        "half_up", "w_100", "peak", "num90",
+    )
+
+    def __init__(self, attrs: List[int], params: Dict[str, Any], half_up: bool = True) -> None:
+        self.attrs = [int(v) for v in attrs]
+        self.weights = [float(w) for w in params["weights"]]
+        self.weights_100 = [int(round(w * 100)) for w in self.weights]
+        self.prim = [int(i) - 1 for i in params["prim"] if 0 <= int(i) - 1 < len(self.attrs)]
+        self.prim_set = set(self.prim)
+        self.alpha = float(params["alpha"])
+        self.half_up = bool(half_up)
+        self.w_100 = sum(w * a for w, a in zip(self.weights_100, self.attrs))
+        self.peak = max((self.attrs[i] for i in self.prim), default=75)
+        self.num90 = sum(1 for v in self.attrs if v >= 90)
+
+    # -- formula -----------------------------------------------------
+    def _round(self, value: float) -> int:
+        if self.half_up:
+            return int(math.floor(value + 0.5))
+        return int(round(value))
+
+    def _finish(self, raw: float, num90: int) -> int:
+        raw = max(float(OVERALL_MIN), min(float(OVERALL_MAX), raw))
+        overall = self._round(raw)
+        if num90 >= 3:
+            overall = min(OVERALL_MAX, overall + (num90 - 2))
+        return int(overall)
+
+    def _raw(self, weighted: float, peak: float) -> float:
+        blended = self.alpha * peak + (1.0 - self.alpha) * weighted
+        return OVERALL_MIN + (OVERALL_MAX - OVERALL_MIN) * (
+            1.0 / (1.0 + math.exp(-SIGMOID_SLOPE * (blended - SIGMOID_MIDPOINT)))
+        )
+
+    def _reference_raw(self, idx: int, value: int, peak: int) -> float:
+        # Same sequential float sum as calc_overall_from_attrs.
+        weighted = 0.0
+        for i, w in enumerate(self.weights):
+            weighted += w * float(value if i == idx else self.attrs[i])
+        return self._raw(weighted, float(peak))
+
+    def _evaluate(self, w_100: int, peak: int, num90: int, idx: int, value: int) -> int:
+        raw = self._raw(w_100 / 100.0, float(peak))
+        if abs((raw % 1.0) - 0.5) < _ROUNDING_GUARD:
+            raw = self._reference_raw(idx, value, peak)
+        return self._finish(raw, num90)
+
+    # -- queries -----------------------------------------------------
+    def overall(self) -> int:
+        return self._evaluate(self.w_100, self.peak, self.num90, -1, 0)
+
+    def _shifted(self, idx: int, delta: int):
+        old = self.attrs[idx]
+        new = ATTR_MIN if old + delta < ATTR_MIN else ATTR_MAX if old + delta > ATTR_MAX else old + delta
+        w_100 = self.w_100 + self.weights_100[idx] * (new - old)
+        peak = self.peak
+        if idx in self.prim_set and new != old:
+            peak = max(new if i == idx else self.attrs[i] for i in self.prim)
+        num90 = self.num90 + (new >= 90) - (old >= 90)
+        return new, w_100, peak, num90
+
+    def overall_after(self, idx: int, delta: int) -> int:
+        """Overall if attrs[idx] moved by delta (clamped 25-99); attrs unchanged."""
+        new, w_100, peak, num90 = self._shifted(idx, delta)
+        return self._evaluate(w_100, peak, num90, idx, new)
+
+    # -- mutation ----------------------------------------------------
+    def apply(self, idx: int, delta: int) -> bool:
+        """Move attrs[idx] by delta (clamped). Returns False if it could not move."""
+        new, w_100, peak, num90 = self._shifted(idx, delta)
+        if new == self.attrs[idx]:
+            return False
+        self.attrs[idx] = new
+        self.w_100, self.peak, self.num90 = w_100, peak, num90
+        return True
+
+    def snapshot(self) -> List[int]:
+        return list(self.attrs)
+
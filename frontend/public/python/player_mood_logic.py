@@ -26,6 +26,7 @@ from __future__ import annotations
 
 import json
 import math
+from contextlib import nullcontext
 from datetime import date as _date
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -42,6 +43,12 @@ except Exception:  # pragma: no cover - Pyodide fallback path
     _fa_get_current_season_year = None
     _fa_get_player_role_rank_on_team = None
 
+try:
+    from league_financials import financial_rules_scope
+except Exception:  # pragma: no cover - Pyodide fallback path
+    def financial_rules_scope(league_data=None):
+        return nullcontext()
+
 DEFAULT_SEASON_YEAR = 2026
 MOOD_SYSTEM_VERSION = "2026-08-08_contextual_sentiment_v11"
 
@@ -2540,10 +2547,12 @@ def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
             payload = {}
 
         if action in ["get_locker_room_moods", "locker_room_moods", "player_moods"]:
-            return get_locker_room_moods(
-                league_data=league_data,
-                team_name=payload.get("teamName") or payload.get("selectedTeamName"),
-            )
+            # Market values come from free_agency_logic, priced in this league's economy.
+            with financial_rules_scope(league_data or None):
+                return get_locker_room_moods(
+                    league_data=league_data,
+                    team_name=payload.get("teamName") or payload.get("selectedTeamName"),
+                )
 
         return {"ok": False, "reason": f"Unknown player mood action: {action}", "players": []}
     except Exception as exc:
@@ -6,6 +6,12 @@ import random
 import math
 import datetime as _dt
 import hashlib
+import heapq
+import importlib
+import sys
+
+from overall_evaluator import OverallEvaluator
+from season_stats_store import as_stats_store
 
 PROGRESSION_PY_VERSION = "2026-08-21_progression_story_arc_v3"
 
@@ -14,6 +20,12 @@ RATING_MAX_OVERALL = 99
 OVERALL_SIGMOID_SLOPE = 0.135
 OVERALL_SIGMOID_MIDPOINT = 77.4
 
+# Raw-plan backend: "python" is the reference per-player engine
+# (_compute_raw_progression_plan); "numpy" uses progression_numpy (one
+# whole-league array pass). Falls back to "python" automatically when NumPy is
+# not loaded.
+PROGRESSION_PLAN_BACKEND = "python"
+
 
 # -------------------------
 # Helpers
@@ -105,6 +117,12 @@ def _team_name(team: Dict[str, Any]) -> str:
     return str(team.get("name") or team.get("team") or "")
 
 
+def _season_stats_source(stats_by_key: Any) -> Any:
+    """A columnar season-stats payload becomes a SeasonStatsStore once."""
+    store = as_stats_store(stats_by_key)
+    return stats_by_key if store is None else store
+
+
 def _stat_lookup(
     stats_by_key: Optional[Dict[str, Dict[str, Any]]],
     p: Dict[str, Any],
@@ -116,6 +134,9 @@ def _stat_lookup(
       - Player__CurrentTeam
       - Player__PreviousTeam
       - name-only fallback
+
+    stats_by_key may be a dict or a SeasonStatsStore (same keys, rows come
+    back as plain dicts).
     """
     if not stats_by_key:
         return None
@@ -2209,10 +2230,11 @@ def _move_attrs_toward_target_overall(
     best_overall = current_overall
     best_dist = abs(best_overall - target_overall)
     change_counts: Dict[int, int] = {}
+    evaluator = OverallEvaluator(attrs, _POS_PARAMS.get(_normalized_pos(pos), _POS_PARAMS["SF"]))
+    attrs = evaluator.attrs
 
     steps = 0
     while steps < max_steps:
-        current_overall = calc_overall_from_attrs(attrs, pos)
         current_dist = abs(current_overall - target_overall)
 
         if current_dist < best_dist:
@@ -2234,41 +2256,33 @@ def _move_attrs_toward_target_overall(
         if not candidates:
             break
 
-        best_candidate_attrs: Optional[List[int]] = None
+        best_candidate_idx = -1
         best_candidate_overall: Optional[int] = None
         best_candidate_dist = 999
         best_candidate_overshoot = True
 
         for idx in candidates:
-            trial = list(attrs)
-            trial[idx] = int(_clamp(trial[idx] + direction, 25, 99))
-            trial_overall = calc_overall_from_attrs(trial, pos)
+            trial_overall = evaluator.overall_after(idx, direction)
             trial_dist = abs(trial_overall - target_overall)
             overshoot = (direction > 0 and trial_overall > target_overall) or (direction < 0 and trial_overall < target_overall)
 
             if trial_dist < best_candidate_dist or (
                 trial_dist == best_candidate_dist and best_candidate_overshoot and not overshoot
             ):
-                best_candidate_attrs = trial
+                best_candidate_idx = idx
                 best_candidate_overall = trial_overall
                 best_candidate_dist = trial_dist
                 best_candidate_overshoot = overshoot
 
-        if best_candidate_attrs is None or best_candidate_overall is None:
+        if best_candidate_idx < 0 or best_candidate_overall is None:
             break
 
         if best_candidate_dist > current_dist and current_dist <= 1:
             break
 
-        changed_idx = -1
-        for i in range(len(attrs)):
-            if best_candidate_attrs[i] != attrs[i]:
-                changed_idx = i
-                break
-
-        attrs = best_candidate_attrs
-        if changed_idx >= 0:
-            change_counts[changed_idx] = change_counts.get(changed_idx, 0) + 1
+        if evaluator.apply(best_candidate_idx, direction):
+            change_counts[best_candidate_idx] = change_counts.get(best_candidate_idx, 0) + 1
+        current_overall = best_candidate_overall
 
         if best_candidate_dist < best_dist:
             best_attrs = list(attrs)
@@ -2291,18 +2305,15 @@ def _apply_small_attribute_churn(p: Dict[str, Any], settings: Dict[str, Any], rn
         p["overall"] = start_overall
         return
 
-    trial = list(attrs)
+    evaluator = OverallEvaluator(attrs, _POS_PARAMS.get(_normalized_pos(pos), _POS_PARAMS["SF"]))
+    trial = evaluator.attrs
     indices = list(range(len(trial)))
     rng.shuffle(indices)
 
     for idx in indices[:5]:
         direction = 1 if rng.random() < 0.50 else -1
-        new_val = int(_clamp(trial[idx] + direction, 25, 99))
-        if new_val != trial[idx]:
-            old_val = trial[idx]
-            trial[idx] = new_val
-            if calc_overall_from_attrs(trial, pos) != start_overall:
-                trial[idx] = old_val
+        if evaluator.overall_after(idx, direction) == start_overall:
+            evaluator.apply(idx, direction)
 
     p["attrs"] = trial
     p["overall"] = calc_overall_from_attrs(trial, pos)
@@ -3991,6 +4002,37 @@ def _compute_raw_progression_plan(
 
 
 
+def set_progression_plan_backend(backend: str) -> str:
+    """Select the raw-plan backend; returns the backend actually in use."""
+    global PROGRESSION_PLAN_BACKEND
+    PROGRESSION_PLAN_BACKEND = "python"
+    if backend != "numpy":
+        return PROGRESSION_PLAN_BACKEND
+    try:
+        import progression_numpy
+        # Imported before NumPy was loaded, or bound to an older copy of this
+        # module after a registry reload.
+        if not progression_numpy.NUMPY_AVAILABLE or progression_numpy.pg is not sys.modules.get(__name__):
+            progression_numpy = importlib.reload(progression_numpy)
+    except Exception:
+        return PROGRESSION_PLAN_BACKEND
+    if progression_numpy.NUMPY_AVAILABLE:
+        PROGRESSION_PLAN_BACKEND = "numpy"
+    return PROGRESSION_PLAN_BACKEND
+
+
+def _compute_progression_plan(
+    league: Dict[str, Any],
+    stats_by_key: Optional[Dict[str, Dict[str, Any]]],
+    settings: Dict[str, Any],
+    rng: random.Random
+) -> List[Dict[str, Any]]:
+    if PROGRESSION_PLAN_BACKEND == "numpy":
+        from progression_numpy import compute_raw_progression_plan_numpy
+        return compute_raw_progression_plan_numpy(league, stats_by_key, settings, rng)
+    return _compute_raw_progression_plan(league, stats_by_key, settings, rng)
+
+
 # v20 fine-grained cumulative shelves. These match the current 2026-27 roster
 # ecosystem and are rebuilt from the imported league, including free agents.
 _PROGRESS_TIER_THRESHOLDS = tuple(range(RATING_MAX_OVERALL, 61, -1))
@@ -5820,6 +5862,112 @@ def _apply_age_peak_caps(plan: List[Dict[str, Any]], rng: random.Random) -> None
     _refresh_plan_targets(plan)
 
 
+# Shape ledger: overall histogram + target buckets shared by every hard-lock
+# pass. Moves go through _shape_ledger_set_target so counts stay O(1) and
+# shelf candidates come from buckets instead of a full plan scan.
+def _shape_ledger(plan: List[Dict[str, Any]]) -> Dict[str, Any]:
+    hist = [0] * (RATING_MAX_OVERALL + 1)
+    buckets: Dict[int, Dict[int, Dict[str, Any]]] = {}
+    order: Dict[int, int] = {}
+    for idx, item in enumerate(plan):
+        target = int(item.get("target_overall", 0))
+        order[id(item)] = idx
+        hist[target] += 1
+        buckets.setdefault(target, {})[idx] = item
+    return {"hist": hist, "buckets": buckets, "order": order, "stamps": {}}
+
+
+def _shape_ledger_count(ledger: Dict[str, Any], lo: int, hi: int = RATING_MAX_OVERALL) -> int:
+    hist = ledger["hist"]
+    return sum(hist[v] for v in range(max(0, int(lo)), min(RATING_MAX_OVERALL, int(hi)) + 1))
+
+
+def _shape_ledger_items(ledger: Dict[str, Any], lo: int, hi: int = RATING_MAX_OVERALL) -> List[Dict[str, Any]]:
+    """Items with lo <= target <= hi, in plan order."""
+    rows: List[Tuple[int, Dict[str, Any]]] = []
+    for v in range(max(0, int(lo)), min(RATING_MAX_OVERALL, int(hi)) + 1):
+        bucket = ledger["buckets"].get(v)
+        if bucket:
+            rows.extend(bucket.items())
+    rows.sort(key=lambda row: row[0])
+    return [item for _, item in rows]
+
+
+def _shape_ledger_set_target(
+    ledger: Dict[str, Any],
+    item: Dict[str, Any],
+    desired: int,
+    rng: random.Random,
+) -> bool:
+    old = int(item.get("target_overall", 0))
+    if not _hard_set_target(item, desired, rng):
+        return False
+    new = int(item.get("target_overall", 0))
+    idx = ledger["order"][id(item)]
+    ledger["hist"][old] -= 1
+    ledger["hist"][new] += 1
+    ledger["buckets"].get(old, {}).pop(idx, None)
+    ledger["buckets"].setdefault(new, {})[idx] = item
+    ledger["stamps"][idx] = ledger["stamps"].get(idx, 0) + 1
+    return True
+
+
+def _shape_ledger_trim(
+    ledger: Dict[str, Any],
+    lo: int,
+    hi: int,
+    high: int,
+    demote_to: int,
+    rng: random.Random,
+    prefer_movable: bool = True,
+) -> None:
+    """Move players out of the lo..hi shelf until it holds at most `high`.
+
+    Same selection as the old re-sort-per-move loop: the lowest
+    _hard_trim_priority among players whose yearly window reaches demote_to,
+    falling back to any unprotected player on the shelf. Priorities are
+    computed once per shelf and a moved player is re-pushed only if the
+    window kept it on the shelf, so each move is O(log n).
+    """
+    if _shape_ledger_count(ledger, lo, hi) <= high:
+        return
+
+    stamps = ledger["stamps"]
+    order = ledger["order"]
+    movable: List[Tuple[Any, ...]] = []
+    fallback: List[Tuple[Any, ...]] = []
+
+    def push(item: Dict[str, Any]) -> None:
+        idx = order[id(item)]
+        entry = (_hard_trim_priority(item, rng), idx, stamps.get(idx, 0), item)
+        if prefer_movable and _hard_item_bounds(item, rng)[0] <= demote_to:
+            heapq.heappush(movable, entry)
+        else:
+            heapq.heappush(fallback, entry)
+
+    for item in _shape_ledger_items(ledger, lo, hi):
+        if not _is_shape_protected_item(item):
+            push(item)
+
+    def pop_live(heap: List[Tuple[Any, ...]]) -> Optional[Dict[str, Any]]:
+        while heap:
+            _key, idx, stamp, item = heapq.heappop(heap)
+            if stamps.get(idx, 0) == stamp:
+                return item
+        return None
+
+    while _shape_ledger_count(ledger, lo, hi) > high:
+        item = pop_live(movable)
+        if item is None:
+            item = pop_live(fallback)
+        if item is None:
+            break
+        if not _shape_ledger_set_target(ledger, item, demote_to, rng):
+            break
+        if lo <= int(item.get("target_overall", 0)) <= hi:
+            push(item)
+
+
 def _apply_true_hard_shape_lock(
     plan: List[Dict[str, Any]],
     settings: Dict[str, Any],
@@ -5838,68 +5986,37 @@ def _apply_true_hard_shape_lock(
     exact = _hard_exact_corridors()
     _refresh_plan_targets(plan)
     _apply_age_peak_caps(plan, rng)
+    ledger = _shape_ledger(plan)
 
     # 1. Hard cumulative maximums, highest shelf first.
     for threshold in _PROGRESS_TIER_THRESHOLDS:
-        _refresh_plan_targets(plan)
         _low, high = cumulative[int(threshold)]
-        while _hard_count(plan, threshold) > high:
-            candidates = [
-                item for item in plan
-                if not _is_shape_protected_item(item)
-                and int(item.get("target_overall", 0)) >= threshold
-                and _hard_item_bounds(item, rng)[0] <= threshold - 1
-            ]
-            candidates.sort(key=lambda item: _hard_trim_priority(item, rng))
-            if not candidates:
-                candidates = [item for item in plan if not _is_shape_protected_item(item) and int(item.get("target_overall", 0)) >= threshold]
-                if not candidates:
-                    break
-                candidates.sort(key=lambda item: _hard_trim_priority(item, rng))
-            if not _hard_set_target(candidates[0], threshold - 1, rng):
-                break
+        _shape_ledger_trim(ledger, threshold, RATING_MAX_OVERALL, high, threshold - 1, rng)
 
     # 2. Hard exact-rung anti-clump maximums.
     for rung in range(_PROGRESS_EXACT_RUNG_MAX, _PROGRESS_EXACT_RUNG_MIN - 1, -1):
-        _refresh_plan_targets(plan)
         _low, high = exact.get(rung, (0, 9999))
-        while _hard_exact_count(plan, rung) > high:
-            candidates = [
-                item for item in plan
-                if not _is_shape_protected_item(item)
-                and int(item.get("target_overall", 0)) == rung
-                and _hard_item_bounds(item, rng)[0] <= rung - 1
-            ]
-            candidates.sort(key=lambda item: _hard_trim_priority(item, rng))
-            if not candidates:
-                candidates = [item for item in plan if not _is_shape_protected_item(item) and int(item.get("target_overall", 0)) == rung]
-                if not candidates:
-                    break
-                candidates.sort(key=lambda item: _hard_trim_priority(item, rng))
-            if not _hard_set_target(candidates[0], rung - 1, rng):
-                break
+        _shape_ledger_trim(ledger, rung, rung, high, rung - 1, rng)
 
     # 3. Tight cumulative floors create replacement stars when old players
     # leave. Only plausible candidates within their yearly/age bounds can fill.
     for _pass in range(3):
         changed = False
         for threshold in _PROGRESS_TIER_THRESHOLDS:
-            _refresh_plan_targets(plan)
             low, _high = cumulative[int(threshold)]
-            need = low - _hard_count(plan, threshold)
+            need = low - _shape_ledger_count(ledger, threshold)
             if need <= 0:
                 continue
             candidates = []
-            for item in plan:
+            near_floor = threshold - 2 if threshold <= 84 else threshold - 1
+            for item in _shape_ledger_items(ledger, near_floor, threshold - 1):
                 if _is_shape_protected_item(item):
                     continue
-                after = int(item.get("target_overall", 0))
                 _lo, hi = _hard_item_bounds(item, rng)
                 p = item.get("player") or {}
                 age = _safe_int(p.get("age"), 25)
-                pot = _safe_int(p.get("potential"), int(item.get("before_overall", after)))
-                near_enough = after == threshold - 1 or (threshold <= 84 and after >= threshold - 2)
-                if after < threshold and hi >= threshold and near_enough:
+                pot = _safe_int(p.get("potential"), int(item.get("before_overall", item.get("target_overall", 0))))
+                if hi >= threshold:
                     if threshold >= 95 and (age > 30 or pot < threshold):
                         continue
                     if threshold >= 90 and (age > 31 or pot < threshold - 1):
@@ -5907,7 +6024,7 @@ def _apply_true_hard_shape_lock(
                     candidates.append(item)
             candidates.sort(key=lambda item: _hard_boost_priority(item, threshold, rng), reverse=True)
             for item in candidates[:need]:
-                if _hard_set_target(item, threshold, rng):
+                if _shape_ledger_set_target(ledger, item, threshold, rng):
                     changed = True
         if not changed:
             break
@@ -5916,41 +6033,28 @@ def _apply_true_hard_shape_lock(
     # players upward, then re-run all hard maximums.
     for rung in range(_PROGRESS_EXACT_RUNG_MAX - 1, _PROGRESS_EXACT_RUNG_MIN - 1, -1):
         low, _high = exact.get(rung, (0, 9999))
-        need = low - _hard_exact_count(plan, rung)
+        need = low - _shape_ledger_count(ledger, rung, rung)
         if need <= 0:
             continue
         candidates = []
-        for item in plan:
+        for item in _shape_ledger_items(ledger, rung - 2, rung - 1):
             if _is_shape_protected_item(item):
                 continue
-            after = int(item.get("target_overall", 0))
             _lo, hi = _hard_item_bounds(item, rng)
-            if rung - 2 <= after < rung and hi >= rung:
+            if hi >= rung:
                 candidates.append(item)
         candidates.sort(key=lambda item: _hard_boost_priority(item, rung, rng), reverse=True)
         for item in candidates[:need]:
-            _hard_set_target(item, rung, rng)
+            _shape_ledger_set_target(ledger, item, rung, rng)
 
     # Re-assert every upper cap after floor filling. These loops terminate
     # because each correction moves a player below the current threshold/rung.
     for threshold in _PROGRESS_TIER_THRESHOLDS:
         _low, high = cumulative[int(threshold)]
-        while _hard_count(plan, threshold) > high:
-            candidates = [item for item in plan if not _is_shape_protected_item(item) and int(item.get("target_overall", 0)) >= threshold]
-            candidates.sort(key=lambda item: _hard_trim_priority(item, rng))
-            if not candidates:
-                break
-            if not _hard_set_target(candidates[0], threshold - 1, rng):
-                break
+        _shape_ledger_trim(ledger, threshold, RATING_MAX_OVERALL, high, threshold - 1, rng, prefer_movable=False)
     for rung in range(_PROGRESS_EXACT_RUNG_MAX, _PROGRESS_EXACT_RUNG_MIN - 1, -1):
         _low, high = exact.get(rung, (0, 9999))
-        while _hard_exact_count(plan, rung) > high:
-            candidates = [item for item in plan if not _is_shape_protected_item(item) and int(item.get("target_overall", 0)) == rung]
-            candidates.sort(key=lambda item: _hard_trim_priority(item, rng))
-            if not candidates:
-                break
-            if not _hard_set_target(candidates[0], rung - 1, rng):
-                break
+        _shape_ledger_trim(ledger, rung, rung, high, rung - 1, rng, prefer_movable=False)
 
     _refresh_plan_targets(plan)
     violations: List[Dict[str, Any]] = []
@@ -5958,7 +6062,7 @@ def _apply_true_hard_shape_lock(
     exact_audit: Dict[str, Any] = {}
     for threshold in _PROGRESS_TIER_THRESHOLDS:
         low, high = cumulative[int(threshold)]
-        actual = _hard_count(plan, threshold)
+        actual = _shape_ledger_count(ledger, threshold)
         ok = low <= actual <= high
         cumulative_audit[str(threshold)] = {
             "actual": actual, "targetMin": low, "max": high,
@@ -5973,7 +6077,7 @@ def _apply_true_hard_shape_lock(
             pass
     for rung in range(_PROGRESS_EXACT_RUNG_MAX, _PROGRESS_EXACT_RUNG_MIN - 1, -1):
         low, high = exact.get(rung, (0, 9999))
-        actual = _hard_exact_count(plan, rung)
+        actual = _shape_ledger_count(ledger, rung, rung)
         ok = low <= actual <= high
         exact_audit[str(rung)] = {"actual": actual, "targetMin": low, "max": high, "hard": True, "ok": ok, "belowTarget": actual < low}
         if actual > high:
@@ -6071,19 +6175,20 @@ def _force_overall_at_most(
     weights = list(pos_cfg["weights"])
     prim = {int(i) - 1 for i in pos_cfg["prim"]}
 
+    evaluator = OverallEvaluator(attrs, pos_cfg)
+    attrs = evaluator.attrs
+
     steps = 0
     while current > cap_overall and steps < max_steps:
         candidates = [i for i, v in enumerate(attrs) if int(v) > 25]
         if not candidates:
             break
 
-        best_trial = None
+        best_idx = -1
         best_score = None
 
         for idx in candidates:
-            trial = list(attrs)
-            trial[idx] = int(_clamp(trial[idx] - 1, 25, 99))
-            trial_ovr = calc_overall_from_attrs(trial, pos)
+            trial_ovr = evaluator.overall_after(idx, -1)
             impact = current - trial_ovr
             score = (
                 impact,
@@ -6093,13 +6198,13 @@ def _force_overall_at_most(
             )
             if best_score is None or score > best_score:
                 best_score = score
-                best_trial = trial
+                best_idx = idx
 
-        if best_trial is None:
+        if best_idx < 0:
             break
 
-        attrs = best_trial
-        new_current = calc_overall_from_attrs(attrs, pos)
+        evaluator.apply(best_idx, -1)
+        new_current = evaluator.overall()
 
         # If OVR did not move, keep chipping away at high-impact attributes.
         # Some 98/99/84/82 cliffs require several attribute points before the
@@ -6615,8 +6720,9 @@ def apply_end_of_season_progression(
 
     settings = settings or DEFAULT_SETTINGS
     rng = random.Random(seed)
+    stats_by_key = _season_stats_source(stats_by_key)
 
-    plan = _compute_raw_progression_plan(league, stats_by_key, settings, rng)
+    plan = _compute_progression_plan(league, stats_by_key, settings, rng)
     _apply_league_rating_governor(league, plan, settings, rng)
     _apply_elite_peak_caps(plan, settings, rng)
     _apply_true_hard_shape_lock(plan, settings, rng)
@@ -6775,6 +6881,7 @@ def apply_end_of_season_progression_with_deltas(
 
     # Use one shared RNG stream for progression and potential updates.
     rng = random.Random(seed)
+    stats_by_key = _season_stats_source(stats_by_key)
 
     _v25_league_seed(league, seed)
     ensure_progression_fields(league, season_start_year = season_year)
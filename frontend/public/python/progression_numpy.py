@@ -0,0 +1,568 @@
+# progression_numpy.py
+#
+# Array-backed raw progression plan for apply_end_of_season_progression.
+#
+# progression._compute_raw_progression_plan stays the reference engine. This
+# module walks the league once to pack every player into columns (age,
+# overall, potential, position, the 15-attribute matrix and the saved V25
+# dev-path / career-timing profile fields), computes the expected delta,
+# sigma and per-player delta bounds for the whole league with array ops, draws
+# all the random terms from one NumPy Generator, and only then writes plan
+# items back out. The formulas are the V24/V25 ones term for term, so only the
+# random draws differ from the scalar path.
+# frontend/scripts/progression-numpy-distribution.py checks the deterministic
+# terms exactly and the sampled deltas by distribution against the scalar
+# engine.
+#
+# The plan is a small share of a progression pass (about 7% on the 2027
+# fixture). Most of the time goes to _move_attrs_toward_target_overall and the
+# shape locks, greedy per-player searches whose candidate order comes from the
+# shared rng, so they stay scalar. This engine is opt-in, and the exact-term
+# checks above are what keep its copy of the formulas in sync with
+# progression.py.
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - NumPy is optional (Pyodide loads it on demand)
+    np = None
+
+import progression as pg
+
+NUMPY_AVAILABLE = np is not None
+
+ATTR_COUNT = 15
+
+_PROFILE_NAMES = (
+    "generational_hit", "star_hit", "quality_starter", "steady_growth",
+    "slow_burn", "late_bloomer", "early_peak", "short_peak", "volatile",
+    "disappointment", "true_bust", "hidden_gem", "raw_tools_outlier",
+    "skill_feel_outlier", "long_prime", "fast_decliner",
+)
+_PROFILE_CODES = {name: code for code, name in enumerate(_PROFILE_NAMES)}
+_UNKNOWN_PROFILE = -1
+
+_POSITIONS = tuple(pg._POS_PARAMS.keys())
+
+# _v24_age_expectation base by age, indexed from 18 (<=18) to 39 (>=39).
+_AGE_BASE = (
+    0.34, 0.31, 0.28, 0.23, 0.16, 0.10, 0.04, 0.00, -0.04, -0.09, -0.17,
+    -0.28, -0.45, -0.70, -0.98, -1.28, -1.60, -1.95, -2.35, -2.75, -3.15,
+    -3.50,
+)
+
+
+def _code(name):
+    return _PROFILE_CODES[name]
+
+
+def _is(names, *wanted):
+    out = np.zeros(names.shape, dtype=bool)
+    for name in wanted:
+        out |= names == _code(name)
+    return out
+
+
+# ------------------------------------------------------------
+# Packing
+# ------------------------------------------------------------
+
+def pack_progression_league(league, rng):
+    """One pass over _all_players_with_team -> column dict.
+
+    Mirrors the per-player prelude of _compute_raw_progression_plan: the
+    attribute matrix is packed first so missing overalls can be filled from
+    the vectorised formula, then age/overall/potential and the saved profile
+    fields are read. Profile and career-timing lookups stay scalar: they are
+    saved dicts, built with `rng` only when a player has none yet.
+    """
+    players, teams, attrs, pos, has_attrs = [], [], [], [], []
+    for p, tname in pg._all_players_with_team(league):
+        if not isinstance(p, dict):
+            continue
+        with_attrs = isinstance(p.get("attrs"), list) and len(p.get("attrs") or []) > 0
+        if with_attrs:
+            p["attrs"] = pg._ensure_attrs(p.get("attrs"))
+        players.append(p)
+        teams.append(tname)
+        has_attrs.append(with_attrs)
+        attrs.append(p["attrs"] if with_attrs else [75] * ATTR_COUNT)
+        pos.append(_POSITIONS.index(pg._normalized_pos(p.get("pos") or p.get("position") or "SF")))
+
+    packed = {"players": players, "teams": teams, "profiles": [], "size": len(players)}
+    if not players:
+        return packed
+
+    packed["attrs"] = np.array(attrs, dtype=np.int64).reshape(len(players), ATTR_COUNT)
+    packed["pos"] = np.array(pos, dtype=np.int64)
+    formula = formula_overalls(packed["attrs"], packed["pos"])
+
+    cols = {k: [] for k in (
+        "current", "age", "overall", "potential", "gate_potential", "protected",
+        "name", "ceiling", "event_ceiling", "floor", "peak_start", "peak_end",
+        "decline_start", "sharp", "volatility", "hidden_level", "reveal_age",
+        "boom_bust", "elite_young", "low_young", "timing_mult",
+    )}
+    for i, p in enumerate(players):
+        if has_attrs[i]:
+            current = pg._safe_int(p.get("overall"), int(formula[i]))
+            if p.get("overall") is None:
+                p["overall"] = current
+        else:
+            current = pg._safe_int(p.get("overall"), 70)
+
+        age = pg._safe_int(p.get("age"), 25)
+        overall = int(pg._clamp(pg._safe_int(p.get("overall"), 70), 25, 99))
+        potential = int(pg._clamp(pg._safe_int(p.get("potential"), overall), overall, 99))
+        protected = pg._is_current_draft_shape_protected(p)
+        prof = pg._v25_profile(p, rng)
+        name = str(prof.get("profile") or "steady_growth")
+        peak_start = pg._safe_int(prof.get("peakStartAge"), 25)
+        packed["profiles"].append(prof)
+
+        cols["current"].append(current)
+        cols["age"].append(age)
+        cols["overall"].append(overall)
+        cols["potential"].append(potential)
+        # _apply_threshold_crossing_gates reads potential unclamped.
+        cols["gate_potential"].append(pg._safe_int(p.get("potential"), current))
+        cols["protected"].append(protected)
+        cols["name"].append(_PROFILE_CODES.get(name, _UNKNOWN_PROFILE))
+        cols["ceiling"].append(pg._safe_int(prof.get("hiddenCeiling"), max(overall, potential)))
+        cols["event_ceiling"].append(pg._safe_int(prof.get("hiddenCeiling"), potential))
+        cols["floor"].append(pg._safe_int(prof.get("hiddenFloor"), min(overall, potential)))
+        cols["peak_start"].append(peak_start)
+        cols["peak_end"].append(pg._safe_int(prof.get("peakEndAge"), 30))
+        cols["decline_start"].append(pg._safe_int(prof.get("declineStartAge"), 32))
+        cols["sharp"].append(pg._safe_float(prof.get("declineSharpness"), 0.5))
+        cols["volatility"].append(pg._safe_float(prof.get("volatility"), 1.0))
+        cols["hidden_level"].append(pg._v25_hidden_upside_level_from_profile(prof))
+        cols["reveal_age"].append(pg._safe_int(prof.get("hiddenRevealAge"), peak_start))
+        cols["boom_bust"].append(pg._v25_traits(p)["boomBust"])
+        cols["elite_young"].append(pg._v25_elite_young_prospect(p, age, overall, potential, prof))
+        cols["low_young"].append(pg._v25_low_young_developmental(p, age, overall, potential, prof))
+        # Shape-protected rookies never roll, so they never get a timing profile.
+        cols["timing_mult"].append(1.0 if protected else pg._career_timing_sigma_mult(p, age, overall, potential, rng))
+
+    float_cols = {"sharp", "volatility", "boom_bust", "timing_mult"}
+    bool_cols = {"protected", "elite_young", "low_young"}
+    for key, values in cols.items():
+        dtype = float if key in float_cols else bool if key in bool_cols else np.int64
+        packed[key] = np.array(values, dtype=dtype)
+    packed["formula"] = formula
+    return packed
+
+
+def formula_overalls(attrs, pos):
+    """calc_overall_from_attrs for every row of an (N, 15) attribute matrix.
+
+    The weighted sum is accumulated column by column in the same order as the
+    scalar loop, so every row rounds exactly like the reference.
+    """
+    n = attrs.shape[0]
+    weights = np.array([pg._POS_PARAMS[name]["weights"] for name in _POSITIONS], dtype=float)[pos]
+    alpha = np.array([float(pg._POS_PARAMS[name]["alpha"]) for name in _POSITIONS])[pos]
+    values = attrs.astype(float)
+
+    weighted = np.zeros(n)
+    for i in range(ATTR_COUNT):
+        weighted = weighted + weights[:, i] * values[:, i]
+
+    peak = np.full(n, 75.0)
+    for code, name in enumerate(_POSITIONS):
+        rows = pos == code
+        prim = [int(i) - 1 for i in pg._POS_PARAMS[name]["prim"] if 0 <= int(i) - 1 < ATTR_COUNT]
+        if rows.any() and prim:
+            peak[rows] = values[rows][:, prim].max(axis=1)
+
+    blended = alpha * peak + (1.0 - alpha) * weighted
+    sigmoid = 1.0 / (1.0 + np.exp(-pg.OVERALL_SIGMOID_SLOPE * (blended - pg.OVERALL_SIGMOID_MIDPOINT)))
+    overall = pg.RATING_MIN_OVERALL + (pg.RATING_MAX_OVERALL - pg.RATING_MIN_OVERALL) * sigmoid
+    overall = np.clip(overall, float(pg.RATING_MIN_OVERALL), float(pg.RATING_MAX_OVERALL))
+    overall = np.floor(overall + 0.5).astype(np.int64)
+    num90 = (values >= 90.0).sum(axis=1)
+    bonus = np.where(num90 >= 3, num90 - 2, 0)
+    return np.where(bonus > 0, np.minimum(pg.RATING_MAX_OVERALL, overall + bonus), overall)
+
+
+# ------------------------------------------------------------
+# Deterministic terms
+# ------------------------------------------------------------
+
+def _age_expectation(age, overall):
+    base = np.array(_AGE_BASE)[np.clip(age, 18, 39) - 18]
+    young = age <= 24
+    adjust = np.select(
+        [overall >= 97, overall >= 95, overall >= 92, overall >= 90, (overall < 62) & young, (overall < 65) & young],
+        [-0.22, -0.15, -0.08, -0.04, 0.14, 0.10],
+        default = 0.0,
+    )
+    return base + adjust
+
+
+def _potential_expectation(age, overall, potential):
+    gap = np.maximum(-8, potential - overall).astype(float)
+    return np.select(
+        [gap <= -2, gap <= 0, age <= 21, age <= 24, age <= 26, age <= 28],
+        [
+            -0.14,
+            np.where(age <= 28, -0.05, 0.0),
+            np.clip(0.028 * gap, 0.0, 0.38),
+            np.clip(0.018 * gap, 0.0, 0.22),
+            np.clip(0.010 * gap, 0.0, 0.10),
+            np.clip(0.004 * gap, 0.0, 0.03),
+        ],
+        default = 0.0,
+    )
+
+
+def _tier_expectation(age, overall, potential):
+    gap = np.maximum(0, potential - overall)
+    return np.select(
+        [overall >= 97, overall >= 95, overall >= 92, overall >= 90,
+         (overall >= 70) & (overall <= 73) & (age <= 27), (overall >= 62) & (overall <= 69) & (age <= 27)],
+        [np.where(gap < 2, -0.52, -0.32), np.where(gap < 4, -0.34, -0.18),
+         np.where(gap < 5, -0.18, -0.04), np.where(gap < 4, -0.08, 0.02), 0.06, 0.03],
+        default = 0.0,
+    )
+
+
+def _story_phase_pressure(c):
+    age, overall, potential = c["age"], c["overall"], c["potential"]
+    names, hidden = c["name"], c["hidden_level"]
+    ps, pe = c["peak_start"], c["peak_end"]
+    room = np.maximum(0, c["ceiling"] - overall)
+
+    pre_peak = age < ps
+    in_peak = ~pre_peak & (age <= pe)
+    post_peak = ~pre_peak & ~in_peak
+
+    years_to_peak = np.maximum(1, ps - age)
+    pre = np.clip((room / years_to_peak) * 0.095, 0.0, 0.42)
+    pre_name = np.select(
+        [_is(names, "generational_hit", "star_hit"), _is(names, "quality_starter", "steady_growth"),
+         _is(names, "slow_burn", "late_bloomer"), _is(names, "disappointment"), _is(names, "true_bust")],
+        [np.where(room >= 5, 0.13, 0.04), np.where(room >= 3, 0.05, 0.0),
+         np.where(age < ps - 2, -0.03, -0.09), -0.08, -0.16],
+        default = 0.0,
+    )
+    pre = pre + pre_name
+
+    peak = np.clip(room * 0.055, 0.0, 0.35)
+    outlier = _is(names, "hidden_gem", "raw_tools_outlier", "skill_feel_outlier")
+    peak = np.where(outlier, peak + (0.18 + hidden * 0.04), peak)
+
+    late = np.where((overall > c["floor"]) & _is(names, "true_bust", "fast_decliner"), -0.18, 0.0)
+
+    adj = np.select([pre_peak, in_peak], [pre, peak], default = late)
+
+    post = np.maximum(1, age - pe)
+    fade = np.select(
+        [_is(names, "long_prime"), _is(names, "late_bloomer", "slow_burn", "hidden_gem", "raw_tools_outlier", "skill_feel_outlier")],
+        [np.minimum(0.24, post * 0.045), np.minimum(0.42, post * 0.085)],
+        default = np.minimum(0.55, post * 0.12),
+    )
+    adj = np.where(post_peak, adj - fade, adj)
+
+    low_young_lift = 0.16 + np.maximum(0, np.minimum(8, potential - overall)) * 0.018
+    adj = np.where(c["low_young"], adj + low_young_lift, adj)
+    return np.clip(adj, -0.55, 0.65)
+
+
+def _profile_adjustment_terms(c):
+    """_v25_profile_expected_adjustment split into a fixed part and the
+    per-profile random branches (volatile pick, disappointment/bust rebounds)."""
+    age, overall, potential = c["age"], c["overall"], c["potential"]
+    names, hidden = c["name"], c["hidden_level"]
+    ps, pe, ds = c["peak_start"], c["peak_end"], c["decline_start"]
+    ceiling = c["ceiling"]
+    room = np.maximum(0, ceiling - overall)
+
+    adj = _story_phase_pressure(c)
+
+    in_peak_room2 = (age <= pe) & (room >= 2)
+    by_name = np.select(
+        [_is(names, n) for n in (
+            "generational_hit", "star_hit", "quality_starter", "steady_growth", "slow_burn",
+            "late_bloomer", "early_peak", "short_peak", "disappointment", "true_bust",
+            "hidden_gem", "raw_tools_outlier", "skill_feel_outlier", "long_prime", "fast_decliner",
+        )],
+        [
+            np.where(room >= 4, 0.52, 0.15),
+            np.where(room >= 3, 0.34, 0.08),
+            np.where(room >= 2, 0.16, 0.0),
+            np.where((room >= 2) & (age <= 27), 0.05, 0.0),
+            np.where(age < ps - 2, -0.14, np.where(in_peak_room2, 0.32, 0.04)),
+            np.where(age < ps - 1, -0.08, np.where(in_peak_room2, 0.42, 0.02)),
+            np.where(in_peak_room2, 0.30, np.where(age >= ds, -0.18, 0.0)),
+            np.where((ps <= age) & in_peak_room2, 0.28, np.where(age >= ds, -0.28, 0.0)),
+            -np.where((potential >= 90) & (age <= 24), 0.10, 0.24),
+            -np.where((potential >= 90) & (age <= 24), 0.22, 0.48),
+            np.where(age < ps, 0.28, np.where(in_peak_room2, 0.78, 0.14)),
+            np.where(age < 21, 0.16, np.where((age <= pe) & (room >= 3), 0.70, 0.10)),
+            np.where(age < 22, 0.10, np.where(in_peak_room2, 0.60, 0.14)),
+            np.where(age <= pe, 0.08, np.where(age >= ds, 0.18, 0.0)),
+            -np.where(age >= ds - 1, 0.40, 0.0),
+        ],
+        default = 0.0,
+    )
+    adj = adj + by_name
+
+    star_names = _is(names, "generational_hit", "star_hit", "hidden_gem")
+    adj = np.where(
+        (ceiling >= 98) & (age >= 23) & (age <= 29) & (overall >= 94)
+        & (star_names | _is(names, "raw_tools_outlier", "skill_feel_outlier")),
+        adj + 0.12, adj,
+    )
+    adj = np.where((ceiling >= 99) & (age >= 24) & (age <= 28) & (overall >= 96) & star_names, adj + 0.16, adj)
+
+    has_hidden = (hidden > 0) & (room > 0)
+    reveal = c["reveal_age"]
+    runway = np.select(
+        [age < reveal - 1, age <= pe],
+        [0.08 + hidden * 0.055, 0.22 + hidden * 0.205],
+        default = 0.05 + hidden * 0.05,
+    )
+    adj = np.where(has_hidden, adj + runway, adj)
+    adj = np.where(has_hidden & (potential <= 84) & (age <= 26), adj + (0.11 + hidden * 0.075), adj)
+    adj = np.where(has_hidden & (hidden >= 3) & (age <= 24) & (overall <= 78) & (room >= 10), adj + 0.18, adj)
+    adj = np.where(has_hidden & (hidden >= 4) & (age <= 23) & (overall <= 76) & (room >= 12), adj + 0.22, adj)
+
+    declining = age >= ds
+    pressure = np.minimum(2.8, (age - ds + 1) * c["sharp"] * 0.46)
+    fast = _is(names, "fast_decliner", "short_peak")
+    pressure = np.select(
+        [_is(names, "long_prime"), fast], [pressure * 0.35, pressure * 1.30], default = pressure,
+    )
+    pressure = np.select(
+        [(age <= 33) & (overall >= 90) & ~fast, (age <= 33) & (overall >= 86) & ~fast],
+        [pressure * 0.52, pressure * 0.78],
+        default = pressure,
+    )
+
+    return {
+        "fixed": adj,
+        "decline": np.where(declining, pressure, 0.0),
+        "room": room,
+    }
+
+
+def _finish_profile_adjustment(terms, extra):
+    adj = terms["fixed"] + extra
+    adj = adj - terms["decline"]
+    return np.where((terms["room"] <= 0) & (adj > 0), adj * 0.18, adj)
+
+
+def _sigma(c):
+    age, overall, names = c["age"], c["overall"], c["name"]
+    base = np.select([age <= 22, age <= 25, age <= 29, age <= 33], [1.05, 1.00, 0.94, 1.02], default = 1.15)
+    base = np.select([overall >= 95, overall >= 90, overall < 74], [base * 0.72, base * 0.84, base * 1.08], default = base)
+    organic = base * c["timing_mult"]
+
+    mult = c["volatility"]
+    mult = np.where(_is(names, "volatile", "raw_tools_outlier", "skill_feel_outlier", "hidden_gem"), mult * 1.12, mult)
+    mult = np.where(_is(names, "steady_growth", "long_prime"), mult * 0.88, mult)
+    mult = np.where(_is(names, "true_bust", "disappointment") & (c["age"] <= 23), mult * 1.05, mult)
+    hidden = c["hidden_level"]
+    mult = np.where((hidden > 0) & (age <= 26), mult * (1.0 + hidden * 0.06), mult)
+    return organic * np.clip(mult, 0.55, 1.95)
+
+
+def _delta_bounds(c):
+    """_v25_bound_delta as (lo, hi, lucky_hi, lucky_chance) arrays.
+
+    Rows in one of the random +1 lanes use lucky_hi with probability
+    lucky_chance; every other row has lucky_chance == 0.
+    """
+    age, overall, potential = c["age"], c["overall"], c["potential"]
+    names, hidden = c["name"], c["hidden_level"]
+    elite, low_young = c["elite_young"], c["low_young"]
+    room = np.maximum(0, c["ceiling"] - overall)
+    bust = _is(names, "true_bust", "disappointment")
+
+    lo = np.select([age < 30, age <= 33], [-3, -4], default = -5)
+    elite_floor = np.select(
+        [_is(names, "true_bust"), _is(names, "disappointment", "volatile")],
+        [-2, -1],
+        default = np.where(age <= 20, 0, -1),
+    )
+    lo = np.where(elite, np.maximum(lo, elite_floor), lo)
+    lo = np.where(~elite & (potential >= 90) & (age <= 24), np.maximum(lo, np.where(bust, -2, -1)), lo)
+    lo = np.where(low_young, np.maximum(lo, np.where(age <= 22, 0, -1)), lo)
+
+    outlier = _is(names, "raw_tools_outlier", "skill_feel_outlier", "hidden_gem")
+    lanes = [
+        (age <= 23) & (hidden >= 4) & (overall <= 77) & (room >= 12),
+        (age <= 23) & outlier & (room >= 11) & (overall <= 77),
+        (age <= 22) & _is(names, "generational_hit") & (room >= 9),
+        (age <= 24) & ((hidden >= 3) | outlier) & (room >= 8),
+        (age <= 24) & (_is(names, "generational_hit", "star_hit", "slow_burn", "late_bloomer") | elite) & (room >= 6),
+        (age <= 25) & low_young & (room >= 8),
+        age <= 24,
+        age <= 29,
+    ]
+    hi = np.select(lanes, [5, 4, 4, 4, 3, 3, 3, 2], default = 1)
+    lucky_hi = np.select(lanes[:6], [5, 5, 5, 4, 4, 4], default = 1)
+    lucky_chance = np.select(
+        [lanes[0], lanes[1], lanes[2], lanes[3], lanes[4], lanes[5]],
+        [0.0, 0.22, 0.12, 0.0, np.where(elite, 0.24, 0.16), 0.20],
+        default = 0.0,
+    )
+
+    def cap(value):
+        value = np.where(overall >= 95, np.minimum(value, 2), np.where(overall >= 90, np.minimum(value, 3), value))
+        value = np.where(room <= 0, np.minimum(value, 0), np.where(room == 1, np.minimum(value, 1), value))
+        bust_cap = np.where(
+            elite | ((potential >= 90) & (age <= 24)),
+            np.where(_is(names, "disappointment"), 2, 1),
+            np.where(age <= 23, 1, 0),
+        )
+        return np.where(bust, np.minimum(value, bust_cap), value)
+
+    return lo, cap(hi), cap(lucky_hi), lucky_chance
+
+
+def progression_terms(packed):
+    """Deterministic per-player terms: expected (without random branches),
+    sigma and delta bounds. Exposed for the equivalence check."""
+    c = packed
+    age, overall, potential = c["age"], c["overall"], c["potential"]
+    profile = _profile_adjustment_terms(c)
+    lo, hi, lucky_hi, lucky_chance = _delta_bounds(c)
+    return {
+        "age": _age_expectation(age, overall),
+        "potential": _potential_expectation(age, overall, potential),
+        "tier": _tier_expectation(age, overall, potential),
+        "profile": profile,
+        "sigma": _sigma(c),
+        "lo": lo,
+        "hi": hi,
+        "lucky_hi": lucky_hi,
+        "lucky_chance": lucky_chance,
+    }
+
+
+# ------------------------------------------------------------
+# Random terms
+# ------------------------------------------------------------
+
+def _profile_random_extra(c, gen):
+    age, names = c["age"], c["name"]
+    n = age.shape[0]
+    volatile_pick = np.array([-0.34, -0.16, 0.16, 0.38])[gen.integers(0, 4, n)]
+    rebound = gen.random(n)
+    return np.select(
+        [_is(names, "volatile"), _is(names, "disappointment") & (age <= 23) & (rebound < 0.16),
+         _is(names, "true_bust") & (age <= 22) & (rebound < 0.10)],
+        [volatile_pick, 0.34, 0.50],
+        default = 0.0,
+    )
+
+
+def _random_event(c, gen):
+    age, overall, potential = c["age"], c["overall"], c["potential"]
+    names, hidden = c["name"], c["hidden_level"]
+    n = age.shape[0]
+
+    chance = 0.018 + np.maximum(0, potential - overall) * 0.0015
+    chance = np.where(age <= 23, chance + 0.010, chance)
+    chance = np.where(_is(names, "volatile", "hidden_gem", "raw_tools_outlier", "skill_feel_outlier"), chance + 0.026, chance)
+    chance = np.where((hidden > 0) & (age <= 26), chance + (0.010 + hidden * 0.006), chance)
+    chance = np.where(c["boom_bust"] >= 0.65, chance + 0.012, chance)
+    chance = np.clip(chance, 0.006, 0.075)
+
+    roll = gen.random(n)
+    pick4 = gen.integers(0, 4, n)
+    pick3 = gen.integers(0, 3, n)
+    ceiling = c["event_ceiling"]
+    boom = np.select(
+        [(hidden >= 4) & (age <= 23) & (overall <= 78) & (ceiling >= 90),
+         (hidden >= 3) & (age <= 24) & (overall <= 80) & (ceiling >= 88)],
+        [np.array([1.35, 1.75, 2.25, 2.65])[pick4], np.array([1.05, 1.45, 1.85, 2.20])[pick4]],
+        default = np.array([0.70, 1.05, 1.45])[pick3],
+    )
+    sheltered = ~_is(names, "true_bust", "volatile")
+    bust = -np.select(
+        [c["elite_young"] & sheltered, (potential >= 90) & (age <= 24) & sheltered],
+        [np.array([0.20, 0.35, 0.55])[pick3], np.array([0.25, 0.45, 0.70])[pick3]],
+        default = np.array([0.55, 0.90, 1.20])[pick3],
+    )
+    return np.select([roll < chance * 0.45, roll > 1.0 - chance * 0.55], [boom, bust], default = 0.0)
+
+
+def _threshold_gates(c, before, target, gen):
+    age = c["age"]
+    gap = np.maximum(0, c["gate_potential"] - before)
+    hidden = c["hidden_level"]
+    bonus = np.where((hidden > 0) & (age <= 26), 0.14 + hidden * 0.105, 0.0)
+    bonus = np.where((hidden >= 3) & (age <= 26) & (before <= 78), bonus + 0.08, bonus)
+    rising = target > before
+
+    # (band, trigger, ceiling, base, gap span, per gap point, young age, young bonus)
+    gates = (
+        (before < 68, 73, 72, 0.06, 0.20, 0.012, 22, 0.04),
+        (before < 70, 75, 74, 0.04, 0.18, 0.010, 22, 0.04),
+        ((before >= 70) & (before <= 73), 77, 76, 0.08, 0.18, 0.012, 23, 0.05),
+        ((before >= 74) & (before <= 76), 80, 79, 0.09, 0.18, 0.012, 24, 0.05),
+        ((before >= 77) & (before <= 80), 83, 82, 0.12, 0.18, 0.014, 24, 0.05),
+    )
+    for band, trigger, ceiling, base, span, per_gap, young_age, young_bonus in gates:
+        chance = base + np.minimum(span, gap * per_gap) + np.where(age <= young_age, young_bonus, 0.0) + bonus
+        blocked = rising & band & (target >= trigger) & (gen.random(before.shape[0]) > chance)
+        target = np.where(blocked, np.minimum(target, ceiling), target)
+    return np.clip(target, pg.RATING_MIN_OVERALL, pg.RATING_MAX_OVERALL)
+
+
+# ------------------------------------------------------------
+# Plan
+# ------------------------------------------------------------
+
+def compute_raw_progression_plan_numpy(league, stats_by_key, settings, rng):
+    """Drop-in for progression._compute_raw_progression_plan.
+
+    `rng` seeds the NumPy Generator (one getrandbits call) and builds any
+    missing saved profiles; stats_by_key is ignored exactly like the scalar
+    engine ignores current-season stats.
+    """
+    packed = pack_progression_league(league, rng)
+    n = packed["size"]
+    if n == 0:
+        return []
+    gen = np.random.default_rng(rng.getrandbits(64))
+    terms = progression_terms(packed)
+
+    profile_adj = _finish_profile_adjustment(terms["profile"], _profile_random_extra(packed, gen))
+    expected = terms["age"] + terms["potential"] + terms["tier"] + profile_adj + _random_event(packed, gen)
+
+    raw = expected + gen.standard_normal(n) * terms["sigma"]
+    floor = np.floor(raw)
+    delta = floor.astype(np.int64) + (gen.random(n) < raw - floor)
+
+    surprise = np.where(_is(packed["name"], "volatile", "hidden_gem", "raw_tools_outlier", "skill_feel_outlier"), 0.05, 0.025)
+    nudge = np.where(gen.random(n) < 0.5, -1, 1)
+    delta = np.where(gen.random(n) < surprise, delta + nudge, delta)
+
+    hi = np.where(gen.random(n) < terms["lucky_chance"], terms["lucky_hi"], terms["hi"])
+    delta = np.clip(delta, terms["lo"], hi)
+
+    before = packed["current"]
+    target = np.clip(before + delta, pg.RATING_MIN_OVERALL, pg.RATING_MAX_OVERALL)
+    target = _threshold_gates(packed, before, target, gen)
+    protected = packed["protected"]
+    target = np.where(protected, before, target)
+
+    plan = []
+    players, teams, profiles = packed["players"], packed["teams"], packed["profiles"]
+    for i in range(n):
+        current = int(before[i])
+        item = {
+            "player": players[i],
+            "team": teams[i],
+            "before_overall": current,
+            "target_delta": int(target[i]) - current,
+            "target_overall": int(target[i]),
+        }
+        if protected[i]:
+            item["shape_protected"] = True
+        item["v25_profile"] = profiles[i]
+        plan.append(item)
+    return plan
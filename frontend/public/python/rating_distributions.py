@@ -0,0 +1,145 @@
+# rating_distributions.py
+# Shared empirical rating distributions and rating -> per-36 lookup tables
+# for the assists / blocks / steals / rebounds models.
+#
+# The four stat models used to parse 30.json separately at import and then
+# bisect the distribution + interpolate their per-36 curve for every player in
+# every game. Ratings are integers, so each model now keeps a dense
+# rating -> per-36 table that is built once per distribution snapshot.
+# Replacing the distributions (or calling invalidate_rating_tables) bumps a
+# version number and every table rebuilds lazily on its next lookup; the
+# NumPy box-score tables (box_score_numpy.py) follow the same version.
+#
+# The source is still 30.json, as before the tables existed, or the 25-99
+# fallback when it is missing. set_league_rating_distributions() can point the
+# models at a league's rosters instead, but the sim does not call it: doing so
+# would change every box score against the current calibration.
+
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+DISTRIBUTION_SOURCE = "30.json"
+
+# Dense table range; anything outside (or non-integer) takes the exact path.
+RATING_TABLE_MIN = 0
+RATING_TABLE_MAX = 120
+
+_source_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+_distributions: Dict[Tuple[int, str], List[float]] = {}
+_league_players: Optional[List[Dict[str, Any]]] = None
+_version = 0
+
+
+def _read_source(path: str) -> Optional[Dict[str, Any]]:
+    if path not in _source_cache:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                _source_cache[path] = json.load(f)
+        except Exception:
+            _source_cache[path] = None
+    return _source_cache[path]
+
+
+def _iter_source_players(data: Optional[Dict[str, Any]]) -> Iterable[Dict[str, Any]]:
+    if not isinstance(data, dict):
+        return
+    for conf_teams in (data.get("conferences") or {}).values():
+        for team in conf_teams or []:
+            for p in team.get("players", []) or []:
+                if isinstance(p, dict):
+                    yield p
+
+
+def _collect(players: Iterable[Dict[str, Any]], attr_index: int, flat_key: str) -> List[float]:
+    vals: List[float] = []
+    for p in players:
+        attrs = p.get("attrs")
+        if isinstance(attrs, list) and len(attrs) > attr_index:
+            v = attrs[attr_index]
+            if isinstance(v, (int, float)):
+                vals.append(float(v))
+                continue
+        # fallback: flat rating field
+        if isinstance(p.get(flat_key), (int, float)):
+            vals.append(float(p[flat_key]))
+    return vals
+
+
+def rating_distribution(attr_index: int, flat_key: str, path: str = DISTRIBUTION_SOURCE) -> List[float]:
+    """
+    Sorted empirical distribution for one attribute.
+
+    Source is the league snapshot set via set_league_rating_distributions,
+    otherwise 30.json (parsed once for all models). If nothing loads, a
+    synthetic 25-99 range keeps the sim running.
+    """
+    key = (attr_index, flat_key)
+    cached = _distributions.get(key)
+    if cached is not None:
+        return cached
+
+    if _league_players is not None:
+        vals = _collect(_league_players, attr_index, flat_key)
+    else:
+        data = _read_source(path)
+        if data is None:
+            vals = [float(x) for x in range(25, 100)]
+        else:
+            try:
+                vals = _collect(_iter_source_players(data), attr_index, flat_key)
+            except Exception:
+                vals = [float(x) for x in range(25, 100)]
+
+    if not vals:
+        vals = [50.0]
+    vals.sort()
+    _distributions[key] = vals
+    return vals
+
+
+def distributions_version() -> int:
+    return _version
+
+
+def invalidate_rating_tables() -> int:
+    """Drop cached distributions and force every lookup table to rebuild."""
+    global _version
+    _distributions.clear()
+    _version += 1
+    return _version
+
+
+def set_league_rating_distributions(league: Optional[Dict[str, Any]]) -> int:
+    """
+    Use a league snapshot's rosters as the rating distribution source.
+    Pass None to go back to 30.json. Returns the new table version.
+    """
+    global _league_players
+    _league_players = None if league is None else list(_iter_source_players(league))
+    return invalidate_rating_tables()
+
+
+class RatingTable:
+    """Dense integer-rating lookup for a rating -> value function."""
+
+    __slots__ = ("fn", "values", "version")
+
+    def __init__(self, fn: Callable[[float], float]):
+        self.fn = fn
+        self.values: Optional[List[float]] = None
+        self.version = -1
+
+    def rebuild(self) -> List[float]:
+        self.values = [self.fn(float(r)) for r in range(RATING_TABLE_MIN, RATING_TABLE_MAX + 1)]
+        self.version = _version
+        return self.values
+
+    def lookup(self, rating: float) -> float:
+        values = self.values if self.version == _version else self.rebuild()
+        try:
+            idx = int(rating)
+        except (ValueError, OverflowError):
+            return self.fn(rating)
+        if idx == rating and RATING_TABLE_MIN <= idx <= RATING_TABLE_MAX:
+            return values[idx - RATING_TABLE_MIN]
+        return self.fn(rating)
@@ -2,12 +2,13 @@
 # Rebounding model using percentile-based per-36 curves and Gaussian noise
 # Aligned with the Tk "Rebounds View" logic.
 
-import json
 import math
 import random
 import bisect
 from typing import List
 
+from rating_distributions import RatingTable, rating_distribution
+
 # ------------------------------
 # Global config / constants
 # ------------------------------
@@ -23,57 +24,20 @@ def clamp(x: float, lo: float, hi: float) -> float:
 #    REBOUNDING → PERCENTILE → TRB36 → GAME REBOUNDS
 # ============================================================
 
-def _load_rebound_distribution(path: str = "30.json") -> List[float]:
-    """
-    Build global list of Rebounding ratings from 30.json.
-
-    Matches the Tk UI helper:
-      attrs = p.get("attrs"); index 12 = Rebounding.
-    Falls back to p["Rebounding"] if present.
-
-    If loading fails, returns a synthetic 25–99 range so the
-    sim can still run.
-    """
-    vals: List[float] = []
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        conferences = data.get("conferences", {})
-        for conf_teams in conferences.values():
-            for team in conf_teams:
-                for p in team.get("players", []):
-                    attrs = p.get("attrs")
-                    if isinstance(attrs, list) and len(attrs) > 12:
-                        v = attrs[12]
-                        if isinstance(v, (int, float)):
-                            vals.append(float(v))
-                            continue
-                    # Fallback: flat field
-                    if isinstance(p.get("Rebounding"), (int, float)):
-                        vals.append(float(p["Rebounding"]))
-    except Exception:
-        # Fallback distribution if the JSON isn't available
-        vals = [float(x) for x in range(25, 100)]
-
-    if not vals:
-        vals = [50.0]
-
-    vals.sort()
-    return vals
+# Rebounding distribution: rating_distributions.py.
+REBOUND_ATTR_INDEX = 12
 
 
-# Global empirical distribution
-ALL_REBOUND: List[float] = _load_rebound_distribution()
+def _rebound_distribution() -> List[float]:
+    return rating_distribution(REBOUND_ATTR_INDEX, "Rebounding")
 
 
 def rebound_to_percentile(reb: float) -> float:
     """
     Empirical CDF: map a Rebounding rating to a 0–100 percentile
-    based on ALL_REBOUND, with interpolation between neighbors.
+    based on the shared rating distribution, with interpolation between neighbors.
     """
-    arr = ALL_REBOUND
+    arr = _rebound_distribution()
     if not arr:
         return 50.0
 
@@ -160,13 +124,21 @@ def percentile_to_trb36(pct: float) -> float:
     return curve[-1][1]
 
 
+def _rebound_per36_exact(reb_rating: float) -> float:
+    pct = rebound_to_percentile(reb_rating)
+    return percentile_to_trb36(pct)
+
+
+# Dense rating -> TRB36 table, rebuilt when the distribution changes.
+_TRB36_TABLE = RatingTable(_rebound_per36_exact)
+
+
 def rebound_per36(reb_rating: float) -> float:
     """
     Convert a rebounding rating to expected TRB per 36 using
     the percentile -> TRB36 curve.
     """
-    pct = rebound_to_percentile(reb_rating)
-    return percentile_to_trb36(pct)
+    return _TRB36_TABLE.lookup(float(reb_rating))
 
 
 def rebound_to_game_rebounds(reb_rating: float, minutes: float) -> float:
@@ -182,7 +154,7 @@ def rebound_to_game_rebounds(reb_rating: float, minutes: float) -> float:
 # Noise model (Gaussian, UI-style)
 # ------------------------------
 
-def noisy_rebounds(expected: float) -> int:
+def noisy_rebounds(expected: float, rng=None) -> int:
     """
     Add game-to-game variance around an expected rebound count.
     Matches the Tk statline logic:
@@ -203,7 +175,7 @@ def noisy_rebounds(expected: float) -> int:
     base_stdev = max(0.5, math.sqrt(expected) * 0.7)
     stdev = base_stdev * STATLINE_VARIANCE_BOOST
 
-    val = random.gauss(expected, stdev)
+    val = (rng or random).gauss(expected, stdev)
     if val < 0:
         return 0
     return int(round(val))
@@ -213,7 +185,7 @@ def noisy_rebounds(expected: float) -> int:
 # Public API - same name/signature
 # ----------------------------------------
 
-def get_rebounds(players, team_reb_rate: float = 1.0, pace_adj: float = 1.0):
+def get_rebounds(players, team_reb_rate: float = 1.0, pace_adj: float = 1.0, rng=None):
     """
     players: list of dicts, each like:
         {
@@ -224,7 +196,8 @@ def get_rebounds(players, team_reb_rate: float = 1.0, pace_adj: float = 1.0):
         }
 
     team_reb_rate and pace_adj are kept for compatibility and act
-    as global multipliers.
+    as global multipliers. rng is the game's random.Random stream
+    (None = the global random module).
     """
     out = []
 
@@ -239,6 +212,6 @@ def get_rebounds(players, team_reb_rate: float = 1.0, pace_adj: float = 1.0):
         expected *= team_reb_rate
         expected *= pace_adj
 
-        out.append(noisy_rebounds(expected))
+        out.append(noisy_rebounds(expected, rng))
 
     return out
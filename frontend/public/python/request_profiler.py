@@ -0,0 +1,177 @@
+"""
+request_profiler.py
+Opt-in profiling of engine requests.
+
+The worker only times whole requests (toPyMs / pythonComputeMs / toJsMs),
+which says nothing about which helper inside free_agency_logic.py or
+progression.py the time goes to. With profiling on, run_engine_request()
+runs an engine's handle_request under a deterministic profiler (cProfile,
+or the pure-Python profile module where _lsprof is missing) and attaches the
+top functions by cumulative time to the result as result["pythonProfile"].
+
+Profiling is off by default and is turned on either
+  - per request: request["profile"] = True, or {"topN": 40, "sortBy": "self"}
+    (request["profile"] = False opts one request out), or
+  - for every request: set_profiling(True, top_n=..., sort_by=...), which the
+    worker's "set-python-profiling" message calls.
+
+module_registry.handle_engine_request() routes every worker and session
+handle_request call through here; run_profiled() wraps any other call.
+"""
+from __future__ import annotations
+
+import os
+import pstats
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import cProfile as _profile_module
+    PROFILER_NAME = "cProfile"
+except ImportError:  # pragma: no cover - builds without _lsprof
+    import profile as _profile_module
+    PROFILER_NAME = "profile"
+
+REQUEST_PROFILER_VERSION = "2026-10-17_request_profiler_v1"
+
+DEFAULT_TOP_N = 30
+MAX_TOP_N = 500
+# Table column each sortBy option orders by (descending).
+SORT_COLUMNS: Dict[str, str] = {
+    "cumulative": "cumulativeMs",
+    "self": "selfMs",
+    "calls": "calls",
+}
+
+_THIS_FILE = os.path.abspath(__file__)
+
+_SETTINGS: Dict[str, Any] = {"enabled": False, "topN": DEFAULT_TOP_N, "sortBy": "cumulative"}
+
+
+def _top_n(value: Any, default: int = DEFAULT_TOP_N) -> int:
+    try:
+        n = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(MAX_TOP_N, n))
+
+
+def _sort_by(value: Any, default: str = "cumulative") -> str:
+    return value if value in SORT_COLUMNS else default
+
+
+def set_profiling(enabled: bool = True, top_n: Optional[int] = None, sort_by: Optional[str] = None) -> Dict[str, Any]:
+    """Profile every engine request (or stop); returns the settings in force."""
+    _SETTINGS["enabled"] = bool(enabled)
+    if top_n is not None:
+        _SETTINGS["topN"] = _top_n(top_n)
+    if sort_by is not None:
+        _SETTINGS["sortBy"] = _sort_by(sort_by)
+    return get_profiling_settings()
+
+
+def get_profiling_settings() -> Dict[str, Any]:
+    return {**_SETTINGS, "profiler": PROFILER_NAME, "version": REQUEST_PROFILER_VERSION}
+
+
+def _options(flag: Any) -> Optional[Dict[str, Any]]:
+    """Profile options for a request's "profile" flag; None when not profiling."""
+    if flag is None:
+        flag = _SETTINGS["enabled"]
+    if not flag:
+        return None
+    options = flag if isinstance(flag, dict) else {}
+    return {
+        "topN": _top_n(options.get("topN"), _SETTINGS["topN"]),
+        "sortBy": _sort_by(options.get("sortBy"), _SETTINGS["sortBy"]),
+    }
+
+
+def _function_label(key: tuple) -> Dict[str, Any]:
+    filename, line, name = key
+    if filename == "~" or not filename:
+        # Built-ins and C methods: name is e.g. "<method 'append' of 'list' objects>".
+        return {"function": name, "module": "builtins", "line": 0}
+    module = os.path.splitext(os.path.basename(filename))[0]
+    return {"function": name, "module": module, "line": int(line)}
+
+
+def _is_profiler_frame(key: tuple) -> bool:
+    """This module's wrappers and Profile.disable() itself."""
+    filename, _line, name = key
+    if filename and os.path.abspath(filename) == _THIS_FILE:
+        return True
+    return "Profiler' objects>" in name or "Profile' objects>" in name
+
+
+def profile_table(profiler: Any, top_n: int = DEFAULT_TOP_N, sort_by: str = "cumulative") -> Dict[str, Any]:
+    """Top-N functions of a finished profiler run.
+
+    Rows: {function, module, line, calls, primitiveCalls, selfMs,
+    cumulativeMs, perCallMs}; perCallMs is cumulative time per primitive call.
+    """
+    stats = pstats.Stats(profiler).stats
+    rows: List[Dict[str, Any]] = []
+    for key, (primitive_calls, calls, self_seconds, cumulative_seconds, _callers) in stats.items():
+        if _is_profiler_frame(key):
+            continue
+        rows.append({
+            **_function_label(key),
+            "calls": int(calls),
+            "primitiveCalls": int(primitive_calls),
+            "selfMs": round(self_seconds * 1000.0, 3),
+            "cumulativeMs": round(cumulative_seconds * 1000.0, 3),
+            "perCallMs": round(cumulative_seconds * 1000.0 / max(1, primitive_calls), 4),
+        })
+    column = SORT_COLUMNS[_sort_by(sort_by)]
+    rows.sort(key=lambda row: (-row[column], row["module"], row["function"]))
+    return {
+        "sortBy": _sort_by(sort_by),
+        "topN": int(top_n),
+        "functionCount": len(rows),
+        "totalCalls": sum(row["calls"] for row in rows),
+        "functions": rows[:top_n],
+    }
+
+
+def profile_call(call: Callable[[], Any], top_n: int = DEFAULT_TOP_N, sort_by: str = "cumulative"):
+    """Run call() under the profiler; returns (result, profile table)."""
+    profiler = _profile_module.Profile()
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        result = call()
+    finally:
+        profiler.disable()
+        wall_ms = (time.perf_counter() - started) * 1000.0
+    table = profile_table(profiler, top_n, sort_by)
+    table["wallMs"] = round(wall_ms, 3)
+    table["profiler"] = PROFILER_NAME
+    return result, table
+
+
+def run_profiled(engine: str, action: Any, call: Callable[[], Any], flag: Any = None) -> Any:
+    """call(), profiled when `flag` (or, when it is None, set_profiling) says so.
+
+    A dict result gets the table as result["pythonProfile"].
+    """
+    options = _options(flag)
+    if options is None:
+        return call()
+    result, table = profile_call(call, options["topN"], options["sortBy"])
+    if isinstance(result, dict):
+        result["pythonProfile"] = {"engine": engine, "action": action, **table}
+    return result
+
+
+def run_engine_request(engine: str, handle_request: Callable[[Dict[str, Any]], Any], request: Any) -> Any:
+    """handle_request(request) with the request's opt-in "profile" flag honoured."""
+    flag = None
+    action = None
+    if isinstance(request, dict):
+        action = request.get("action")
+        if "profile" in request:
+            flag = request["profile"]
+            # Engines never see the flag.
+            request = {key: value for key, value in request.items() if key != "profile"}
+    return run_profiled(engine, action, lambda: handle_request(request), flag)
@@ -4,6 +4,9 @@ import random
 import sys
 from typing import Any, Dict, List, Optional, Tuple
 
+from league_clone import clone_league_sharing_cold
+from season_stats_store import as_stats_store, is_stats_store
+
 DEFAULT_SEASON_YEAR = 2026
 
 
@@ -41,11 +44,20 @@ def build_exact_stats_key(player_name: str, team_name: str) -> str:
     return f"{player_name}__{team_name}"
 
 
+def _season_stats_source(stats_by_key: Any) -> Any:
+    # A columnar season-stats payload becomes an indexed SeasonStatsStore.
+    store = as_stats_store(stats_by_key)
+    return stats_by_key if store is None else store
+
+
 def get_player_stats_entry(
     stats_by_key: Optional[Dict[str, Any]],
     player_name: str,
     team_name: str,
 ) -> Dict[str, Any]:
+    if is_stats_store(stats_by_key):
+        return stats_by_key.lookup(player_name, team_name) or {}
+
     if not isinstance(stats_by_key, dict):
         return {}
 
@@ -393,9 +405,10 @@ def apply_player_retirements(
     seed: Optional[int] = None,
     season_year: Optional[int] = None,
 ) -> Dict[str, Any]:
-    updated = copy.deepcopy(league_data)
+    updated = clone_league_sharing_cold(league_data)
     current_year = int(season_year or get_current_season_year(updated))
     rng = random.Random(seed if seed is not None else current_year)
+    stats_by_key = _season_stats_source(stats_by_key)
 
     retired_players: List[Dict[str, Any]] = []
     teams_affected = set()
@@ -542,6 +555,7 @@ def preview_player_retirements(
     season_year: Optional[int] = None,
 ) -> Dict[str, Any]:
     current_year = int(season_year or get_current_season_year(league_data))
+    stats_by_key = _season_stats_source(stats_by_key)
     previews = []
 
     # 1. Preview rostered players
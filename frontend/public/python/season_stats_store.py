@@ -0,0 +1,295 @@
+"""
+season_stats_store.py
+Columnar season aggregates for awards, all-stars, progression and retirement.
+
+The calendar keeps season totals as one dict per "Player__Team" row
+(applyGameToPlayerStats in Calendar.jsx) and that map stays the source of
+truth: it is saved with the league and read by the stats pages. This module
+is the transport format for those totals on their way to the Python engines,
+which used to walk thousands of dicts probing alias keys. SeasonStatsStore
+keeps the same totals as one float array per stat plus a key index:
+
+  - the frontend packs statsByKey into the columnar payload
+    (utils/seasonStatsColumns.js) for all-stars, progression and retirement;
+    coerce_stats_store() accepts either form
+  - record_game() totals game_sim box scores with the calendar's counting
+    rules; the headless league runner builds its season stats this way
+  - store[key] / store.lookup(player, team) hand back a plain row dict, so
+    progression / retirement helpers that check isinstance(stats, dict) keep
+    working unchanged
+
+A 600-row league is 17 arrays of 600 doubles (~80 KB) instead of 600 dicts.
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+SEASON_STATS_COLUMNS_FORMAT = "season-stats-columns-v1"
+
+STAT_FIELDS: Tuple[str, ...] = (
+    "gp", "min", "pts", "reb", "ast", "stl", "blk",
+    "fgm", "fga", "tpm", "tpa", "ftm", "fta", "to", "pf",
+    "started", "sixth",
+)
+
+# Alias keys the engines already accept on row dicts, in lookup order.
+STAT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "gp": ("gp", "gamesPlayed", "games", "g"),
+    "min": ("min", "mins", "minutes", "totMinutes", "totalMinutes"),
+    "pts": ("pts", "points"),
+    "reb": ("reb", "rebounds"),
+    "ast": ("ast", "assists"),
+    "stl": ("stl", "steals"),
+    "blk": ("blk", "blocks"),
+    "tpm": ("tpm", "threesMade"),
+    "tpa": ("tpa", "threesAttempted"),
+    "to": ("to", "tov", "turnovers"),
+    "pf": ("pf", "fouls"),
+}
+
+# Rows that only carry per-game rates are scaled back to totals by gp.
+STAT_PER_GAME_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "min": ("mpg", "minutesPerGame"),
+    "pts": ("ppg", "pointsPerGame"),
+}
+
+
+def _num(value: Any) -> float:
+    try:
+        out = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return out if out == out else 0.0
+
+
+def _minutes(value: Any) -> float:
+    if isinstance(value, str) and ":" in value:
+        mins, _, secs = value.partition(":")
+        return _num(mins) + _num(secs) / 60.0
+    return _num(value)
+
+
+def _pair(value: Any) -> Tuple[int, int]:
+    made, _, attempted = str(value or "0/0").partition("/")
+    return int(_num(made)), int(_num(attempted))
+
+
+def _plain(value: float) -> Any:
+    return int(value) if value.is_integer() else value
+
+
+def _row_value(raw: Dict[str, Any], field: str) -> float:
+    for key in STAT_ALIASES.get(field, (field,)):
+        value = raw.get(key)
+        if value not in (None, ""):
+            return _minutes(value) if field == "min" else _num(value)
+    for key in STAT_PER_GAME_ALIASES.get(field, ()):
+        value = raw.get(key)
+        if value not in (None, ""):
+            return _num(value) * _row_value(raw, "gp")
+    return 0.0
+
+
+class SeasonStatsStore(Mapping):
+    """Season totals by "Player__Team" key, one array('d') per stat."""
+
+    is_season_stats_store = True
+
+    def __init__(self) -> None:
+        self.keys_list: List[str] = []
+        self.players: List[str] = []
+        self.teams: List[str] = []
+        self.columns: Dict[str, array] = {field: array("d") for field in STAT_FIELDS}
+        self.games_recorded = 0
+        self._index: Dict[str, int] = {}
+        self._first_by_player: Dict[str, int] = {}
+
+    # -- rows ----------------------------------------------------------
+    def _slot(self, key: str, player: str = "", team: str = "") -> int:
+        i = self._index.get(key)
+        if i is not None:
+            return i
+        if (not player or not team) and "__" in key:
+            left, _, right = key.partition("__")
+            player = player or left.strip()
+            team = team or right.strip()
+        i = len(self.keys_list)
+        self._index[key] = i
+        self.keys_list.append(key)
+        self.players.append(str(player or ""))
+        self.teams.append(str(team or ""))
+        if player:
+            self._first_by_player.setdefault(str(player), i)
+        for column in self.columns.values():
+            column.append(0.0)
+        return i
+
+    def add_row(self, key: str, raw: Dict[str, Any]) -> None:
+        """Accumulate a calendar-style totals row (aliases accepted)."""
+        player = raw.get("player") or raw.get("name") or raw.get("playerName") or ""
+        team = raw.get("team") or raw.get("teamName") or ""
+        i = self._slot(str(key), str(player), str(team))
+        for field, column in self.columns.items():
+            column[i] += _row_value(raw, field)
+
+    def record_box(self, team_name: str, rows: Iterable[Dict[str, Any]]) -> None:
+        """Add one team's box score (game_sim rows) to the season totals.
+
+        Shooting lines come from the "fg"/"3p"/"ft" strings. Starters
+        are the row "role" when present, else the top five by minutes, the
+        same rule the calendar applies to saved box scores.
+        """
+        played = [r for r in rows if _minutes(r.get("min")) > 0]
+        by_minutes = sorted(played, key=lambda r: -_minutes(r.get("min")))
+        starters = {r.get("player") for r in by_minutes[:5]}
+        cols = self.columns
+        for r in played:
+            player = str(r.get("player") or "")
+            i = self._slot(f"{player}__{team_name}", player, team_name)
+            fgm, fga, tpm, tpa, ftm, fta = _pair(r.get("fg")) + _pair(r.get("3p")) + _pair(r.get("ft"))
+            cols["gp"][i] += 1
+            cols["min"][i] += _minutes(r.get("min"))
+            cols["pts"][i] += _num(r.get("pts"))
+            cols["reb"][i] += _num(r.get("reb"))
+            cols["ast"][i] += _num(r.get("ast"))
+            cols["stl"][i] += _num(r.get("stl"))
+            cols["blk"][i] += _num(r.get("blk"))
+            cols["fgm"][i] += fgm
+            cols["fga"][i] += fga
+            cols["tpm"][i] += tpm
+            cols["tpa"][i] += tpa
+            cols["ftm"][i] += ftm
+            cols["fta"][i] += fta
+            cols["to"][i] += _num(r.get("to"))
+            cols["pf"][i] += _num(r.get("pf"))
+            role = r.get("role")
+            started = role == "starter" if role else r.get("player") in starters
+            cols["started" if started else "sixth"][i] += 1
+
+    def record_game(self, home_team: str, away_team: str, result: Dict[str, Any]) -> None:
+        self.record_box(home_team, result.get("box_home") or [])
+        self.record_box(away_team, result.get("box_away") or [])
+        self.games_recorded += 1
+
+    def merge(self, other: "SeasonStatsStore") -> "SeasonStatsStore":
+        """Add another store's totals (e.g. from a second sim worker)."""
+        for j, key in enumerate(other.keys_list):
+            i = self._slot(key, other.players[j], other.teams[j])
+            for field, column in self.columns.items():
+                column[i] += other.columns[field][j]
+        self.games_recorded += other.games_recorded
+        return self
+
+    # -- reads ---------------------------------------------------------
+    def row(self, i: int) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"player": self.players[i], "team": self.teams[i]}
+        for field, column in self.columns.items():
+            out[field] = _plain(column[i])
+        return out
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return self.row(self._index[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys_list)
+
+    def __len__(self) -> int:
+        return len(self.keys_list)
+
+    def lookup(self, player: str, team: str) -> Optional[Dict[str, Any]]:
+        """Exact "Player__Team" row, else the player's first row."""
+        i = self._index.get(f"{player}__{team}")
+        if i is None:
+            i = self._first_by_player.get(str(player))
+        return None if i is None else self.row(i)
+
+    def rows(self, min_gp: float = 0) -> List[Dict[str, Any]]:
+        gp = self.columns["gp"]
+        return [self.row(i) for i in range(len(self.keys_list)) if gp[i] >= min_gp]
+
+    def per_game(self, field: str) -> List[float]:
+        gp = self.columns["gp"]
+        return [v / g if g > 0 else 0.0 for v, g in zip(self.columns[field], gp)]
+
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column) for column in self.columns.values())
+
+    # -- transport -----------------------------------------------------
+    def to_columns(self) -> Dict[str, Any]:
+        return {
+            "format": SEASON_STATS_COLUMNS_FORMAT,
+            "keys": list(self.keys_list),
+            "players": list(self.players),
+            "teams": list(self.teams),
+            "columns": {field: [_plain(v) for v in column] for field, column in self.columns.items()},
+            "gamesRecorded": self.games_recorded,
+        }
+
+    @classmethod
+    def from_columns(cls, payload: Dict[str, Any]) -> "SeasonStatsStore":
+        store = cls()
+        keys = list(payload.get("keys") or [])
+        players = list(payload.get("players") or [])
+        teams = list(payload.get("teams") or [])
+        columns = payload.get("columns") or {}
+        for j, key in enumerate(keys):
+            store._slot(
+                str(key),
+                str(players[j]) if j < len(players) else "",
+                str(teams[j]) if j < len(teams) else "",
+            )
+        for field, column in store.columns.items():
+            values = list(columns.get(field) or [])
+            for i in range(len(keys)):
+                column[i] = _num(values[i]) if i < len(values) else 0.0
+        store.games_recorded = int(_num(payload.get("gamesRecorded")))
+        return store
+
+    @classmethod
+    def from_stats(cls, stats: Any) -> "SeasonStatsStore":
+        """Build from a stats_by_key dict or a list of totals rows."""
+        store = cls()
+        if isinstance(stats, dict):
+            items: Iterable = stats.items()
+        elif isinstance(stats, (list, tuple)):
+            items = (
+                (f"{r.get('player') or r.get('name') or ''}__{r.get('team') or ''}", r)
+                for r in stats if isinstance(r, dict)
+            )
+        else:
+            return store
+        for key, raw in items:
+            if isinstance(raw, dict):
+                store.add_row(str(key), raw)
+        return store
+
+
+def is_stats_store(value: Any) -> bool:
+    # Duck-typed: module_registry reloads can leave two class objects alive.
+    return bool(getattr(value, "is_season_stats_store", False))
+
+
+def is_stats_columns(value: Any) -> bool:
+    return isinstance(value, dict) and value.get("format") == SEASON_STATS_COLUMNS_FORMAT
+
+
+def as_stats_store(value: Any) -> Optional[SeasonStatsStore]:
+    """The store for a store or columnar payload; None for anything else."""
+    if is_stats_store(value):
+        return value
+    if is_stats_columns(value):
+        return SeasonStatsStore.from_columns(value)
+    return None
+
+
+def coerce_stats_store(value: Any) -> SeasonStatsStore:
+    """Any supported stats input (store, columns, dict, row list) as a store."""
+    store = as_stats_store(value)
+    if store is not None:
+        return store
+    return SeasonStatsStore.from_stats(value)
@@ -33,11 +33,12 @@ def lin(x, x1, y1, x2, y2):
     return y1 + (y2 - y1) * ((x - x1) / (x2 - x1))
 
 
-def bino(n, p):
+def bino(n, p, rng=None):
     """Simple binomial via n Bernoulli draws."""
+    rng = rng or random
     c = 0
     for _ in range(n):
-        if random.random() < p:
+        if rng.random() < p:
             c += 1
     return c
 
@@ -192,7 +193,8 @@ def shot_dist(r3, rMid, rClose):
 # -------------------------------------------------------
 # RECONCILIATION
 # -------------------------------------------------------
-def reconcile(stats, target_pts, player):
+def reconcile(stats, target_pts, player, rng=None):
+    rng = rng or random
     r3, rMid, rClose, _ = player["attrs"][:4]
     off = player["offRating"]
 
@@ -229,7 +231,7 @@ def reconcile(stats, target_pts, player):
             for _ in range(max(0, need2)):
                 if diff <= 0:
                     break
-                roll = random.random()
+                roll = rng.random()
                 if midM < midA and roll < pmid_w:
                     midM += 1
                     diff -= 2
@@ -252,7 +254,7 @@ def reconcile(stats, target_pts, player):
             if diff == 1 and threeM < threeA and (midM > 0 or closeM > 0):
                 threeM += 1
                 diff -= 3
-                if midM > 0 and random.random() < pmid_w:
+                if midM > 0 and rng.random() < pmid_w:
                     midM -= 1
                     diff += 2
                 elif closeM > 0:
@@ -265,7 +267,7 @@ def reconcile(stats, target_pts, player):
                 if diff >= 0:
                     break
                 if midM > 0 or closeM > 0:
-                    roll = random.random()
+                    roll = rng.random()
                     if midM > 0 and roll < pmid_w:
                         midM -= 1
                         diff += 2
@@ -288,7 +290,7 @@ def reconcile(stats, target_pts, player):
             if diff == -1 and threeM > 0 and (midM < midA or closeM < closeA):
                 threeM -= 1
                 diff += 3
-                roll = random.random()
+                roll = rng.random()
                 if midM < midA and roll < pmid_w:
                     midM += 1
                     diff -= 2
@@ -300,7 +302,7 @@ def reconcile(stats, target_pts, player):
 
     if diff > 0:
         while diff > 0 and (midM < midA or closeM < closeA or threeM < threeA):
-            if midM < midA and random.random() < pmid_w:
+            if midM < midA and rng.random() < pmid_w:
                 midM += 1
                 diff -= 2
                 continue
@@ -320,7 +322,7 @@ def reconcile(stats, target_pts, player):
 
     elif diff < 0:
         while diff < 0 and (midM > 0 or closeM > 0 or threeM > 0):
-            if midM > 0 and random.random() < pmid_w:
+            if midM > 0 and rng.random() < pmid_w:
                 midM -= 1
                 diff += 2
                 continue
@@ -350,7 +352,8 @@ def reconcile(stats, target_pts, player):
 # -------------------------------------------------------
 # MAIN: simulate_one_game
 # -------------------------------------------------------
-def simulate_one_game(player, minutes, target_pts):
+def simulate_one_game(player, minutes, target_pts, rng=None):
+    rng = rng or random
     r3, rMid, rClose, rFT = player["attrs"][:4]
     off = player["offRating"]
 
@@ -386,7 +389,7 @@ def simulate_one_game(player, minutes, target_pts):
         )
 
     # Luck only – don’t bias efficiency by ratio
-    E = clamp(random.gauss(1.0, 0.08), 0.80, 1.20)
+    E = clamp(rng.gauss(1.0, 0.08), 0.80, 1.20)
 
 
     two_rating = 0.60 * rClose + 0.40 * rMid
@@ -399,7 +402,7 @@ def simulate_one_game(player, minutes, target_pts):
 
 
     rawFGA = target_pts / (exp_pp_fga * E)
-    rawFGA *= random.gauss(1.0, 0.02)
+    rawFGA *= rng.gauss(1.0, 0.02)
     FGA = max(1, int(rawFGA))
 
     tr = FTr(rClose)
@@ -428,10 +431,10 @@ def simulate_one_game(player, minutes, target_pts):
             f"3A/midA/closeA={threeA}/{midA}/{closeA}"
         )
 
-    threeM = bino(threeA, p3r)
-    midM = bino(midA, pMr)
-    closeM = bino(closeA, pCr)
-    FTM = bino(FTA, pFTr)
+    threeM = bino(threeA, p3r, rng)
+    midM = bino(midA, pMr, rng)
+    closeM = bino(closeA, pCr, rng)
+    FTM = bino(FTA, pFTr, rng)
 
     stats = {
         "FGA": FGA,
@@ -446,7 +449,7 @@ def simulate_one_game(player, minutes, target_pts):
         "minutes": minutes,
     }
 
-    threeM, midM, closeM, FTM, FTA = reconcile(stats, target_pts, player)
+    threeM, midM, closeM, FTM, FTA = reconcile(stats, target_pts, player, rng)
     FGM = threeM + midM + closeM
     pts = FTM + threeM * 3 + (midM + closeM) * 2
 
@@ -2,12 +2,13 @@
 # Steal model using percentile-based per-36 curves and Gaussian noise
 # Aligned with the Tk "Steals View" logic.
 
-import json
 import math
 import random
 import bisect
 from typing import List
 
+from rating_distributions import RatingTable, rating_distribution
+
 STATLINE_VARIANCE_BOOST = 1.35  # same swinginess as UI
 
 
@@ -19,49 +20,12 @@ def clamp(x: float, lo: float, hi: float) -> float:
 #     STEAL RATING → PERCENTILE → STL36 → GAME STEALS
 # ============================================================
 
-def _load_steal_distribution(path: str = "30.json") -> List[float]:
-    """
-    Build global list of Steal ratings from 30.json.
-
-    Matches the Tk UI helper:
-      attrs = p.get("attrs"); index 11 = Steal.
-    Falls back to p["Steal"] if present.
-
-    If loading fails, returns a synthetic 25–99 range so the
-    sim can still run.
-    """
-    vals: List[float] = []
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        conferences = data.get("conferences", {})
-        for conf_teams in conferences.values():
-            for team in conf_teams:
-                for p in team.get("players", []):
-                    attrs = p.get("attrs")
-                    if isinstance(attrs, list) and len(attrs) > 11:
-                        v = attrs[11]
-                        if isinstance(v, (int, float)):
-                            vals.append(float(v))
-                            continue
-                    # fallback: flat Steal field if present
-                    if isinstance(p.get("Steal"), (int, float)):
-                        vals.append(float(p["Steal"]))
-    except Exception:
-        # fallback distribution if JSON isn't available
-        vals = [float(x) for x in range(25, 100)]
-
-    if not vals:
-        vals = [50.0]
+# Steal distribution: rating_distributions.py.
+STEAL_ATTR_INDEX = 11
 
-    vals.sort()
-    return vals
 
-
-# Global empirical distribution
-ALL_STEALS: List[float] = _load_steal_distribution()
+def _steal_distribution() -> List[float]:
+    return rating_distribution(STEAL_ATTR_INDEX, "Steal")
 
 
 def steal_rating_from_player(p) -> float:
@@ -76,15 +40,15 @@ def steal_rating_from_player(p) -> float:
     if isinstance(p.get("Steal"), (int, float)):
         return float(p["Steal"])
     # default to global average
-    return sum(ALL_STEALS) / len(ALL_STEALS)
+    return sum(_steal_distribution()) / len(_steal_distribution())
 
 
 def steal_to_percentile(steal_rating: float) -> float:
     """
     Empirical CDF: map a Steal rating to a 0–100 percentile
-    based on ALL_STEALS, with interpolation between neighbors.
+    based on the shared rating distribution, with interpolation between neighbors.
     """
-    arr = ALL_STEALS
+    arr = _steal_distribution()
     if not arr:
         return 50.0
 
@@ -170,13 +134,21 @@ def percentile_to_stl36(pct: float) -> float:
     return curve[-1][1]
 
 
+def _steal_per36_from_rating_exact(steal_rating: float) -> float:
+    pct = steal_to_percentile(steal_rating)
+    return percentile_to_stl36(pct)
+
+
+# Dense rating -> STL36 table, rebuilt when the distribution changes.
+_STL36_TABLE = RatingTable(_steal_per36_from_rating_exact)
+
+
 def steal_per36_from_rating(steal_rating: float) -> float:
     """
     Convert a steal rating to expected STL per 36 using the
     percentile -> STL36 curve.
     """
-    pct = steal_to_percentile(steal_rating)
-    return percentile_to_stl36(pct)
+    return _STL36_TABLE.lookup(float(steal_rating))
 
 
 def steal_to_game_steals(steal_rating: float, minutes: float) -> float:
@@ -206,7 +178,7 @@ def steals_per36(pos, steal_rating, def_iq, overall) -> float:
     return steal_per36_from_rating(val)
 
 
-def noisy_steals(expected: float) -> int:
+def noisy_steals(expected: float, rng=None) -> int:
     """
     Add game-to-game variance around an expected steal count
     for a single game.
@@ -225,7 +197,7 @@ def noisy_steals(expected: float) -> int:
     base_stdev = max(0.25, math.sqrt(expected) * 0.7)
     stdev = base_stdev * STATLINE_VARIANCE_BOOST
 
-    val = random.gauss(expected, stdev)
+    val = (rng or random).gauss(expected, stdev)
     if val < 0:
         return 0
     return int(round(val))
@@ -13,15 +13,21 @@ from __future__ import annotations
 
 import copy
 import random
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional, Tuple
 
+from league_clone import clone_league_sharing_cold, own_child
+
 try:
-    from league_financials import ensure_league_financials, get_financial_rules, get_rookie_salary_for_pick
+    from league_financials import ensure_league_financials, financial_rules_scope, get_financial_rules, get_rookie_salary_for_pick
 except Exception:
     ensure_league_financials = None
     get_financial_rules = None
     get_rookie_salary_for_pick = None
 
+    def financial_rules_scope(league_data=None):
+        return nullcontext()
+
 TEAM_ROSTER_LOGIC_VERSION = "2026-08-21_patch45_deflated_rookie_signings_v10"
 
 STANDARD_ROSTER_MIN = 14
@@ -52,6 +58,14 @@ def _plain(value: Any) -> Any:
     return value
 
 
+def _clone_league_request(league_data: Any) -> Dict[str, Any]:
+    # Plain dicts are cloned sharing their cold subtrees; proxies go through _plain, which
+    # already builds a fresh copy.
+    if isinstance(league_data, dict):
+        return clone_league_sharing_cold(league_data)
+    return _plain(league_data) or {}
+
+
 def _safe_int(value: Any, default: int = 0) -> int:
     try:
         if value is None:
@@ -741,15 +755,16 @@ def _normalize_existing_rookie_rights_for_team(
 
 
 def _add_transaction(player: Dict[str, Any], season_year: int, label: str, team_name: str, tx_type: str) -> None:
-    history = player.setdefault("history", {})
-    if not isinstance(history.get("transactions"), list):
-        history["transactions"] = []
-    history["transactions"].append({
+    # history is shared with the caller's league until written; replace it.
+    history = own_child(player, "history")
+    transactions = list(history.get("transactions")) if isinstance(history.get("transactions"), list) else []
+    transactions.append({
         "seasonYear": season_year,
         "type": tx_type,
         "label": label,
         "teamName": team_name,
     })
+    history["transactions"] = transactions
 
 
 def _apply_decision_to_player(
@@ -1045,7 +1060,7 @@ def _auto_manage_cpu_two_way_players_after_rookie_signings(
 
 
 def preview_rookie_signings(league_data: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-    league = copy.deepcopy(_plain(league_data) or {})
+    league = _clone_league_request(league_data)
     payload = _plain(payload) or {}
     user_team_name = payload.get("userTeamName") or payload.get("teamName")
     season_year = _safe_int(payload.get("seasonYear") or league.get("seasonYear") or league.get("currentSeasonYear"), 2026)
@@ -1086,7 +1101,7 @@ def preview_rookie_signings(league_data: Dict[str, Any], payload: Dict[str, Any]
 
 
 def apply_rookie_signings(league_data: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-    league = copy.deepcopy(_plain(league_data) or {})
+    league = _clone_league_request(league_data)
     payload = _plain(payload) or {}
     user_team_name = payload.get("userTeamName") or payload.get("teamName")
     season_year = _safe_int(payload.get("seasonYear") or league.get("seasonYear") or league.get("currentSeasonYear"), 2026)
@@ -1201,7 +1216,7 @@ def apply_rookie_signings(league_data: Dict[str, Any], payload: Dict[str, Any])
 
 
 def get_roster_rules_summary(league_data: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-    league = copy.deepcopy(_plain(league_data) or {})
+    league = _clone_league_request(league_data)
     normalize_league_roster_lists(league)
     rows = []
     for team in _get_all_teams(league):
@@ -1960,7 +1975,7 @@ def _build_finalization_report(league: Dict[str, Any], user_team_name: Optional[
 
 
 def preview_roster_finalization(league_data: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-    league = copy.deepcopy(_plain(league_data) or {})
+    league = _clone_league_request(league_data)
     payload = _plain(payload) or {}
     user_team_name = payload.get("userTeamName") or payload.get("teamName")
     normalize_league_roster_lists(league)
@@ -1975,7 +1990,7 @@ def preview_roster_finalization(league_data: Dict[str, Any], payload: Dict[str,
 
 
 def apply_roster_finalization(league_data: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-    league = copy.deepcopy(_plain(league_data) or {})
+    league = _clone_league_request(league_data)
     payload = _plain(payload) or {}
     user_team_name = payload.get("userTeamName") or payload.get("teamName")
     season_year = _safe_int(payload.get("seasonYear") or league.get("seasonYear") or league.get("currentSeasonYear"), 2026)
@@ -2031,7 +2046,12 @@ def apply_roster_finalization(league_data: Dict[str, Any], payload: Dict[str, An
 
 
 def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
-    req = _plain(request) or {}
+    # Financial rules (minimum contracts and rookie scale) are memoized for the request.
+    with financial_rules_scope():
+        return _dispatch_request(_plain(request) or {})
+
+
+def _dispatch_request(req: Dict[str, Any]) -> Dict[str, Any]:
     action = req.get("action") or "preview_rookie_signings"
     league_data = req.get("leagueData") or req.get("league") or {}
     payload = req.get("payload") or {}
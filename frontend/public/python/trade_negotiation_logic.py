@@ -3,9 +3,15 @@ trade_negotiation_logic.py
 
 Main CPU trade brain for Basketball Manager.
 
-React/Pyodide public entry points:
-- evaluate_trade_json(proposal_json): used by Trade Builder.
-- find_trade_offers_json(search_json): used by Trade Finder.
+React/Pyodide public entry points, served through src/api/tradeNegotiationPy.js:
+- evaluate_trade_json(proposal_json): Trade Builder accept/counter/reject.
+- find_trade_offers_json(search_json): Trade Finder offers.
+
+No page imports tradeNegotiationPy.js at present: the Trade Finder page runs
+the JS offer engines (utils/tradeFinderOfferEngine.js and
+reverseTradeFinderOfferEngine.js). The branch-and-bound offer search below is
+therefore an offline speedup (engine benchmarks, regression scripts); it does
+not change in-app Trade Finder times.
 
 This file coordinates:
 - trade_value_model.py = how players/picks/packages are valued
@@ -28,6 +34,7 @@ from trade_value_model import (
     package_value,
     player_overall,
     player_salary,
+    trade_value_cache_stats,
 )
 
 
@@ -180,12 +187,21 @@ def score_trade_for_cpu(
     cpu_sends: Dict[str, Any],
     team_context: Dict[str, Any] | None = None,
     cpu_team: Dict[str, Any] | None = None,
+    cpu_preferences: Dict[str, Any] | None = None,
+    receives_eval: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
-    """Shared scoring engine used by both Trade Builder and Trade Finder."""
-    cpu_preferences = get_team_preferences(cpu_team or cpu_team_name, team_context)
+    """Shared scoring engine used by both Trade Builder and Trade Finder.
+
+    Trade Finder scores one fixed incoming package against many outgoing
+    ones, so it passes the CPU preferences and the incoming package_value
+    it already computed instead of re-deriving them per combo.
+    """
+    if cpu_preferences is None:
+        cpu_preferences = get_team_preferences(cpu_team or cpu_team_name, team_context)
     cpu_phase = cpu_preferences["phase"]
 
-    receives_eval = package_value(cpu_receives, cpu_preferences)
+    if receives_eval is None:
+        receives_eval = package_value(cpu_receives, cpu_preferences)
     sends_eval = package_value(cpu_sends, cpu_preferences)
 
     value_delta = receives_eval["totalValue"] - sends_eval["totalValue"]
@@ -230,8 +246,17 @@ def decision_from_score(score: float) -> Tuple[str, bool]:
 # -----------------------------------------------------------------------------
 
 
-def evaluate_trade(proposal: Dict[str, Any]) -> Dict[str, Any]:
-    """Evaluate an exact trade from the CPU team's perspective."""
+def evaluate_trade(
+    proposal: Dict[str, Any],
+    cpu_preferences: Dict[str, Any] | None = None,
+    receives_eval: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """Evaluate an exact trade from the CPU team's perspective.
+
+    cpu_preferences / receives_eval are optional precomputed inputs for
+    callers that evaluate many proposals with the same CPU team and the same
+    cpuReceives package (see score_trade_for_cpu).
+    """
     if not isinstance(proposal, dict):
         return {
             "decision": "reject",
@@ -255,6 +280,8 @@ def evaluate_trade(proposal: Dict[str, Any]) -> Dict[str, Any]:
         cpu_sends=cpu_sends,
         team_context=team_context,
         cpu_team=cpu_team,
+        cpu_preferences=cpu_preferences,
+        receives_eval=receives_eval,
     )
 
     score = scored["score"]
@@ -352,6 +379,11 @@ def _dedupe_combo_key(combo: Tuple[Dict[str, Any], ...]) -> str:
 
 
 def _candidate_combos(candidates: List[Dict[str, Any]], max_assets: int) -> List[List[Dict[str, Any]]]:
+    """Every deduped combo of the top finder candidates (reference search).
+
+    build_best_offer_for_team walks the same combos in the same order through
+    _search_offer_combos, which prunes them instead of listing them all.
+    """
     top_n = int(NEGOTIATION_KNOBS["finderTopCandidates"])
     limited = candidates[:top_n]
     combos: List[List[Dict[str, Any]]] = []
@@ -372,6 +404,155 @@ def _offer_items_to_package(items: List[Dict[str, Any]]) -> Dict[str, Any]:
     return items_to_package(items)
 
 
+# Package totals are rounded to cents, so bounds built from raw asset sums get
+# this much slack; a bound only prunes when it loses by more than this.
+FINDER_BOUND_EPSILON = 0.01
+
+
+def _min_salary_penalty(receives_salary: float, sends_low: float, sends_high: float) -> float:
+    """Smallest salary-match penalty for any outgoing salary in [low, high]."""
+    closest = min(max(receives_salary, sends_low), sends_high)
+    return _salary_match_penalty(receives_salary, closest)[0]
+
+
+def _finder_sort_key(gap: float, score: float, size: int) -> Tuple[float, float, int]:
+    # 1. Closest value gap.
+    # 2. Then closest to the target accept score, so it does not overpay wildly.
+    # 3. Then fewer assets.
+    return (abs(gap), abs(score - NEGOTIATION_KNOBS["finderAcceptedScoreTarget"]), size)
+
+
+class _OfferSearch:
+    """Branch-and-bound over a team's top finder candidates.
+
+    Candidates arrive sorted by value (highest first), so the best and worst
+    value reachable with k more assets from position i are the next k and the
+    last k candidates; salary reach per (i, k) is precomputed the same way.
+    A branch is dropped when, for every combo it could still complete:
+
+    - the offer cannot reach the value-ratio floor,
+    - the CPU score cannot reach acceptScore (value delta minus the smallest
+      possible salary penalty and the star-exit penalty already committed), or
+    - the value gap cannot get within the best accepted gap found so far.
+
+    Combos are visited size by size in itertools.combinations order and only
+    strictly worse branches are pruned, so the winner (including tie-breaks)
+    is the one the exhaustive _candidate_combos loop would pick.
+    """
+
+    def __init__(
+        self,
+        candidates: List[Dict[str, Any]],
+        target_value: float,
+        receives_salary: float,
+        star_retention: float,
+    ) -> None:
+        self.items = candidates[: int(NEGOTIATION_KNOBS["finderTopCandidates"])]
+        self.values = [_num(item.get("value"), 0.0) for item in self.items]
+        self.salaries = [_num(item.get("salary"), 0.0) for item in self.items]
+        self.players = [item.get("player") if item.get("type") == "player" else None for item in self.items]
+        self.target_value = target_value
+        self.receives_salary = receives_salary
+        self.min_offer_value = 0.82 * max(target_value, 1.0)
+        self.accept_score = NEGOTIATION_KNOBS["acceptScore"]
+        # Star-exit penalties only grow as players are added when retention is
+        # non-negative; otherwise that term cannot bound a branch.
+        self.star_retention = star_retention
+        self.star_bound = star_retention >= 0
+
+        n = len(self.items)
+        # salary_reach[i][k] = (lowest, highest) salary of k assets from items[i:].
+        self.salary_reach: List[List[Tuple[float, float]]] = []
+        for i in range(n + 1):
+            suffix = sorted(self.salaries[i:])
+            lows = [0.0]
+            highs = [0.0]
+            for k in range(1, len(suffix) + 1):
+                lows.append(lows[-1] + suffix[k - 1])
+                highs.append(highs[-1] + suffix[-k])
+            self.salary_reach.append(list(zip(lows, highs)))
+
+        self.best_gap = math.inf
+        self.best_key: Tuple[float, float, int] | None = None
+
+    def _star_penalty(self, index: int) -> float:
+        player = self.players[index]
+        if not isinstance(player, dict):
+            return 0.0
+        overall = player_overall(player)
+        age = _num(player.get("age"), 27.0)
+        if overall >= 92:
+            return STAR_EXIT_PENALTIES["superstar"] * self.star_retention
+        if overall >= 88:
+            return STAR_EXIT_PENALTIES["allStar"] * self.star_retention
+        if overall >= 84 and age <= 25:
+            return STAR_EXIT_PENALTIES["youngPremium"] * self.star_retention
+        return 0.0
+
+    def _viable(self, start: int, left: int, value: float, salary: float, star: float) -> bool:
+        n = len(self.items)
+        if n - start < left:
+            return False
+        eps = FINDER_BOUND_EPSILON
+        best_value = value + sum(self.values[start:start + left])
+        worst_value = value + sum(self.values[n - left:]) if left else value
+        low, high = self.salary_reach[start][left]
+        penalty_floor = _min_salary_penalty(self.receives_salary, salary + low, salary + high)
+        if self.star_bound:
+            penalty_floor += star
+
+        if best_value < self.min_offer_value - eps:
+            return False
+        # Offers only get accepted below target - acceptScore - penalties.
+        ceiling = self.target_value - self.accept_score - penalty_floor
+        if worst_value > ceiling + eps:
+            return False
+        closest_gap = self.target_value - min(best_value, ceiling)
+        return closest_gap <= self.best_gap + eps
+
+    def combos(self, size: int):
+        """Yield index tuples of `size` assets whose branch survives the bounds."""
+        chosen: List[int] = []
+        star_terms = [self._star_penalty(i) for i in range(len(self.items))]
+
+        def walk(start: int, value: float, salary: float, star: float):
+            left = size - len(chosen)
+            if not self._viable(start, left, value, salary, star):
+                return
+            if left == 0:
+                yield tuple(chosen)
+                return
+            for i in range(start, len(self.items) - left + 1):
+                chosen.append(i)
+                yield from walk(i + 1, value + self.values[i], salary + self.salaries[i], star + star_terms[i])
+                chosen.pop()
+
+        yield from walk(0, 0.0, 0.0, 0.0)
+
+    def settled(self) -> bool:
+        """True once no remaining combo can beat the current best offer.
+
+        An accepted offer needs score >= acceptScore, and score is the value
+        gap minus non-negative penalties, so no gap can beat acceptScore; at
+        that gap the score is exactly acceptScore. Larger combos also lose the
+        asset-count tie-break.
+        """
+        if self.best_key is None or not self.star_bound:
+            return False
+        target_score = NEGOTIATION_KNOBS["finderAcceptedScoreTarget"]
+        if self.accept_score > target_score:
+            return False
+        eps = 1e-9
+        return (
+            self.best_key[0] <= self.accept_score + eps
+            and self.best_key[1] <= (target_score - self.accept_score) + eps
+        )
+
+    def record(self, gap: float, sort_key: Tuple[float, float, int]) -> None:
+        self.best_gap = abs(gap)
+        self.best_key = sort_key
+
+
 def build_best_offer_for_team(
     team: Dict[str, Any],
     selected_team_name: str,
@@ -388,70 +569,79 @@ def build_best_offer_for_team(
     if not candidates:
         return None
 
+    # The CPU always receives the same package: value it once per team.
+    receives_eval = package_value(selected_package, prefs)
+    star_retention = _num((prefs.get("preferences") or {}).get("starRetention"), 1.0)
+    search = _OfferSearch(candidates, receives_eval["totalValue"], receives_eval["salaryTotal"], star_retention)
+
     max_assets = int(NEGOTIATION_KNOBS["maxFinderOfferAssets"])
-    combos = _candidate_combos(candidates, max_assets)
+    seen = set()
 
     best = None
     best_sort_key = None
 
-    for combo in combos:
-        cpu_receives = selected_package
-        cpu_sends = _offer_items_to_package(combo)
-        evaluation = evaluate_trade(
-            {
-                "userTeam": selected_team_name,
-                "cpuTeam": team_name,
-                "cpuTeamObject": team,
-                "teamContext": team_context,
-                "cpuReceives": cpu_receives,
-                "cpuSends": cpu_sends,
-            }
-        )
-
-        # Trade Finder should not show pure lowballs just because the CPU would accept them.
-        # We prefer packages that are both CPU-acceptable and reasonably close to the
-        # user's package value.
-        decision = evaluation.get("decision")
-        score = _num(evaluation.get("score"), -999)
-        offer_value = _num((evaluation.get("cpuSends") or {}).get("totalValue"), 0.0)
-        target_value = _num((evaluation.get("cpuReceives") or {}).get("totalValue"), 0.0)
-        gap = offer_value - target_value
-
-        value_ratio = offer_value / max(target_value, 1.0)
-
-        # Trade Finder is an executable-offer screen, not a rumor board. Only
-        # return packages the CPU already accepts and that are close enough in
-        # value to avoid showing pure lowball theft offers. React still applies
-        # final hard-cap, roster, pick-ownership, and player-ownership checks
-        # before the offer is displayed or loaded into the builder.
-        if decision != "accept" or not evaluation.get("accepted") or value_ratio < 0.82:
-            continue
+    for size in range(1, max_assets + 1):
+        if search.settled():
+            break
+        for indexes in search.combos(size):
+            combo = [search.items[i] for i in indexes]
+            key = _dedupe_combo_key(tuple(combo))
+            if key in seen:
+                continue
+            seen.add(key)
 
-        # Sort priorities:
-        # 1. Closest value gap.
-        # 2. Then closest to the target accept score, so it does not overpay wildly.
-        # 3. Then fewer assets.
-        sort_key = (
-            abs(gap),
-            abs(score - NEGOTIATION_KNOBS["finderAcceptedScoreTarget"]),
-            len(combo),
-        )
+            evaluation = evaluate_trade(
+                {
+                    "userTeam": selected_team_name,
+                    "cpuTeam": team_name,
+                    "cpuTeamObject": team,
+                    "teamContext": team_context,
+                    "cpuReceives": selected_package,
+                    "cpuSends": _offer_items_to_package(combo),
+                },
+                cpu_preferences=prefs,
+                receives_eval=receives_eval,
+            )
+
+            # Trade Finder should not show pure lowballs just because the CPU would accept them.
+            # We prefer packages that are both CPU-acceptable and reasonably close to the
+            # user's package value.
+            decision = evaluation.get("decision")
+            score = _num(evaluation.get("score"), -999)
+            offer_value = _num((evaluation.get("cpuSends") or {}).get("totalValue"), 0.0)
+            target_value = _num((evaluation.get("cpuReceives") or {}).get("totalValue"), 0.0)
+            gap = offer_value - target_value
+
+            value_ratio = offer_value / max(target_value, 1.0)
+
+            # Trade Finder is an executable-offer screen, not a rumor board. Only
+            # return packages the CPU already accepts and that are close enough in
+            # value to avoid showing pure lowball theft offers. React still applies
+            # final hard-cap, roster, pick-ownership, and player-ownership checks
+            # before the offer is displayed or loaded into the builder.
+            if decision != "accept" or not evaluation.get("accepted") or value_ratio < 0.82:
+                continue
 
-        if best is None or sort_key < best_sort_key:
-            best = {
-                "team": team,
-                "teamName": team_name,
-                "offer": combo,
-                "offerValue": round(offer_value, 2),
-                "targetValue": round(target_value, 2),
-                "gap": round(gap, 2),
-                "quality": "Accepted Offer",
-                "decision": evaluation.get("decision"),
-                "accepted": True,
-                "score": score,
-                "evaluation": evaluation,
-            }
-            best_sort_key = sort_key
+            sort_key = _finder_sort_key(gap, score, len(combo))
+
+            if best is None or sort_key < best_sort_key:
+                best = {
+                    "team": team,
+                    "teamName": team_name,
+                    "offer": combo,
+                    "offerValue": round(offer_value, 2),
+                    "targetValue": round(target_value, 2),
+                    "gap": round(gap, 2),
+                    "quality": "Accepted Offer",
+                    "decision": evaluation.get("decision"),
+                    "accepted": True,
+                    "score": score,
+                    "evaluation": evaluation,
+                }
+                best_sort_key = sort_key
+                search.record(gap, sort_key)
+                if search.settled():
+                    break
 
     return best
 
@@ -521,6 +711,7 @@ def find_trade_offers(search: Dict[str, Any]) -> Dict[str, Any]:
         "selectedTeamName": selected_team_name,
         "targetValue": target_eval["totalValue"],
         "teamsChecked": max(0, len(teams) - 1),
+        "valueCache": trade_value_cache_stats(),
         "offers": offers[:max_offers],
     }
 
@@ -12,12 +12,15 @@ This file is where your friend should tune how much the CPU values:
 - draft picks and pick protections
 
 It has no final accept/reject logic. It only assigns value.
+
+Player and pick values are memoized (see "Value cache" below). After editing
+the knobs at runtime, call clear_trade_value_cache().
 """
 
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 # -----------------------------------------------------------------------------
@@ -256,6 +259,120 @@ def pick_label(pick: Dict[str, Any]) -> str:
     return f"{year} {suffix}{pick_text} - {original}"
 
 
+# -----------------------------------------------------------------------------
+# Value cache
+# -----------------------------------------------------------------------------
+#
+# Trade Builder, Trade Finder and package_value value the same players and
+# picks over and over (every combo, every team). Values are memoized by a
+# fingerprint of exactly the fields the formulas read, plus the preference
+# multipliers of the viewing team's phase. A rating or contract change gives
+# a new fingerprint, so stale values are never served; invalidate_* drops a
+# player's or pick's entries explicitly (e.g. after a re-sign) to free them.
+
+TRADE_VALUE_CACHE_MAX_ENTRIES = 50000
+
+_PLAYER_VALUE_CACHE: Dict[Tuple[Any, ...], float] = {}
+_PICK_VALUE_CACHE: Dict[Tuple[Any, ...], float] = {}
+_VALUE_CACHE_STATS: Dict[str, int] = {"playerHits": 0, "playerMisses": 0, "pickHits": 0, "pickMisses": 0}
+
+_PLAYER_FINGERPRINT_FIELDS = (
+    "overall", "ovr", "rating", "overallRating", "potential", "pot", "age",
+    "salary", "currentSalary", "contractSalary", "capHit", "aav",
+    "yearsLeft", "contractYears", "rookieScale",
+)
+_PICK_FINGERPRINT_FIELDS = (
+    "round", "roundNum", "pickRound", "year", "seasonYear",
+    "pickNumber", "overallPick", "resolvedPickNumber", "draftPickNumber", "pickNo", "pick",
+    "projectedRank", "recordRank", "expectedRank", "slot", "assetType", "type",
+    "protection", "protections", "displayProtection", "protectionText",
+    "currentSeasonYear", "leagueSeasonYear", "seasonNow", "baseSeasonYear",
+)
+
+
+def _player_identity(player: Dict[str, Any]) -> Any:
+    return player.get("id") or player.get("playerId") or player.get("pid") or player_name(player)
+
+
+def _pick_identity(pick: Dict[str, Any]) -> Any:
+    return pick.get("id") or pick.get("pickId") or pick_label(pick)
+
+
+def _player_fingerprint(player: Dict[str, Any]) -> Tuple[Any, ...]:
+    contract = player.get("contract")
+    salaries = contract.get("salaryByYear") if isinstance(contract, dict) else None
+    rights = player.get("rights")
+    return (
+        _player_identity(player),
+        tuple(player.get(key) for key in _PLAYER_FINGERPRINT_FIELDS),
+        tuple(salaries) if isinstance(salaries, list) else None,
+        rights.get("rookieScale") if isinstance(rights, dict) else None,
+    )
+
+
+def _pick_fingerprint(pick: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (_pick_identity(pick), tuple(pick.get(key) for key in _PICK_FINGERPRINT_FIELDS))
+
+
+def _phase_key(team_preferences: Dict[str, Any] | None, keys: Tuple[str, ...]) -> Tuple[Any, ...]:
+    prefs = team_preferences if isinstance(team_preferences, dict) else {}
+    phase_prefs = prefs.get("preferences") if isinstance(prefs.get("preferences"), dict) else {}
+    return (prefs.get("phase"),) + tuple(phase_prefs.get(key) for key in keys)
+
+
+def _cached_value(cache: Dict[Tuple[Any, ...], float], kind: str, key: Tuple[Any, ...], compute) -> float:
+    try:
+        value = cache.get(key)
+    except TypeError:
+        # Unhashable field values (nested objects): value without caching.
+        return compute()
+    if value is not None:
+        _VALUE_CACHE_STATS[f"{kind}Hits"] += 1
+        return value
+    _VALUE_CACHE_STATS[f"{kind}Misses"] += 1
+    value = compute()
+    if len(cache) >= TRADE_VALUE_CACHE_MAX_ENTRIES:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+def clear_trade_value_cache() -> None:
+    """Drop every memoized value and reset the hit counters."""
+    _PLAYER_VALUE_CACHE.clear()
+    _PICK_VALUE_CACHE.clear()
+    for key in _VALUE_CACHE_STATS:
+        _VALUE_CACHE_STATS[key] = 0
+
+
+def invalidate_player_trade_value(player: Dict[str, Any] | Any) -> int:
+    """Drop cached values for one player (dict, or its id/name). Returns entries removed."""
+    identity = _player_identity(player) if isinstance(player, dict) else player
+    stale = [key for key in _PLAYER_VALUE_CACHE if key[0][0] == identity]
+    for key in stale:
+        del _PLAYER_VALUE_CACHE[key]
+    return len(stale)
+
+
+def invalidate_pick_trade_value(pick: Dict[str, Any] | Any) -> int:
+    """Drop cached values for one pick (dict, or its id). Returns entries removed."""
+    identity = _pick_identity(pick) if isinstance(pick, dict) else pick
+    stale = [key for key in _PICK_VALUE_CACHE if key[0][0] == identity]
+    for key in stale:
+        del _PICK_VALUE_CACHE[key]
+    return len(stale)
+
+
+def trade_value_cache_stats() -> Dict[str, Any]:
+    stats: Dict[str, Any] = dict(_VALUE_CACHE_STATS)
+    for kind in ("player", "pick"):
+        lookups = stats[f"{kind}Hits"] + stats[f"{kind}Misses"]
+        stats[f"{kind}HitRate"] = round(stats[f"{kind}Hits"] / lookups, 4) if lookups else 0.0
+    stats["playerEntries"] = len(_PLAYER_VALUE_CACHE)
+    stats["pickEntries"] = len(_PICK_VALUE_CACHE)
+    return stats
+
+
 # -----------------------------------------------------------------------------
 # Public valuation API
 # -----------------------------------------------------------------------------
@@ -265,7 +382,14 @@ def player_trade_value(player: Dict[str, Any], team_preferences: Dict[str, Any]
     """Return a rough trade value for a player from the perspective of a team."""
     if not isinstance(player, dict):
         return 0.0
+    key = (_player_fingerprint(player), _phase_key(team_preferences, ("currentTalent", "upside", "salaryFlex")))
+    return _cached_value(
+        _PLAYER_VALUE_CACHE, "player", key,
+        lambda: _player_trade_value_uncached(player, team_preferences),
+    )
+
 
+def _player_trade_value_uncached(player: Dict[str, Any], team_preferences: Dict[str, Any] | None = None) -> float:
     prefs = team_preferences if isinstance(team_preferences, dict) else {}
     phase_prefs = prefs.get("preferences") if isinstance(prefs.get("preferences"), dict) else {}
 
@@ -324,7 +448,14 @@ def pick_trade_value(pick: Dict[str, Any], team_preferences: Dict[str, Any] | No
     """
     if not isinstance(pick, dict):
         return 0.0
+    key = (_pick_fingerprint(pick), _phase_key(team_preferences, ("picks",)))
+    return _cached_value(
+        _PICK_VALUE_CACHE, "pick", key,
+        lambda: _pick_trade_value_uncached(pick, team_preferences),
+    )
+
 
+def _pick_trade_value_uncached(pick: Dict[str, Any], team_preferences: Dict[str, Any] | None = None) -> float:
     prefs = team_preferences if isinstance(team_preferences, dict) else {}
     phase_prefs = prefs.get("preferences") if isinstance(prefs.get("preferences"), dict) else {}
     picks_mult = _num(phase_prefs.get("picks"), 1.0)
@@ -1,6 +1,13 @@
 ﻿// ============================================================
 // simWorkerV2.js - Batch-safe Pyodide Simulation Worker
 // ============================================================
+// This is the app's one Pyodide runtime host. Game sims, the offseason
+// engines, Trade Builder / Trade Finder negotiation (trade-*) and CPU/CPU
+// trade generation (cpu-cpu-trade-*) all run on one Pyodide version with one
+// module set. Every instance belongs to the page's one pool
+// (src/api/pythonWorkerPool.js), which caps the total number of hosts.
+// The CDN bundle and the .py sources use stable URLs, so every host after
+// the first is served from the HTTP cache.
 const BM_SIM_LOG_ENABLED = false;
 const simLog = (...args) => { if (BM_SIM_LOG_ENABLED) console.log(...args); };
 simLog("[simWorkerV2] booting...");
@@ -12,12 +19,16 @@ self.addEventListener("unhandledrejection", (e) =>
   console.error("[simWorkerV2] UNHANDLED:", e.reason)
 );
 
-// Pyodide
-importScripts("https://cdn.jsdelivr.net/pyodide/v0.24.1/full/pyodide.js");
+// Pyodide: the single pinned runtime version for every Python worker.
+const BM_PYODIDE_VERSION = "0.24.1";
+const BM_PYODIDE_INDEX_URL = `https://cdn.jsdelivr.net/pyodide/v${BM_PYODIDE_VERSION}/full/`;
+importScripts(`${BM_PYODIDE_INDEX_URL}pyodide.js`);
 
 let pyodide = null;
 let ready = false;
 let initPromise = null;
+let initStartedAt = 0;
+let initMs = 0;
 
 // Python files loaded from /public/python
 const pythonFiles = [
@@ -30,8 +41,16 @@ const pythonFiles = [
   "steals.py",
   "blocks.py",
   "shooting_model.py",
+  "rating_distributions.py",
+  "overall_evaluator.py",
+  "box_score_numpy.py",
+  "season_stats_store.py",
   "progression.py",
+  "progression_numpy.py",
   "league_financials.py",
+  "league_clone.py",
+  "league_history_store.py",
+  "free_agent_index.py",
   "free_agency_logic.py",
   "contract_extension_acceptance.py",
   "cpu_contract_extensions.py",
@@ -43,16 +62,44 @@ const pythonFiles = [
   "autogenerated_draft_class.py",
   "draft_logic.py",
   "team_roster_logic.py",
+  "league_session.py",
+  "trade_value_model.py",
+  "trade_team_ai.py",
+  "trade_negotiation_logic.py",
+  "cpu_cpu_trade_logic.py",
+  "request_profiler.py",
+  "module_registry.py",
 ]
 
+function looksLikeHtml(text) {
+  const head = String(text || "").trim().slice(0, 160).toLowerCase();
+  return head.startsWith("<!doctype") || head.startsWith("<html") || head.includes("<title>");
+}
+
+// "no-cache" revalidates against the dev server / CDN (ETag), so edited
+// sources are still picked up, but unchanged files come back as 304s instead
+// of full downloads on every worker boot.
+async function fetchPythonSource(file) {
+  const path = `/python/${file}`;
+  const response = await fetch(path, { cache: "no-cache" });
+  const source = await response.text();
+  if (!response.ok) throw new Error(`${path} returned HTTP ${response.status}`);
+  if (looksLikeHtml(source)) {
+    throw new Error(`${path} returned HTML instead of Python. Put ${file} in frontend/public/python.`);
+  }
+  return source;
+}
+
 async function init() {
   if (ready) return pyodide;
   if (initPromise) return initPromise;
 
   initPromise = (async () => {
     simLog("[simWorkerV2] loading Pyodide...");
+    initStartedAt = performance.now();
+    const sourcesPromise = Promise.all(pythonFiles.map(fetchPythonSource));
     const loadedPyodide = await loadPyodide({
-      indexURL: "https://cdn.jsdelivr.net/pyodide/v0.24.1/full/",
+      indexURL: BM_PYODIDE_INDEX_URL,
     });
 
     await loadedPyodide.loadPackage("micropip");
@@ -63,13 +110,13 @@ sys.path.append("/python")
     `);
 
     // Load Python files exactly once. Concurrent init/request messages share
-    // this promise so they cannot start a second Pyodide runtime.
-    for (const file of pythonFiles) {
-      const code = await fetch(`/python/${file}?v=${Date.now()}`).then((r) => r.text());
-      loadedPyodide.FS.writeFile(file, code);
-    }
+    // this promise so they cannot start a second Pyodide runtime. The sources
+    // download while the interpreter boots.
+    const sources = await sourcesPromise;
+    pythonFiles.forEach((file, index) => loadedPyodide.FS.writeFile(file, sources[index]));
 
     pyodide = loadedPyodide;
+    initMs = performance.now() - initStartedAt;
     ready = true;
     simLog("[simWorkerV2] READY");
     postMessage({ type: "ready" });
@@ -94,17 +141,33 @@ self.addEventListener("message", (e) => {
 // ------------------------------------------------------------
 // SINGLE GAME MODE
 // ------------------------------------------------------------
-async function simulateOneGame(id, home, away, multiYearDiagnostics = false) {
+// The game RNG master seed is per message: a message without masterSeed runs
+// with none, whatever an earlier message (or benchmark) used.
+function setGameRngMasterSeedGlobal(masterSeed) {
+  pyodide.globals.set("bm_game_master_seed", Number.isFinite(masterSeed) ? Math.trunc(masterSeed) : null);
+}
+
+async function simulateOneGame(id, home, away, multiYearDiagnostics = false, seed = null, gameId = null, masterSeed = null) {
   try {
     const toPyStartedAt = multiYearDiagnostics ? performance.now() : 0;
     pyodide.globals.set("home", pyodide.toPy(home));
     pyodide.globals.set("away", pyodide.toPy(away));
     const toPyMs = multiYearDiagnostics ? performance.now() - toPyStartedAt : 0;
 
+    // The game runs on its own RNG stream (explicit seed, or game id under a
+    // master seed), so the result does not depend on which pool worker ran
+    // it or on what that worker simulated before. The message id is a page
+    // counter, not a game key: without a seed or gameId the game keeps the
+    // global stream.
+    pyodide.globals.set("bm_game_seed", Number.isFinite(seed) ? seed : null);
+    pyodide.globals.set("bm_game_key", gameId ?? null);
+    setGameRngMasterSeedGlobal(masterSeed);
+
     const pythonStartedAt = multiYearDiagnostics ? performance.now() : 0;
     const pyRes = await pyodide.runPythonAsync(`
-from game_sim import simulate_game
-result = await simulate_game(home, away)
+from game_sim import simulate_game, make_game_rng, set_game_rng_master_seed
+set_game_rng_master_seed(bm_game_master_seed)
+result = await simulate_game(home, away, make_game_rng(bm_game_seed, bm_game_key))
 result
     `);
     const pythonComputeMs = multiYearDiagnostics ? performance.now() - pythonStartedAt : 0;
@@ -131,7 +194,7 @@ result
 // ------------------------------------------------------------
 // BATCH GAME MODE
 // ------------------------------------------------------------
-async function simulateBatch(batchId, games, multiYearDiagnostics = false) {
+async function simulateBatch(batchId, games, multiYearDiagnostics = false, masterSeed = null) {
   simLog("[simWorkerV2] simulateBatch:", games.length, "games");
 
   // IMPORTANT: Pyodide 0.24.1 can fatally crash when one runPythonAsync call
@@ -145,17 +208,21 @@ async function simulateBatch(batchId, games, multiYearDiagnostics = false) {
     let toPyMs = 0;
     let pythonComputeMs = 0;
     let toJsMs = 0;
+    setGameRngMasterSeedGlobal(masterSeed);
 
     for (const game of games || []) {
       const toPyStartedAt = multiYearDiagnostics ? performance.now() : 0;
       pyodide.globals.set("home", pyodide.toPy(game.home));
       pyodide.globals.set("away", pyodide.toPy(game.away));
+      pyodide.globals.set("bm_game_seed", Number.isFinite(game.seed) ? game.seed : null);
+      pyodide.globals.set("bm_game_key", game.id ?? null);
       if (multiYearDiagnostics) toPyMs += performance.now() - toPyStartedAt;
 
       const pythonStartedAt = multiYearDiagnostics ? performance.now() : 0;
       const pyRes = await pyodide.runPythonAsync(`
-from game_sim import simulate_game
-result = await simulate_game(home, away)
+from game_sim import simulate_game, make_game_rng, set_game_rng_master_seed
+set_game_rng_master_seed(bm_game_master_seed)
+result = await simulate_game(home, away, make_game_rng(bm_game_seed, bm_game_key))
 result
       `);
       if (multiYearDiagnostics) pythonComputeMs += performance.now() - pythonStartedAt;
@@ -183,6 +250,61 @@ result
   }
 }
 
+// ------------------------------------------------------------
+// NATIVE SLATE MODE
+// ------------------------------------------------------------
+// Every roster crosses the bridge once and the whole slate (a day, a week or
+// a full season) runs inside one synchronous Python call. Games still run in
+// the given order through simulate_game, so RNG order matches single mode.
+async function simulateGamesBatch(batchId, teamsByName, matchups, multiYearDiagnostics = false, masterSeed = null) {
+  simLog("[simWorkerV2] simulateGamesBatch:", (matchups || []).length, "games");
+
+  try {
+    const toPyStartedAt = multiYearDiagnostics ? performance.now() : 0;
+    pyodide.globals.set("bm_batch_teams", pyodide.toPy(teamsByName || {}));
+    pyodide.globals.set("bm_batch_matchups", pyodide.toPy(matchups || []));
+    const toPyMs = multiYearDiagnostics ? performance.now() - toPyStartedAt : 0;
+
+    const pythonStartedAt = multiYearDiagnostics ? performance.now() : 0;
+    setGameRngMasterSeedGlobal(masterSeed);
+    const pyRes = pyodide.runPython(`
+from game_sim import simulate_games_batch, set_game_rng_master_seed
+set_game_rng_master_seed(bm_game_master_seed)
+simulate_games_batch(bm_batch_teams, bm_batch_matchups)
+    `);
+    const pythonComputeMs = multiYearDiagnostics ? performance.now() - pythonStartedAt : 0;
+
+    const toJsStartedAt = multiYearDiagnostics ? performance.now() : 0;
+    const results = pyRes.toJs({ dict_converter: Object, create_pyproxies: false });
+    pyRes.destroy();
+    const toJsMs = multiYearDiagnostics ? performance.now() - toJsStartedAt : 0;
+
+    let teamRatingCache = null;
+    if (multiYearDiagnostics) {
+      const statsJson = pyodide.runPython(`
+import json
+from game_sim import get_team_rating_cache_stats
+json.dumps(get_team_rating_cache_stats())
+      `);
+      teamRatingCache = JSON.parse(statsJson);
+    }
+
+    postMessage({
+      type: "result-games-batch",
+      batchId,
+      results,
+      ...(multiYearDiagnostics ? { perf: { toPyMs, pythonComputeMs, toJsMs, teamRatingCache } } : {}),
+    });
+  } catch (err) {
+    postMessage({
+      type: "result-games-batch",
+      batchId,
+      results: [],
+      error: err.toString(),
+    });
+  }
+}
+
 async function setGameBenchmarkRngSeed(requestId, seed) {
   try {
     pyodide.globals.set("bm_game_benchmark_seed", Number(seed) || 1);
@@ -226,21 +348,111 @@ game_sim.BM_GAME_COOPERATIVE_YIELDS = not bool(bm_disable_game_yields)
   }
 }
 
+async function setBoxScoreBackend(requestId, backend) {
+  try {
+    if (backend === "numpy") {
+      await pyodide.loadPackage("numpy");
+    }
+    pyodide.globals.set("bm_box_score_backend", String(backend || "python"));
+    const active = await pyodide.runPythonAsync(`
+import importlib
+import box_score_numpy
+import game_sim
+# box_score_numpy may have been imported before NumPy was loaded.
+if not box_score_numpy.NUMPY_AVAILABLE:
+    importlib.reload(box_score_numpy)
+    game_sim.NUMPY_AVAILABLE = box_score_numpy.NUMPY_AVAILABLE
+    game_sim.build_box_numpy = box_score_numpy.build_box_numpy
+game_sim.set_box_score_backend(bm_box_score_backend)
+    `);
+    postMessage({
+      type: "box-score-backend-set",
+      requestId,
+      backend: active,
+    });
+  } catch (err) {
+    postMessage({
+      type: "box-score-backend-set",
+      requestId,
+      backend: "python",
+      error: err.toString(),
+    });
+  }
+}
+
+// Opt-in Python profiling (public/python/request_profiler.py). Profiled
+// results carry pythonProfile; reportPythonProfile also posts it on its own
+// so simEnginePy.js can log it whichever API module made the request.
+async function setPythonProfiling(requestId, enabled, topN, sortBy) {
+  try {
+    pyodide.globals.set("bm_python_profiling_js", pyodide.toPy({
+      enabled: Boolean(enabled),
+      topN: Number.isFinite(topN) ? topN : null,
+      sortBy: sortBy || null,
+    }));
+    const pyJson = await pyodide.runPythonAsync(`
+import json
+from request_profiler import set_profiling
+json.dumps(set_profiling(
+    bm_python_profiling_js.get("enabled"),
+    top_n=bm_python_profiling_js.get("topN"),
+    sort_by=bm_python_profiling_js.get("sortBy"),
+))
+    `);
+    postMessage({
+      type: "python-profiling-set",
+      requestId,
+      payload: JSON.parse(pyJson),
+    });
+  } catch (err) {
+    postMessage({
+      type: "python-profiling-set",
+      requestId,
+      error: err.toString(),
+    });
+  }
+}
+
+function reportPythonProfile(payload) {
+  const profile = payload?.pythonProfile ?? payload?.result?.pythonProfile;
+  if (profile) postMessage({ type: "python-profile", profile });
+}
+
+async function getModuleLoadStats(requestId) {
+  try {
+    const pyJson = await pyodide.runPythonAsync(`
+import json
+from module_registry import get_module_load_stats
+json.dumps(get_module_load_stats())
+    `);
+    postMessage({
+      type: "module-load-stats",
+      requestId,
+      payload: JSON.parse(pyJson),
+    });
+  } catch (err) {
+    postMessage({
+      type: "module-load-stats",
+      requestId,
+      error: err.toString(),
+    });
+  }
+}
+
 // ------------------------------------------------------------
 // AWARDS MODE
 // ------------------------------------------------------------
-async function computeAwards(requestId, players, teams, seasonYear) {
+async function computeAwards(requestId, players, teams, seasonYear, playerMeta = null) {
   try {
     pyodide.globals.set("players_js", pyodide.toPy(players || []));
     pyodide.globals.set("teams_js", pyodide.toPy(teams || []));
     pyodide.globals.set("season_js", seasonYear ?? null);
+    pyodide.globals.set("player_meta_js", pyodide.toPy(playerMeta || {}));
 
     const pyRes = await pyodide.runPythonAsync(`
-import importlib
-import awards
-importlib.reload(awards)
-from awards import compute_awards
-res = compute_awards(players_js, teams_js, season_js)
+from module_registry import load_engine
+compute_awards = load_engine("awards").compute_awards
+res = compute_awards(players_js, teams_js, season_js, player_meta_js)
 res
     `);
 
@@ -270,10 +482,8 @@ async function computeFinalsMvp(requestId, players, meta) {
     pyodide.globals.set("meta_js", pyodide.toPy(meta || {}));
 
     const pyRes = await pyodide.runPythonAsync(`
-import importlib
-import awards
-importlib.reload(awards)
-from awards import compute_finals_mvp
+from module_registry import load_engine
+compute_finals_mvp = load_engine("awards").compute_finals_mvp
 
 champion = meta_js.get("championTeam") if hasattr(meta_js, "get") else None
 season = meta_js.get("seasonYear") if hasattr(meta_js, "get") else None
@@ -303,10 +513,8 @@ async function computeAllStars(requestId, payload) {
     pyodide.globals.set("all_star_payload_js", pyodide.toPy(payload || {}));
 
     const pyRes = await pyodide.runPythonAsync(`
-import importlib
-import all_star_logic
-importlib.reload(all_star_logic)
-from all_star_logic import compute_all_stars
+from module_registry import load_engine
+compute_all_stars = load_engine("all_star_logic").compute_all_stars
 
 res = compute_all_stars(all_star_payload_js)
 res
@@ -328,6 +536,31 @@ res
     });
   }
 }
+async function setProgressionBackend(requestId, backend) {
+  try {
+    if (backend === "numpy") {
+      await pyodide.loadPackage("numpy");
+    }
+    pyodide.globals.set("bm_progression_backend", String(backend || "python"));
+    const active = await pyodide.runPythonAsync(`
+from module_registry import configure_engine
+configure_engine("progression", "set_progression_plan_backend", bm_progression_backend)
+    `);
+    postMessage({
+      type: "progression-backend-set",
+      requestId,
+      backend: active,
+    });
+  } catch (err) {
+    postMessage({
+      type: "progression-backend-set",
+      requestId,
+      backend: "python",
+      error: err.toString(),
+    });
+  }
+}
+
 // ------------------------------------------------------------
 // PLAYER PROGRESSION MODE
 // ------------------------------------------------------------
@@ -338,11 +571,10 @@ async function computeProgression(requestId, leagueData, statsByKey, meta) {
     pyodide.globals.set("meta_js", pyodide.toPy(meta || {}));
 
     const pyJson = await pyodide.runPythonAsync(`
-import importlib, json
-import progression
-importlib.reload(progression)
-
-from progression import apply_end_of_season_progression_with_deltas
+import json
+from module_registry import load_engine
+from request_profiler import run_profiled
+apply_end_of_season_progression_with_deltas = load_engine("progression").apply_end_of_season_progression_with_deltas
 
 seed = None
 try:
@@ -356,18 +588,19 @@ try:
 except Exception:
   season_year = None
 
-res = apply_end_of_season_progression_with_deltas(
+res = run_profiled("progression", "apply_end_of_season_progression_with_deltas", lambda: apply_end_of_season_progression_with_deltas(
   league = league_js,
   stats_by_key = stats_js,
   settings = None,
   seed = seed,
   season_year = season_year
-)
+))
 
 json.dumps(res)
     `);
 
     const payload = JSON.parse(pyJson);
+    reportPythonProfile(payload);
 
     postMessage({
       type: "progression-result",
@@ -391,10 +624,9 @@ async function enforceFinalProgressionShape(requestId, leagueData, meta) {
     pyodide.globals.set("final_shape_meta_js", pyodide.toPy(meta || {}));
 
     const pyJson = await pyodide.runPythonAsync(`
-import importlib, json
-import progression
-importlib.reload(progression)
-from progression import apply_final_league_shape_lock
+import json
+from module_registry import load_engine
+apply_final_league_shape_lock = load_engine("progression").apply_final_league_shape_lock
 
 seed = None
 try:
@@ -443,10 +675,10 @@ async function runFreeAgencyRequest(requestId, action, leagueData, payload, okTy
     const pyJson = await pyodide.runPythonAsync(`
 import json
 import time
-from free_agency_logic import handle_request
+from module_registry import handle_engine_request
 
 _fa_compute_started = time.perf_counter()
-res = handle_request(fa_request_js)
+res = handle_engine_request("free_agency_logic", fa_request_js)
 _fa_compute_ms = (time.perf_counter() - _fa_compute_started) * 1000.0
 _fa_serialize_started = time.perf_counter()
 _fa_payload_json = json.dumps(res)
@@ -458,6 +690,7 @@ _fa_payload_json
     const jsonParseStartedAt = performance.now();
     const payloadOut = JSON.parse(pyJson);
     const jsonParseMs = performance.now() - jsonParseStartedAt;
+    reportPythonProfile(payloadOut);
 
     if (action === "advance_free_agency_day" && payloadOut && typeof payloadOut === "object") {
       const pythonComputeMs = Number(pyodide.globals.get("_fa_compute_ms") || 0);
@@ -697,23 +930,20 @@ async function runContractExtensionRequest(requestId, action, leagueData, payloa
     }));
 
     const pyJson = await pyodide.runPythonAsync(`
-import importlib, json
-import contract_extension_acceptance
-import cpu_contract_extensions
-import contract_extension_logic
-importlib.reload(contract_extension_acceptance)
-importlib.reload(cpu_contract_extensions)
-importlib.reload(contract_extension_logic)
-from contract_extension_logic import handle_request
-
-res = handle_request(contract_extension_request_js)
+import json
+from module_registry import handle_engine_request
+
+res = handle_engine_request("contract_extension_logic", contract_extension_request_js)
 json.dumps(res)
     `);
 
+    const payloadOut = JSON.parse(pyJson);
+    reportPythonProfile(payloadOut);
+
     postMessage({
       type: "contract-extension-result",
       requestId,
-      payload: JSON.parse(pyJson),
+      payload: payloadOut,
     });
   } catch (err) {
     console.error("[simWorkerV2] contract extension request error:", action, err);
@@ -737,16 +967,15 @@ async function runPlayerMoodRequest(requestId, leagueData, payload) {
     }));
 
     const pyJson = await pyodide.runPythonAsync(`
-import importlib, json
-import player_mood_logic
-importlib.reload(player_mood_logic)
-from player_mood_logic import handle_request
+import json
+from module_registry import handle_engine_request
 
-res = handle_request(player_mood_request_js)
+res = handle_engine_request("player_mood_logic", player_mood_request_js)
 json.dumps(res)
     `);
 
     const payloadOut = JSON.parse(pyJson);
+    reportPythonProfile(payloadOut);
 
     postMessage({
       type: "player-mood-result",
@@ -775,17 +1004,15 @@ async function runRetirementRequest(requestId, leagueData, payload, okType, errT
     }));
 
     const pyJson = await pyodide.runPythonAsync(`
-import importlib, json
-import retirement_logic
-importlib.reload(retirement_logic)
-
-from retirement_logic import handle_request
+import json
+from module_registry import handle_engine_request
 
-res = handle_request(ret_request_js)
+res = handle_engine_request("retirement_logic", ret_request_js)
 json.dumps(res)
     `);
 
     const payloadOut = JSON.parse(pyJson);
+    reportPythonProfile(payloadOut);
 
     postMessage({
       type: okType,
@@ -813,6 +1040,126 @@ async function runPlayerRetirements(requestId, leagueData, payload) {
 }
 
 
+// ------------------------------------------------------------
+// TRADE NEGOTIATION (Trade Builder / Trade Finder)
+// ------------------------------------------------------------
+function parsePythonJsonResult(resultJson, fallback) {
+  try {
+    return JSON.parse(resultJson);
+  } catch {
+    return { ...fallback, rawResult: String(resultJson || "") };
+  }
+}
+
+async function evaluateTrade(requestId, proposal) {
+  try {
+    pyodide.globals.set("proposal_json_js", JSON.stringify(proposal || {}));
+    const resultJson = pyodide.runPython(`
+from module_registry import load_engine
+load_engine("trade_negotiation_logic").evaluate_trade_json(proposal_json_js)
+`);
+    postMessage({
+      type: "trade-evaluate-result",
+      requestId,
+      payload: parsePythonJsonResult(resultJson, {
+        decision: "reject",
+        accepted: false,
+        score: -999,
+        message: "Trade negotiation returned invalid JSON.",
+      }),
+    });
+  } catch (err) {
+    postMessage({ type: "trade-evaluate-error", requestId, error: err?.message || String(err) });
+  } finally {
+    try {
+      pyodide.globals.delete("proposal_json_js");
+    } catch {}
+  }
+}
+
+async function findTradeOffers(requestId, search) {
+  try {
+    pyodide.globals.set("trade_finder_json_js", JSON.stringify(search || {}));
+    const resultJson = pyodide.runPython(`
+from module_registry import load_engine
+load_engine("trade_negotiation_logic").find_trade_offers_json(trade_finder_json_js)
+`);
+    postMessage({
+      type: "trade-find-offers-result",
+      requestId,
+      payload: parsePythonJsonResult(resultJson, { ok: false, offers: [], message: "Trade Finder returned invalid JSON." }),
+    });
+  } catch (err) {
+    postMessage({ type: "trade-find-offers-error", requestId, error: err?.message || String(err) });
+  } finally {
+    try {
+      pyodide.globals.delete("trade_finder_json_js");
+    } catch {}
+  }
+}
+
+// ------------------------------------------------------------
+// CPU/CPU TRADE CANDIDATES
+// ------------------------------------------------------------
+async function findCpuCpuTradeCandidates(requestId, payload, diagnosticsTraceEnabled = false, readyWaitMs = 0) {
+  const traceEnabled = Boolean(diagnosticsTraceEnabled);
+  const requestReceivedAt = traceEnabled ? performance.now() : 0;
+
+  try {
+    const inputSerializationStartedAt = traceEnabled ? performance.now() : 0;
+    const payloadJson = JSON.stringify(payload || {});
+    const inputSerializationMs = traceEnabled ? performance.now() - inputSerializationStartedAt : 0;
+    pyodide.globals.set("cpu_trade_payload_json_js", payloadJson);
+
+    const pythonStartedAt = traceEnabled ? performance.now() : 0;
+    const resultJson = pyodide.runPython(`
+from module_registry import load_engine
+load_engine("cpu_cpu_trade_logic").find_cpu_cpu_trade_candidates_json(cpu_trade_payload_json_js)
+`);
+    const pythonExecutionMs = traceEnabled ? performance.now() - pythonStartedAt : 0;
+
+    const parseStartedAt = traceEnabled ? performance.now() : 0;
+    const parsedPayload = parsePythonJsonResult(resultJson, { ok: false, candidates: [], skippedReason: "invalid_json" });
+    const resultParseMs = traceEnabled ? performance.now() - parseStartedAt : 0;
+
+    if (traceEnabled) {
+      const responsePreparationStartedAt = performance.now();
+      parsedPayload.debug = {
+        ...(parsedPayload?.debug || {}),
+        workerTiming: {
+          requestReceivedAt,
+          readyWaitMs,
+          pyodideInitializationMs: initMs,
+          pyodideVersion: BM_PYODIDE_VERSION,
+          reusedWarmRuntime: readyWaitMs < 5 && initMs > 0,
+          inputSerializationMs,
+          pythonExecutionMs,
+          resultParseMs,
+          inputBytes: payloadJson.length,
+          resultBytes: String(resultJson || "").length,
+        },
+      };
+      parsedPayload.debug.workerTiming.responsePreparationMs = performance.now() - responsePreparationStartedAt;
+    }
+
+    postMessage({
+      type: "cpu-cpu-trade-candidates-result",
+      requestId,
+      payload: parsedPayload,
+    });
+  } catch (err) {
+    postMessage({
+      type: "cpu-cpu-trade-candidates-error",
+      requestId,
+      error: err?.message || String(err || "CPU trade season worker failed"),
+    });
+  } finally {
+    try {
+      pyodide.globals.delete("cpu_trade_payload_json_js");
+    } catch {}
+  }
+}
+
 // ------------------------------------------------------------
 // DRAFT LOTTERY REQUEST MODE
 // ------------------------------------------------------------
@@ -825,18 +1172,19 @@ async function runDraftLotteryRequest(requestId, leagueData, payload) {
     }));
 
     const pyJson = await pyodide.runPythonAsync(`
-import importlib, json
-import draft_lottery
-importlib.reload(draft_lottery)
-from draft_lottery import handle_request
-res = handle_request(draft_lottery_request_js)
+import json
+from module_registry import handle_engine_request
+res = handle_engine_request("draft_lottery", draft_lottery_request_js)
 json.dumps(res)
     `);
 
+    const payloadOut = JSON.parse(pyJson);
+    reportPythonProfile(payloadOut);
+
     postMessage({
       type: "draft-lottery-result",
       requestId,
-      payload: JSON.parse(pyJson),
+      payload: payloadOut,
     });
   } catch (err) {
     console.error("[simWorkerV2] draft lottery error:", err);
@@ -860,20 +1208,19 @@ async function runDraftLogicRequest(requestId, action, leagueData, payload) {
     }));
 
     const pyJson = await pyodide.runPythonAsync(`
-import importlib, json
-import autogenerated_draft_class
-import draft_logic
-importlib.reload(autogenerated_draft_class)
-importlib.reload(draft_logic)
-from draft_logic import handle_request
-res = handle_request(draft_request_js)
+import json
+from module_registry import handle_engine_request
+res = handle_engine_request("draft_logic", draft_request_js)
 json.dumps(res)
     `);
 
+    const payloadOut = JSON.parse(pyJson);
+    reportPythonProfile(payloadOut);
+
     postMessage({
       type: "draft-action-result",
       requestId,
-      payload: JSON.parse(pyJson),
+      payload: payloadOut,
     });
   } catch (err) {
     console.error("[simWorkerV2] draft logic error:", action, err);
@@ -897,18 +1244,19 @@ async function runTeamRosterLogicRequest(requestId, action, leagueData, payload)
     }));
 
     const pyJson = await pyodide.runPythonAsync(`
-import importlib, json
-import team_roster_logic
-importlib.reload(team_roster_logic)
-from team_roster_logic import handle_request
-res = handle_request(team_roster_request_js)
+import json
+from module_registry import handle_engine_request
+res = handle_engine_request("team_roster_logic", team_roster_request_js)
 json.dumps(res)
     `);
 
+    const payloadOut = JSON.parse(pyJson);
+    reportPythonProfile(payloadOut);
+
     postMessage({
       type: "team-roster-action-result",
       requestId,
-      payload: JSON.parse(pyJson),
+      payload: payloadOut,
     });
   } catch (err) {
     console.error("[simWorkerV2] team roster logic error:", action, err);
@@ -920,13 +1268,114 @@ json.dumps(res)
   }
 }
 
+// ------------------------------------------------------------
+// RESIDENT LEAGUE SESSION MODE
+// ------------------------------------------------------------
+// The league is converted with toPy once per load; later engine requests
+// only send action + payload and get back a delta of the changed teams,
+// players and state keys instead of the full league JSON.
+async function runLeagueSessionRequest(requestId, op, msg) {
+  const startedAt = performance.now();
+  try {
+    if (op === "load") {
+      pyodide.globals.set("league_session_league_js", pyodide.toPy(msg.leagueData || {}));
+    } else if (op === "patch") {
+      pyodide.globals.set("league_session_ops_js", pyodide.toPy(msg.ops || []));
+    } else if (op === "action") {
+      pyodide.globals.set("league_session_request_js", pyodide.toPy({
+        engine: msg.engine,
+        action: msg.action,
+        payload: msg.payload || {},
+      }));
+    }
+    pyodide.globals.set("league_session_op", op);
+
+    const pyJson = await pyodide.runPythonAsync(`
+import json
+import league_session
+
+if league_session_op == "load":
+    res = league_session.load_league(league_session_league_js)
+elif league_session_op == "patch":
+    res = league_session.apply_league_patch(league_session_ops_js)
+elif league_session_op == "action":
+    res = league_session.run_session_action(
+        league_session_request_js.get("engine"),
+        league_session_request_js.get("action"),
+        league_session_request_js.get("payload"),
+    )
+else:
+    res = league_session.clear_league()
+json.dumps(res)
+    `);
+
+    const payloadOut = JSON.parse(pyJson);
+    reportPythonProfile(payloadOut);
+    payloadOut.perf = {
+      workerMs: Number((performance.now() - startedAt).toFixed(3)),
+      responseJsonChars: pyJson.length,
+    };
+    postMessage({
+      type: "league-session-result",
+      requestId,
+      payload: payloadOut,
+    });
+  } catch (err) {
+    console.error("[simWorkerV2] league session error:", op, err);
+    postMessage({
+      type: "league-session-error",
+      requestId,
+      error: err.toString(),
+    });
+  }
+}
+
 // ------------------------------------------------------------
 // Dispatcher
 // ------------------------------------------------------------
+// Trade callers expect a typed error reply when the runtime cannot start.
+const RUNTIME_INIT_ERROR_TYPES = {
+  "trade-evaluate": "trade-evaluate-error",
+  "trade-find-offers": "trade-find-offers-error",
+  "cpu-cpu-trade-candidates": "cpu-cpu-trade-candidates-error",
+};
+
 onmessage = async (e) => {
   const msg = e.data;
 
-  if (!ready) await init();
+  let readyWaitMs = 0;
+  if (!ready) {
+    const readyStartedAt = performance.now();
+    try {
+      await init();
+    } catch (err) {
+      const errorType = RUNTIME_INIT_ERROR_TYPES[msg?.type];
+      if (!errorType) throw err;
+      postMessage({ type: errorType, requestId: msg.requestId, error: `Pyodide runtime failed to start: ${err?.message || err}` });
+      return;
+    }
+    readyWaitMs = performance.now() - readyStartedAt;
+  }
+
+  if (msg.type === "trade-evaluate") {
+    return evaluateTrade(msg.requestId, msg.proposal);
+  }
+
+  if (msg.type === "trade-find-offers") {
+    return findTradeOffers(msg.requestId, msg.search);
+  }
+
+  if (msg.type === "cpu-cpu-trade-prewarm") {
+    return;
+  }
+
+  if (msg.type === "cpu-cpu-trade-candidates") {
+    return findCpuCpuTradeCandidates(msg.requestId, msg.payload || {}, Boolean(msg.diagnosticsTraceEnabled), readyWaitMs);
+  }
+
+  if (msg.type === "league-session") {
+    return runLeagueSessionRequest(msg.requestId, msg.op, msg);
+  }
 
   if (msg.type === "run-draft-lottery") {
     const leaguePayload = msg.leagueData ?? msg.league ?? {};
@@ -944,7 +1393,15 @@ onmessage = async (e) => {
   }
 
   if (msg.type === "simulate-single") {
-    return simulateOneGame(msg.id, msg.home, msg.away, Boolean(msg.multiYearDiagnostics));
+    return simulateOneGame(
+      msg.id,
+      msg.home,
+      msg.away,
+      Boolean(msg.multiYearDiagnostics),
+      Number.isFinite(msg.seed) ? msg.seed : null,
+      msg.gameId ?? null,
+      Number.isFinite(msg.masterSeed) ? msg.masterSeed : null
+    );
   }
     if (msg.type === "compute-all-stars") {
     return computeAllStars(msg.requestId, msg.payload || {});
@@ -963,15 +1420,46 @@ onmessage = async (e) => {
     return;
   }
 
+  if (msg.type === "get-module-load-stats") {
+    return getModuleLoadStats(msg.requestId);
+  }
+
+  if (msg.type === "set-python-profiling") {
+    return setPythonProfiling(msg.requestId, msg.enabled, msg.topN, msg.sortBy);
+  }
+
+  if (msg.type === "set-box-score-backend") {
+    return setBoxScoreBackend(msg.requestId, msg.backend);
+  }
+
+  if (msg.type === "set-progression-backend") {
+    return setProgressionBackend(msg.requestId, msg.backend);
+  }
+
   if (msg.type === "simulate-batch") {
-    return simulateBatch(msg.batchId, msg.games, Boolean(msg.multiYearDiagnostics));
+    return simulateBatch(
+      msg.batchId,
+      msg.games,
+      Boolean(msg.multiYearDiagnostics),
+      Number.isFinite(msg.masterSeed) ? msg.masterSeed : null
+    );
+  }
+
+  if (msg.type === "simulate-games-batch") {
+    return simulateGamesBatch(
+      msg.batchId,
+      msg.teamsByName,
+      msg.matchups,
+      Boolean(msg.multiYearDiagnostics),
+      Number.isFinite(msg.masterSeed) ? msg.masterSeed : null
+    );
   }
 
   // awards
   if (msg.type === "compute-awards") {
     const seasonYear = msg.meta?.seasonYear ?? null;
     const teams = msg.teams || msg.meta?.teams || [];
-    return computeAwards(msg.requestId, msg.players, teams, seasonYear);
+    return computeAwards(msg.requestId, msg.players, teams, seasonYear, msg.meta?.playerMeta ?? null);
   }
 
   // finals mvp
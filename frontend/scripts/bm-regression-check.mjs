@@ -112,9 +112,11 @@ includes("src/pages/Calendar.jsx", 'recordCpuTradeTiming("recordBuildMs"', "Cale
 includes("src/pages/Calendar.jsx", 'recordCpuTradeTiming("rosterRepairMs"', "Calendar measures post-trade roster repair.");
 includes("src/api/cpuTradeEngine.js", 'recordCpuTradeTiming("workerGenerationMs"', "CPU trade worker round-trip time is measured.");
 includes("src/api/cpuTradeEngine.js", "cancelCpuTradeWorkerGeneration", "CPU trade worker exposes explicit cancellation for stale generation work.");
-includes("src/api/cpuTradeEngine.js", 'replaceWorkerSlot(slot.index, "request_timeout")', "Timed-out CPU trade requests replace only their affected generation worker.");
+includes("src/api/cpuTradeEngine.js", 'abandonWorkerJob(requestId, "request_timeout")', "Timed-out CPU trade requests replace only their affected generation worker.");
 excludes("src/pages/Calendar.jsx", "foreground_superseded_background", "Continuous market generation never cancels background work to launch an emergency duplicate.");
-includes("src/api/cpuTradeEngine.js", "MAX_GENERATION_WORKERS = 4", "V5B uses up to four persistent Pyodide generation workers on high-core desktops while scaling down on smaller systems.");
+includes("src/api/pythonWorkerPool.js", "PYTHON_POOL_MAX_SIZE = 6", "Sims, trade requests and CPU trade generation share one Pyodide pool with a global worker cap.");
+excludes("src/api/cpuTradeEngine.js", "new Worker(", "CPU trade generation starts no Pyodide workers of its own.");
+excludes("src/api/simEnginePy.js", "new Worker(", "The sim engine starts no Pyodide workers outside the shared pool.");
 includes("src/api/cpuTradeEngine.js", "compactCpuTradeHistoryForWorker", "CPU trade generation sends only the exact history fields consumed by Python.");
 includes("src/api/cpuTradeEngine.js", "tradeHistory.slice(-CPU_TRADE_HISTORY_LIMIT)", "CPU trade history compaction preserves the original 120-row tail window before stripping unused fields.");
 includes("src/api/cpuTradeEngine.js", "getCpuCpuTradeCandidateBatch", "V5B exposes ordered parallel generation for independent exact-seed passes.");
@@ -146,6 +148,35 @@ includes("src/pages/Calendar.jsx", "shouldPauseForContractExtensionDeadline", "C
 includes("src/pages/TeamHub.jsx", 'path: "/contract-extensions"', "Team Hub links the Contract Extensions front-office page.");
 includes("public/workers/simWorkerV2.js", "if (initPromise) return initPromise;", "Simulation worker uses a single shared Pyodide initialization promise.");
 includes("public/workers/simWorkerV2.js", "const loadedPyodide = await loadPyodide", "Pyodide is assigned only after the one shared initialization completes.");
+includes("public/workers/simWorkerV2.js", 'const BM_PYODIDE_VERSION = "0.24.1"', "Every Pyodide worker runs one pinned runtime version.");
+includes("public/workers/simWorkerV2.js", '"trade_negotiation_logic.py"', "The shared Pyodide host loads the trade negotiation engine.");
+includes("public/workers/simWorkerV2.js", '"cpu_cpu_trade_logic.py"', "The shared Pyodide host loads the CPU-CPU trade engine.");
+excludes("public/workers/simWorkerV2.js", "?v=${Date.now()}", "Python sources revalidate through the HTTP cache instead of a per-boot cache-busting query.");
+excludes("src/api/tradeNegotiationPy.js", "/workers/tradeWorker.js", "Trade negotiation no longer boots a second Pyodide runtime.");
+excludes("src/api/cpuTradeEngine.js", "/workers/cpuTradeSeasonWorker.js", "CPU-trade generation runs on the shared Pyodide host.");
+includes("src/api/simEnginePy.js", "leagueData: hotLeague.leagueData", "Engine requests send the hot league without player history.");
+includes("src/api/simEnginePy.js", "deepSanitize(stripTeamHistory(homeTeam))", "Game sim payloads drop player history.");
+includes("public/workers/simWorkerV2.js", '"league_history_store.py"', "The worker loads the session history store.");
+includes("src/utils/leagueSessionDelta.js", "delta.historyAppends", "Session deltas apply history appends to the JS league.");
+includes("public/workers/simWorkerV2.js", '"request_profiler.py"', "The worker loads the request profiler.");
+excludes("public/workers/simWorkerV2.js", "handle_request = load_engine(", "Worker engine requests go through handle_engine_request so they can be profiled.");
+includes("public/python/league_session.py", "handle_engine_request(module_name", "Session actions go through handle_engine_request so they can be profiled.");
+includes("src/api/simEnginePy.js", 'action: "advance_free_agency_day", payload: { userTeamName }', "Free-agency days run on the resident league session.");
+includes("src/api/simEnginePy.js", 'msg.type === "python-profile"', "The page records Python profiles posted by the worker.");
+includes("public/python/free_agency_logic.py", "with free_agent_index_scope(), financial_rules_scope():", "Free-agency requests memoize financial rules for the request.");
+excludes("public/python/free_agency_logic.py", "global DEFAULT_SALARY_CAP", "sync_financial_constants binds the request economy instead of rewriting module constants.");
+includes("src/pages/Calendar.jsx", "simulateGamesBatch(teamsByName, matchups)", "Calendar sims a date's pending games as native slates.");
+includes("src/api/simEnginePy.js", "abandonPythonPoolJob(batchId);", "A slate that never answers times out instead of stalling the day loop.");
+includes("src/pages/Calendar.jsx", "activeRuntime, currentDate, 1);", "Games retried after a bad slate row start at a new seed attempt.");
+includes("src/api/simEnginePy.js", "export async function setBoxScoreBackend", "The page can switch every sim worker to the NumPy box-score engine.");
+includes("src/api/simEnginePy.js", "export function setProgressionBackend", "The page can switch progression to the NumPy plan.");
+includes("public/python/module_registry.py", "enter_league(request.get(\"leagueData\"))", "Engine requests reset league-scoped module state when the league changes.");
+includes("src/api/pythonWorkerPool.js", "pool.queue.unshift(job);", "A job on a crashed pool worker is re-queued to another worker.");
+includes("src/api/tradeNegotiationPy.js", "dispatchPythonPoolJob({", "Trade requests are pool jobs, so they neither block nor wait behind sims on the main worker, and their timeout starts when a ready worker takes them.");
+includes("src/pages/Calendar.jsx", "currentDate, firstAttempt + attempt - 1);", "Game retries draw a new seed per attempt.");
+includes("public/workers/simWorkerV2.js", "set_game_rng_master_seed(bm_game_master_seed)", "Every sim request sets its own game RNG master seed.");
+includes("public/workers/simWorkerV2.js", "pyodide.globals.set(\"bm_game_key\", gameId ?? null);", "Single-game streams are keyed by the game id, never the message counter.");
+includes("src/api/simEnginePy.js", "{ gameId } : {}", "simulateOneGame sends the game id to the worker.");
 includes("src/utils/cpuTradeBank.js", "buildSameStateValidationCacheScope", "CPU trade validation reuse is scoped to identical package-relevant state.");
 includes("src/utils/cpuTradeBank.js", "sameStatePeriodicCacheHits", "CPU trade diagnostics distinguish periodic same-state validation reuse.");
 includes("src/utils/cpuTradeBank.js", "objectIdentityToken(draftPicks)", "Same-state validation cache invalidates when draft-pick ownership storage changes.");
@@ -196,7 +227,7 @@ includes("src/utils/cpuTradeTelemetry.js", "MAX_TRACE_ROWS = 4000", "Deep CPU-tr
 includes("src/utils/cpuTradeTelemetry.js", "installCpuTradeTraceConsoleApi", "Deep CPU-trade diagnostics expose one console export API.");
 includes("src/api/cpuTradeEngine.js", 'recordCpuTradeTrace("generation", "launched"', "Generation diagnostics record launch reason, nonce, payload, and worker-pool state.");
 includes("src/api/cpuTradeEngine.js", "...(traceEnabled ? { diagnosticsTraceEnabled: true } : {})", "Generation worker diagnostics are opt-in so the normal V5B worker message stays unchanged.");
-includes("public/workers/cpuTradeSeasonWorker.js", "Boolean(msg.diagnosticsTraceEnabled)", "The generation worker forwards the diagnostics flag into Python timing collection.");
+includes("public/workers/simWorkerV2.js", "Boolean(msg.diagnosticsTraceEnabled)", "The generation worker (shared Pyodide host) forwards the diagnostics flag into Python timing collection.");
 includes("src/api/cpuTradeValidationPool.js", "queueAndInboundTransferMs", "Exact-validation diagnostics separate queue/inbound transfer from worker compute.");
 includes("src/utils/cpuTradeBank.js", 'recordCpuTradeTrace("bank", "admission_completed"', "Bank diagnostics record inventory and admission outcomes.");
 includes("src/pages/Calendar.jsx", 'recordCpuTradeTrace("repair", "post_trade_repair_completed"', "Post-trade diagnostics record roster counts and mandatory repair completion.");
@@ -834,7 +865,7 @@ check("python.free_agency.targeted_scope", freeAgency.includes("normalize_cpu_re
 check("python.free_agency.global_76_rule_preserved", freeAgency.includes("sign_high_value_free_agents_before_simulation") && freeAgency.includes("has_high_value_free_agents"), "The global 76+ free-agent placement rule remains active in targeted repair.");
 check("python.free_agency.compact_patch", freeAgency.includes("build_cpu_roster_repair_league_patch") && freeAgency.includes('result["leaguePatch"]'), "Targeted repair returns only changed teams and mutated free-agency ledgers.");
 check("python.free_agency.unrelated_illegal_fallback", freeAgency.includes("unrelated_team_requires_full_repair") && freeAgency.includes("targetedFallbackRequired"), "Unexpected unrelated roster violations request the full legacy fallback.");
-check("python.free_agency.full_path_copy_preserved", freeAgency.includes("updated = league_data if targeted_mode else copy.deepcopy(league_data)"), "The legacy full repair keeps its original deep-copy semantics while the isolated targeted worker avoids a redundant copy.");
+check("python.free_agency.full_path_copy_preserved", freeAgency.includes("updated = league_data if targeted_mode else clone_league_sharing_cold(league_data)"), "The legacy full repair keeps its copy semantics (league clone sharing cold subtrees) while the isolated targeted worker avoids a redundant copy.");
 check("python.free_agency.no_regular_season_shape_lock", !freeAgency.includes("from progression import apply_final_league_shape_lock") && !freeAgency.includes("pre_simulation_final_shape_lock"), "Regular-season CPU roster repair no longer invokes the offseason progression shape lock.");
 check("python.team_roster.max15", /STANDARD_ROSTER_MAX\s*=\s*15/.test(teamRoster), "Season-start roster logic keeps the 15-player simulation maximum.");
 check("python.cpu_trade.temp16", /STANDARD_ROSTER_MAX\s*=\s*16/.test(cpuTrade), "CPU trade generation starts from the temporary 16-player ceiling.");
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Seeded statistical-equivalence check for the NumPy box-score backend.
+
+Runs the reference pure-Python build_box and box_score_numpy.build_box_numpy
+on the same rosters, minutes and team totals with fixed seeds, then compares
+per-player means for every counting stat. Both engines must also satisfy the
+hard box-score invariants on every line.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import json
+import pathlib
+import random
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import box_score_numpy  # noqa: E402
+import game_sim  # noqa: E402
+
+if not box_score_numpy.NUMPY_AVAILABLE:
+    print(json.dumps({"status": "SKIP", "reason": "numpy is not installed"}))
+    sys.exit(0)
+
+GAMES_PER_TEAM = 300
+TEAMS_CHECKED = 4
+STATS = ["pts", "fgm", "fga", "3pm", "3pa", "ftm", "fta", "reb", "ast", "stl", "blk", "to", "pf"]
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def split_made(value):
+    made, attempted = str(value).split("/")
+    return int(made), int(attempted)
+
+
+def line_stats(row):
+    fgm, fga = split_made(row["fg"])
+    tpm, tpa = split_made(row["3p"])
+    ftm, fta = split_made(row["ft"])
+    return {
+        "pts": row["pts"], "fgm": fgm, "fga": fga, "3pm": tpm, "3pa": tpa,
+        "ftm": ftm, "fta": fta, "reb": row["reb"], "ast": row["ast"],
+        "stl": row["stl"], "blk": row["blk"], "to": row["to"], "pf": row["pf"],
+    }
+
+
+def check_invariants(rows, team_points, label, exact_total):
+    # The reference splitter stops early when it draws a scoreless player
+    # while trimming, so only the array backend guarantees an exact total.
+    if exact_total:
+        check(sum(r["pts"] for r in rows) == team_points, f"{label}: player points must sum to team points")
+    for r in rows:
+        s = line_stats(r)
+        check(0 <= s["fgm"] <= s["fga"], f"{label}: FG makes exceed attempts for {r['player']}")
+        check(0 <= s["3pm"] <= s["3pa"] and s["3pm"] <= s["fgm"], f"{label}: bad 3P line for {r['player']}")
+        check(0 <= s["ftm"] <= s["fta"], f"{label}: FT makes exceed attempts for {r['player']}")
+        check(2 * (s["fgm"] - s["3pm"]) + 3 * s["3pm"] + s["ftm"] == s["pts"], f"{label}: shooting line does not add up for {r['player']}")
+        check(s["pf"] <= 6, f"{label}: more than six fouls for {r['player']}")
+
+
+def fixture_teams():
+    league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+    teams = []
+    for conference in league["conferences"].values():
+        for team in conference:
+            ranked = sorted(team["players"], key=lambda p: -p.get("overall", 0))
+            minutes = dict(zip((p["name"] for p in ranked), [36, 34, 32, 30, 28, 24, 20, 16, 12, 8]))
+            teams.append({"name": team["name"], "players": team["players"], "minutes": minutes})
+    return teams[:TEAMS_CHECKED]
+
+
+def mean_lines(builder, team, team_points, exact_total):
+    totals = {}
+    for _ in range(GAMES_PER_TEAM):
+        rows = builder(team, team["minutes"], team_points)
+        check_invariants(rows, team_points, team["name"], exact_total)
+        for r in rows:
+            if r["min"] <= 0:
+                continue
+            acc = totals.setdefault(r["player"], {k: 0 for k in STATS})
+            for k, v in line_stats(r).items():
+                acc[k] += v
+    return {name: {k: v / GAMES_PER_TEAM for k, v in acc.items()} for name, acc in totals.items()}
+
+
+def python_builder(team, mins, team_points):
+    return asyncio.run(game_sim.build_box(team, mins, team_points, None))
+
+
+def numpy_builder(team, mins, team_points):
+    return box_score_numpy.build_box_numpy(team, mins, team_points, None)
+
+
+random.seed(2027)
+box_score_numpy.seed_box_score_rng(2027)
+
+worst = {}
+with contextlib.redirect_stdout(io.StringIO()):  # shooting_model debug prints
+    for team in fixture_teams():
+        team_points = 112
+        ref = mean_lines(python_builder, team, team_points, exact_total=False)
+        vec = mean_lines(numpy_builder, team, team_points, exact_total=True)
+        check(set(ref) == set(vec), f"{team['name']}: engines produced different active players")
+        for name, ref_line in ref.items():
+            for stat in STATS:
+                a = ref_line[stat]
+                b = vec[name][stat]
+                tolerance = max(0.6, 0.15 * a)
+                gap = abs(a - b)
+                if gap > worst.get(stat, (0.0, ""))[0]:
+                    worst[stat] = (round(gap, 3), f"{team['name']} / {name}")
+                check(gap <= tolerance, f"{team['name']} / {name} {stat}: python {a:.2f} vs numpy {b:.2f}")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "gamesPerTeam": GAMES_PER_TEAM,
+    "teamsChecked": TEAMS_CHECKED,
+    "worstMeanGap": {k: v[0] for k, v in worst.items()},
+}, indent=2))
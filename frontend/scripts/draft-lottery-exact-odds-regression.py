@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Exact draft-lottery odds vs brute force and Monte Carlo.
+
+The legacy matrix is checked against a direct enumeration of every ordered
+top-four draw. The 3-2-1 matrix (all 16 teams drawn plus the relegated floor)
+is checked against the Monte Carlo validation mode. Both matrices must be
+proper distributions and repeated requests must hit the exact-odds cache.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import draft_lottery  # noqa: E402
+
+MONTE_CARLO_SIMULATIONS = 40000
+MONTE_CARLO_TOLERANCE_PCT = 1.0
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def team(index, **extra):
+    return {"teamName": f"Team {index:02d}", "wins": 10 + index, "losses": 72 - index, **extra}
+
+
+def brute_force_legacy(weights):
+    count = len(weights)
+    out = [[0.0] * count for _ in range(count)]
+    for top_four in itertools.permutations(range(count), 4):
+        chance = 1.0
+        remaining = float(sum(weights))
+        for i in top_four:
+            chance *= weights[i] / remaining
+            remaining -= weights[i]
+        order = list(top_four) + [i for i in range(count) if i not in top_four]
+        for pick_index, i in enumerate(order):
+            out[i][pick_index] += chance
+    return out
+
+
+def check_distribution(rows, max_pick, label):
+    for row in rows:
+        total = sum(row["oddsByPick"].values())
+        check(abs(total - 100.0) < 0.02, f"{label} {row['teamName']}: row sums to {total}")
+    for pick in range(1, max_pick + 1):
+        total = sum(row["oddsByPick"][str(pick)] for row in rows)
+        check(abs(total - 100.0) < 0.02, f"{label} pick {pick}: column sums to {total}")
+
+
+# Legacy: exact DP == brute-force permutation enumeration.
+weights = tuple(draft_lottery.LOTTERY_COMBINATIONS)
+exact = draft_lottery._exact_legacy_pick_probabilities(weights, tuple(range(len(weights))))
+brute = brute_force_legacy(weights)
+legacy_gap = max(abs(a - b) for ra, rb in zip(exact, brute) for a, b in zip(ra, rb))
+check(legacy_gap < 1e-12, f"legacy exact odds differ from brute force by {legacy_gap}")
+
+legacy_teams = [team(i) for i in range(14)]
+legacy_rows = draft_lottery._exact_legacy_odds(legacy_teams, list(weights))
+check_distribution(legacy_rows, 14, "legacy")
+check(legacy_rows[0]["firstPickOddsPct"] == 14.0, "legacy worst team must have 14% at #1")
+
+# 3-2-1: exact DP vs Monte Carlo with the relegated floor.
+weights_321 = [3] * 7 + [2] * 4 + [2] * 3 + [1] * 2
+teams_321 = [team(i) for i in range(16)]
+relegated = {"Team 11", "Team 12", "Team 13"}
+exact_rows = draft_lottery._exact_321_odds(teams_321, weights_321, relegated)
+check(exact_rows is not None, "3-2-1 exact odds unavailable without restriction flags")
+check_distribution(exact_rows, 16, "3-2-1")
+for row in exact_rows:
+    if row["teamName"] in relegated:
+        tail = sum(row["oddsByPick"][str(pick)] for pick in range(13, 17))
+        check(tail == 0.0, f"{row['teamName']}: relegated team can fall past 12")
+
+sampled_rows, _ = draft_lottery._simulate_321_odds(
+    teams_321, weights_321, relegated, 2027, simulations=MONTE_CARLO_SIMULATIONS
+)
+validation = draft_lottery._compare_odds_rows(exact_rows, sampled_rows)
+check(
+    validation["maxAbsDiffPct"] <= MONTE_CARLO_TOLERANCE_PCT,
+    f"3-2-1 exact vs Monte Carlo gap {validation['maxAbsDiffPct']} at {validation['maxDiffTeam']} #{validation['maxDiffPick']}",
+)
+
+# Cache hit on the same weights + relegation set.
+before = draft_lottery.get_exact_odds_cache_stats()["hits"]
+draft_lottery._exact_321_odds(teams_321, weights_321, relegated)
+check(draft_lottery.get_exact_odds_cache_stats()["hits"] == before + 1, "repeat 3-2-1 odds must hit the cache")
+
+# Restriction flags are not modelled by the DP; the request falls back to sampling.
+restricted = [team(0, cannotPickFirst=True)] + teams_321[1:]
+rows, meta = draft_lottery._resolve_odds_rows(
+    draft_lottery.ODDS_MODE_EXACT,
+    lambda: draft_lottery._exact_321_odds(restricted, weights_321, relegated),
+    lambda: draft_lottery._simulate_321_odds(restricted, weights_321, relegated, 2027, simulations=200)[0],
+)
+check(meta["oddsMode"] == draft_lottery.ODDS_MODE_MONTE_CARLO, "restricted lottery must fall back to Monte Carlo")
+check(meta.get("exactOddsUnavailable") == "pick_restrictions", "fallback reason missing")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "legacyMaxGap": legacy_gap,
+    "threeTwoOneMonteCarloGapPct": validation["maxAbsDiffPct"],
+    "monteCarloSimulations": MONTE_CARLO_SIMULATIONS,
+}, indent=2))
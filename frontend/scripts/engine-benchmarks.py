@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""Engine benchmarks on the bundled league fixtures, with a JSON baseline.
+
+Times the Python entry points the worker calls most, without a browser:
+game_sim.simulate_game (90 games) and build_box (four boxes per team),
+end-of-season progression, 30 days of free agency, the Trade Finder, the
+CPU-CPU trade generator, the draft lottery, sim-rest-of-draft, locker-room
+moods for every team and retirements (three seeds).
+
+Each benchmark prepares its inputs untimed, then times `rounds` calls
+(pytest-benchmark's pedantic mode: one setup per round, no warm caches
+carried between rounds). Every round is also expressed in units of a fixed
+reference workload timed around it, so machine-speed drift cancels out. The
+chosen statistic (min relative time by default; --absolute for seconds) is
+compared with engine-benchmarks-baseline.json, and the run fails when any
+benchmark is more than --threshold percent slower than its baseline.
+
+    python scripts/engine-benchmarks.py                     # compare
+    python scripts/engine-benchmarks.py --update            # rewrite baseline
+    python scripts/engine-benchmarks.py --only free_agency_30_days --threshold 40
+    python scripts/engine-benchmarks.py --fixture deflation_patch31
+
+A benchmark over the threshold is run again (--confirm times) and its best
+rounds kept, so a regression has to reproduce before the run fails;
+--update records the best of the same number of runs.
+The baseline keeps only the compared statistics, no machine details;
+rewrite it with --update on the machine that runs the comparison.
+Benchmarks missing from the baseline are reported as
+new and never fail.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import gc
+import inspect
+import io
+import json
+import pathlib
+import platform
+import random
+import statistics
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+BASELINE_FILE = pathlib.Path(__file__).resolve().with_name("engine-benchmarks-baseline.json")
+FIXTURES = {
+    "core_2027": ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json",
+    "deflation_patch31": ROOT.parent / "deflation fc PATCH31.json",
+}
+sys.path.insert(0, str(PYTHON_DIR))
+
+import cpu_cpu_trade_logic  # noqa: E402
+import draft_lottery  # noqa: E402
+import draft_logic  # noqa: E402
+import free_agency_logic  # noqa: E402
+import game_sim  # noqa: E402
+import league_runner  # noqa: E402
+import player_mood_logic  # noqa: E402
+import progression  # noqa: E402
+import retirement_logic  # noqa: E402
+import trade_negotiation_logic  # noqa: E402
+from trade_value_model import clear_trade_value_cache, player_overall  # noqa: E402
+
+SEED = 2027
+FIXTURE_GAMES_PER_TEAM = 20
+FREE_AGENCY_DAYS = 30
+DEFAULT_THRESHOLD_PERCENT = 25.0
+BASELINE_STATS = ("min", "median", "relativeMin", "relativeMedian")
+
+
+class Fixture:
+    """A league plus one short simulated season for the stats-reading engines."""
+
+    def __init__(self, name, path):
+        self.name = name
+        self.league = json.loads(path.read_text(encoding="utf-8"))
+        self.season_year = league_runner.get_season_year(self.league)
+        with league_runner.quiet_engines():
+            regular = league_runner.run_regular_season(self.league, SEED, FIXTURE_GAMES_PER_TEAM)
+        self.rotations = regular["teams"]
+        self.stats = regular["stats"]
+        self.standings = regular["standings"]
+        self.teams = [team for _, team in league_runner.iter_teams(self.league)]
+
+    def copy(self):
+        return copy.deepcopy(self.league)
+
+    def team_records(self):
+        return [
+            {**row, "playoffResult": "missed_playoffs" if not row["madePlayoffs"] else "first_round"}
+            for row in self.standings
+        ]
+
+
+# Each benchmark takes the fixture and returns a zero-argument callable for
+# one timed round; everything before the return is untimed setup. A round
+# that returns {"ok": False} aborts the run rather than timing a fast failure.
+# Long rounds may be generators: each yield ends a step that is normalized on
+# its own (see time_round).
+
+def bench_simulate_game(fx):
+    names = sorted(fx.rotations)
+    pairs = [(names[i], names[(i + step) % len(names)]) for step in (1, 2, 3) for i in range(len(names))]
+
+    def run():
+        for i, (home, away) in enumerate(pairs):
+            rng = game_sim.make_game_rng(game_id=f"bench-{i}", season=fx.season_year, master_seed=SEED)
+            result = game_sim._run_game_coroutine_sync(game_sim.simulate_game(fx.rotations[home], fx.rotations[away], rng))
+        return result
+    return run
+
+
+def bench_build_box(fx):
+    teams = [(team, game_sim.compute_team_ratings(team, team["minutes"])) for team in fx.rotations.values()]
+
+    def run():
+        rng = random.Random(SEED)
+        for team_points in (98, 106, 114, 122):
+            for team, ratings in teams:
+                box = game_sim._run_game_coroutine_sync(game_sim.build_box(team, team["minutes"], team_points, ratings, rng))
+        return box
+    return run
+
+
+def bench_progression(fx):
+    league = fx.copy()
+    return lambda: progression.apply_end_of_season_progression_with_deltas(
+        league=league, stats_by_key=fx.stats, settings=None, seed=SEED, season_year=fx.season_year,
+    )
+
+
+def bench_free_agency_30_days(fx):
+    started = free_agency_logic.initialize_free_agency_period(fx.copy(), None, FREE_AGENCY_DAYS)["leagueData"]
+
+    def run():
+        league = started
+        for _ in range(FREE_AGENCY_DAYS):
+            if not (league.get("freeAgencyState") or {}).get("isActive"):
+                break
+            result = free_agency_logic.advance_free_agency_day(league, None)
+            league = result["leagueData"]
+            yield result
+    return run
+
+
+def bench_find_trade_offers(fx):
+    clear_trade_value_cache()
+    team = fx.teams[0]
+    star = max(team["players"], key=player_overall)
+    search = {
+        "selectedTeamName": team["name"],
+        "selectedItems": [{"type": "player", "player": star}],
+        "teams": fx.teams,
+        "draftPicks": fx.league.get("draftPicks") or [],
+        "maxOffers": 30,
+    }
+    return lambda: trade_negotiation_logic.find_trade_offers(search)
+
+
+def bench_find_cpu_cpu_trade_candidates(fx):
+    payload = {
+        "leagueData": fx.league,
+        "context": {
+            "currentDate": f"{fx.season_year + 1}-01-25",
+            "tradeDeadlineDate": f"{fx.season_year + 1}-02-08",
+            "userTeamName": fx.teams[0]["name"],
+            "maxCandidates": 84,
+            "inventoryPressure": 1.25,
+            "foregroundRecommended": True,
+            "bankGenerationMode": True,
+            "bankSeed": "engine-benchmarks",
+            "recordsByTeam": {row["teamName"]: {"wins": row["wins"], "losses": row["losses"]} for row in fx.standings},
+        },
+    }
+    return lambda: cpu_cpu_trade_logic.find_cpu_cpu_trade_candidates(payload)
+
+
+def bench_run_draft_lottery(fx):
+    payload = {"seasonYear": fx.season_year, "teamRecords": fx.team_records(), "seed": f"{SEED}_bench"}
+    return lambda: draft_lottery.run_draft_lottery(fx.league, payload)
+
+
+def bench_sim_rest_of_draft(fx):
+    lottery = draft_lottery.run_draft_lottery(fx.league, {
+        "seasonYear": fx.season_year, "teamRecords": fx.team_records(), "seed": f"{SEED}_bench",
+    })
+    init = draft_logic.initialize_draft(fx.copy(), {
+        "seasonYear": fx.season_year, "userTeamName": None,
+        "draftOrder": lottery.get("fullDraftOrder") or [], "classSeed": SEED,
+    })
+    league, state = init["leagueData"], init["draftState"]
+    return lambda: draft_logic.sim_rest_of_draft(league, {
+        "seasonYear": fx.season_year, "userTeamName": None, "draftState": state,
+    })
+
+
+def bench_get_locker_room_moods(fx):
+    names = [team["name"] for team in fx.teams]
+
+    def run():
+        for name in names:
+            result = player_mood_logic.get_locker_room_moods(fx.league, name)
+        return result
+    return run
+
+
+def bench_apply_player_retirements(fx):
+    def run():
+        for seed in (SEED, SEED + 1, SEED + 2):
+            result = retirement_logic.apply_player_retirements(
+                fx.league, stats_by_key=fx.stats, seed=seed, season_year=fx.season_year,
+            )
+        return result
+    return run
+
+
+# name: (benchmark, rounds)
+BENCHMARKS = {
+    "simulate_game": (bench_simulate_game, 10),
+    "build_box": (bench_build_box, 10),
+    "progression": (bench_progression, 3),
+    "free_agency_30_days": (bench_free_agency_30_days, 1),
+    "find_trade_offers": (bench_find_trade_offers, 5),
+    "find_cpu_cpu_trade_candidates": (bench_find_cpu_cpu_trade_candidates, 5),
+    "run_draft_lottery": (bench_run_draft_lottery, 10),
+    "sim_rest_of_draft": (bench_sim_rest_of_draft, 3),
+    "get_locker_room_moods": (bench_get_locker_room_moods, 5),
+    "apply_player_retirements": (bench_apply_player_retirements, 5),
+}
+
+
+def _reference_workload():
+    rng = random.Random(0)
+    rows = [{"id": str(i), "value": rng.random()} for i in range(20000)]
+    rows.sort(key=lambda row: row["value"])
+    total = sum(row["value"] * len(row["id"]) for row in rows)
+    return total + len(json.dumps(rows[:2000]))
+
+
+def reference_seconds():
+    """Best of five runs of a fixed pure-Python workload.
+
+    Shared and throttled machines drift by 2x over a run; dividing each round
+    by this unit, timed right around it, keeps the comparison meaningful.
+    """
+    best = None
+    for _ in range(5):
+        started = time.perf_counter()
+        _reference_workload()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_round(call):
+    """One timed round: (seconds, reference units, last result).
+
+    The cyclic garbage collector is off while a step runs (as with
+    pytest-benchmark's --benchmark-disable-gc); its pauses land on whichever
+    call happens to cross the threshold.
+    """
+    steps = call() if inspect.isgeneratorfunction(call) else None
+    seconds = relative = 0.0
+    result = None
+    while True:
+        unit = reference_seconds()
+        gc.collect()
+        gc.disable()
+        started = time.perf_counter()
+        try:
+            result = next(steps) if steps is not None else call()
+        except StopIteration:
+            break
+        finally:
+            elapsed = time.perf_counter() - started
+            gc.enable()
+        seconds += elapsed
+        relative += elapsed / ((unit + reference_seconds()) / 2)
+        if steps is None:
+            break
+    return seconds, relative, result
+
+
+def run_benchmark(fx, name):
+    bench, rounds = BENCHMARKS[name]
+    times, relative = [], []
+    for _ in range(rounds):
+        with contextlib.redirect_stdout(io.StringIO()):
+            elapsed, units, result = time_round(bench(fx))
+        if isinstance(result, dict) and result.get("ok") is False:
+            raise SystemExit(f"{fx.name}/{name} failed: {result.get('reason') or result.get('message')}")
+        times.append(elapsed)
+        relative.append(units)
+    return {
+        "rounds": rounds,
+        "min": round(min(times), 4),
+        "median": round(statistics.median(times), 4),
+        "max": round(max(times), 4),
+        "relativeMin": round(min(relative), 2),
+        "relativeMedian": round(statistics.median(relative), 2),
+    }
+
+
+def merge_runs(first, second):
+    """Two runs of one benchmark as one: best of each statistic."""
+    merged = {key: min(first[key], second[key]) for key in first if key not in ("rounds", "max")}
+    merged["rounds"] = first["rounds"] + second["rounds"]
+    merged["max"] = max(first["max"], second["max"])
+    return merged
+
+
+def machine():
+    return {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.machine()}
+
+
+def baseline_entry(result):
+    """The part of a result the comparison reads; rounds and max stay in the run output."""
+    return {key: result[key] for key in BASELINE_STATS}
+
+
+def compare(results, baseline, stat, threshold):
+    """stat is a key of the run_benchmark results; returns (rows, regressed keys)."""
+    rows, failed = [], []
+    for key, result in results.items():
+        base = (baseline.get("benchmarks") or {}).get(key)
+        if base is None:
+            rows.append({"benchmark": key, stat: result[stat], "status": "new"})
+            continue
+        change = (result[stat] - base[stat]) / max(base[stat], 1e-9) * 100.0
+        status = "regressed" if change > threshold else "ok"
+        rows.append({"benchmark": key, stat: result[stat], "baseline": base[stat], "changePercent": round(change, 1), "status": status})
+        if status == "regressed":
+            failed.append(key)
+    return rows, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture", action="append", choices=sorted(FIXTURES), help="league fixture (repeatable; default core_2027)")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="run only these benchmarks (repeatable)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PERCENT, help="allowed slowdown in percent (default 25)")
+    parser.add_argument("--stat", choices=("min", "median"), default="min", help="statistic compared with the baseline")
+    parser.add_argument("--absolute", action="store_true", help="compare seconds instead of reference-workload units")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_FILE)
+    parser.add_argument("--confirm", type=int, default=1, help="re-runs of a regressed benchmark before it fails (default 1)")
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results, fixtures = {}, {}
+    for fixture_name in args.fixture or ["core_2027"]:
+        fixtures[fixture_name] = fx = Fixture(fixture_name, FIXTURES[fixture_name])
+        for name in args.only or BENCHMARKS:
+            results[f"{fixture_name}/{name}"] = run_benchmark(fx, name)
+            print(f"{fixture_name}/{name}: {results[f'{fixture_name}/{name}']}", file=sys.stderr)
+
+    if args.update:
+        # Same sample size as a confirmed comparison.
+        for _ in range(max(0, args.confirm)):
+            for key in results:
+                fixture_name, name = key.split("/", 1)
+                results[key] = merge_runs(results[key], run_benchmark(fixtures[fixture_name], name))
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+        benchmarks = {**(baseline.get("benchmarks") or {}), **results}
+        baseline = {"benchmarks": {key: baseline_entry(value) for key, value in sorted(benchmarks.items())}}
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(json.dumps({"status": "UPDATED", "baseline": str(args.baseline), "benchmarks": results}, indent=2))
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    stat = args.stat if args.absolute else "relative" + args.stat.capitalize()
+    rows, failed = compare(results, baseline, stat, args.threshold)
+    for _ in range(max(0, args.confirm)):
+        if not failed:
+            break
+        for key in failed:
+            fixture_name, name = key.split("/", 1)
+            results[key] = merge_runs(results[key], run_benchmark(fixtures[fixture_name], name))
+            print(f"{key} (confirm): {results[key]}", file=sys.stderr)
+        rows, failed = compare(results, baseline, stat, args.threshold)
+    report = {
+        "status": "FAIL" if failed else "PASS",
+        "stat": stat,
+        "thresholdPercent": args.threshold,
+        "machine": machine(),
+        "results": rows,
+    }
+    if failed:
+        report["regressed"] = failed
+    print(json.dumps(report, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Incremental CPU offer board must match a cold rebuild every day.
+
+Runs the same free-agency days twice from the fixture league: once with the
+board cache warm across days (the worker's normal path) and once with the
+board reset before every day. The saved league after each day must be
+identical, and the warm run must actually reuse pair scores.
+
+A team's board entry must also rebuild when its own season-history rows change
+(same number of seasons), and a board built for one league must not be
+reused for another.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import free_agency_logic as fa  # noqa: E402
+
+DAYS = 4
+USER_TEAM = "Boston Celtics"
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def request(action, league, payload=None):
+    result = fa.handle_request({"action": action, "leagueData": league, "payload": payload or {}})
+    return result, result.get("leagueData") or league
+
+
+def opening_league():
+    league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+    _, league = request("preview_offseason_contracts", league)
+    _, league = request("apply_offseason_contract_decisions", league, {"decisions": []})
+    _, league = request("initialize_free_agency_period", league, {"userTeamName": USER_TEAM})
+    return league
+
+
+def run_days(reset_each_day):
+    fa.reset_cpu_offer_board()
+    league = opening_league()
+    snapshots = []
+    reused = 0
+    for _ in range(DAYS):
+        if reset_each_day:
+            fa.reset_cpu_offer_board()
+        result, league = request("advance_free_agency_day", league, {"userTeamName": USER_TEAM})
+        check(result.get("ok"), f"advance_free_agency_day failed: {result.get('reason')}")
+        board = result["performanceDiagnostics"]["python"].get("cpuOfferBoard") or {}
+        reused += int(board.get("pairsReused", 0))
+        snapshots.append(json.dumps(league, sort_keys=True, default=str))
+    return snapshots, reused
+
+
+warm, warm_reused = run_days(reset_each_day=False)
+cold, cold_reused = run_days(reset_each_day=True)
+
+for day, (a, b) in enumerate(zip(warm, cold), start=1):
+    check(a == b, f"day {day}: incremental board diverged from a cold rebuild")
+check(warm_reused > cold_reused, "warm board never reused a (team, player) score")
+
+# Team signatures follow the content of the team's own history rows.
+league = json.loads(cold[-1])
+team = next(fa.iter_teams(league))[2]
+other_team = fa.get_team_name_from_team(list(fa.iter_teams(league))[1][2])
+league["seasonHistory"] = [{"seasonYear": 2026, "teams": [
+    {"teamName": team["name"], "wins": 55, "losses": 27, "playoffResult": "finals"},
+    {"teamName": other_team, "wins": 30, "losses": 52},
+]}]
+signature = fa._cpu_board_team_signature(team, league)
+league["seasonHistory"][0]["teams"][1]["wins"] = 31
+check(fa._cpu_board_team_signature(team, league) == signature, "another team's history changed this team's signature")
+league["seasonHistory"][0]["teams"][0]["playoffResult"] = "first_round"
+check(fa._cpu_board_team_signature(team, league) != signature, "a rewritten history row kept the team signature")
+
+# The board left by the last cold day is reused for the same league only.
+fa.generate_cpu_offers_for_day(json.loads(cold[-1]), USER_TEAM)
+check(fa.get_cpu_offer_board_stats()["pairsReused"] > 0, "the same league did not reuse the board")
+other_league = json.loads(cold[-1])
+other_league["__leagueStorageId"] = "another-save"
+fa.generate_cpu_offers_for_day(other_league, USER_TEAM)
+board = fa.get_cpu_offer_board_stats()
+check(board["pairsReused"] == 0 and board["dirtyTeams"] == board["teams"], "a board built for one league was reused for another")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "days": DAYS,
+    "warmPairsReused": warm_reused,
+    "coldPairsReused": cold_reused,
+}, indent=2))
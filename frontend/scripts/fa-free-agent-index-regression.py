@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""FreeAgentIndex / OfferBook must answer exactly like the linear scans.
+
+Runs free-agency days and the pre-sim roster repair with and without the
+request-scoped index and compares the saved league, then drives the index
+directly through signings, releases and out-of-band list edits and checks
+every lookup against the linear find_free_agent_index / offer helpers.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import random
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import free_agency_logic as fa  # noqa: E402
+import free_agent_index  # noqa: E402
+
+USER_TEAM = "Boston Celtics"
+DAYS = 3
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def request(action, league, payload=None, indexed=True):
+    req = {"action": action, "leagueData": league, "payload": payload or {}}
+    if indexed:
+        result = fa.handle_request(req)
+    else:
+        # Skip only the index scope; the request economy stays bound.
+        with fa.financial_rules_scope():
+            result = fa._dispatch_request(req)
+    return result, result.get("leagueData") or league
+
+
+def linear_find(free_agents, player_id, player_name):
+    for idx, player in enumerate(free_agents):
+        if player_id and player.get("id") == player_id:
+            return idx
+        if player_name and player.get("name") == player_name:
+            return idx
+    return -1
+
+
+def linear_offer_stats(state, team_name):
+    count = total = 0
+    for offers in state.get("offersByPlayer", {}).values():
+        for offer in offers:
+            if offer.get("status", "active") == "active" and offer.get("teamName") == team_name:
+                count += 1
+                total += int(fa.num(offer.get("currentYearSalary"), 0))
+    return count, total
+
+
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+_, league = request("preview_offseason_contracts", league)
+_, league = request("apply_offseason_contract_decisions", league, {"decisions": []})
+_, league = request("initialize_free_agency_period", league, {"userTeamName": USER_TEAM})
+
+# 1. Whole-day parity: indexed request vs the original linear paths. Later
+# days put CPU teams at the roster limit (overfill candidates come from a
+# market-OVR range query); the repair runs the pre-sim high-value sweep.
+def same(a, b):
+    return json.dumps(a, sort_keys=True, default=str) == json.dumps(b, sort_keys=True, default=str)
+
+
+roster_limit = fa.get_roster_limit(league)
+full_teams = 0
+for day in range(1, DAYS + 1):
+    fa.reset_cpu_offer_board()
+    _, indexed = request("advance_free_agency_day", json.loads(json.dumps(league)), {"userTeamName": USER_TEAM})
+    fa.reset_cpu_offer_board()
+    _, linear = request("advance_free_agency_day", json.loads(json.dumps(league)), {"userTeamName": USER_TEAM}, indexed=False)
+    check(same(indexed, linear), f"day {day}: indexed free-agency day diverged from the linear scans")
+    full_teams = max(full_teams, sum(
+        1 for _, _, team in fa.iter_teams(indexed) if len(fa.get_team_players(team)) >= roster_limit
+    ))
+    league = indexed
+check(full_teams > 0, "no CPU team reached the roster limit; the overfill path was not exercised")
+
+repair = {"userTeamName": USER_TEAM, "minPlayers": 14, "currentDay": DAYS + 1}
+_, indexed_repair = request("repair_cpu_teams_to_min_roster", json.loads(json.dumps(league)), repair)
+_, linear_repair = request("repair_cpu_teams_to_min_roster", json.loads(json.dumps(league)), repair, indexed=False)
+check(same(indexed_repair, linear_repair), "indexed roster repair diverged from the linear scans")
+
+# 2. Lookups stay exact through pops, appends and out-of-band edits.
+rng = random.Random(2027)
+pool = json.loads(json.dumps(indexed.get("freeAgents") or []))
+check(len(pool) > 20, "fixture needs a free-agent pool")
+state = indexed.get("freeAgencyState") or {}
+teams = sorted({o.get("teamName") for offers in state.get("offersByPlayer", {}).values() for o in offers if o.get("teamName")})
+
+with free_agent_index.free_agent_index_scope():
+    index = fa.get_free_agent_index(pool)
+    check(index is fa.get_free_agent_index(pool), "one index per list per request")
+    released = []
+    for step in range(120):
+        probe = rng.choice(pool)
+        pid = probe.get("id") if rng.random() < 0.7 else None
+        pname = probe.get("name") if pid is None or rng.random() < 0.3 else None
+        check(
+            fa.find_free_agent_index(pool, pid, pname) == linear_find(pool, pid, pname),
+            f"step {step}: index position mismatch for {pid}/{pname}",
+        )
+        check(fa.find_free_agent_index(pool, "missing-id", "Missing Name") == -1, "unknown player must miss")
+        action = rng.random()
+        if action < 0.4:
+            released.append(fa.pop_free_agent(pool, rng.randrange(len(pool))))
+        elif action < 0.7 and released:
+            fa.append_free_agent(pool, released.pop())
+        elif action < 0.8:
+            # Out-of-band edit the index was not told about.
+            i, j = rng.randrange(len(pool)), rng.randrange(len(pool))
+            pool[i], pool[j] = pool[j], pool[i]
+        elif released:
+            back = released.pop()
+            fa.remove_existing_free_agent_match(pool, back.get("id"), back.get("name"))
+            check(linear_find(pool, back.get("id"), back.get("name")) == -1, "remove_existing_free_agent_match left a match")
+
+    for player in pool:
+        key = fa.get_player_key_from_player(player)
+        check(index.contains(key), f"{key} missing from key index")
+
+    ovr_band = index.by_market_ovr(70, None)
+    check(
+        ovr_band == [p for p in pool if fa.get_fa_market_equivalent_ovr(p) >= 70],
+        "market OVR bucket disagrees with a direct filter",
+    )
+    cheap = index.by_asking_salary(None, fa.MIN_DEAL)
+    check(
+        cheap == [p for p in pool if int(fa.num((p.get("marketValue") or {}).get("expectedAAV"), fa.MIN_DEAL)) <= fa.MIN_DEAL],
+        "asking salary bucket disagrees with a direct filter",
+    )
+    guards = index.by_position("PG")
+    check(guards == [p for p in pool if fa.get_player_position_bucket(p) == "PG"], "position bucket disagrees")
+
+    for team_name in teams:
+        expected = linear_offer_stats(state, team_name)
+        got = (
+            fa.get_active_offer_count_for_team(state, team_name),
+            fa.get_outstanding_offer_year1_total(state, team_name),
+        )
+        check(got == expected, f"{team_name}: offer book {got} != linear {expected}")
+
+    for player_key, offers in state.get("offersByPlayer", {}).items():
+        active = [o for o in offers if o.get("status", "active") == "active"]
+        check(fa.get_active_offers_for_player(state, player_key) == active, f"{player_key}: active offers differ")
+        for team_name in teams[:8] + [o.get("teamName") for o in active]:
+            expected = next((o for o in active if o.get("teamName") == team_name), None)
+            check(
+                fa.find_existing_offer_for_team_player(state, player_key, team_name) is expected,
+                f"{player_key}/{team_name}: offer book found another offer",
+            )
+
+check(fa.get_free_agent_index(pool) is None, "index must not outlive its request scope")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "poolSize": len(pool),
+    "indexRebuilds": index.rebuilds,
+    "indexHits": index.hits,
+    "indexFallbacks": index.fallbacks,
+}, indent=2))
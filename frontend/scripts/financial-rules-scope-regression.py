@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Request-scoped financial rules (league_financials.financial_rules_scope).
+
+1. get_financial_rules is memoized inside a scope and rebuilt outside one.
+   The cache key covers the financials block, the season context, the legacy
+   alias keys and the season year, so a changed economy misses the cache.
+2. Nested scopes share the cache; a binding ends with its scope.
+3. sync_financial_constants binds the request economy instead of rewriting
+   free_agency_logic's module constants, so an inflated league no longer
+   leaks into later requests on another league.
+4. Free agency, contract extension, roster, draft and mood requests give the
+   same results with the memo as with it disabled, and hit the cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import contract_extension_logic  # noqa: E402
+import draft_logic  # noqa: E402
+import draft_lottery  # noqa: E402
+import free_agency_logic as fa  # noqa: E402
+import league_financials as lf  # noqa: E402
+import player_mood_logic  # noqa: E402
+import team_roster_logic  # noqa: E402
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+league = lf.ensure_league_financials(json.loads(LEAGUE_FILE.read_text(encoding="utf-8")))
+inflated = lf.apply_league_inflation_for_offseason(league, lf.get_league_season_year(league) + 4)
+team_names = [team["name"] for conference in league["conferences"].values() for team in conference]
+
+# 1. Memoized in a scope, rebuilt outside one; every input is part of the key.
+outside = lf.get_financial_rules(league)
+check(outside is not lf.get_financial_rules(league), "rules memoized outside a scope")
+with lf.financial_rules_scope() as scope:
+    first = lf.get_financial_rules(league)
+    check(first == outside and lf.get_financial_rules(league) is first, "scope did not memoize the rules")
+    check(lf.get_financial_rules(league, 2031) == lf._build_financial_rules(league, 2031), "season year not in the key")
+    check(scope["stats"] == {"hits": 1, "misses": 2}, f"scope stats {scope['stats']}")
+
+    mutated = copy.deepcopy(league)
+    mutated["financials"]["annualInflationRate"] = 0.10
+    mutated["financials"]["currentSeasonYear"] += 2
+    mutated["currentFinancialSeasonYear"] = mutated["financials"]["currentSeasonYear"]
+    check(lf.get_financial_rules(mutated) == lf._build_financial_rules(mutated) != first, "financials change hit a stale entry")
+    mutated["financials"]["baseRules"]["maxSalary"] += 1_000_000
+    check(lf.get_financial_rules(mutated)["maxSalary"] == lf._build_financial_rules(mutated)["maxSalary"], "baseRules change hit a stale entry")
+    legacy = {"seasonYear": 2026, "salaryCap": 150_000_000}
+    check(lf.get_financial_rules(legacy)["salaryCap"] == 150_000_000, "legacy alias key not in the key")
+    legacy["salaryCap"] = 160_000_000
+    check(lf.get_financial_rules(legacy)["salaryCap"] == 160_000_000, "legacy alias change hit a stale entry")
+
+# 2. Nesting and binding.
+check(lf.bound_financial_rules() is None, "binding outside a scope")
+with lf.financial_rules_scope(inflated) as outer:
+    bound = lf.bound_financial_rules()
+    check(bound == lf.get_financial_rules(inflated), "scope did not bind its league")
+    with lf.financial_rules_scope(league) as inner:
+        check(inner["cache"] is outer["cache"], "nested scope did not share the cache")
+        check(lf.bound_financial_rules()["salaryCap"] == outside["salaryCap"], "nested binding")
+    check(lf.bound_financial_rules() is bound, "nested binding outlived its scope")
+check(lf.bound_financial_rules() is None, "binding outlived its scope")
+
+# 3. No module state left behind by an inflated league.
+constants = {name: getattr(fa, name) for name in ("MIN_DEAL", "MAX_SALARY", "DEFAULT_SALARY_CAP", "DEFAULT_FIRST_APRON")}
+player = next(p for p in league["conferences"]["East"][0]["players"] if p.get("overall"))
+market_before = quiet(fa.estimate_market_value, player, league)
+with lf.financial_rules_scope():
+    fa.sync_financial_constants(copy.deepcopy(inflated))
+    rules = lf.bound_financial_rules()
+    check(fa.current_min_deal() == rules["minimumSalary"] > constants["MIN_DEAL"], "bound minimum salary")
+    check(fa.current_max_salary() == rules["maxSalary"] > constants["MAX_SALARY"], "bound max salary")
+quiet(fa.handle_request, {"action": "get_team_cap_snapshot", "leagueData": copy.deepcopy(inflated), "payload": {"teamName": team_names[0]}})
+check({name: getattr(fa, name) for name in constants} == constants, "sync_financial_constants rewrote module constants")
+check(fa.current_min_deal() == constants["MIN_DEAL"], "request economy leaked past the request")
+check(quiet(fa.estimate_market_value, player, league) == market_before, "inflated league leaked into a later market value")
+
+
+# 4. Engine results with the memo match the uncached rules.
+def draft_requests(source):
+    records = [{"teamName": name, "wins": 20 + i, "losses": 62 - i, "madePlayoffs": False} for i, name in enumerate(team_names)]
+    lottery = draft_lottery.run_draft_lottery(source, {"seasonYear": 2027, "teamRecords": records, "seed": "fin_scope"})
+    init = draft_logic.handle_request({"action": "initialize_draft", "leagueData": copy.deepcopy(source), "payload": {
+        "seasonYear": 2027, "userTeamName": None, "draftOrder": lottery.get("fullDraftOrder") or [], "classSeed": 2027,
+    }})
+    done = draft_logic.handle_request({"action": "sim_rest_of_draft", "leagueData": init["leagueData"], "payload": {
+        "seasonYear": 2027, "userTeamName": None, "draftState": init["draftState"],
+    }})
+    rookies = team_roster_logic.handle_request({"action": "preview_rookie_signings", "leagueData": done["leagueData"], "payload": {
+        "seasonYear": 2027, "userTeamName": None,
+    }})
+    return [init, done, rookies]
+
+
+def engine_results(source):
+    started = fa.handle_request({"action": "initialize_free_agency_period", "leagueData": copy.deepcopy(source), "payload": {"userTeamName": None}})
+    day = fa.handle_request({"action": "advance_free_agency_day", "leagueData": started["leagueData"], "payload": {"userTeamName": None}})
+    extensions = contract_extension_logic.handle_request({"action": "preview_contract_extensions", "leagueData": copy.deepcopy(source), "payload": {"userTeamName": team_names[0]}})
+    cpu_extensions = contract_extension_logic.handle_request({"action": "process_cpu_contract_extensions", "leagueData": copy.deepcopy(source), "payload": {"userTeamName": team_names[0]}})
+    finalization = team_roster_logic.handle_request({"action": "preview_roster_finalization", "leagueData": copy.deepcopy(source), "payload": {"userTeamName": team_names[0]}})
+    moods = player_mood_logic.handle_request({"action": "get_locker_room_moods", "leagueData": source, "payload": {"teamName": team_names[0]}})
+    return [started, day, extensions, cpu_extensions, finalization, moods, *draft_requests(source)]
+
+
+def comparable(value):
+    """Results without wall-clock timing diagnostics."""
+    if isinstance(value, dict):
+        return {key: comparable(item) for key, item in value.items() if key != "performanceDiagnostics"}
+    if isinstance(value, list):
+        return [comparable(item) for item in value]
+    return value
+
+
+for source in (league, inflated):
+    fa.reset_cpu_offer_board()
+    with lf.financial_rules_scope() as scope:
+        memoized = quiet(engine_results, source)
+    check(all(result.get("ok", True) is not False for result in memoized), "an engine request failed")
+    check(scope["stats"]["hits"] > 50 * scope["stats"]["misses"], f"cache barely used: {scope['stats']}")
+
+    fa.reset_cpu_offer_board()
+    build_key = lf._rules_cache_key
+    lf._rules_cache_key = lambda league_data, season_year: None
+    try:
+        uncached = quiet(engine_results, source)
+    finally:
+        lf._rules_cache_key = build_key
+    check(comparable(memoized) == comparable(uncached), "memoized financial rules changed engine results")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "lastScope": scope["stats"],
+    "inflatedSalaryCap": lf.get_financial_rules(inflated)["salaryCap"],
+}, indent=2))
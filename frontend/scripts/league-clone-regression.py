@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""League clones sharing cold subtrees (public/python/league_clone.py).
+
+1. clone_league_sharing_cold() shares the cold subtrees (league logs, player history)
+   with the source and deep-copies everything else.
+2. Mutating a clone's hot keys (teams, rosters, contracts, free agents,
+   free-agency state) never touches the source league.
+3. own_child() gives a writer a private copy of a shared subtree, so an
+   appended history row lands on the clone only.
+4. Engine requests that clone through league_clone (extensions,
+   roster finalization, retirements, the draft, free agency) leave the
+   source league, and every cold subtree they share with it, unchanged.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import json
+import pathlib
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import draft_lottery  # noqa: E402
+import league_clone as lt  # noqa: E402
+from module_registry import handle_engine_request  # noqa: E402
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def snapshot(value):
+    return json.dumps(value, sort_keys=True)
+
+
+def cold_subtrees(league):
+    out = [league[key] for key in lt.COLD_LEAGUE_KEYS if isinstance(league.get(key), (dict, list))]
+    for player in lt.iter_league_players(league):
+        out.extend(player[key] for key in lt.COLD_PLAYER_KEYS if isinstance(player.get(key), (dict, list)))
+    return out
+
+
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+league["tradeHistory"] = [{"id": "t1", "teams": ["A", "B"], "season": 2026}]
+league["seasonHistory"] = [{"seasonYear": 2026, "champion": "A"}]
+source = snapshot(league)
+cold = cold_subtrees(league)
+cold_before = [snapshot(value) for value in cold]
+check(len(cold) > 400, f"fixture has only {len(cold)} cold subtrees")
+
+# 1. Sharing.
+check(len(lt.cold_subtree_memo(league)) == len(cold), "cold_subtree_memo missed a cold subtree")
+started = time.perf_counter()
+clone = lt.clone_league_sharing_cold(league)
+clone_ms = (time.perf_counter() - started) * 1000.0
+check(all(a is b for a, b in zip(cold_subtrees(clone), cold)), "cold subtree was copied")
+team, clone_team = league["conferences"]["East"][0], clone["conferences"]["East"][0]
+check(clone_team is not team and clone_team["players"][0] is not team["players"][0], "hot roster was shared")
+check(clone_team["players"][0]["contract"] is not team["players"][0]["contract"], "contract was shared")
+
+# 2. Hot writes stay on the clone.
+clone_team["name"] = "Renamed"
+clone_team["players"][0]["contract"]["salaryByYear"] = [1]
+clone_team["players"][0]["overall"] = 1
+clone_team["players"].append(clone["freeAgents"].pop(0))
+clone["conferences"]["West"].pop()
+clone.setdefault("freeAgencyState", {})["currentDay"] = 99
+check(snapshot(league) == source, "a hot write on the clone reached the source")
+
+# 3. own_child.
+player = clone_team["players"][1]
+history = lt.own_child(player, "history")
+history["transactions"] = [*history.get("transactions", []), {"id": "cow-row"}]
+check(player["history"] is not team["players"][1]["history"], "own_child did not swap in a private copy")
+check(player["history"]["seasons"] is team["players"][1]["history"]["seasons"], "own_child deep-copied untouched sections")
+check(snapshot(league) == source, "own_child write reached the source")
+check(lt.own_child({}, "history") == {}, "own_child on a missing key")
+
+
+# 4. Real engine requests.
+def request(module, action, league_data, payload=None):
+    result = quiet(handle_engine_request, module, {"action": action, "leagueData": league_data, "payload": payload or {}})
+    check(isinstance(result, dict) and result.get("ok") is not False, f"{module}.{action} failed: {result.get('reason') if isinstance(result, dict) else result}")
+    return result
+
+
+user_team = league["conferences"]["East"][0]["name"]
+request("contract_extension_logic", "process_cpu_contract_extensions", league, {"userTeamName": user_team})
+request("team_roster_logic", "apply_roster_finalization", league, {"userTeamName": None})
+request("retirement_logic", "run_player_retirements", league, {"seasonYear": 2026, "seed": 2026})
+team_names = [team["name"] for teams in league["conferences"].values() for team in teams]
+records = [{"teamName": name, "wins": 20 + i, "losses": 62 - i, "madePlayoffs": False} for i, name in enumerate(team_names)]
+lottery = quiet(draft_lottery.run_draft_lottery, league, {"seasonYear": 2027, "teamRecords": records, "seed": "cow"})
+request("draft_logic", "initialize_draft", league, {
+    "seasonYear": 2027, "userTeamName": None, "classSeed": 2027, "draftOrder": lottery.get("fullDraftOrder") or [],
+})
+started = request("free_agency_logic", "initialize_free_agency_period", copy.deepcopy(league), {"userTeamName": None})
+fa_league = started["leagueData"]
+fa_source = snapshot(fa_league)
+fa_cold = [snapshot(value) for value in cold_subtrees(fa_league)]
+request("free_agency_logic", "advance_free_agency_day", fa_league, {"userTeamName": None})
+check(snapshot(fa_league) == fa_source, "advance_free_agency_day changed its source league")
+check([snapshot(value) for value in cold_subtrees(fa_league)] == fa_cold, "free agency wrote a shared cold subtree")
+
+check(snapshot(league) == source, "an engine request changed its source league")
+check([snapshot(value) for value in cold] == cold_before, "an engine request wrote a shared cold subtree")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "sharedSubtrees": len(cold),
+    "cloneMs": round(clone_ms, 1),
+}, indent=2))
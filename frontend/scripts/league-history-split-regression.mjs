@@ -0,0 +1,132 @@
+// Hot/cold league split (src/utils/leagueHistorySplit.js) must be lossless.
+//
+// 1. splitLeagueHistory() leaves no history on hot players (or only the
+//    requested sections) and never mutates the source league.
+// 2. restoreLeagueHistoryInResult() on an unchanged hot league gives back the
+//    original histories; appended transaction rows are merged (upsert by id)
+//    and rows in sections that were sent are ignored.
+// 3. Retired-player records and roster-repair patches get their history back.
+// 4. applyLeagueSessionDelta() keeps history on upserted / moved players and
+//    applies delta.historyAppends.
+// Also reports payload sizes for the fixture league.
+import assert from "node:assert/strict";
+import fs from "node:fs";
+import path from "node:path";
+import { fileURLToPath, pathToFileURL } from "node:url";
+
+const here = path.dirname(fileURLToPath(import.meta.url));
+const root = path.resolve(here, "..");
+const load = (relativePath) => import(pathToFileURL(path.join(root, relativePath)).href);
+
+const {
+  HISTORY_SECTIONS_BY_REQUEST,
+  restoreLeagueHistoryInResult,
+  splitLeagueHistory,
+  stripTeamHistory,
+} = await load("src/utils/leagueHistorySplit.js");
+const { applyLeagueSessionDelta, leagueSessionPlayerKey } = await load("src/utils/leagueSessionDelta.js");
+
+const league = JSON.parse(fs.readFileSync(path.join(root, "..", "2027_roster_FINAL_core_awards_DIVISIONS.json"), "utf8"));
+const snapshot = JSON.stringify(league);
+let checks = 0;
+const check = (fn) => {
+  fn();
+  checks += 1;
+};
+
+const allPlayers = (leagueData) => [
+  ...Object.values(leagueData.conferences || {}).flatMap((teams) => teams.flatMap((team) => team.players || [])),
+  ...(leagueData.freeAgents || []),
+];
+const historyByKey = (leagueData) => new Map(allPlayers(leagueData).map((p) => [leagueSessionPlayerKey(p), p.history]));
+const roundTrip = (value) => JSON.parse(JSON.stringify(value));
+
+// 1. Split.
+const split = splitLeagueHistory(league);
+check(() => assert.ok(allPlayers(split.hot).every((p) => !("history" in p) && !("careerHistory" in p))));
+check(() => assert.equal(split.cold.size, allPlayers(league).length));
+check(() => assert.equal(JSON.stringify(league), snapshot, "split mutated the source league"));
+check(() => assert.equal(split.hot.draftPicks, league.draftPicks, "untouched state is not shared"));
+const moodSections = HISTORY_SECTIONS_BY_REQUEST["get-locker-room-moods"];
+const moodSplit = splitLeagueHistory(league, moodSections);
+for (const player of allPlayers(moodSplit.hot)) {
+  check(() => assert.ok(Object.keys(player.history || {}).every((section) => moodSections.includes(section))));
+}
+const team = league.conferences.East[0];
+check(() => assert.ok(stripTeamHistory(team).players.every((p) => !("history" in p))));
+check(() => assert.ok(team.players.every((p) => "history" in p)));
+
+// 2. Restore.
+const expected = historyByKey(league);
+const restored = restoreLeagueHistoryInResult({ ok: true, leagueData: roundTrip(split.hot) }, split).leagueData;
+for (const [key, history] of historyByKey(restored)) {
+  check(() => assert.equal(history, expected.get(key), `${key}: history not restored by identity`));
+}
+
+const target = allPlayers(league).find((p) => (p.history?.transactions || []).length > 0);
+const targetKey = leagueSessionPlayerKey(target);
+const written = roundTrip(moodSplit.hot);
+const writtenPlayer = allPlayers(written).find((p) => leagueSessionPlayerKey(p) === targetKey);
+const row = { id: "ext-1", seasonYear: 2027, type: "extension", label: "Signed extension" };
+writtenPlayer.history = {
+  ...writtenPlayer.history,
+  seasons: [],
+  transactions: [row, { ...row, label: "Signed extension (revised)" }],
+};
+const merged = historyByKey(restoreLeagueHistoryInResult({ leagueData: written }, moodSplit).leagueData).get(targetKey);
+check(() => assert.deepEqual(merged.seasons, target.history.seasons, "sent section was overwritten"));
+check(() => assert.deepEqual(merged.transactions, [...target.history.transactions, { ...row, label: "Signed extension (revised)" }]));
+check(() => assert.equal(merged.accolades, target.history.accolades));
+
+// 3. Retired records and roster-repair patches.
+const retiredRecord = { id: target.id, name: target.name, retired: true, history: {} };
+const retirement = restoreLeagueHistoryInResult(
+  { leagueData: { ...roundTrip(split.hot), retiredPlayersHistory: [retiredRecord] }, retiredPlayers: [retiredRecord] },
+  split
+);
+check(() => assert.equal(retirement.retiredPlayers[0].history, target.history));
+check(() => assert.equal(retirement.leagueData.retiredPlayersHistory[0].history, target.history));
+const patchTeam = roundTrip(split.hot.conferences.East[0]);
+const patched = restoreLeagueHistoryInResult(
+  { leaguePatch: { teamPatches: [{ teamName: patchTeam.name, team: patchTeam }], topLevel: { freeAgents: roundTrip(split.hot.freeAgents) } } },
+  split
+);
+for (const player of [...patched.leaguePatch.teamPatches[0].team.players, ...patched.leaguePatch.topLevel.freeAgents]) {
+  check(() => assert.equal(player.history, expected.get(leagueSessionPlayerKey(player))));
+}
+
+// 4. Session deltas from the hot resident league.
+const source = league.conferences.East[0];
+const moved = split.hot.conferences.East[0].players.find((p) => leagueSessionPlayerKey(p) !== targetKey);
+const movedKey = leagueSessionPlayerKey(moved);
+const delta = {
+  teams: {
+    [source.name]: {
+      players: { order: source.players.map(leagueSessionPlayerKey).filter((key) => key !== movedKey), upserts: {} },
+    },
+    [league.conferences.West[0].name]: {
+      players: {
+        order: [...league.conferences.West[0].players.map(leagueSessionPlayerKey), movedKey],
+        upserts: { [movedKey]: { ...roundTrip(moved), overall: moved.overall + 1 } },
+      },
+    },
+  },
+  state: {},
+  removedStateKeys: [],
+  historyAppends: { [targetKey]: { transactions: [row] } },
+};
+const next = applyLeagueSessionDelta(league, delta);
+const nextHistory = historyByKey(next);
+check(() => assert.equal(nextHistory.get(movedKey), expected.get(movedKey), "moved player lost its history"));
+check(() => assert.deepEqual(nextHistory.get(targetKey).transactions, [...target.history.transactions, row]));
+const untouchedTeam = league.conferences.East[1];
+check(() => assert.equal(next.conferences.East.find((t) => t.name === untouchedTeam.name), untouchedTeam, "untouched team lost identity"));
+check(() => assert.equal(JSON.stringify(league), snapshot, "delta mutated the source league"));
+
+const bytes = (value) => JSON.stringify(value).length;
+console.log(JSON.stringify({
+  status: "PASS",
+  checks,
+  leagueBytes: { full: bytes(league), hot: bytes(split.hot), moodSlices: bytes(moodSplit.hot) },
+  teamBytes: { full: bytes(team), hot: bytes(stripTeamHistory(team)) },
+}, null, 2));
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Hot league payloads must give the same engine results as the full league.
+
+1. Engines that are sent no history (team roster, free agency, retirement)
+   give the same answer on the hot league; putting the cold history back with
+   merge_history / fill_retired_records reproduces the full-league result.
+2. Player moods and CPU contract extensions read only the "seasons" and
+   "awards" sections: a league carrying just those slices gives identical
+   moods for every team, and the extension transaction rows merge back into
+   the full-league histories.
+3. The resident league session keeps history in its PlayerHistoryStore: the
+   session league is hot, session actions match direct calls, and
+   delta["historyAppends"] brings the store and the JS copy to the
+   full-league result.
+Also reports the serialized size of the full and hot league.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import contract_extension_logic  # noqa: E402
+import free_agency_logic  # noqa: E402
+import league_session  # noqa: E402
+import player_mood_logic  # noqa: E402
+import retirement_logic  # noqa: E402
+import team_roster_logic  # noqa: E402
+from league_history_store import (  # noqa: E402
+    ENGINE_HISTORY_SECTIONS,
+    PlayerHistoryStore,
+    history_key,
+    merge_history,
+    strip_league_history,
+)
+from league_clone import COLD_PLAYER_KEYS, iter_league_players  # noqa: E402
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def run(module, action, league, payload=None):
+    return quiet(module.handle_request, {"action": action, "leagueData": league, "payload": payload or {}})
+
+
+def without_history(value):
+    value = copy.deepcopy(value)
+    if isinstance(value, dict) and isinstance(value.get("leagueData"), dict):
+        strip_league_history(value["leagueData"])
+        for record in value["leagueData"].get("retiredPlayersHistory") or []:
+            record.pop("history", None)
+    for record in (value.get("retiredPlayers") or []) if isinstance(value, dict) else []:
+        record.pop("history", None)
+    return value
+
+
+def histories(league):
+    return {history_key(p): p.get("history") for p in iter_league_players(league)}
+
+
+def restore(result, store, sent=()):
+    """What the JS side does with a hot response (leagueHistorySplit.js)."""
+    league = result["leagueData"]
+    for player in iter_league_players(league):
+        key = history_key(player)
+        if key in store:
+            player["history"] = merge_history(store.history(key), player.get("history"), sent)
+    store.fill_retired_records(result.get("retiredPlayers"))
+    store.fill_retired_records(league.get("retiredPlayersHistory"))
+    return result
+
+
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+hot = copy.deepcopy(league)
+cold = PlayerHistoryStore.from_league(hot)
+check(all(not any(k in p for k in COLD_PLAYER_KEYS) for p in iter_league_players(hot)), "hot league still carries history")
+check(len(cold) == sum(1 for _ in iter_league_players(league)), "store is missing players")
+sizes = {"full": len(json.dumps(league)), "hot": len(json.dumps(hot))}
+players = list(iter_league_players(league))
+per_player = {
+    "full": round(sum(len(json.dumps(p)) for p in players) / len(players)),
+    "hot": round(sum(len(json.dumps({k: v for k, v in p.items() if k not in COLD_PLAYER_KEYS})) for p in players) / len(players)),
+}
+
+# 1. Engines that never read history.
+cases = [
+    (team_roster_logic, "apply_rookie_signings", {}),
+    (team_roster_logic, "apply_roster_finalization", {}),
+    (free_agency_logic, "generate_market_for_all_free_agents", {}),
+    (retirement_logic, "run_player_retirements", {"seed": 2027, "seasonYear": 2027}),
+]
+for module, action, payload in cases:
+    full = run(module, action, copy.deepcopy(league), payload)
+    lean = run(module, action, copy.deepcopy(hot), payload)
+    check(full.get("ok"), f"{action}: full-league run failed")
+    check(without_history(full) == without_history(lean), f"{action}: hot league changed the result")
+    restored = restore(lean, cold)
+    check(histories(restored["leagueData"]) == histories(full["leagueData"]), f"{action}: restored history differs")
+    if "retiredPlayers" in full:
+        check(restored["retiredPlayers"] == full["retiredPlayers"], f"{action}: retired records differ")
+
+# 2. Moods read only the sections they are sent.
+sections = ENGINE_HISTORY_SECTIONS["player_mood"]
+sliced = copy.deepcopy(hot)
+cold.attach(sliced, sections)
+team_names = [team["name"] for conference in league["conferences"].values() for team in conference]
+for name in team_names:
+    full = run(player_mood_logic, "get_locker_room_moods", copy.deepcopy(league), {"teamName": name})
+    lean = run(player_mood_logic, "get_locker_room_moods", copy.deepcopy(sliced), {"teamName": name})
+    check(full.get("ok") and full == lean, f"{name}: moods differ on the sliced league")
+
+full = run(contract_extension_logic, "process_cpu_contract_extensions", copy.deepcopy(league))
+lean = run(contract_extension_logic, "process_cpu_contract_extensions", copy.deepcopy(sliced))
+check(without_history(full) == without_history(lean), "CPU extensions differ on the sliced league")
+restored = restore(lean, cold, sections)
+check(histories(restored["leagueData"]) == histories(full["leagueData"]), "CPU extension history rows did not merge back")
+extension_writes = sum(
+    1 for p in iter_league_players(full["leagueData"])
+    if p.get("history") != cold.history(history_key(p))
+)
+check(extension_writes > 0, "fixture CPU extensions wrote no history rows")
+
+# 3. Resident session.
+loaded = league_session.load_league(copy.deepcopy(league))
+check(loaded["historyPlayers"] == len(cold), "session store size")
+resident = league_session.get_resident_league()
+check(all(not any(k in p for k in COLD_PLAYER_KEYS) for p in iter_league_players(resident)), "session league is not hot")
+
+for name in team_names[:5]:
+    direct = run(player_mood_logic, "get_locker_room_moods", copy.deepcopy(league), {"teamName": name})
+    session = quiet(league_session.run_session_action, "player_mood", "get_locker_room_moods", {"teamName": name})
+    check(session["result"] == direct, f"{name}: session moods differ")
+    check(not session["delta"].get("historyAppends"), f"{name}: mood read appended history")
+check(all("history" not in p for p in iter_league_players(league_session.get_resident_league())), "mood slices left on the session league")
+
+session = quiet(league_session.run_session_action, "team_roster", "apply_roster_finalization", {})
+check(not session["delta"].get("historyAppends"), "roster finalization reported history appends")
+full = run(team_roster_logic, "apply_roster_finalization", copy.deepcopy(league))
+full = run(contract_extension_logic, "process_cpu_contract_extensions", full["leagueData"])
+session = quiet(league_session.run_session_action, "contract_extension", "process_cpu_contract_extensions", {})
+check(without_history(full)["leagueData"] == without_history({"leagueData": league_session.get_resident_league()})["leagueData"], "session extensions differ")
+appends = session["delta"].get("historyAppends") or {}
+check(len(appends) == extension_writes, f"session reported {len(appends)} history appends")
+store = league_session.get_history_store()
+expected = histories(full["leagueData"])
+for key, history in expected.items():
+    check(store.history(key) == (history or {}), f"{key}: session store history differs")
+js_side = {history_key(p): p.get("history") for p in iter_league_players(league)}
+for key, rows in appends.items():
+    js_side[key] = merge_history(js_side.get(key), rows)
+for key, history in expected.items():
+    check(js_side.get(key) == history, f"{key}: applying historyAppends differs")
+league_session.clear_league()
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "leagueBytes": sizes,
+    "avgPlayerBytes": per_player,
+    "historyAppendPlayers": len(appends),
+}, indent=2))
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Headless league runner (public/python/league_runner.py) regression.
+
+1. Short seasons (--games 20) run end to end: CPU contract extensions,
+   regular season, playoffs, awards and every offseason phase, and each
+   season summary has the shape summary.json consumers read.
+2. Replicas are deterministic: the process pool gives the same results as
+   running the replicas serially, and different seeds give different seasons.
+3. The saved league is in the next season's context, with the completed
+   free-agency state compacted.
+4. --box-score-backend reaches game_sim in each replica (NumPy when it is
+   installed), and replicas go back to the Python engine without the flag.
+   Progression runs on the Python plan by default and on NumPy on request.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import tempfile
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import league_runner  # noqa: E402
+
+GAMES = 20
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def comparable(results):
+    """Results without wall-clock fields."""
+    out = []
+    for result in results:
+        seasons = [{k: v for k, v in season.items() if k not in ("timings", "elapsedSeconds")} for season in result["seasons"]]
+        out.append({**result, "seasons": seasons})
+    return out
+
+
+with tempfile.TemporaryDirectory() as out_dir:
+    serial = league_runner.run_replicas(
+        str(LEAGUE_FILE), 1, replicas=2, workers=1, seed=7, out_dir=out_dir, games_per_team=GAMES, save_league=True,
+    )
+    written = sorted(p.relative_to(out_dir).as_posix() for p in pathlib.Path(out_dir).rglob("*.json"))
+    next_league = json.loads((pathlib.Path(out_dir) / "replica-00" / "final-league.json").read_text(encoding="utf-8"))
+check(written == [f"replica-{i:02d}/{name}" for i in (0, 1) for name in ("final-league.json", "season-2026.json")], f"unexpected output files {written}")
+check(set(next_league["freeAgencyState"]) <= set(league_runner.FREE_AGENCY_STATE_KEPT_KEYS), "free agency state not compacted")
+check(next_league["seasonYear"] == 2027, "season context not advanced")
+
+# Pool workers are fresh processes, so this also checks that a seed replays
+# the same season with no state carried over from an earlier replica.
+pooled = league_runner.run_replicas(str(LEAGUE_FILE), 1, replicas=2, workers=2, seed=7, games_per_team=GAMES)
+check(comparable(serial) == comparable(pooled), "process pool results differ from the serial run")
+check(serial[0]["seasons"][0]["standings"] != serial[1]["seasons"][0]["standings"], "replicas with different seeds are identical")
+
+for result in serial:
+    season = result["seasons"][0]
+    check(season["seasonYear"] == 2026, "season year")
+    check(set(league_runner.OFFSEASON_PHASES) <= set(season["timings"]), "offseason phase missing from timings")
+    check(season["champion"] and season["awards"].get("finals_mvp"), "no champion or finals MVP")
+    # Regular-season awards have games thresholds a 20-game season may miss.
+    check(set(season["awards"]) >= {"mvp", "dpoy", "roty", "sixth_man", "mip", "all_nba_first"}, "award keys missing")
+    check("contract_extensions" in season["timings"], "contract extension phase missing from timings")
+    extensions = season["contractExtensions"]
+    check(set(extensions["byPhase"]) == set(league_runner.CONTRACT_EXTENSION_PHASES), "extension deadline skipped")
+    check(extensions["signed"] > 0, "CPU teams signed no extensions")
+    check(season["offseason"]["draft"]["picks"] == 60, "draft did not make 60 picks")
+    check(season["offseason"]["freeAgency"]["signings"] > 0, "free agency signed nobody")
+    league_end = season["after"]
+    check(league_end["players"] > 0 and 13 <= league_end["avgRosterSize"] <= 15, f"roster sizes {league_end}")
+
+game_sim = league_runner.engine("game_sim")
+expected_backend = "numpy" if game_sim.NUMPY_AVAILABLE else "python"
+league_runner.run_replicas(str(LEAGUE_FILE), 0, workers=1, box_score_backend="numpy")
+check(game_sim.BM_BOX_SCORE_BACKEND == expected_backend, "replica did not select the box-score backend")
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+array_season = league_runner.run_regular_season(league, 7, 4)
+league_runner.run_replicas(str(LEAGUE_FILE), 0, workers=1)
+check(game_sim.BM_BOX_SCORE_BACKEND == "python", "box-score backend leaked into the next run")
+progression = league_runner.engine("progression")
+check(progression.PROGRESSION_PLAN_BACKEND == "python", "runner did not default to the Python progression plan")
+league_runner.run_replicas(str(LEAGUE_FILE), 0, workers=1, progression_backend="numpy")
+check(progression.PROGRESSION_PLAN_BACKEND == expected_backend, "replica did not select the progression backend")
+check(array_season["games"] == league_runner.run_regular_season(league, 7, 4)["games"], "backend changed the schedule")
+
+report = league_runner.aggregate(serial)
+print(json.dumps({"status": "PASS", "checks": checks, "champions": report["2026"]["champions"]}, indent=2))
@@ -0,0 +1,134 @@
+// Resident league session (public/python/league_session.py) parity with the
+// full-payload engine path, end to end through the JS delta merge.
+//
+// 1. Free-agency days run through run_session_action and merged into the JS
+//    league with applyLeagueSessionDelta() give, day after day, exactly the
+//    league and result of sending the whole league to
+//    handle_engine_request("free_agency_logic", ...) each day.
+// 2. Those deltas only carry the keys SESSION_ACTION_TOUCHES declares.
+// 3. Players without an id are keyed by list position: two id-less players
+//    with the same name stay two players through a diff + merge.
+import assert from "node:assert/strict";
+import { spawnSync } from "node:child_process";
+import path from "node:path";
+import { fileURLToPath, pathToFileURL } from "node:url";
+
+const here = path.dirname(fileURLToPath(import.meta.url));
+const root = path.resolve(here, "..");
+const pythonModuleDir = path.join(root, "public", "python");
+const leagueFile = path.join(root, "..", "2027_roster_FINAL_core_awards_DIVISIONS.json");
+const DAYS = 5;
+
+const { applyLeagueSessionDelta } = await import(pathToFileURL(path.join(root, "src/utils/leagueSessionDelta.js")).href);
+
+let checks = 0;
+const check = (fn) => {
+  fn();
+  checks += 1;
+};
+
+function findPython() {
+  for (const attempt of [
+    { command: "python", prefix: [] },
+    { command: "py", prefix: ["-3"] },
+    { command: "python3", prefix: [] },
+  ]) {
+    const probe = spawnSync(attempt.command, [...attempt.prefix, "--version"], { encoding: "utf8" });
+    if (probe.status === 0) return attempt;
+  }
+  throw new Error("Python 3 was not found. Install Python or ensure python/py/python3 is available in PATH.");
+}
+
+const pythonCode = String.raw`
+import contextlib
+import copy
+import io
+import json
+import sys
+
+sys.path.insert(0, sys.argv[1])
+import league_session
+from league_history_store import strip_league_history
+from module_registry import handle_engine_request
+
+def quiet(fn, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args)
+
+def round_trip(value):
+    return json.loads(json.dumps(value))
+
+def fa_request(action, league):
+    return quiet(handle_engine_request, "free_agency_logic", {"action": action, "leagueData": round_trip(league), "payload": {"userTeamName": None}})
+
+with open(sys.argv[2], encoding="utf-8") as handle:
+    league = json.load(handle)
+strip_league_history(league)
+initial = fa_request("initialize_free_agency_period", league)["leagueData"]
+
+quiet(league_session.load_league, round_trip(initial))
+full_league = initial
+days = []
+for _ in range(int(sys.argv[3])):
+    full = fa_request("advance_free_agency_day", full_league)
+    full_league = full.pop("leagueData")
+    session = quiet(league_session.run_session_action, "free_agency", "advance_free_agency_day", {"userTeamName": None})
+    days.append({"expected": full_league, "fullResult": full, "session": session})
+
+old = {"conferences": {}, "freeAgents": [{"name": "Twin", "overall": 60}, {"name": "Twin", "overall": 61}, {"id": 7, "name": "Seven"}]}
+new = copy.deepcopy(old)
+new["freeAgents"][1]["overall"] = 62
+new["freeAgents"].insert(0, {"name": "Twin", "overall": 55})
+idless = {"old": old, "new": new, "delta": league_session.diff_leagues(old, new)}
+
+print(json.dumps({
+    "initial": initial,
+    "days": days,
+    "touches": list(league_session.SESSION_ACTION_TOUCHES[("free_agency", "advance_free_agency_day")]),
+    "idless": idless,
+}))
+`;
+
+const python = findPython();
+const run = spawnSync(python.command, [...python.prefix, "-c", pythonCode, pythonModuleDir, leagueFile, String(DAYS)], {
+  encoding: "utf8",
+  maxBuffer: 512 * 1024 * 1024,
+});
+if (run.status !== 0) {
+  throw new Error(`Python session runner failed (${run.status}).\n${run.stderr || run.stdout}`);
+}
+const trace = JSON.parse(run.stdout);
+
+// Wall-clock diagnostics differ between any two runs.
+const comparable = (value) => {
+  if (Array.isArray(value)) return value.map(comparable);
+  if (!value || typeof value !== "object") return value;
+  return Object.fromEntries(
+    Object.entries(value)
+      .filter(([key]) => key !== "performanceDiagnostics" && key !== "pythonProfile")
+      .map(([key, item]) => [key, comparable(item)])
+  );
+};
+
+// 1 + 2. Day by day parity, and deltas within the declared keys.
+const touches = new Set(trace.touches);
+let league = trace.initial;
+let rosterDays = 0;
+trace.days.forEach(({ expected, fullResult, session }, day) => {
+  check(() => assert.equal(session.ok, true, `day ${day + 1}: session action failed`));
+  check(() => assert.deepEqual(comparable(session.result), comparable(fullResult), `day ${day + 1}: results differ`));
+  league = applyLeagueSessionDelta(league, session.delta);
+  check(() => assert.deepEqual(league, expected, `day ${day + 1}: merged league differs from the full-payload league`));
+  for (const key of Object.keys(session.delta.state || {})) {
+    check(() => assert.ok(touches.has(key), `day ${day + 1}: undeclared key ${key} in the delta`));
+  }
+  if (Object.keys(session.delta.teams || {}).length) rosterDays += 1;
+});
+check(() => assert.ok(rosterDays > 0, "no free-agency day changed a roster; the fixture did not exercise team deltas"));
+
+// 3. Id-less players.
+const { old, new: next, delta } = trace.idless;
+check(() => assert.ok(Object.keys(delta.freeAgents.upserts).every((key) => !key.startsWith("name:"))));
+check(() => assert.deepEqual(applyLeagueSessionDelta(old, delta).freeAgents, next.freeAgents));
+
+console.log(JSON.stringify({ status: "PASS", checks, days: DAYS, rosterDays }, null, 2));
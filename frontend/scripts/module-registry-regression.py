@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Warm engine-module registry (public/python/module_registry.py).
+
+1. A warm load_engine() returns the resident module without re-executing it.
+2. Touching a source file without changing its content does not reload it;
+   changing the content does.
+3. Changing a dependency reloads the dependency and the engines that list it.
+4. A request for a different league resets league-scoped module state (CPU
+   offer board, trade value cache, FA power cache, game RNG master seed);
+   requests for the same league keep it.
+5. configure_engine() settings survive a league reset and a module reload.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import textwrap
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import module_registry as mr  # noqa: E402
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def write_module(directory, name, body):
+    path = pathlib.Path(directory) / f"{name}.py"
+    path.write_text(textwrap.dedent(body), encoding="utf-8")
+    # Keep mtime moving even on coarse filesystem clocks.
+    stamp = (checks + 1) * 1_000_000_000 + len(body)
+    os.utime(path, ns=(stamp, stamp))
+    return path
+
+
+def executions(name):
+    return mr.get_module_load_stats()["modules"][name]["coldLoads"]
+
+
+workdir = tempfile.mkdtemp(prefix="bm-registry-")
+sys.path.insert(0, workdir)
+sys.dont_write_bytecode = True
+
+write_module(workdir, "bm_reg_dep", """
+    VALUE = 1
+""")
+write_module(workdir, "bm_reg_engine", """
+    import bm_reg_dep
+    SEEN = bm_reg_dep.VALUE
+    MODE = "default"
+
+    def set_mode(mode):
+        global MODE
+        MODE = mode
+        return MODE
+
+    def handle_request(request):
+        return {"ok": True, "seen": SEEN, "mode": MODE}
+""")
+DEPS = ("bm_reg_dep",)
+
+# 1. Warm loads.
+engine = mr.load_engine("bm_reg_engine", DEPS)
+check(engine.SEEN == 1, "engine did not import its dependency")
+check(mr.load_engine("bm_reg_engine", DEPS) is engine, "warm load returned another module")
+check(executions("bm_reg_engine") == 1 and executions("bm_reg_dep") == 1, "warm load re-executed a module")
+check(mr.get_module_load_stats()["modules"]["bm_reg_engine"]["warmHits"] == 1, "warm hit not counted")
+
+# 2. Touch vs edit.
+engine_path = pathlib.Path(workdir) / "bm_reg_engine.py"
+stamp = engine_path.stat().st_mtime_ns + 5_000_000_000
+os.utime(engine_path, ns=(stamp, stamp))
+mr.load_engine("bm_reg_engine", DEPS)
+check(executions("bm_reg_engine") == 1, "touching an unchanged file reloaded it")
+engine.MARK = "resident"
+write_module(workdir, "bm_reg_engine", engine_path.read_text(encoding="utf-8").replace('"default"', '"edited"'))
+engine = mr.load_engine("bm_reg_engine", DEPS)
+check(executions("bm_reg_engine") == 2 and engine.MODE == "edited", "a content change did not reload the engine")
+check(executions("bm_reg_dep") == 1, "an engine edit reloaded its dependency")
+
+# 3. Dependency edits.
+write_module(workdir, "bm_reg_dep", """
+    VALUE = 2
+""")
+engine = mr.load_engine("bm_reg_engine", DEPS)
+check(executions("bm_reg_dep") == 2, "a dependency edit did not reload the dependency")
+check(executions("bm_reg_engine") == 3 and engine.SEEN == 2, "a dependency edit did not reload the engine")
+
+# 4. League-scoped state.
+import free_agency_logic  # noqa: E402
+import game_sim  # noqa: E402
+import trade_value_model  # noqa: E402
+
+
+def fill_league_state():
+    free_agency_logic._CPU_OFFER_BOARD["fits"]["pair"] = 1.0
+    free_agency_logic._FA_TEAM_POWER_CONTEXT_CACHE["league"] = {}
+    trade_value_model._PLAYER_VALUE_CACHE[(("p1",), ())] = 10.0
+    game_sim.set_game_rng_master_seed(7)
+
+
+def league_state_filled():
+    return (
+        bool(free_agency_logic._CPU_OFFER_BOARD["fits"]),
+        bool(free_agency_logic._FA_TEAM_POWER_CONTEXT_CACHE),
+        bool(trade_value_model._PLAYER_VALUE_CACHE),
+        game_sim.GAME_RNG_MASTER_SEED is not None,
+    )
+
+
+def request(league_id):
+    return mr.handle_engine_request("bm_reg_engine", {"leagueData": {"__leagueStorageId": league_id}})
+
+
+request("league-a")
+fill_league_state()
+request("league-a")
+check(all(league_state_filled()), "a same-league request reset league state")
+check(mr.league_id_of({"leagueName": "Fixture"}) == "leagueName:Fixture", "league name fallback")
+check(mr.league_id_of({}) is None, "a league without an id has an id")
+request("league-b")
+check(not any(league_state_filled()), f"a new league kept state: {league_state_filled()}")
+fill_league_state()
+mr.handle_engine_request("bm_reg_engine", {"payload": {}})
+check(all(league_state_filled()), "a request without league data reset league state")
+
+# 5. Settings.
+mr.LEAGUE_STATE_RESETS["bm_reg_engine"] = (("set_mode", ("default",)),)
+mr.configure_engine("bm_reg_engine", "set_mode", "configured")
+check(request("league-c")["mode"] == "configured", "a league reset dropped a configured setting")
+write_module(workdir, "bm_reg_engine", engine_path.read_text(encoding="utf-8") + "\n# edited\n")
+check(request("league-c")["mode"] == "configured", "a reload dropped a configured setting")
+check(executions("bm_reg_engine") == 4, "the settings edit did not reload the engine")
+
+stats = mr.get_module_load_stats()
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "leagueResets": stats["leagueResets"],
+}, indent=2))
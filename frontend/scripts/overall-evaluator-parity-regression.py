@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""OverallEvaluator must match every reference overall formula exactly.
+
+Random walks over 15-attribute vectors for every position: at each state the
+evaluator's O(1) overall_after(idx, +/-1) for all 30 one-point moves is
+compared with a full recompute by progression.calc_overall_from_attrs,
+autogenerated_draft_class._calc_overall_from_attrs and
+draft_logic._calc_overall_from_attrs. Walks are biased toward the 25/99
+clamps and the 90+ bonus so those branches are exercised too.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import random
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import autogenerated_draft_class as adc  # noqa: E402
+import draft_logic  # noqa: E402
+import progression as pg  # noqa: E402
+from overall_evaluator import OverallEvaluator  # noqa: E402
+
+SEED = 2027
+WALKS_PER_POSITION = 20
+STEPS_PER_WALK = 30
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def random_attrs(rng):
+    style = rng.random()
+    if style < 0.2:
+        return [rng.randint(84, 99) for _ in range(15)]
+    if style < 0.35:
+        return [rng.randint(25, 40) for _ in range(15)]
+    return [rng.randint(45, 95) for _ in range(15)]
+
+
+rng = random.Random(SEED)
+moves = 0
+for pos in ("PG", "SG", "SF", "PF", "C", "G", "wing", None):
+    for _ in range(WALKS_PER_POSITION):
+        attrs = random_attrs(rng)
+        progression_eval = OverallEvaluator(attrs, pg._POS_PARAMS[pg._normalized_pos(pos)])
+        draft_eval = OverallEvaluator(
+            attrs,
+            adc.OVERALL_POS_PARAMS.get(str(pos or "SF").upper(), adc.OVERALL_POS_PARAMS["SF"]),
+            half_up = False,
+        )
+        for _step in range(STEPS_PER_WALK):
+            current = progression_eval.snapshot()
+            check(progression_eval.overall() == pg.calc_overall_from_attrs(current, pos), f"{pos} {current}: overall drifted")
+            check(draft_eval.overall() == adc._calc_overall_from_attrs(current, pos), f"{pos} {current}: draft overall drifted")
+            for idx in range(15):
+                for delta in (1, -1):
+                    trial = list(current)
+                    trial[idx] = max(25, min(99, trial[idx] + delta))
+                    expected = pg.calc_overall_from_attrs(trial, pos)
+                    check(
+                        progression_eval.overall_after(idx, delta) == expected,
+                        f"{pos} {current} attr {idx} {delta:+d}: evaluator != calc_overall_from_attrs",
+                    )
+                    expected_draft = adc._calc_overall_from_attrs(trial, pos)
+                    check(
+                        draft_eval.overall_after(idx, delta) == expected_draft,
+                        f"{pos} {current} attr {idx} {delta:+d}: evaluator != draft-class formula",
+                    )
+                    check(
+                        expected_draft == draft_logic._calc_overall_from_attrs(trial, pos),
+                        f"{pos} {current} attr {idx} {delta:+d}: draft_logic formula diverged",
+                    )
+                    moves += 1
+            idx = rng.randrange(15)
+            delta = 1 if rng.random() < 0.5 else -1
+            progression_eval.apply(idx, delta)
+            draft_eval.apply(idx, delta)
+            check(progression_eval.snapshot() == draft_eval.snapshot(), "evaluators diverged on apply")
+
+# apply() on a clamped attribute is a no-op.
+edge = OverallEvaluator([99] * 15, pg._POS_PARAMS["SF"])
+check(edge.apply(0, 1) is False, "apply past 99 must not move")
+check(edge.overall() == pg.calc_overall_from_attrs([99] * 15, "SF"), "99 clamp overall mismatch")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "onePointMovesCompared": moves,
+}, indent=2))
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Seeded equivalence check for the NumPy progression plan backend.
+
+1. The deterministic per-player terms of progression_numpy (formula overall,
+   age/potential/tier expectation, profile adjustment, sigma and delta
+   bounds) must equal the scalar V24/V25 helpers exactly on every fixture
+   player.
+2. Raw plans from _compute_raw_progression_plan and
+   compute_raw_progression_plan_numpy over the same seeds must agree in
+   distribution: mean/std of target deltas overall and by age band, plus the
+   share of big moves.
+3. A full season on the NumPy backend must still pass the hard shape lock.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import random
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import progression as pg  # noqa: E402
+import progression_numpy as pn  # noqa: E402
+
+if not pn.NUMPY_AVAILABLE:
+    print(json.dumps({"status": "SKIP", "reason": "numpy is not installed"}))
+    sys.exit(0)
+
+SEEDS = range(2027, 2059)
+SEASON_YEAR = 2027
+AGE_BANDS = (("<=23", 0, 23), ("24-29", 24, 29), ("30+", 30, 99))
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def fixture_league():
+    league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+    pg._v25_league_seed(league, SEASON_YEAR)
+    pg._ensure_v25_profiles_for_league(league, SEASON_YEAR, SEASON_YEAR)
+    return league
+
+
+class _NoEventRng(random.Random):
+    """Takes no random branch in _v25_profile_expected_adjustment."""
+
+    def random(self):
+        return 0.999999
+
+
+# 1. Deterministic terms, exact.
+league = fixture_league()
+packed = pn.pack_progression_league(league, random.Random(1))
+terms = pn.progression_terms(packed)
+profile_adj = pn._finish_profile_adjustment(terms["profile"], 0.0)
+lane_rng = random.Random(7)
+for i, p in enumerate(packed["players"]):
+    label = p.get("name") or i
+    pos = p.get("pos") or p.get("position") or "SF"
+    check(int(packed["formula"][i]) == pg.calc_overall_from_attrs(p["attrs"], pos), f"{label}: formula overall")
+    if packed["protected"][i]:
+        continue
+    age, ovr, pot = int(packed["age"][i]), int(packed["overall"][i]), int(packed["potential"][i])
+    base = pg._v24_age_expectation(age, ovr) + pg._v24_potential_expectation(age, ovr, pot) + pg._v24_rating_tier_expectation(age, ovr, pot)
+    check(base == terms["age"][i] + terms["potential"][i] + terms["tier"][i], f"{label}: base expectation")
+    if packed["profiles"][i].get("profile") != "volatile":
+        scalar_adj = pg._v25_profile_expected_adjustment(p, age, ovr, pot, _NoEventRng())
+        check(scalar_adj == profile_adj[i], f"{label}: profile adjustment {scalar_adj} != {profile_adj[i]}")
+    sigma = pg._v24_organic_sigma(p, age, ovr, pot, lane_rng) * pg._v25_sigma_mult(p, age, ovr, pot, lane_rng)
+    check(sigma == terms["sigma"][i], f"{label}: sigma")
+    check(pg._v25_bound_delta(p, age, ovr, pot, -99, lane_rng) == terms["lo"][i], f"{label}: lower bound")
+    allowed = {int(terms["hi"][i])}
+    if terms["lucky_chance"][i] > 0:
+        allowed.add(int(terms["lucky_hi"][i]))
+    for _ in range(12):
+        check(pg._v25_bound_delta(p, age, ovr, pot, 99, lane_rng) in allowed, f"{label}: upper bound lane")
+
+
+# 2. Sampled plans, by distribution.
+def plan_deltas(builder):
+    rows = []
+    elapsed = 0.0
+    for seed in SEEDS:
+        league = fixture_league()
+        started = time.perf_counter()
+        plan = builder(league, None, pg.DEFAULT_SETTINGS, random.Random(seed))
+        elapsed += time.perf_counter() - started
+        for item in plan:
+            check(
+                int(item["target_overall"]) == int(item["before_overall"]) + int(item["target_delta"]),
+                "plan item target/delta out of sync",
+            )
+            if item.get("shape_protected"):
+                check(int(item["target_delta"]) == 0, "shape-protected rookie was given a delta")
+                continue
+            rows.append((pg._safe_int(item["player"].get("age"), 25), int(item["target_delta"])))
+    return rows, elapsed * 1000.0 / len(SEEDS)
+
+
+def summary(rows):
+    def stats(values):
+        n = len(values)
+        mean = sum(values) / n
+        std = (sum((v - mean) ** 2 for v in values) / n) ** 0.5
+        return {
+            "n": n,
+            "mean": round(mean, 4),
+            "std": round(std, 4),
+            "up3": round(sum(1 for v in values if v >= 3) / n, 4),
+            "down3": round(sum(1 for v in values if v <= -3) / n, 4),
+        }
+
+    out = {"all": stats([d for _, d in rows])}
+    for label, lo, hi in AGE_BANDS:
+        out[label] = stats([d for age, d in rows if lo <= age <= hi])
+    return out
+
+
+scalar_rows, scalar_ms = plan_deltas(pg._compute_raw_progression_plan)
+numpy_rows, numpy_ms = plan_deltas(pn.compute_raw_progression_plan_numpy)
+scalar = summary(scalar_rows)
+vector = summary(numpy_rows)
+for band in scalar:
+    a, b = scalar[band], vector[band]
+    check(a["n"] == b["n"], f"{band}: engines planned different players")
+    check(abs(a["mean"] - b["mean"]) <= 0.08, f"{band}: mean delta {a['mean']} vs {b['mean']}")
+    check(abs(a["std"] - b["std"]) <= 0.08, f"{band}: delta std {a['std']} vs {b['std']}")
+    check(abs(a["up3"] - b["up3"]) <= 0.025, f"{band}: +3 share {a['up3']} vs {b['up3']}")
+    check(abs(a["down3"] - b["down3"]) <= 0.025, f"{band}: -3 share {a['down3']} vs {b['down3']}")
+
+# 3. Full season on the NumPy backend.
+check(pg.set_progression_plan_backend("numpy") == "numpy", "numpy backend did not activate")
+try:
+    league = fixture_league()
+    pg.apply_end_of_season_progression(league, None, pg.DEFAULT_SETTINGS, SEEDS[0])
+    pg.apply_final_league_shape_lock(league, pg.DEFAULT_SETTINGS, SEEDS[0] + 1)
+    audit = pg.audit_current_league_shape(league)
+    check(audit["ok"], f"numpy season violates the hard shape: {audit['violations']}")
+finally:
+    pg.set_progression_plan_backend("python")
+check(pg.PROGRESSION_PLAN_BACKEND == "python", "backend switch did not reset")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "seeds": len(SEEDS),
+    "planMs": {"python": round(scalar_ms, 1), "numpy": round(numpy_ms, 1)},
+    "python": scalar,
+    "numpy": vector,
+}, indent=2))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Hard shape lock on the shape ledger keeps every corridor.
+
+Builds the raw end-of-season plan from the fixture league, runs
+_apply_true_hard_shape_lock and checks that the ledger's histogram agrees
+with a direct recount of the plan and that no protected item moved. Then runs
+a full season (progression + final league shape lock) and checks the saved
+pool is legal and stays legal under another lock pass.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import random
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import progression as pg  # noqa: E402
+
+SEED = 2027
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+settings = pg.DEFAULT_SETTINGS
+rng = random.Random(SEED)
+plan = pg._compute_raw_progression_plan(league, None, settings, rng)
+check(len(plan) > 400, "fixture plan is unexpectedly small")
+pg._cap_plan_yearly_deltas(plan)
+protected_before = {id(item): int(item["target_overall"]) for item in plan if pg._is_shape_protected_item(item)}
+
+started = time.perf_counter()
+audit = pg._apply_true_hard_shape_lock(plan, settings, rng)
+lock_ms = (time.perf_counter() - started) * 1000.0
+
+# Ledger counts == direct recount.
+for threshold, row in audit["cumulative"].items():
+    actual = sum(1 for item in plan if int(item["target_overall"]) >= int(threshold))
+    check(row["actual"] == actual, f"{threshold}+: ledger {row['actual']} != recount {actual}")
+for rung, row in audit["exact"].items():
+    actual = sum(1 for item in plan if int(item["target_overall"]) == int(rung))
+    check(row["actual"] == actual, f"rung {rung}: ledger {row['actual']} != recount {actual}")
+
+# Plan items stay self-consistent and protected rookies are untouched.
+for item in plan:
+    check(
+        int(item["target_overall"]) == int(item["before_overall"]) + int(item["target_delta"]),
+        f"{item['player'].get('name')}: target_overall out of sync with target_delta",
+    )
+    if id(item) in protected_before:
+        check(int(item["target_overall"]) == protected_before[id(item)], "shape-protected item was moved")
+
+# Full season: the saved pool must be legal and stay legal under another lock.
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+pg.apply_end_of_season_progression(league, None, settings, SEED)
+pg.apply_final_league_shape_lock(league, settings, SEED + 1)
+final_audit = pg.audit_current_league_shape(league)
+check(final_audit["ok"], f"saved pool violates the hard shape: {final_audit['violations']}")
+
+plan = pg._build_current_shape_plan(league)
+again = pg._apply_true_hard_shape_lock(plan, settings, random.Random(SEED + 2))
+check(again["ok"], f"second pass reported violations: {again['violations']}")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "planPlayers": len(plan),
+    "lockMs": round(lock_ms, 1),
+}, indent=2))
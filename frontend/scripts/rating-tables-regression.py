@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Rating -> per-36 lookup tables (public/python/rating_distributions.py).
+
+1. For every integer rating in the table range, and for off-grid ratings, the
+   assist / rebound / steal / block tables equal the exact percentile curve.
+2. Changing the rating distribution bumps the version, and every table (and
+   the NumPy box-score tables, when NumPy is available) rebuilds to match the
+   exact curve over the new distribution.
+3. invalidate_rating_tables() alone also forces a rebuild.
+4. Going back to the default source restores the original values.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import assists  # noqa: E402
+import blocks  # noqa: E402
+import box_score_numpy  # noqa: E402
+import rating_distributions as rd  # noqa: E402
+import rebounds  # noqa: E402
+import steals  # noqa: E402
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+MODELS = {
+    "ast36": (assists._AST36_TABLE, assists._ast36_exact),
+    "reb36": (rebounds._TRB36_TABLE, rebounds._rebound_per36_exact),
+    "stl36": (steals._STL36_TABLE, steals._steal_per36_from_rating_exact),
+    "blk36": (blocks._BLK36_TABLE, blocks._block_per36_from_rating_exact),
+}
+RATINGS = [float(r) for r in range(rd.RATING_TABLE_MIN, rd.RATING_TABLE_MAX + 1)] + [44.5, 71.25, 130.0, -3.0]
+
+
+def table_values():
+    return {name: [table.lookup(r) for r in RATINGS] for name, (table, _) in MODELS.items()}
+
+
+def check_tables_exact(label):
+    for name, (table, exact) in MODELS.items():
+        check(
+            [table.lookup(r) for r in RATINGS] == [exact(r) for r in RATINGS],
+            f"{label}: {name} table differs from the exact curve",
+        )
+        check(table.version == rd.distributions_version(), f"{label}: {name} table was not rebuilt")
+
+
+def numpy_tables():
+    if not box_score_numpy.NUMPY_AVAILABLE:
+        return None
+    tables = box_score_numpy._get_tables()
+    return {name: tables[name].tolist() for name in ("reb36", "stl36", "blk36")}
+
+
+def check_numpy_tables(label):
+    tables = numpy_tables()
+    if tables is None:
+        return
+    grid = range(box_score_numpy.RATING_GRID_MAX + 1)
+    check(tables["reb36"] == [rebounds.rebound_per36(r) for r in grid], f"{label}: NumPy REB36 table is stale")
+    check(tables["stl36"] == [steals.steals_per36(None, r, None, None) for r in grid], f"{label}: NumPy STL36 table is stale")
+    check(tables["blk36"] == [blocks.blocks_per36(None, r, None, None) for r in grid], f"{label}: NumPy BLK36 table is stale")
+
+
+# 1. Default source.
+rd.set_league_rating_distributions(None)
+check_tables_exact("default")
+check_numpy_tables("default")
+default_values = table_values()
+default_numpy = numpy_tables()
+
+# 2. A league snapshot with a different spread.
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+version = rd.distributions_version()
+check(rd.set_league_rating_distributions(league) == version + 1, "a distribution change did not bump the version")
+check_tables_exact("league")
+check_numpy_tables("league")
+league_values = table_values()
+for name in MODELS:
+    check(league_values[name] != default_values[name], f"{name}: the league distribution did not change the table")
+
+# 3. Explicit invalidation after the source players change in place.
+for conference in league["conferences"].values():
+    for team in conference:
+        for player in team["players"]:
+            if isinstance(player.get("attrs"), list):
+                player["attrs"] = [min(99, value + 8) if isinstance(value, (int, float)) else value for value in player["attrs"]]
+rd.set_league_rating_distributions(league)
+check(table_values() != league_values, "re-pointing at edited rosters did not rebuild the tables")
+check_tables_exact("edited")
+previous = {name: table.values for name, (table, _) in MODELS.items()}
+rd.invalidate_rating_tables()
+check_tables_exact("invalidated")
+check(all(MODELS[name][0].values is not previous[name] for name in MODELS), "invalidate_rating_tables() kept a table")
+
+# 4. Back to the default source.
+rd.set_league_rating_distributions(None)
+check(table_values() == default_values, "returning to the default source changed the tables")
+check(numpy_tables() == default_numpy, "returning to the default source changed the NumPy tables")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "numpy": box_score_numpy.NUMPY_AVAILABLE,
+    "version": rd.distributions_version(),
+}, indent=2))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Opt-in request profiling (public/python/request_profiler.py).
+
+1. With profiling off, module_registry.handle_engine_request gives exactly
+   the engine's handle_request result, with no pythonProfile.
+2. request["profile"] profiles one request: the result is unchanged apart
+   from pythonProfile, a JSON-serializable top-N table sorted by the chosen
+   column that includes the engine's own functions; the engine never sees
+   the flag.
+3. set_profiling() profiles every request (including resident-session
+   actions) until turned off; request["profile"] = False opts one out.
+4. run_profiled wraps non-request calls (the worker's progression call).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import league_session  # noqa: E402
+import player_mood_logic  # noqa: E402
+import request_profiler  # noqa: E402
+import retirement_logic  # noqa: E402
+from module_registry import handle_engine_request  # noqa: E402
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def check_table(profile, engine, action, top_n, column):
+    check(profile["engine"] == engine and profile["action"] == action, f"{engine}: profile labels {profile.get('engine')}.{profile.get('action')}")
+    rows = profile["functions"]
+    check(0 < len(rows) <= top_n and profile["topN"] == top_n, f"{engine}: {len(rows)} rows for topN {top_n}")
+    check(all(a[column] >= b[column] for a, b in zip(rows, rows[1:])), f"{engine}: rows not sorted by {column}")
+    check(profile["functionCount"] >= len(rows) and profile["wallMs"] > 0, f"{engine}: totals")
+    check(json.loads(json.dumps(profile)) == profile, f"{engine}: profile is not JSON-serializable")
+
+
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+team_name = league["conferences"]["East"][0]["name"]
+retire = {"action": "run_player_retirements", "leagueData": league, "payload": {"seed": 2027, "seasonYear": 2027}}
+moods = {"action": "get_locker_room_moods", "leagueData": league, "payload": {"teamName": team_name}}
+
+# 1. Off by default.
+check(not request_profiler.get_profiling_settings()["enabled"], "profiling on by default")
+direct = quiet(retirement_logic.handle_request, copy.deepcopy(retire))
+routed = quiet(handle_engine_request, "retirement_logic", copy.deepcopy(retire))
+check(routed == direct and "pythonProfile" not in routed, "unprofiled request differs from handle_request")
+
+# 2. Per-request opt-in.
+seen = []
+original = player_mood_logic.handle_request
+player_mood_logic.handle_request = lambda request: seen.append(set(request)) or original(request)
+try:
+    profiled = quiet(handle_engine_request, "player_mood_logic", {**moods, "profile": {"topN": 12, "sortBy": "self"}})
+finally:
+    player_mood_logic.handle_request = original
+check(seen == [{"action", "leagueData", "payload"}], f"engine saw {seen}")
+profile = profiled.pop("pythonProfile")
+check(profiled == quiet(player_mood_logic.handle_request, moods), "profiled moods differ")
+check_table(profile, "player_mood_logic", "get_locker_room_moods", 12, "selfMs")
+
+profiled = quiet(handle_engine_request, "retirement_logic", {**copy.deepcopy(retire), "profile": True})
+profile = profiled.pop("pythonProfile")
+check(profiled == direct, "profiled retirements differ")
+check_table(profile, "retirement_logic", "run_player_retirements", request_profiler.DEFAULT_TOP_N, "cumulativeMs")
+check(any(row["module"] == "retirement_logic" for row in profile["functions"]), "engine functions missing from the table")
+check(profile["functions"][0]["cumulativeMs"] <= profile["wallMs"] + 1.0, "cumulative time exceeds wall time")
+
+# 3. Global switch, session actions and per-request opt-out.
+settings = request_profiler.set_profiling(True, top_n=5)
+check(settings["enabled"] and settings["topN"] == 5, f"settings {settings}")
+try:
+    profiled = quiet(handle_engine_request, "retirement_logic", copy.deepcopy(retire))
+    check_table(profiled["pythonProfile"], "retirement_logic", "run_player_retirements", 5, "cumulativeMs")
+    skipped = quiet(handle_engine_request, "retirement_logic", {**copy.deepcopy(retire), "profile": False})
+    check("pythonProfile" not in skipped, "profile False did not opt out")
+    quiet(league_session.load_league, copy.deepcopy(league))
+    session = quiet(league_session.run_session_action, "player_mood", "get_locker_room_moods", {"teamName": team_name})
+    check_table(session["result"]["pythonProfile"], "player_mood_logic", "get_locker_room_moods", 5, "cumulativeMs")
+    league_session.clear_league()
+finally:
+    request_profiler.set_profiling(False, top_n=request_profiler.DEFAULT_TOP_N, sort_by="cumulative")
+check("pythonProfile" not in quiet(handle_engine_request, "retirement_logic", copy.deepcopy(retire)), "profiling stayed on")
+
+# 4. Arbitrary calls.
+wrapped = request_profiler.run_profiled("progression", "apply", lambda: {"ok": True}, {"topN": 3})
+check(wrapped["ok"] and wrapped["pythonProfile"]["engine"] == "progression", "run_profiled did not attach a profile")
+check(request_profiler.run_profiled("progression", "apply", lambda: [1, 2], True) == [1, 2], "non-dict results must pass through")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "profiler": request_profiler.PROFILER_NAME,
+    "retirementTop5": [f"{row['module']}.{row['function']} {row['cumulativeMs']}ms" for row in profile["functions"][:5]],
+}, indent=2))
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""SeasonStatsStore must hold exactly the totals the calendar would build.
+
+1. A store filled with record_game() from a fixture slate run through
+   game_sim.simulate_games_batch must equal a recount of the same box scores
+   using the calendar's applyGameToPlayerStats rules ("5/11" strings,
+   top-5-by-minutes starters), and stores over two halves of the slate must
+   merge into it. Repeated for the NumPy box-score backend when NumPy is
+   installed.
+2. to_columns / from_columns must round-trip.
+3. Progression (_stat_lookup), retirement (get_player_stats_entry), the
+   all-star normalizer and compute_awards must read a store, its columnar
+   payload and the plain stats_by_key dict identically.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import pathlib
+import random
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import all_star_logic  # noqa: E402
+import awards  # noqa: E402
+import game_sim  # noqa: E402
+import progression  # noqa: E402
+import retirement_logic  # noqa: E402
+from season_stats_store import STAT_FIELDS, SeasonStatsStore, coerce_stats_store  # noqa: E402
+
+SEED = 2027
+DATES = 6
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def fixture_teams():
+    league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+    teams = {}
+    for conference in league["conferences"].values():
+        for team in conference:
+            ranked = sorted(team["players"], key=lambda p: -p.get("overall", 0))
+            minutes = dict(zip((p["name"] for p in ranked), [36, 34, 32, 30, 28, 24, 20, 16, 12, 8]))
+            teams[team["name"]] = {"name": team["name"], "players": team["players"], "minutes": minutes}
+    return league, teams
+
+
+def fixture_schedule(teams):
+    rng = random.Random(SEED)
+    names = sorted(teams)
+    schedule = []
+    for day in range(DATES):
+        rng.shuffle(names)
+        schedule += [
+            {"id": f"d{day}-g{i}", "home": names[2 * i], "away": names[2 * i + 1], "seed": SEED * 1000 + day * 100 + i}
+            for i in range(len(names) // 2)
+        ]
+    return schedule
+
+
+def minutes(value):
+    if isinstance(value, str) and ":" in value:
+        mins, _, secs = value.partition(":")
+        return float(mins or 0) + float(secs or 0) / 60.0
+    return float(value or 0)
+
+
+def pair(value):
+    made, _, attempted = str(value or "0/0").partition("/")
+    return int(made or 0), int(attempted or 0)
+
+
+def calendar_recount(schedule, results):
+    # Mirrors applyGameToPlayerStats in src/pages/Calendar.jsx.
+    stats = {}
+    for game in schedule:
+        result = results[game["id"]]
+        for side, team_name in (("box_home", game["home"]), ("box_away", game["away"])):
+            played = [r for r in result[side] if minutes(r.get("min")) > 0]
+            starters = {r["player"] for r in sorted(played, key=lambda r: -minutes(r.get("min")))[:5]}
+            for r in played:
+                cur = stats.setdefault(f"{r['player']}__{team_name}", {"player": r["player"], "team": team_name, **{f: 0 for f in STAT_FIELDS}})
+                cur["gp"] += 1
+                cur["min"] += minutes(r.get("min"))
+                for field in ("pts", "reb", "ast", "stl", "blk", "to", "pf"):
+                    cur[field] += float(r.get(field) or 0)
+                (fgm, fga), (tpm, tpa), (ftm, fta) = pair(r.get("fg")), pair(r.get("3p")), pair(r.get("ft"))
+                for field, value in (("fgm", fgm), ("fga", fga), ("tpm", tpm), ("tpa", tpa), ("ftm", ftm), ("fta", fta)):
+                    cur[field] += value
+                cur["started" if r["player"] in starters else "sixth"] += 1
+    return stats
+
+
+def run(teams, schedule):
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = game_sim.simulate_games_batch(teams, schedule, compact=True)
+    for row in rows:
+        check("error" not in row, f"{row['id']}: {row.get('error')}")
+    return {row["id"]: row["result"] for row in rows}
+
+
+def record(schedule, results):
+    store = SeasonStatsStore()
+    for game in schedule:
+        store.record_game(game["home"], game["away"], results[game["id"]])
+    return store
+
+
+def same_row(a, b, label):
+    for field in STAT_FIELDS:
+        check(abs(float(a.get(field, 0)) - float(b.get(field, 0))) < 1e-9, f"{label}: {field} {a.get(field)} != {b.get(field)}")
+
+
+def check_backend(teams, schedule, label):
+    results = run(teams, schedule)
+    store = record(schedule, results)
+    check(store.games_recorded == len(schedule), f"{label}: store recorded {store.games_recorded} games")
+
+    expected = calendar_recount(schedule, results)
+    check(set(store) == set(expected), f"{label}: store keys differ from the calendar recount")
+    for key, row in expected.items():
+        same_row(store[key], row, f"{label} {key}")
+
+    # Two stores over halves of the slate merge into the whole.
+    half = len(schedule) // 2
+    merged = record(schedule[:half], results).merge(record(schedule[half:], results))
+    check(merged.games_recorded == len(schedule), f"{label}: merge lost games")
+    for key in expected:
+        same_row(merged[key], store[key], f"{label} merged {key}")
+    return store, expected
+
+
+league, teams = fixture_teams()
+schedule = fixture_schedule(teams)
+
+store, stats_by_key = check_backend(teams, schedule, "python")
+backends = ["python"]
+if game_sim.set_box_score_backend("numpy") == "numpy":
+    try:
+        check_backend(teams, schedule, "numpy")
+        backends.append("numpy")
+    finally:
+        game_sim.set_box_score_backend("python")
+
+# 2. Columnar transport.
+columns = json.loads(json.dumps(store.to_columns()))
+restored = coerce_stats_store(columns)
+check(list(restored) == list(store), "from_columns changed the key order")
+check(restored.games_recorded == store.games_recorded, "from_columns lost gamesRecorded")
+for key in store:
+    check(restored[key] == store[key], f"round trip changed {key}")
+rebuilt = coerce_stats_store(stats_by_key)
+for key in store:
+    same_row(rebuilt[key], store[key], f"from_stats {key}")
+
+# 3. Consumers read dict, store and columns the same way.
+sources = {"dict": stats_by_key, "store": store}
+players = [p for conference in league["conferences"].values() for team in conference for p in team["players"]]
+team_of = {p["name"]: team["name"] for conference in league["conferences"].values() for team in conference for p in team["players"]}
+for p in players:
+    team_name = team_of[p["name"]]
+    looked = {name: progression._stat_lookup(progression._season_stats_source(src), p, team_name) for name, src in sources.items()}
+    looked["columns"] = progression._stat_lookup(progression._season_stats_source(columns), p, team_name)
+    check((looked["dict"] is None) == (looked["store"] is None) == (looked["columns"] is None), f"{p['name']}: progression lookup presence")
+    if looked["dict"] is not None:
+        same_row(looked["store"], looked["dict"], f"progression {p['name']}")
+        same_row(looked["columns"], looked["dict"], f"progression columns {p['name']}")
+
+    entries = {name: retirement_logic.get_player_stats_entry(retirement_logic._season_stats_source(src), p["name"], team_name) for name, src in sources.items()}
+    check(bool(entries["dict"]) == bool(entries["store"]), f"{p['name']}: retirement lookup presence")
+    check(
+        retirement_logic.extract_games_played(entries["dict"]) == retirement_logic.extract_games_played(entries["store"]),
+        f"{p['name']}: retirement games played",
+    )
+    check(
+        abs(retirement_logic.extract_minutes_per_game(entries["dict"]) - retirement_logic.extract_minutes_per_game(entries["store"])) < 1e-9,
+        f"{p['name']}: retirement minutes per game",
+    )
+
+
+def all_star_view(rows):
+    return sorted(sorted(r.items()) for r in rows)
+
+
+
+check(
+    all_star_view(all_star_logic._normalize_player_stats(stats_by_key)) == all_star_view(all_star_logic._normalize_player_stats(columns)),
+    "all-star normalization differs between dict and columns",
+)
+
+team_rows = [{"name": name, "team": name, "wins": 3, "losses": 3} for name in teams]
+with contextlib.redirect_stdout(io.StringIO()):
+    from_rows = awards.compute_awards(list(stats_by_key.values()), team_rows, SEED)
+    from_columns = awards.compute_awards(columns, team_rows, SEED, {})
+check(from_rows == from_columns, "compute_awards differs between rows and the columnar store")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "games": len(schedule),
+    "rows": len(store),
+    "storeBytes": store.nbytes(),
+    "backends": backends,
+}, indent=2))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Native slate simulation matches the per-game path game for game.
+
+The calendar now sends a date's pending games through
+game_sim.simulate_games_batch (simulateGamesBatch in simEnginePy.js) instead
+of one simulate-single message per game. This runs a fixture slate both ways
+with fixed seeds:
+
+1. Batch results equal awaiting simulate_game per game with
+   make_game_rng(seed, game id) and cooperative yields on, exactly as the
+   simulate-single worker message does.
+2. Per-game minutes overrides (injury-safe rotations) equal a single game run
+   with that gameplan on the team, and never leak into the resident roster.
+3. A game with an unknown team reports an error without aborting the slate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import io
+import json
+import pathlib
+import random
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import game_sim  # noqa: E402
+from league_runner import build_rotation  # noqa: E402
+
+SEED = 2027
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def fixture_teams():
+    league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+    return {
+        team["name"]: build_rotation(team)
+        for conference in league["conferences"].values()
+        for team in conference
+    }
+
+
+def fixture_slate(teams):
+    names = sorted(teams)
+    random.Random(SEED).shuffle(names)
+    return [
+        {"id": f"2027-11-01-{i}", "home": names[2 * i], "away": names[2 * i + 1], "seed": SEED * 1000 + i}
+        for i in range(len(names) // 2)
+    ]
+
+
+def rest_starter(team):
+    """Injury-safe style override: the starter sits, the bench absorbs it."""
+    minutes = dict(team["minutes"])
+    ranked = sorted(minutes, key=lambda name: -minutes[name])
+    freed = minutes.pop(ranked[0])
+    minutes[ranked[1]] += freed
+    return minutes
+
+
+def run_batch(teams, matchups):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return game_sim.simulate_games_batch(teams, matchups, compact=True)
+
+
+def run_single(teams, matchup):
+    home = teams[matchup["home"]]
+    away = teams[matchup["away"]]
+    if matchup.get("homeMinutes"):
+        home = {**home, "minutes": matchup["homeMinutes"]}
+    if matchup.get("awayMinutes"):
+        away = {**away, "minutes": matchup["awayMinutes"]}
+    rng = game_sim.make_game_rng(matchup.get("seed"), matchup["id"])
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = asyncio.run(game_sim.simulate_game(home, away, rng))
+    return game_sim._compact_game_result(result)
+
+
+teams = fixture_teams()
+slate = fixture_slate(teams)
+check(len(slate) >= 10, "fixture slate is unexpectedly small")
+
+# 1. Batch equals the per-game path.
+batch = run_batch(teams, slate)
+check([row["id"] for row in batch] == [m["id"] for m in slate], "batch reordered or lost games")
+for matchup, row in zip(slate, batch):
+    check("error" not in row, f"{matchup['id']}: {row.get('error')}")
+    check(row["result"] == run_single(teams, matchup), f"{matchup['id']}: batch differs from simulate_game")
+
+# 2. Minutes overrides.
+untouched = copy.deepcopy(teams)
+overridden = [
+    {**m, "homeMinutes": rest_starter(teams[m["home"]])} if i % 2 == 0 else {**m, "awayMinutes": rest_starter(teams[m["away"]])}
+    for i, m in enumerate(slate)
+]
+override_batch = run_batch(teams, overridden)
+for matchup, row, plain in zip(overridden, override_batch, batch):
+    check(row["result"] == run_single(teams, matchup), f"{matchup['id']}: override differs from simulate_game")
+    check(row["result"] != plain["result"], f"{matchup['id']}: minutes override had no effect")
+check(teams == untouched, "minutes override leaked into the resident rosters")
+
+# 3. One bad game does not abort the slate.
+broken = slate[:2] + [{"id": "bad", "home": "No Such Team", "away": slate[0]["away"], "seed": 1}] + slate[2:4]
+broken_rows = run_batch(teams, broken)
+check("error" in broken_rows[2] and broken_rows[2]["id"] == "bad", "unknown team did not report an error")
+check([row["result"] for row in broken_rows[:2] + broken_rows[3:]] == [row["result"] for row in batch[:4]], "a failed game changed the others")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "gamesPerSlate": len(slate),
+}, indent=2))
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Per-game RNG streams make a slate independent of how it is split across workers.
+
+The calendar's sim pool hands each game of a date to whichever worker is
+free, with a seed derived from the game id. This runs a fixture slate through
+game_sim.simulate_games_batch in schedule order, reversed, and partitioned
+round-robin over 2/3/4 "workers" (other games interleaved in between), and
+checks every game comes out identical. Repeated for the NumPy box-score
+backend when NumPy is installed.
+
+Then the game-id keyed streams (master seed + season + game id) must be
+stable, must leave the global random module untouched, and must give both
+box-score engines the same score, quarters and minutes game for game.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import pathlib
+import random
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import box_score_numpy  # noqa: E402
+import game_sim  # noqa: E402
+
+SEED = 2027
+POOL_SIZES = (2, 3, 4)
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def fixture_teams():
+    league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+    teams = {}
+    for conference in league["conferences"].values():
+        for team in conference:
+            ranked = sorted(team["players"], key=lambda p: -p.get("overall", 0))
+            minutes = dict(zip((p["name"] for p in ranked), [36, 34, 32, 30, 28, 24, 20, 16, 12, 8]))
+            teams[team["name"]] = {"name": team["name"], "players": team["players"], "minutes": minutes}
+    return teams
+
+
+def fixture_slate(teams):
+    # One date: every team plays at most once.
+    names = sorted(teams)
+    random.Random(SEED).shuffle(names)
+    return [
+        {"id": f"2027-11-01-{i}", "home": names[2 * i], "away": names[2 * i + 1], "seed": SEED * 1000 + i}
+        for i in range(len(names) // 2)
+    ]
+
+
+def perturb_global_rngs(seed):
+    random.seed(seed)
+    box_score_numpy.seed_box_score_rng(seed)
+
+
+def run(teams, matchups):
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = game_sim.simulate_games_batch(teams, matchups, compact=True)
+    for row in rows:
+        check("error" not in row, f"{row['id']}: {row.get('error')}")
+    return {row["id"]: row["result"] for row in rows}
+
+
+def check_backend(teams, slate, label):
+    baseline = run(teams, slate)
+    check(len(baseline) == len(slate), f"{label}: slate lost games")
+    check(run(teams, slate) == baseline, f"{label}: rerun of the same slate differs")
+    check(run(teams, list(reversed(slate))) == baseline, f"{label}: reversed order changed results")
+
+    noise_rng = random.Random(SEED + 1)
+    for workers in POOL_SIZES:
+        merged = {}
+        for w in range(workers):
+            # Each worker's RNG state is whatever its previous games left.
+            perturb_global_rngs(noise_rng.randrange(2**31))
+            merged.update(run(teams, slate[w::workers]))
+        check(merged == baseline, f"{label}: {workers}-worker split changed results")
+
+    unseeded = [{k: v for k, v in m.items() if k != "seed"} for m in slate]
+    perturb_global_rngs(SEED + 2)
+    check(run(teams, unseeded) != baseline, f"{label}: seeds had no effect")
+
+
+teams = fixture_teams()
+slate = fixture_slate(teams)
+check(len(slate) >= 10, "fixture slate is unexpectedly small")
+
+backends = ["python"]
+check_backend(teams, slate, "python")
+if game_sim.set_box_score_backend("numpy") == "numpy":
+    try:
+        check_backend(teams, slate, "numpy")
+        backends.append("numpy")
+    finally:
+        game_sim.set_box_score_backend("python")
+
+# Master-seed streams keyed by (season, game id).
+unseeded = [{k: v for k, v in m.items() if k != "seed"} for m in slate]
+check(game_sim.make_game_rng(game_id="x") is None, "no master seed must keep the global stream")
+check(game_sim.set_game_rng_master_seed(SEED) == SEED, "master seed not set")
+try:
+    keyed = run(teams, unseeded)
+    perturb_global_rngs(SEED + 3)
+    check(run(teams, list(reversed(unseeded))) == keyed, "keyed streams depend on slate order")
+    check(game_sim.game_rng_seed("g1", 2027, SEED) == game_sim.game_rng_seed("g1", 2027, SEED), "stream seed is not stable")
+    check(game_sim.game_rng_seed("g1", 2027, SEED) != game_sim.game_rng_seed("g1", 2028, SEED), "season is not part of the key")
+    next_season = run(teams, [{**m, "season": 2028} for m in unseeded])
+    check(next_season != keyed, "season did not change the stream")
+
+    random.seed(SEED + 4)
+    before = random.getstate()
+    run(teams, unseeded)
+    check(random.getstate() == before, "a streamed game drew from the global random module")
+
+    if "numpy" in backends:
+        game_sim.set_box_score_backend("numpy")
+        try:
+            array_keyed = run(teams, unseeded)
+        finally:
+            game_sim.set_box_score_backend("python")
+        for game_id, result in keyed.items():
+            other = array_keyed[game_id]
+            check(result["score"] == other["score"], f"{game_id}: engines disagree on the score")
+            check(result["quarters_home"] == other["quarters_home"], f"{game_id}: engines disagree on quarters")
+            minutes = lambda box: [(r["player"], r["min"]) for r in box]
+            check(minutes(result["box_home"]) == minutes(other["box_home"]), f"{game_id}: engines disagree on minutes")
+finally:
+    game_sim.set_game_rng_master_seed(None)
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "gamesPerSlate": len(slate),
+    "backends": backends,
+}, indent=2))
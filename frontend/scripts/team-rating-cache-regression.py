@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Memoized team ratings in public/python/game_sim.py.
+
+1. For every fixture team, compute_team_ratings() equals a fresh
+   _compute_team_ratings_uncached(), and a repeat call is a cache hit.
+2. Roster changes (a player added, removed or rested) and in-place attribute
+   edits (overall, off/def rating, stamina, positions, minutes) miss the cache
+   and return the fresh ratings.
+3. Fields the ratings never read leave the signature, and the hit, alone.
+4. invalidate_team_ratings(name) drops only that team's entries;
+   invalidate_team_ratings() drops them all.
+5. The cache stays bounded by TEAM_RATING_CACHE_MAX.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import game_sim  # noqa: E402
+from league_runner import build_rotation  # noqa: E402
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def fresh(team):
+    return game_sim._compute_team_ratings_uncached(team, team["minutes"])
+
+
+def cached(team):
+    return game_sim.compute_team_ratings(team, team["minutes"])
+
+
+def stats():
+    return game_sim.get_team_rating_cache_stats()
+
+
+def expect_miss(team, label):
+    misses = stats()["misses"]
+    result = cached(team)
+    check(stats()["misses"] == misses + 1, f"{label}: served from the cache")
+    check(result == fresh(team), f"{label}: cached ratings differ from a fresh computation")
+
+
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+teams = [build_rotation(team) for conference in league["conferences"].values() for team in conference]
+game_sim.invalidate_team_ratings()
+
+# 1. Every team, cold then warm.
+for team in teams:
+    first = cached(team)
+    check(first == fresh(team), f"{team['name']}: cached ratings differ from a fresh computation")
+    hits = stats()["hits"]
+    check(cached(copy.deepcopy(team)) is first and stats()["hits"] == hits + 1, f"{team['name']}: repeat call missed")
+check(stats()["size"] == len(teams), "one entry per team expected")
+
+# 2. Roster and attribute changes.
+team = copy.deepcopy(teams[0])
+playing = [p for p in team["players"] if team["minutes"].get(p["name"], 0) > 0]
+star, bench = playing[0], playing[-1]
+
+for field, choices in (("overall", (40, 41)), ("offRating", (41, 42)), ("defRating", (42, 43)), ("stamina", (30, 31)), ("pos", ("C", "PG")), ("secondaryPos", ("PF", "SG"))):
+    star[field] = next(value for value in choices if value != star.get(field))
+    expect_miss(team, f"in-place {field} edit")
+
+rested = team["minutes"].pop(star["name"])
+team["minutes"][bench["name"]] += rested
+expect_miss(team, "starter rested")
+
+team["players"].remove(bench)
+expect_miss(team, "player removed")
+
+signing = copy.deepcopy(teams[1]["players"][0])
+team["players"].append(signing)
+team["minutes"][signing["name"]] = team["minutes"].pop(playing[1]["name"])
+expect_miss(team, "player added")
+
+# 3. Unread fields.
+hits = stats()["hits"]
+for player in team["players"]:
+    player["age"] = 99
+    player["contract"] = {"salaryByYear": [1]}
+cached(team)
+check(stats()["hits"] == hits + 1, "a field the ratings never read changed the signature")
+
+# 4. Invalidation.
+other = teams[2]
+size = stats()["size"]
+dropped = game_sim.invalidate_team_ratings(team["name"])
+check(dropped >= 1 and stats()["size"] == size - dropped, "invalidate_team_ratings(name) dropped the wrong entries")
+expect_miss(team, "after invalidating the team")
+hits = stats()["hits"]
+cached(other)
+check(stats()["hits"] == hits + 1, "invalidating one team dropped another")
+game_sim.invalidate_team_ratings()
+check(stats()["size"] == 0, "invalidate_team_ratings() left entries")
+expect_miss(other, "after invalidating every team")
+
+# 5. Bound.
+for i in range(game_sim.TEAM_RATING_CACHE_MAX + 20):
+    variant = {**teams[i % len(teams)], "name": f"Variant {i}"}
+    cached(variant)
+check(stats()["size"] == game_sim.TEAM_RATING_CACHE_MAX, "the cache grew past TEAM_RATING_CACHE_MAX")
+
+print(json.dumps({"status": "PASS", "checks": checks, **stats()}, indent=2))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Pruned Trade Finder search must pick the same offers as the full search.
+
+build_best_offer_for_team used to evaluate_trade every deduped combo from
+_candidate_combos for every team. This keeps that loop as the reference and
+runs fixture searches (single stars, role players, player + pick packages,
+several selecting teams) through both. Every team's best offer must match:
+same assets in the same order, same score, gap and evaluation. Also reports
+the wall time of both searches.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import trade_negotiation_logic as tn  # noqa: E402
+from trade_team_ai import get_team_preferences  # noqa: E402
+from trade_value_model import candidate_assets_for_team, get_owned_picks_for_team, player_overall  # noqa: E402
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+def reference_best_offer(team, selected_team_name, selected_package, league_state, team_context):
+    """The pre-pruning search: every combo through the full evaluate_trade."""
+    team_name = tn._team_name(team)
+    if not team_name or tn._same_team(team_name, selected_team_name):
+        return None
+    prefs = get_team_preferences(team, team_context)
+    candidates = candidate_assets_for_team(team, league_state, prefs)
+    if not candidates:
+        return None
+
+    best = None
+    best_sort_key = None
+    for combo in tn._candidate_combos(candidates, int(tn.NEGOTIATION_KNOBS["maxFinderOfferAssets"])):
+        evaluation = tn.evaluate_trade({
+            "userTeam": selected_team_name,
+            "cpuTeam": team_name,
+            "cpuTeamObject": team,
+            "teamContext": team_context,
+            "cpuReceives": selected_package,
+            "cpuSends": tn._offer_items_to_package(combo),
+        })
+        score = tn._num(evaluation.get("score"), -999)
+        offer_value = tn._num((evaluation.get("cpuSends") or {}).get("totalValue"), 0.0)
+        target_value = tn._num((evaluation.get("cpuReceives") or {}).get("totalValue"), 0.0)
+        gap = offer_value - target_value
+        if evaluation.get("decision") != "accept" or not evaluation.get("accepted") or offer_value / max(target_value, 1.0) < 0.82:
+            continue
+        sort_key = tn._finder_sort_key(gap, score, len(combo))
+        if best is None or sort_key < best_sort_key:
+            best = {"offer": combo, "score": score, "gap": round(gap, 2), "evaluation": evaluation}
+            best_sort_key = sort_key
+    return best
+
+
+def fixture():
+    league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+    teams = [team for conference in league["conferences"].values() for team in conference]
+    return teams, {"draftPicks": league.get("draftPicks") or []}
+
+
+def searches(teams, league_state):
+    for team in teams[::10]:
+        ranked = sorted(team["players"], key=lambda p: -player_overall(p))
+        picks = get_owned_picks_for_team(league_state, team["name"])
+        packages = [
+            [ranked[0]],
+            [ranked[3]],
+            [ranked[1], ranked[6]],
+        ]
+        for players in packages:
+            yield team, [{"type": "player", "player": p} for p in players]
+        if picks:
+            yield team, [{"type": "player", "player": ranked[4]}, {"type": "pick", "pick": picks[0]}]
+
+
+teams, league_state = fixture()
+timings = {"pruned": 0.0, "reference": 0.0}
+offers_found = 0
+cases = 0
+
+for selected_team, items in searches(teams, league_state):
+    cases += 1
+    package = tn._selected_items_to_package(items)
+    for team in teams:
+        started = time.perf_counter()
+        fast = tn.build_best_offer_for_team(team, selected_team["name"], package, league_state, {})
+        timings["pruned"] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        slow = reference_best_offer(team, selected_team["name"], package, league_state, {})
+        timings["reference"] += time.perf_counter() - started
+
+        label = f"{selected_team['name']} {[i.get('player', i.get('pick', {})).get('name') for i in items]} -> {team['name']}"
+        check((fast is None) == (slow is None), f"{label}: one search found an offer, the other did not")
+        if fast is None:
+            continue
+        offers_found += 1
+        check([a["label"] for a in fast["offer"]] == [a["label"] for a in slow["offer"]], f"{label}: different offer")
+        check(fast["score"] == slow["score"], f"{label}: score {fast['score']} != {slow['score']}")
+        check(fast["gap"] == slow["gap"], f"{label}: gap {fast['gap']} != {slow['gap']}")
+        check(fast["evaluation"] == slow["evaluation"], f"{label}: evaluation differs")
+
+    search = {"selectedTeamName": selected_team["name"], "selectedItems": items, "teams": teams, **league_state}
+    result = tn.find_trade_offers(search)
+    check(result["ok"], f"{selected_team['name']}: find_trade_offers failed")
+
+check(offers_found > 0, "fixture searches found no offers at all")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "searches": cases,
+    "offersCompared": offers_found,
+    "seconds": {k: round(v, 2) for k, v in timings.items()},
+    "speedup": round(timings["reference"] / max(timings["pruned"], 1e-9), 1),
+}, indent=2))
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Memoized trade values must equal the uncached formulas.
+
+1. Every fixture player and pick, valued from every phase (plus the team
+   personality overrides), must match _player_trade_value_uncached /
+   _pick_trade_value_uncached; a second pass must be all cache hits.
+2. Rating, age and contract edits must produce fresh values (no stale hits),
+   and invalidate_* must drop exactly that player's or pick's entries.
+3. Trade Finder searches on a cold and a warm cache must return the same
+   offers; the warm run reports its hit rate and the timing of both.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import pathlib
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "public" / "python"
+LEAGUE_FILE = ROOT.parent / "2027_roster_FINAL_core_awards_DIVISIONS.json"
+sys.path.insert(0, str(PYTHON_DIR))
+
+import trade_negotiation_logic as tn  # noqa: E402
+import trade_value_model as tv  # noqa: E402
+from trade_team_ai import PHASE_PREFERENCES, TEAM_PERSONALITY_OVERRIDES, get_team_preferences  # noqa: E402
+
+checks = 0
+
+
+def check(condition, message):
+    global checks
+    checks += 1
+    if not condition:
+        raise AssertionError(message)
+
+
+league = json.loads(LEAGUE_FILE.read_text(encoding="utf-8"))
+teams = [team for conference in league["conferences"].values() for team in conference]
+players = [p for team in teams for p in team["players"]]
+picks = league.get("draftPicks") or []
+
+viewpoints = [None] + [{"phase": phase, "preferences": dict(prefs)} for phase, prefs in PHASE_PREFERENCES.items()]
+viewpoints += [get_team_preferences(name, {}) for name in TEAM_PERSONALITY_OVERRIDES]
+
+# 1. Cached == uncached, then all hits.
+tv.clear_trade_value_cache()
+for prefs in viewpoints:
+    for p in players:
+        check(tv.player_trade_value(p, prefs) == tv._player_trade_value_uncached(p, prefs), f"{p['name']}: cached player value")
+    for pick in picks:
+        check(tv.pick_trade_value(pick, prefs) == tv._pick_trade_value_uncached(pick, prefs), f"{tv.pick_label(pick)}: cached pick value")
+first = tv.trade_value_cache_stats()
+for prefs in viewpoints:
+    for p in players:
+        tv.player_trade_value(p, prefs)
+    for pick in picks:
+        tv.pick_trade_value(pick, prefs)
+second = tv.trade_value_cache_stats()
+check(second["playerMisses"] == first["playerMisses"], "second player pass missed the cache")
+check(second["pickMisses"] == first["pickMisses"], "second pick pass missed the cache")
+
+# 2. Edits are never served stale values; invalidation is targeted.
+prefs = viewpoints[1]
+star = copy.deepcopy(max(players, key=tv.player_overall))
+base = tv.player_trade_value(star, prefs)
+edits = [
+    ("overall", lambda p: p.__setitem__("overall", tv.player_overall(p) - 6)),
+    ("age", lambda p: p.__setitem__("age", tv.player_age(p) + 5)),
+    ("contract", lambda p: p.setdefault("contract", {}).__setitem__("salaryByYear", [55_000_000] * 5)),
+]
+for field, edit in edits:
+    edited = copy.deepcopy(star)
+    edit(edited)
+    value = tv.player_trade_value(edited, prefs)
+    check(value == tv._player_trade_value_uncached(edited, prefs), f"{field} edit served a stale value")
+    check(value != base, f"{field} edit did not change the value")
+check(tv.player_trade_value(star, prefs) == base, "original player value changed")
+
+other = players[0] if players[0]["name"] != star["name"] else players[1]
+before = tv.trade_value_cache_stats()["playerEntries"]
+removed = tv.invalidate_player_trade_value(star)
+check(removed >= 1 + len(edits), f"invalidate removed {removed} entries")
+check(tv.trade_value_cache_stats()["playerEntries"] == before - removed, "invalidate removed other players")
+misses = tv.trade_value_cache_stats()["playerMisses"]
+tv.player_trade_value(other, prefs)
+check(tv.trade_value_cache_stats()["playerMisses"] == misses, "invalidating one player evicted another")
+if picks:
+    check(tv.invalidate_pick_trade_value(picks[0]) >= 1, "pick invalidation removed nothing")
+
+# 3. Trade Finder, cold vs warm.
+selected = teams[0]
+ranked = sorted(selected["players"], key=lambda p: -tv.player_overall(p))
+search = {
+    "selectedTeamName": selected["name"],
+    "selectedItems": [{"type": "player", "player": ranked[0]}, {"type": "player", "player": ranked[4]}],
+    "teams": teams,
+    "draftPicks": picks,
+}
+tv.clear_trade_value_cache()
+started = time.perf_counter()
+cold = tn.find_trade_offers(search)
+cold_ms = (time.perf_counter() - started) * 1000
+started = time.perf_counter()
+warm = tn.find_trade_offers(search)
+warm_ms = (time.perf_counter() - started) * 1000
+check(cold["ok"] and cold["offers"], "fixture search found no offers")
+check(cold["offers"] == warm["offers"], "warm cache changed Trade Finder offers")
+check(warm["valueCache"]["playerHitRate"] > cold["valueCache"]["playerHitRate"], "warm search did not hit the cache more")
+
+print(json.dumps({
+    "status": "PASS",
+    "checks": checks,
+    "finderMs": {"cold": round(cold_ms, 1), "warm": round(warm_ms, 1)},
+    "coldSearchCache": cold["valueCache"],
+    "afterWarmSearchCache": warm["valueCache"],
+}, indent=2))
@@ -1,5 +1,7 @@
 // src/api/cpuTradeEngine.js
-// JS wrapper around a persistent pool of season CPU-to-CPU trade Pyodide workers.
+// JS wrapper around season CPU-to-CPU trade generation. Each request is a job
+// on the page's shared Pyodide pool (pythonWorkerPool.js), so generation
+// passes, sims and trade requests share one global worker cap.
 //
 // V5B preservation rule:
 // - every worker still executes the original cpu_cpu_trade_logic.py generator;
@@ -15,23 +17,29 @@ import {
   recordCpuTradeTrace,
   setCpuTradeRuntimeGauge,
 } from "../utils/cpuTradeTelemetry.js";
+import {
+  abandonPythonPoolJob,
+  dispatchPythonPoolJob,
+  getPythonPoolStats,
+  postToEveryPythonPoolWorker,
+  releasePythonPoolJob,
+} from "./pythonWorkerPool.js";
 
-const MAX_GENERATION_WORKERS = 4;
 const REQUEST_TIMEOUT_MS = 30000;
 const CPU_TRADE_HISTORY_LIMIT = 120;
 
-let workerSlots = [];
 let counter = 0;
 const pending = new Map();
-const queuedRequestIds = [];
 
 function generationPoolSnapshot() {
-  const activeWorkers = workerSlots.filter((slot) => slot?.busy).length;
+  const entries = [...pending.values()];
+  const pool = getPythonPoolStats();
+  const activeWorkers = entries.filter((entry) => entry.status === "running").length;
   return {
-    workerCount: workerSlots.length,
+    workerCount: pool.size,
     activeWorkers,
-    idleWorkers: Math.max(0, workerSlots.length - activeWorkers),
-    queuedRequests: queuedRequestIds.length,
+    idleWorkers: Math.max(0, pool.size - pool.busy),
+    queuedRequests: entries.filter((entry) => entry.status === "queued").length,
     pendingRequests: pending.size,
   };
 }
@@ -51,13 +59,6 @@ export function getCpuTradeGenerationPoolStatus() {
   return generationPoolSnapshot();
 }
 
-function desiredWorkerCount() {
-  let hardware = 4;
-  try {
-    hardware = Math.max(2, Number(globalThis?.navigator?.hardwareConcurrency || 4));
-  } catch {}
-  return hardware >= 12 ? 4 : hardware >= 8 ? 3 : 2;
-}
 
 function makeCpuTradeCancellationError(reason = "cancelled") {
   const error = new Error(`CPU_CPU_TRADE_CANDIDATES_CANCELLED:${reason}`);
@@ -170,13 +171,12 @@ function deepSanitize(value, seen = new WeakSet()) {
   return null;
 }
 
-function replaceWorkerSlot(slotIndex, reason = "worker_reset") {
-  const previous = workerSlots[slotIndex];
-  try { previous?.worker?.terminate(); } catch {}
-  workerSlots[slotIndex] = makeWorkerSlot(slotIndex);
-  try {
-    workerSlots[slotIndex]?.worker?.postMessage({ type: "cpu-cpu-trade-prewarm" });
-  } catch {}
+// A timed-out or cancelled request gives its pool job up: a queued job is
+// dropped, and a running one has its worker replaced (the main worker is
+// kept and freed by the late reply instead).
+function abandonWorkerJob(requestId, reason = "worker_reset") {
+  const { state, slotIndex } = abandonPythonPoolJob(requestId);
+  if (state !== "replaced") return;
   recordCpuTradeGenerationJob({
     event: "worker_replaced",
     workerIndex: slotIndex,
@@ -184,18 +184,12 @@ function replaceWorkerSlot(slotIndex, reason = "worker_reset") {
   });
 }
 
-function finishEntry(requestId, { payload = null, error = null, event = "fulfilled", dispatch = true } = {}) {
+function finishEntry(requestId, { payload = null, error = null, event = "fulfilled" } = {}) {
   const entry = pending.get(requestId);
   if (!entry) return;
   pending.delete(requestId);
   clearTimeout(entry.timer);
 
-  const slot = Number.isInteger(entry.slotIndex) ? workerSlots[entry.slotIndex] : null;
-  if (slot?.requestId === requestId) {
-    slot.busy = false;
-    slot.requestId = null;
-  }
-
   const workerRoundTripMs = cpuTradeNow() - Number(entry.assignedAt || entry.createdAt || cpuTradeNow());
   const candidateCount = Array.isArray(payload?.candidates) ? payload.candidates.length : 0;
   const traceEnabled = isCpuTradeDeepTraceEnabled();
@@ -253,139 +247,89 @@ function finishEntry(requestId, { payload = null, error = null, event = "fulfill
 
   if (error) entry.reject(error);
   else entry.resolve(payload || { ok: true, candidates: [] });
-
-  if (dispatch) dispatchQueuedRequests();
 }
 
-function makeWorkerSlot(index) {
-  const worker = new Worker("/workers/cpuTradeSeasonWorker.js");
-  const slot = {
-    index,
-    worker,
-    busy: false,
-    requestId: null,
-  };
-
-  worker.onmessage = (event) => {
-    const msg = event.data || {};
-    const requestId = msg.requestId;
-    if (!requestId || slot.requestId !== requestId) return;
-
-    if (msg.type === "cpu-cpu-trade-candidates-result") {
-      finishEntry(requestId, {
-        payload: msg.payload || { ok: true, candidates: [] },
-        event: "fulfilled",
-      });
-      return;
-    }
-
-    if (msg.type === "cpu-cpu-trade-candidates-error") {
-      finishEntry(requestId, {
-        error: new Error(msg.error || "CPU-to-CPU trade worker failed"),
-        event: "rejected",
-      });
-    }
-  };
-
-  worker.onerror = (workerError) => {
-    console.warn("[cpuTradeEngine] generation worker error", workerError);
-    const requestId = slot.requestId;
-    if (requestId) {
-      finishEntry(requestId, {
-        error: new Error("CPU_CPU_TRADE_WORKER_ERROR"),
-        event: "rejected",
-        dispatch: false,
-      });
-    }
-    replaceWorkerSlot(index, "worker_error");
-    dispatchQueuedRequests();
-  };
+function handleWorkerMessage(requestId, msg) {
+  if (msg.requestId !== requestId) return false;
 
-  return slot;
-}
+  if (msg.type === "cpu-cpu-trade-candidates-result") {
+    releasePythonPoolJob(requestId);
+    finishEntry(requestId, {
+      payload: msg.payload || { ok: true, candidates: [] },
+      event: "fulfilled",
+    });
+    return true;
+  }
 
-function ensureWorkerPool() {
-  const target = desiredWorkerCount();
-  while (workerSlots.length < target) {
-    workerSlots.push(makeWorkerSlot(workerSlots.length));
+  if (msg.type === "cpu-cpu-trade-candidates-error") {
+    releasePythonPoolJob(requestId);
+    finishEntry(requestId, {
+      error: new Error(msg.error || "CPU-to-CPU trade worker failed"),
+      event: "rejected",
+    });
+    return true;
   }
-  if (isCpuTradeDeepTraceEnabled()) publishGenerationPoolGauges();
-  return workerSlots;
-}
 
-function removeQueuedRequestId(requestId) {
-  const index = queuedRequestIds.indexOf(requestId);
-  if (index >= 0) queuedRequestIds.splice(index, 1);
+  return false;
 }
 
-function dispatchQueuedRequests() {
-  ensureWorkerPool();
-  for (const slot of workerSlots) {
-    if (slot.busy) continue;
+function postRequestToWorker(requestId, poolWorker, slot) {
+  const entry = pending.get(requestId);
+  if (!entry) {
+    releasePythonPoolJob(requestId);
+    return;
+  }
 
-    let requestId = null;
-    let entry = null;
-    while (queuedRequestIds.length && !entry) {
-      requestId = queuedRequestIds.shift();
-      entry = pending.get(requestId) || null;
-    }
-    if (!entry || !requestId) break;
-
-    slot.busy = true;
-    slot.requestId = requestId;
-    entry.slotIndex = slot.index;
-    entry.assignedAt = cpuTradeNow();
-    entry.status = "running";
-    entry.timer = setTimeout(() => {
-      const liveEntry = pending.get(requestId);
-      if (!liveEntry) return;
-      finishEntry(requestId, {
-        error: new Error("CPU_CPU_TRADE_CANDIDATES_TIMEOUT"),
-        event: "timeout",
-        dispatch: false,
-      });
-      replaceWorkerSlot(slot.index, "request_timeout");
-      dispatchQueuedRequests();
-    }, REQUEST_TIMEOUT_MS);
+  // A job re-posted after a worker failure restarts its timeout.
+  clearTimeout(entry.timer);
+  entry.slotIndex = slot.index;
+  entry.assignedAt = cpuTradeNow();
+  entry.status = "running";
+  entry.timer = setTimeout(() => {
+    const liveEntry = pending.get(requestId);
+    if (!liveEntry) return;
+    finishEntry(requestId, {
+      error: new Error("CPU_CPU_TRADE_CANDIDATES_TIMEOUT"),
+      event: "timeout",
+    });
+    abandonWorkerJob(requestId, "request_timeout");
+  }, REQUEST_TIMEOUT_MS);
 
-    const traceEnabled = isCpuTradeDeepTraceEnabled();
-    const assignedPool = traceEnabled ? publishGenerationPoolGauges() : null;
-    recordCpuTradeGenerationJob({
-      event: "assigned",
+  const traceEnabled = isCpuTradeDeepTraceEnabled();
+  const assignedPool = traceEnabled ? publishGenerationPoolGauges() : null;
+  recordCpuTradeGenerationJob({
+    event: "assigned",
+    requestId,
+    workerIndex: slot.index,
+    queueWaitMs: entry.assignedAt - Number(entry.createdAt || entry.assignedAt),
+    generationNonce: entry?.context?.generationNonce ?? null,
+    currentDate: entry?.context?.currentDate || "",
+  });
+  if (traceEnabled) {
+    recordCpuTradeTrace("generation", "assigned", {
       requestId,
       workerIndex: slot.index,
-      queueWaitMs: entry.assignedAt - Number(entry.createdAt || entry.assignedAt),
       generationNonce: entry?.context?.generationNonce ?? null,
       currentDate: entry?.context?.currentDate || "",
+      queueWaitMs: entry.assignedAt - Number(entry.createdAt || entry.assignedAt),
+      requestedCandidates: entry?.context?.maxCandidates ?? null,
+      pool: assignedPool,
     });
-    if (traceEnabled) {
-      recordCpuTradeTrace("generation", "assigned", {
-        requestId,
-        workerIndex: slot.index,
-        generationNonce: entry?.context?.generationNonce ?? null,
-        currentDate: entry?.context?.currentDate || "",
-        queueWaitMs: entry.assignedAt - Number(entry.createdAt || entry.assignedAt),
-        requestedCandidates: entry?.context?.maxCandidates ?? null,
-        pool: assignedPool,
-      });
-    }
+  }
 
-    try {
-      slot.worker.postMessage({
-        type: "cpu-cpu-trade-candidates",
-        requestId,
-        payload: entry.payload,
-        ...(traceEnabled ? { diagnosticsTraceEnabled: true } : {}),
-      });
-    } catch (postError) {
-      finishEntry(requestId, {
-        error: postError instanceof Error ? postError : new Error(String(postError || "worker_post_failed")),
-        event: "rejected",
-        dispatch: false,
-      });
-      replaceWorkerSlot(slot.index, "post_message_failed");
-      dispatchQueuedRequests();
-    }
+  try {
+    poolWorker.postMessage({
+      type: "cpu-cpu-trade-candidates",
+      requestId,
+      payload: entry.payload,
+      ...(traceEnabled ? { diagnosticsTraceEnabled: true } : {}),
+    });
+  } catch (postError) {
+    finishEntry(requestId, {
+      error: postError instanceof Error ? postError : new Error(String(postError || "worker_post_failed")),
+      event: "rejected",
+    });
+    abandonWorkerJob(requestId, "post_message_failed");
   }
 }
 
@@ -393,14 +337,13 @@ function cancelRequest(requestId, reason = "cancelled") {
   const entry = pending.get(requestId);
   if (!entry) return false;
 
-  removeQueuedRequestId(requestId);
   const error = makeCpuTradeCancellationError(reason);
 
-  if (entry.status === "running" && Number.isInteger(entry.slotIndex)) {
-    const slotIndex = entry.slotIndex;
-    finishEntry(requestId, { error, event: "cancelled", dispatch: false });
-    replaceWorkerSlot(slotIndex, reason);
+  if (entry.status === "running") {
+    finishEntry(requestId, { error, event: "cancelled" });
+    abandonWorkerJob(requestId, reason);
   } else {
+    abandonWorkerJob(requestId, reason);
     pending.delete(requestId);
     clearTimeout(entry.timer);
     recordCpuTradeGenerationJob({
@@ -414,7 +357,6 @@ function cancelRequest(requestId, reason = "cancelled") {
     entry.reject(error);
   }
 
-  dispatchQueuedRequests();
   return true;
 }
 
@@ -427,13 +369,10 @@ export function cancelCpuTradeWorkerGeneration(reason = "superseded", requestId
 }
 
 export function prewarmCpuTradeWorker() {
-  const slots = ensureWorkerPool();
-  for (const slot of slots) {
-    try { slot.worker.postMessage({ type: "cpu-cpu-trade-prewarm" }); } catch {}
-  }
+  const workerCount = postToEveryPythonPoolWorker({ type: "cpu-cpu-trade-prewarm" });
   recordCpuTradeGenerationJob({
     event: "pool_prewarm",
-    workerCount: slots.length,
+    workerCount,
   });
 }
 
@@ -449,7 +388,6 @@ function prepareCompactLeague(leagueData = {}) {
 }
 
 function enqueuePreparedRequest(compactLeague, context = {}, sharedDetails = {}) {
-  ensureWorkerPool();
   const requestId = `CCT${counter++}`;
   const payloadStartedAt = cpuTradeNow();
   const sanitizedContext = deepSanitize(context);
@@ -499,7 +437,6 @@ function enqueuePreparedRequest(compactLeague, context = {}, sharedDetails = {})
     resolve: resolvePromise,
     reject: rejectPromise,
   });
-  queuedRequestIds.push(requestId);
 
   const traceEnabled = isCpuTradeDeepTraceEnabled();
   const launchedPool = traceEnabled ? publishGenerationPoolGauges() : null;
@@ -530,7 +467,15 @@ function enqueuePreparedRequest(compactLeague, context = {}, sharedDetails = {})
     });
   }
 
-  dispatchQueuedRequests();
+  dispatchPythonPoolJob({
+    id: requestId,
+    post: (poolWorker, slot) => postRequestToWorker(requestId, poolWorker, slot),
+    onMessage: (msg) => handleWorkerMessage(requestId, msg),
+    fail: () => finishEntry(requestId, {
+      error: new Error("CPU_CPU_TRADE_WORKER_ERROR"),
+      event: "rejected",
+    }),
+  });
   return promise;
 }
 
@@ -595,7 +540,7 @@ export function startCpuCpuTradeCandidateBatch(leagueData, contexts = []) {
       passCount: rows.length,
       fulfilled,
       rejected,
-      workerCount: workerSlots.length,
+      workerCount: getPythonPoolStats().size,
     });
     recordCpuTradeGenerationJob({
       event: "parallel_batch_summary",
@@ -603,7 +548,7 @@ export function startCpuCpuTradeCandidateBatch(leagueData, contexts = []) {
       passCount: rows.length,
       fulfilledCount: fulfilled,
       rejectedCount: rejected,
-      workerCount: workerSlots.length,
+      workerCount: getPythonPoolStats().size,
       generationNonces: rows.map((row) => row?.generationNonce ?? null),
       currentDate: rows[0]?.currentDate || "",
     });
@@ -0,0 +1,199 @@
+// src/api/pythonWorkerPool.js
+// The page's one pool of Pyodide hosts (/workers/simWorkerV2.js).
+//
+// Games, slates, Trade Builder / Trade Finder requests and CPU/CPU trade
+// generation all queue here as jobs, so a trade request takes one slot while
+// games keep running on the others, and the page never starts more hosts
+// than getPythonWorkerPoolSize(): hardwareConcurrency - 1, at most 6.
+//
+// Slot 0 is the main worker. simEnginePy also sends it every offseason/engine
+// request directly, and it holds the league session, so it is never
+// terminated. Extras boot on the first pool job (not for offseason-only use)
+// and join once their runtime posts "ready". A slot runs one job at a time,
+// so a job's timeout starts when the job is posted.
+//
+// A job is { id, post(worker, slot), onMessage?(msg), fail?(reason) }.
+// onMessage sees the messages from the job's worker while the job holds the
+// slot and returns true for the ones it consumes; the job's owner then calls
+// releasePythonPoolJob(id). Messages no job consumes go to the handler set
+// with setPythonPoolMessageHandler (simEnginePy's main message switch).
+
+const PYTHON_POOL_MAX_SIZE = 6;
+const PYTHON_POOL_MIN_SIZE = 1;
+const PYTHON_WORKER_URL = "/workers/simWorkerV2.js";
+
+const pool = {
+  slots: [],
+  queue: [],
+  extrasStarted: false,
+  messageHandler: null,
+  extraReadyHook: null,
+};
+
+function hardwareConcurrency() {
+  const value = Number(globalThis?.navigator?.hardwareConcurrency || 1);
+  return Number.isFinite(value) && value > 0 ? value : 1;
+}
+
+// One core stays with the UI thread.
+export function getPythonWorkerPoolSize() {
+  const available = Math.max(PYTHON_POOL_MIN_SIZE, hardwareConcurrency() - 1);
+  return Math.max(PYTHON_POOL_MIN_SIZE, Math.min(PYTHON_POOL_MAX_SIZE, available));
+}
+
+function makeSlot(worker, index) {
+  return { worker, index, ready: false, busyId: null, busyJob: null, jobsRun: 0 };
+}
+
+function startSlot(index) {
+  const worker = new Worker(PYTHON_WORKER_URL);
+  const slot = makeSlot(worker, index);
+
+  worker.onmessage = (event) => {
+    const msg = event.data || {};
+    if (msg.type === "ready") {
+      if (index === 0) {
+        markSlotReady(slot);
+        pool.messageHandler?.(event);
+        return;
+      }
+      // Extras join once they run the same engine settings as the main worker.
+      const join = () => markSlotReady(slot);
+      if (pool.extraReadyHook) Promise.resolve(pool.extraReadyHook(worker)).then(join, join);
+      else join();
+      return;
+    }
+    if (slot.busyJob?.onMessage?.(msg)) return;
+    pool.messageHandler?.(event);
+  };
+
+  worker.addEventListener("error", (event) => {
+    console.error("[pythonWorkerPool] worker failed", index, event?.message || event);
+    const wasReady = slot.ready;
+    const job = slot.busyJob;
+    slot.busyId = null;
+    slot.busyJob = null;
+    if (index > 0) slot.ready = false;
+    if (job) {
+      // Another worker gets one more try; a job that also kills that one
+      // fails instead of taking the pool down.
+      if (!job.retried) {
+        job.retried = true;
+        pool.queue.unshift(job);
+      } else {
+        job.fail?.("WORKER_FAILED");
+      }
+    }
+    // A crashed extra is replaced; one that never booted stays out, so a
+    // runtime that cannot start is not respawned in a loop.
+    if (index > 0 && wasReady && pool.slots[index] === slot) replaceSlot(slot);
+    pumpPythonPool();
+  });
+
+  worker.postMessage({ type: "init" });
+  return slot;
+}
+
+function replaceSlot(slot) {
+  try { slot.worker.terminate(); } catch {}
+  pool.slots[slot.index] = startSlot(slot.index);
+}
+
+function markSlotReady(slot) {
+  slot.ready = true;
+  pumpPythonPool();
+}
+
+// The main worker carries the league session and every non-pool request.
+export function getPythonPoolMainWorker() {
+  if (!pool.slots.length) pool.slots.push(startSlot(0));
+  return pool.slots[0].worker;
+}
+
+export function ensurePythonPool() {
+  getPythonPoolMainWorker();
+  if (!pool.extrasStarted) {
+    pool.extrasStarted = true;
+    const size = getPythonWorkerPoolSize();
+    for (let index = 1; index < size; index++) pool.slots.push(startSlot(index));
+  }
+  return pool.slots;
+}
+
+export function setPythonPoolMessageHandler(handler) {
+  pool.messageHandler = handler;
+}
+
+// hook(worker) runs when an extra finishes booting, before it takes jobs.
+export function setPythonPoolExtraReadyHook(hook) {
+  pool.extraReadyHook = hook;
+}
+
+function pumpPythonPool() {
+  for (const slot of pool.slots) {
+    if (!pool.queue.length) return;
+    if (!slot.ready || slot.busyId !== null) continue;
+    const job = pool.queue.shift();
+    slot.busyId = job.id;
+    slot.busyJob = job;
+    slot.jobsRun += 1;
+    job.post(slot.worker, slot);
+  }
+}
+
+export function dispatchPythonPoolJob(job) {
+  ensurePythonPool();
+  pool.queue.push(job);
+  pumpPythonPool();
+}
+
+export function releasePythonPoolJob(id) {
+  const slot = pool.slots.find((s) => s.busyId === id);
+  if (!slot) return;
+  slot.busyId = null;
+  slot.busyJob = null;
+  pumpPythonPool();
+}
+
+// Drops a job whose caller gave up on it (timeout, cancellation). A queued
+// job leaves the queue. A running job on an extra has its worker terminated
+// and replaced. On the main worker the job keeps the slot until its reply
+// arrives. Returns { state: "queued" | "replaced" | "running" | null, slotIndex }.
+export function abandonPythonPoolJob(id) {
+  const queued = pool.queue.findIndex((job) => job.id === id);
+  if (queued >= 0) {
+    pool.queue.splice(queued, 1);
+    return { state: "queued", slotIndex: null };
+  }
+  const slot = pool.slots.find((s) => s.busyId === id);
+  if (!slot) return { state: null, slotIndex: null };
+  if (slot.index === 0) return { state: "running", slotIndex: 0 };
+  replaceSlot(slot);
+  pumpPythonPool();
+  return { state: "replaced", slotIndex: slot.index };
+}
+
+// Posts a fire-and-forget message (prewarm, settings) to every pool worker.
+export function postToEveryPythonPoolWorker(message) {
+  const slots = ensurePythonPool();
+  for (const slot of slots) {
+    try { slot.worker.postMessage(message); } catch {}
+  }
+  return slots.length;
+}
+
+export function forEachReadyPythonPoolWorker(fn) {
+  return ensurePythonPool()
+    .filter((slot) => slot.index === 0 || slot.ready)
+    .map((slot) => fn(slot.worker, slot));
+}
+
+export function getPythonPoolStats() {
+  return {
+    size: pool.slots.length,
+    ready: pool.slots.filter((s) => s.ready).length,
+    busy: pool.slots.filter((s) => s.busyId !== null).length,
+    queued: pool.queue.length,
+    jobsBySlot: pool.slots.map((s) => s.jobsRun),
+  };
+}
@@ -20,9 +20,104 @@ import {
   buildCpuRosterRepairFastPathBaseline,
   canUseTargetedCpuRosterRepairFastPath,
 } from "../utils/cpuRosterRepairFastPath.js";
+import { packSeasonStatsColumns } from "../utils/seasonStatsColumns.js";
+import {
+  abandonPythonPoolJob,
+  dispatchPythonPoolJob,
+  ensurePythonPool,
+  forEachReadyPythonPoolWorker,
+  getPythonPoolMainWorker,
+  getPythonPoolStats,
+  getPythonWorkerPoolSize,
+  releasePythonPoolJob,
+  setPythonPoolExtraReadyHook,
+  setPythonPoolMessageHandler,
+} from "./pythonWorkerPool.js";
+import { applyLeagueSessionDelta } from "../utils/leagueSessionDelta.js";
+import {
+  HISTORY_SECTIONS_BY_REQUEST,
+  restoreLeagueHistoryInResult,
+  splitLeagueHistory,
+  stripTeamHistory,
+} from "../utils/leagueHistorySplit.js";
 
 let worker = null;
 
+// ------------------------------------------------------------
+// SIM WORKER POOL
+// ------------------------------------------------------------
+// Single games and slates are jobs on the page's shared Pyodide pool
+// (pythonWorkerPool.js), next to Trade Builder / Trade Finder requests and
+// CPU/CPU trade generation, under one global worker cap. Slot 0 is the main
+// worker (which also serves every offseason/engine request). Games carry a
+// seed derived from their id, so results do not depend on which worker (or
+// how many workers) simulated them.
+const simPool = {
+  boxScoreBackend: "python",
+};
+
+export function getSimWorkerPoolSize() {
+  return getPythonWorkerPoolSize();
+}
+
+function ensureSimPool() {
+  startWorker();
+  ensurePythonPool();
+}
+
+function releaseSimPoolSlot(id) {
+  releasePythonPoolJob(id);
+}
+
+function dispatchSimJob(job) {
+  ensureSimPool();
+  dispatchPythonPoolJob(job);
+}
+
+export function getSimWorkerPoolStats() {
+  const stats = getPythonPoolStats();
+  return {
+    size: stats.size,
+    ready: stats.ready,
+    busy: stats.busy,
+    queued: stats.queued,
+    gamesBySlot: stats.jobsBySlot,
+  };
+}
+
+// ------------------------------------------------------------
+// PER-GAME SEEDS
+// ------------------------------------------------------------
+let sessionGameSeedSalt = null;
+
+function fnv1a32(text) {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193) >>> 0;
+  }
+  return hash >>> 0;
+}
+
+// Saves with a universe seed replay identically; others get one salt per
+// page session so every worker still agrees on a game's seed.
+export function gameSeedSalt(leagueData) {
+  const meta = leagueData?.meta && typeof leagueData.meta === "object" ? leagueData.meta : {};
+  const universe = meta.progressionSeedV25 || leagueData?.progressionSeedV25 || meta.progressionUniverseSeedV25;
+  if (universe) return String(universe);
+  if (sessionGameSeedSalt === null) {
+    sessionGameSeedSalt = `session_${Date.now().toString(36)}_${Math.floor(Math.random() * 1e9).toString(36)}`;
+  }
+  return sessionGameSeedSalt;
+}
+
+// attempt > 0 gives a retry of the same game its own stream.
+export function deriveGameSeed(gameId, salt = "", seasonYear = "", attempt = 0) {
+  if (gameId === null || gameId === undefined || gameId === "") return null;
+  const retry = attempt > 0 ? `|retry${attempt}` : "";
+  return fnv1a32(`${salt}|${seasonYear}|${gameId}${retry}`);
+}
+
 let cpuRosterRepairFastPathBaseline = null;
 const cpuRosterRepairFastPathStats = {
   workerRepairs: 0,
@@ -108,6 +203,21 @@ export function deepSanitize(obj, seen = new WeakSet()) {
 
   return null;
 }
+// ------------------------------------------------------------
+// HOT LEAGUE PAYLOADS
+// ------------------------------------------------------------
+// Engine requests ship the hot league core (utils/leagueHistorySplit.js):
+// player career history stays on this thread unless the request type lists
+// the history sections it reads, and is put back on the league (and any
+// retired-player records) the worker answers with.
+function buildHotLeaguePayload(leagueData, requestType) {
+  const split = splitLeagueHistory(leagueData, HISTORY_SECTIONS_BY_REQUEST[requestType] || []);
+  return {
+    leagueData: deepSanitize(split.hot),
+    restore: (result) => restoreLeagueHistoryInResult(result, split),
+  };
+}
+
 // ------------------------------------------------------------
 // FREE AGENCY BACKEND PAYLOAD GUARD
 // ------------------------------------------------------------
@@ -204,6 +314,13 @@ function recordFreeAgencyPerformanceSample(sample) {
       return rows;
     },
     export: () => JSON.stringify(window.__bmFaPerfRuns || [], null, 2),
+    // Needs Python profiling on (window.bmPyProfile.enable()).
+    hotspots: (index = -1) => {
+      const rows = window.__bmFaPerfRuns || [];
+      const functions = rows.at(index)?.pythonProfile?.functions || [];
+      console.table(functions);
+      return functions;
+    },
   };
 
   console.groupCollapsed(
@@ -227,6 +344,46 @@ function recordFreeAgencyPerformanceSample(sample) {
   console.groupEnd();
 }
 
+// Python profiles (public/python/request_profiler.py) for every profiled
+// engine request, newest last. Turn profiling on with
+// window.bmPyProfile.enable() or setPythonProfiling().
+function recordPythonProfile(profile) {
+  if (typeof window === "undefined" || !profile) return;
+
+  const existing = Array.isArray(window.__bmPyProfileRuns) ? window.__bmPyProfileRuns : [];
+  window.__bmPyProfileRuns = [...existing, { ...profile, recordedAt: Date.now() }].slice(-30);
+  installPythonProfileConsole();
+
+  console.groupCollapsed(
+    `[BM PY PROFILE] ${profile.engine}.${profile.action ?? "?"}: ${profile.wallMs ?? "?"} ms`
+  );
+  console.table((profile.functions || []).slice(0, 15));
+  console.groupEnd();
+}
+
+function installPythonProfileConsole() {
+  if (typeof window === "undefined" || window.bmPyProfile) return;
+  window.bmPyProfile = {
+    enable: (topN = 30, sortBy = "cumulative") => setPythonProfiling({ enabled: true, topN, sortBy }),
+    disable: () => setPythonProfiling({ enabled: false }),
+    latest: () => {
+      const rows = window.__bmPyProfileRuns || [];
+      return rows[rows.length - 1] || null;
+    },
+    all: () => [...(window.__bmPyProfileRuns || [])],
+    report: (index = -1) => {
+      const functions = (window.__bmPyProfileRuns || []).at(index)?.functions || [];
+      console.table(functions);
+      return functions;
+    },
+    reset: () => {
+      window.__bmPyProfileRuns = [];
+      console.log("[BM PY PROFILE] Cleared recorded profiles.");
+    },
+    export: () => JSON.stringify(window.__bmPyProfileRuns || [], null, 2),
+  };
+}
+
 // ------------------------------------------------------------
 // PLAYER PROGRESSION PAYLOAD GUARD
 // ------------------------------------------------------------
@@ -300,15 +457,73 @@ function buildLeagueDataForProgressionWorker(leagueData) {
   };
 }
 
+// ------------------------------------------------------------
+// SINGLE GAME RESULTS
+// ------------------------------------------------------------
+function handleSingleGameResult(msg) {
+  releaseSimPoolSlot(msg.id);
+  const entry = pending.get(msg.id);
+  if (entry) {
+    pending.delete(msg.id);
+    clearTimeout(entry.timer);
+    if (entry.multiYearPerf) {
+      const workerRoundTripMs = Math.max(0, performance.now() - entry.multiYearPerf.postedAt);
+      recordMultiYearGameSimTiming({
+        seasonYear: entry.multiYearPerf.seasonYear,
+        phase: entry.multiYearPerf.phase,
+        teamCloneMs: entry.multiYearPerf.teamCloneMs,
+        sanitizeMs: entry.multiYearPerf.sanitizeMs,
+        workerRoundTripMs,
+        workerToPyMs: msg?.perf?.toPyMs || 0,
+        pythonComputeMs: msg?.perf?.pythonComputeMs || 0,
+        workerToJsMs: msg?.perf?.toJsMs || 0,
+        payloadBytes: entry.multiYearPerf.payloadBytes || 0,
+      });
+    }
+    simEngineLog("[simEnginePy] result-single for id", msg.id);
+    entry.resolve(convert(msg.result));
+  } else {
+    console.warn("[simEnginePy] result-single for unknown id", msg.id, msg);
+  }
+}
+
+function handleGamesBatchResult(msg) {
+  releaseSimPoolSlot(msg.batchId);
+  const entry = batchPending.get(msg.batchId);
+  if (!entry) return;
+  batchPending.delete(msg.batchId);
+  if (msg.error) {
+    entry({ ok: false, error: msg.error, results: [] });
+    return;
+  }
+  entry({
+    ok: true,
+    results: (msg.results || []).map((x) => ({
+      id: x.id,
+      result: x.error ? { error: x.error } : convert(x.result),
+    })),
+    ...(msg.perf ? { perf: msg.perf } : {}),
+  });
+}
+
 // ------------------------------------------------------------
 // WORKER INIT
 // ------------------------------------------------------------
+// The main worker is slot 0 of the shared Pyodide pool (pythonWorkerPool.js).
+// Pool jobs consume their own replies; everything else lands here.
 function startWorker() {
   if (worker) return;
 
-  worker = new Worker("/workers/simWorkerV2.js");
+  worker = getPythonPoolMainWorker();
+  installPythonProfileConsole();
+  // Extras join the pool once they run the same box-score engine as the rest.
+  setPythonPoolExtraReadyHook((extra) =>
+    simPool.boxScoreBackend !== "python"
+      ? postEngineBackend(extra, "set-box-score-backend", simPool.boxScoreBackend)
+      : null
+  );
 
-  worker.onmessage = (e) => {
+  setPythonPoolMessageHandler((e) => {
     const msg = e.data;
 
     // ready
@@ -319,29 +534,7 @@ function startWorker() {
 
     // single result
     if (msg.type === "result-single") {
-      const entry = pending.get(msg.id);
-      if (entry) {
-        pending.delete(msg.id);
-        clearTimeout(entry.timer);
-        if (entry.multiYearPerf) {
-          const workerRoundTripMs = Math.max(0, performance.now() - entry.multiYearPerf.postedAt);
-          recordMultiYearGameSimTiming({
-            seasonYear: entry.multiYearPerf.seasonYear,
-            phase: entry.multiYearPerf.phase,
-            teamCloneMs: entry.multiYearPerf.teamCloneMs,
-            sanitizeMs: entry.multiYearPerf.sanitizeMs,
-            workerRoundTripMs,
-            workerToPyMs: msg?.perf?.toPyMs || 0,
-            pythonComputeMs: msg?.perf?.pythonComputeMs || 0,
-            workerToJsMs: msg?.perf?.toJsMs || 0,
-            payloadBytes: entry.multiYearPerf.payloadBytes || 0,
-          });
-        }
-        simEngineLog("[simEnginePy] result-single for id", msg.id);
-        entry.resolve(convert(msg.result));
-      } else {
-        console.warn("[simEnginePy] result-single for unknown id", msg.id, msg);
-      }
+      handleSingleGameResult(msg);
       return;
     }
     if (msg.type === "draft-lottery-result") {
@@ -393,6 +586,56 @@ if (msg.type === "team-roster-action-result") {
   return;
 }
 
+if (msg.type === "module-load-stats") {
+  const entry = pending.get(msg.requestId);
+  if (!entry) return;
+  pending.delete(msg.requestId);
+  if (entry.timer) clearTimeout(entry.timer);
+  if (msg.error) entry.reject(new Error(msg.error));
+  else entry.resolve(deepFromEntries(msg.payload));
+  return;
+}
+
+if (msg.type === "python-profile") {
+  recordPythonProfile(msg.profile);
+  return;
+}
+
+if (msg.type === "box-score-backend-set" || msg.type === "progression-backend-set") {
+  handleEngineBackendSet(msg);
+  return;
+}
+
+if (msg.type === "python-profiling-set") {
+  const entry = pending.get(msg.requestId);
+  if (!entry) return;
+  pending.delete(msg.requestId);
+  if (entry.timer) clearTimeout(entry.timer);
+  if (msg.error) entry.reject(new Error(msg.error));
+  else entry.resolve(deepFromEntries(msg.payload));
+  return;
+}
+
+if (msg.type === "league-session-result") {
+  const entry = pending.get(msg.requestId);
+  if (!entry) return;
+  pending.delete(msg.requestId);
+  if (entry.timer) clearTimeout(entry.timer);
+  entry.resolve(deepFromEntries(msg.payload));
+  return;
+}
+
+if (msg.type === "league-session-error") {
+  const entry = pending.get(msg.requestId);
+  if (!entry) return;
+  pending.delete(msg.requestId);
+  if (entry.timer) clearTimeout(entry.timer);
+  const err = msg.error || "League session request failed";
+  if (entry.reject) entry.reject(new Error(err));
+  else entry.resolve({ ok: false, reason: err });
+  return;
+}
+
 if (msg.type === "team-roster-action-error") {
   const entry = pending.get(msg.requestId);
   if (!entry) return;
@@ -421,6 +664,12 @@ if (msg.type === "team-roster-action-error") {
       return;
     }
 
+    // native slate result
+    if (msg.type === "result-games-batch") {
+      handleGamesBatchResult(msg);
+      return;
+    }
+
     // awards result
     if (msg.type === "awards-result") {
       const entry = pending.get(msg.requestId);
@@ -1184,9 +1433,7 @@ if (msg.type === "free-agency-process-rfa-match-error") {
       else entry.resolve({ ok: false, reason: err });
       return;
     }
-  };
-
-  worker.postMessage({ type: "init" });
+  });
 }
 
 // Worker is now lazy-started on first simulation/offseason action.
@@ -1250,6 +1497,8 @@ function requestCpuRosterRepairWorker(
   const requestId = "FACR" + counter++;
   const TIMEOUT_MS = 60000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "repair-cpu-teams-to-min-roster");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1260,7 +1509,7 @@ function requestCpuRosterRepairWorker(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1272,7 +1521,7 @@ function requestCpuRosterRepairWorker(
     worker.postMessage({
       type: "repair-cpu-teams-to-min-roster",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         userTeamName,
         minPlayers,
@@ -1381,15 +1630,17 @@ export async function repairCpuTeamsToMinRoster(
   return finalResult;
 }
 
-export function simulateOneGame({ homeTeam, awayTeam, diagnostics = null }) {
-  startWorker();
+// gameId is the game's stable key (its stream under a master seed); the
+// message id is only a page counter.
+export function simulateOneGame({ homeTeam, awayTeam, diagnostics = null, seed = null, gameId = null }) {
+  ensureSimPool();
   return queueSim(() => {
     return new Promise((resolve) => {
       const id = counter++;
       const multiYearEnabled = isMultiYearSpeedDiagnosticsEnabled();
       const sanitizeStartedAt = multiYearEnabled ? performance.now() : 0;
-      const sanitizedHome = multiYearEnabled ? deepSanitize(homeTeam) : null;
-      const sanitizedAway = multiYearEnabled ? deepSanitize(awayTeam) : null;
+      const sanitizedHome = deepSanitize(stripTeamHistory(homeTeam));
+      const sanitizedAway = deepSanitize(stripTeamHistory(awayTeam));
       const sanitizeMs = multiYearEnabled ? performance.now() - sanitizeStartedAt : 0;
       let payloadBytes = 0;
       if (multiYearEnabled && shouldSampleMultiYearGamePayload(200)) {
@@ -1412,24 +1663,39 @@ export function simulateOneGame({ homeTeam, awayTeam, diagnostics = null }) {
             }
           : null,
       };
-
-      entry.timer = setTimeout(() => {
-        if (!pending.has(id)) return;
-
-        pending.delete(id);
-        console.warn("[simEnginePy] TIMEOUT waiting for worker result id", id);
-        resolve({ error: "WORKER_TIMEOUT" });
-      }, WORKER_TIMEOUT_MS);
-
       pending.set(id, entry);
-      if (entry.multiYearPerf) entry.multiYearPerf.postedAt = performance.now();
 
-      worker.postMessage({
-        type: "simulate-single",
+      dispatchSimJob({
         id,
-        home: multiYearEnabled ? sanitizedHome : deepSanitize(homeTeam),
-        away: multiYearEnabled ? sanitizedAway : deepSanitize(awayTeam),
-        ...(multiYearEnabled ? { multiYearDiagnostics: true } : {}),
+        fail: (error) => {
+          if (!pending.has(id)) return;
+          pending.delete(id);
+          clearTimeout(entry.timer);
+          resolve({ error });
+        },
+        post: (simWorker) => {
+          // A job re-posted after a worker failure restarts its timeout.
+          clearTimeout(entry.timer);
+          entry.timer = setTimeout(() => {
+            if (!pending.has(id)) return;
+
+            pending.delete(id);
+            console.warn("[simEnginePy] TIMEOUT waiting for worker result id", id);
+            resolve({ error: "WORKER_TIMEOUT" });
+          }, WORKER_TIMEOUT_MS);
+
+          if (entry.multiYearPerf) entry.multiYearPerf.postedAt = performance.now();
+
+          simWorker.postMessage({
+            type: "simulate-single",
+            id,
+            home: sanitizedHome,
+            away: sanitizedAway,
+            ...(Number.isFinite(seed) ? { seed } : {}),
+            ...(gameId !== null && gameId !== undefined ? { gameId } : {}),
+            ...(multiYearEnabled ? { multiYearDiagnostics: true } : {}),
+          });
+        },
       });
     });
   });
@@ -1449,13 +1715,78 @@ export function simulateBatchGames(games) {
       batchId,
       games: games.map((g) => ({
         id: g.id,
-        home: deepSanitize(g.homeTeam),
-        away: deepSanitize(g.awayTeam),
+        home: deepSanitize(stripTeamHistory(g.homeTeam)),
+        away: deepSanitize(stripTeamHistory(g.awayTeam)),
       })),
     });
   });
 }
 
+// ------------------------------------------------------------
+// PUBLIC API - NATIVE SLATE SIMULATION
+// ------------------------------------------------------------
+// teamsByName: { [teamName]: team with players + default minutes }
+// matchups: [{ id, home, away, homeMinutes?, awayMinutes?, seed? }] in schedule order
+// Each roster is sanitized and sent once; Python runs the whole slate in a
+// single call and answers { ok, results: [{ id, result }] } in matchup order.
+// A slate is one sim pool job, so several slates run on separate workers.
+// A slate that does not answer in time resolves with { error } (its worker is
+// abandoned), so callers fall back to single games instead of waiting forever.
+const GAMES_BATCH_TIMEOUT_BASE_MS = 5000;
+const GAMES_BATCH_TIMEOUT_PER_GAME_MS = 1000;
+
+export function simulateGamesBatch(teamsByName, matchups) {
+  ensureSimPool();
+  return new Promise((resolve) => {
+    const batchId = "S" + counter++;
+    let timer = null;
+    batchPending.set(batchId, (result) => {
+      clearTimeout(timer);
+      resolve(result);
+    });
+
+    const sanitizedTeams = {};
+    for (const [name, team] of Object.entries(teamsByName || {})) {
+      sanitizedTeams[name] = deepSanitize(stripTeamHistory(team));
+    }
+    const message = {
+      type: "simulate-games-batch",
+      batchId,
+      teamsByName: sanitizedTeams,
+      matchups: (matchups || []).map((m) => ({
+        id: m.id,
+        home: m.home,
+        away: m.away,
+        ...(m.homeMinutes ? { homeMinutes: deepSanitize(m.homeMinutes) } : {}),
+        ...(m.awayMinutes ? { awayMinutes: deepSanitize(m.awayMinutes) } : {}),
+        ...(Number.isFinite(m.seed) ? { seed: m.seed } : {}),
+      })),
+      ...(isMultiYearSpeedDiagnosticsEnabled() ? { multiYearDiagnostics: true } : {}),
+    };
+
+    const timeoutMs = GAMES_BATCH_TIMEOUT_BASE_MS + GAMES_BATCH_TIMEOUT_PER_GAME_MS * message.matchups.length;
+
+    dispatchSimJob({
+      id: batchId,
+      post: (simWorker) => {
+        // A job re-posted after a worker failure restarts its timeout.
+        clearTimeout(timer);
+        timer = setTimeout(() => {
+          if (!batchPending.has(batchId)) return;
+          batchPending.delete(batchId);
+          // A late reply from the main worker still frees its slot through
+          // handleGamesBatchResult; an extra is replaced here.
+          abandonPythonPoolJob(batchId);
+          console.warn("[simEnginePy] TIMEOUT waiting for slate", batchId, message.matchups.length, "games");
+          resolve({ ok: false, error: "WORKER_TIMEOUT", results: [] });
+        }, timeoutMs);
+        simWorker.postMessage(message);
+      },
+      fail: (error) => handleGamesBatchResult({ batchId, error }),
+    });
+  });
+}
+
 // ------------------------------------------------------------
 // PUBLIC API - SEASON AWARDS
 // ------------------------------------------------------------
@@ -1485,10 +1816,14 @@ export function computeAllStars(payload = {}) {
       timer,
     });
 
+    const playerStats = payload?.playerStats ?? payload?.player_stats;
     worker.postMessage({
       type: "compute-all-stars",
       requestId,
-      payload: deepSanitize(payload),
+      payload: deepSanitize({
+        ...payload,
+        ...(playerStats ? { playerStats: packSeasonStatsColumns(playerStats), player_stats: undefined } : {}),
+      }),
     });
   });
 }
@@ -1579,6 +1914,8 @@ export function computePlayerProgression(leagueData, statsByKey = {}, meta = {})
     Math.min(300000, 45000 + progressionPlayerCount * 300)
   );
 
+  const hotLeague = buildHotLeaguePayload(buildLeagueDataForProgressionWorker(leagueData), "compute-progression");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1591,7 +1928,7 @@ export function computePlayerProgression(leagueData, statsByKey = {}, meta = {})
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1603,8 +1940,8 @@ export function computePlayerProgression(leagueData, statsByKey = {}, meta = {})
     worker.postMessage({
       type: "compute-progression",
       requestId,
-      leagueData: deepSanitize(buildLeagueDataForProgressionWorker(leagueData)),
-      statsByKey: deepSanitize(statsByKey),
+      leagueData: hotLeague.leagueData,
+      statsByKey: packSeasonStatsColumns(deepSanitize(statsByKey)),
       meta: {
         ...meta,
         progressionTimeoutMs: PROGRESSION_TIMEOUT_MS,
@@ -1624,6 +1961,8 @@ export function enforceFinalProgressionShape(leagueData, meta = {}) {
   const playerCount = countProgressionPayloadPlayers(leagueData);
   const TIMEOUT_MS = Math.max(120000, Math.min(300000, 45000 + playerCount * 260));
 
+  const hotLeague = buildHotLeaguePayload(buildLeagueDataForProgressionWorker(leagueData), "enforce-final-progression-shape");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1634,7 +1973,7 @@ export function enforceFinalProgressionShape(leagueData, meta = {}) {
     pending.set(requestId, {
       resolve: (value) => {
         clearTimeout(timer);
-        resolve(value);
+        resolve(hotLeague.restore(value));
       },
       reject: (error) => {
         clearTimeout(timer);
@@ -1646,7 +1985,7 @@ export function enforceFinalProgressionShape(leagueData, meta = {}) {
     worker.postMessage({
       type: "enforce-final-progression-shape",
       requestId,
-      leagueData: deepSanitize(buildLeagueDataForProgressionWorker(leagueData)),
+      leagueData: hotLeague.leagueData,
       meta: deepSanitize(meta),
     });
   });
@@ -1660,6 +1999,8 @@ export function generateFreeAgencyMarket(leagueData) {
   const requestId = "FAM" + counter++;
   const TIMEOUT_MS = 12000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "generate-free-agency-market");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1670,7 +2011,7 @@ export function generateFreeAgencyMarket(leagueData) {
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1682,7 +2023,7 @@ export function generateFreeAgencyMarket(leagueData) {
     worker.postMessage({
       type: "generate-free-agency-market",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
     });
   });
 }
@@ -1696,6 +2037,8 @@ export function evaluateFreeAgencyOffer(leagueData, teamName, player, offer = {}
   const requestId = "FAE" + counter++;
   const TIMEOUT_MS = 12000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "evaluate-free-agent-offer");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1706,7 +2049,7 @@ export function evaluateFreeAgencyOffer(leagueData, teamName, player, offer = {}
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1718,7 +2061,7 @@ export function evaluateFreeAgencyOffer(leagueData, teamName, player, offer = {}
     worker.postMessage({
       type: "evaluate-free-agent-offer",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         teamName,
         player: deepSanitize(player),
@@ -1743,6 +2086,8 @@ export function signFreeAgent(
   const requestId = "FAS" + counter++;
   const TIMEOUT_MS = 12000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "sign-free-agent");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1753,7 +2098,7 @@ export function signFreeAgent(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1765,7 +2110,7 @@ export function signFreeAgent(
     worker.postMessage({
       type: "sign-free-agent",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         teamName,
         playerId,
@@ -1790,6 +2135,8 @@ export function releasePlayerToFreeAgency(
   const requestId = "FAR" + counter++;
   const TIMEOUT_MS = 12000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "release-player-free-agency");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1800,7 +2147,7 @@ export function releasePlayerToFreeAgency(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1812,7 +2159,7 @@ export function releasePlayerToFreeAgency(
     worker.postMessage({
       type: "release-player-free-agency",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         teamName,
         playerId,
@@ -1831,6 +2178,8 @@ export function previewOffseasonContracts(leagueData, userTeamName = null) {
   const requestId = "FAP" + counter++;
   const TIMEOUT_MS = 15000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "preview-offseason-contracts");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1841,7 +2190,7 @@ export function previewOffseasonContracts(leagueData, userTeamName = null) {
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1853,7 +2202,7 @@ export function previewOffseasonContracts(leagueData, userTeamName = null) {
     worker.postMessage({
       type: "preview-offseason-contracts",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         userTeamName,
       },
@@ -1874,6 +2223,8 @@ export function applyOffseasonContractDecisions(
   const requestId = "FAA" + counter++;
   const TIMEOUT_MS = 15000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "apply-offseason-contract-decisions");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1884,7 +2235,7 @@ export function applyOffseasonContractDecisions(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1896,7 +2247,7 @@ export function applyOffseasonContractDecisions(
     worker.postMessage({
       type: "apply-offseason-contract-decisions",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         userTeamName,
         teamOptionDecisions: deepSanitize(teamOptionDecisions),
@@ -1914,6 +2265,8 @@ export function previewPlayerTeamOptions(leagueData, userTeamName = null) {
   const requestId = "PTOP" + counter++;
   const TIMEOUT_MS = 15000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "preview-player-team-options");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1924,7 +2277,7 @@ export function previewPlayerTeamOptions(leagueData, userTeamName = null) {
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1936,7 +2289,7 @@ export function previewPlayerTeamOptions(leagueData, userTeamName = null) {
     worker.postMessage({
       type: "preview-player-team-options",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         userTeamName,
       },
@@ -1957,6 +2310,8 @@ export function applyPlayerTeamOptions(
   const requestId = "PTOA" + counter++;
   const TIMEOUT_MS = 15000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "apply-player-team-options");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -1967,7 +2322,7 @@ export function applyPlayerTeamOptions(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -1979,7 +2334,7 @@ export function applyPlayerTeamOptions(
     worker.postMessage({
       type: "apply-player-team-options",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         userTeamName,
         teamOptionDecisions: deepSanitize(teamOptionDecisions),
@@ -2001,6 +2356,8 @@ export function initializeFreeAgencyPeriod(
   const requestId = "FAI" + counter++;
   const TIMEOUT_MS = 180000;
 
+  const hotLeague = buildHotLeaguePayload(buildLeagueDataForFreeAgencyBackendAction(leagueData), "initialize-free-agency-period");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2011,7 +2368,7 @@ export function initializeFreeAgencyPeriod(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2023,7 +2380,7 @@ export function initializeFreeAgencyPeriod(
     worker.postMessage({
       type: "initialize-free-agency-period",
       requestId,
-      leagueData: deepSanitize(buildLeagueDataForFreeAgencyBackendAction(leagueData)),
+      leagueData: hotLeague.leagueData,
       payload: {
         userTeamName,
         maxDays,
@@ -2041,6 +2398,8 @@ export function getFreeAgencyStateSummary(leagueData) {
   const requestId = "FAST" + counter++;
   const TIMEOUT_MS = 12000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "get-free-agency-state-summary");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2051,7 +2410,7 @@ export function getFreeAgencyStateSummary(leagueData) {
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2063,7 +2422,7 @@ export function getFreeAgencyStateSummary(leagueData) {
     worker.postMessage({
       type: "get-free-agency-state-summary",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {},
     });
   });
@@ -2082,6 +2441,8 @@ export function getFreeAgentOffers(
   const requestId = "FAO" + counter++;
   const TIMEOUT_MS = 12000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "get-free-agent-offers");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2092,7 +2453,7 @@ export function getFreeAgentOffers(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2104,7 +2465,7 @@ export function getFreeAgentOffers(
     worker.postMessage({
       type: "get-free-agent-offers",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         playerId,
         playerName,
@@ -2128,6 +2489,8 @@ export function submitUserFreeAgentOffer(
   const requestId = "FAU" + counter++;
   const TIMEOUT_MS = 15000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "submit-user-free-agent-offer");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2138,7 +2501,7 @@ export function submitUserFreeAgentOffer(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2150,7 +2513,7 @@ export function submitUserFreeAgentOffer(
     worker.postMessage({
       type: "submit-user-free-agent-offer",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         teamName,
         playerId,
@@ -2164,67 +2527,84 @@ export function submitUserFreeAgentOffer(
 // ------------------------------------------------------------
 // PUBLIC API - ADVANCE FREE AGENCY DAY
 // ------------------------------------------------------------
-export function advanceFreeAgencyDay(
+// Days run on the resident league session (public/python/league_session.py).
+// The hot league is loaded once; while the caller passes back the league
+// this returned (or a copy that only replaced top-level keys other than the
+// rosters and free agents, e.g. freeAgencyState.latestResults), a day sends
+// the action plus a patch for the replaced keys and merges the delta.
+// Callers update the league immutably between days, as the pages do.
+let freeAgencySessionLeague = null;
+
+function jsonPointerToken(key) {
+  return String(key).replace(/~/g, "~0").replace(/\//g, "~1");
+}
+
+async function syncFreeAgencySession(leagueData) {
+  const previous = freeAgencySessionLeague;
+  freeAgencySessionLeague = null;
+  const backendLeagueData = buildLeagueDataForFreeAgencyBackendAction(leagueData);
+
+  if (
+    previous &&
+    previous.conferences === leagueData.conferences &&
+    previous.freeAgents === leagueData.freeAgents
+  ) {
+    const ops = [];
+    for (const key of new Set([...Object.keys(previous), ...Object.keys(leagueData)])) {
+      if (previous[key] === leagueData[key]) continue;
+      const path = `/${jsonPointerToken(key)}`;
+      if (!(key in leagueData)) ops.push({ op: "remove", path });
+      else ops.push({ op: "add", path, value: backendLeagueData[key] });
+    }
+    if (ops.length) await postLeagueSessionRequest("patch", { ops: deepSanitize(ops) });
+    return;
+  }
+
+  const hotLeague = buildHotLeaguePayload(backendLeagueData, "advance-free-agency-day");
+  await postLeagueSessionRequest("load", { leagueData: hotLeague.leagueData }, 180000);
+}
+
+export async function advanceFreeAgencyDay(
   leagueData,
   userTeamName = null
 ) {
-  startWorker();
-
-  const requestId = "FAD" + counter++;
-  const TIMEOUT_MS = 180000;
   const callStartedAt = performance.now();
 
-  const payloadBuildStartedAt = performance.now();
-  const backendLeagueData = buildLeagueDataForFreeAgencyBackendAction(leagueData);
-  const sanitizedLeagueData = deepSanitize(backendLeagueData);
-  const payloadBuildMs = performance.now() - payloadBuildStartedAt;
-
-  return new Promise((resolve, reject) => {
-    const timer = setTimeout(() => {
-      if (!pending.has(requestId)) return;
-      pending.delete(requestId);
-      reject(new Error("ADVANCE_FREE_AGENCY_DAY_TIMEOUT"));
-    }, TIMEOUT_MS);
+  const syncStartedAt = performance.now();
+  await syncFreeAgencySession(leagueData);
+  const payloadBuildMs = performance.now() - syncStartedAt;
 
-    let postedAt = 0;
-    pending.set(requestId, {
-      resolve: (value) => {
-        clearTimeout(timer);
-        const receivedAt = performance.now();
-        const diagnostics = value?.performanceDiagnostics || {};
-        const sample = {
-          ...diagnostics,
-          dayResolved: value?.dayResolved ?? diagnostics?.counts?.currentDay ?? null,
-          frontend: {
-            payloadBuildMs: Number(payloadBuildMs.toFixed(3)),
-            workerRoundTripMs: Number((receivedAt - postedAt).toFixed(3)),
-            totalApiMs: Number((receivedAt - callStartedAt).toFixed(3)),
-          },
-        };
-
-        if (value && typeof value === "object") {
-          value.performanceDiagnostics = sample;
-        }
-        recordFreeAgencyPerformanceSample(sample);
-        resolve(value);
-      },
-      reject: (e) => {
-        clearTimeout(timer);
-        reject(e);
-      },
-      timer,
-    });
+  const postedAt = performance.now();
+  const res = await postLeagueSessionRequest(
+    "action",
+    { engine: "free_agency", action: "advance_free_agency_day", payload: { userTeamName } },
+    180000
+  );
+  if (!res?.ok) {
+    return { ok: false, reason: res?.reason || "Advance free agency day failed" };
+  }
 
-    postedAt = performance.now();
-    worker.postMessage({
-      type: "advance-free-agency-day",
-      requestId,
-      leagueData: sanitizedLeagueData,
-      payload: {
-        userTeamName,
-      },
-    });
-  });
+  const nextLeague = applyLeagueSessionDelta(leagueData, res.delta);
+  freeAgencySessionLeague = nextLeague;
+  const value = { ...(res.result || {}), leagueData: nextLeague };
+
+  const receivedAt = performance.now();
+  const diagnostics = value.performanceDiagnostics || {};
+  const sample = {
+    ...diagnostics,
+    ...(value.pythonProfile ? { pythonProfile: value.pythonProfile } : {}),
+    dayResolved: value.dayResolved ?? diagnostics?.counts?.currentDay ?? null,
+    frontend: {
+      payloadBuildMs: Number(payloadBuildMs.toFixed(3)),
+      workerRoundTripMs: Number((receivedAt - postedAt).toFixed(3)),
+      totalApiMs: Number((receivedAt - callStartedAt).toFixed(3)),
+      sessionRevision: res.revision ?? null,
+      responseJsonChars: res.perf?.responseJsonChars ?? null,
+    },
+  };
+  value.performanceDiagnostics = sample;
+  recordFreeAgencyPerformanceSample(sample);
+  return value;
 }
 
 export function processPendingUserFreeAgencyDecisions(
@@ -2239,6 +2619,8 @@ export function processPendingUserFreeAgencyDecisions(
   const requestId = "FAPD" + counter++;
   const TIMEOUT_MS = 180000;
 
+  const hotLeague = buildHotLeaguePayload(buildLeagueDataForFreeAgencyBackendAction(leagueData), "process-pending-user-free-agency-decisions");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2249,7 +2631,7 @@ export function processPendingUserFreeAgencyDecisions(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2261,7 +2643,7 @@ export function processPendingUserFreeAgencyDecisions(
     worker.postMessage({
       type: "process-pending-user-free-agency-decisions",
       requestId,
-      leagueData: deepSanitize(buildLeagueDataForFreeAgencyBackendAction(leagueData)),
+      leagueData: hotLeague.leagueData,
       payload: {
         userTeamName,
         selectedPlayerKeys: deepSanitize(selectedPlayerKeys),
@@ -2283,6 +2665,8 @@ export function processPendingRfaMatchDecision(
   const requestId = "FARFA" + counter++;
   const TIMEOUT_MS = 180000;
 
+  const hotLeague = buildHotLeaguePayload(buildLeagueDataForFreeAgencyBackendAction(leagueData), "process-pending-rfa-match-decision");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2293,7 +2677,7 @@ export function processPendingRfaMatchDecision(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2304,7 +2688,7 @@ export function processPendingRfaMatchDecision(
     worker.postMessage({
       type: "process-pending-rfa-match-decision",
       requestId,
-      leagueData: deepSanitize(buildLeagueDataForFreeAgencyBackendAction(leagueData)),
+      leagueData: hotLeague.leagueData,
       payload: {
         userTeamName,
         playerKey,
@@ -2326,6 +2710,8 @@ export function previewRightsManagement(
   const requestId = "RMP" + counter++;
   const TIMEOUT_MS = 15000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "preview-rights-management");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2336,7 +2722,7 @@ export function previewRightsManagement(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2348,7 +2734,7 @@ export function previewRightsManagement(
     worker.postMessage({
       type: "preview-rights-management",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         teamName,
       },
@@ -2369,6 +2755,8 @@ export function applyRightsManagement(
   const requestId = "RMA" + counter++;
   const TIMEOUT_MS = 15000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "apply-rights-management");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2379,7 +2767,7 @@ export function applyRightsManagement(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2391,7 +2779,7 @@ export function applyRightsManagement(
     worker.postMessage({
       type: "apply-rights-management",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         teamName,
         rightsDecisions: deepSanitize(rightsDecisions),
@@ -2407,6 +2795,8 @@ function runContractExtensionAction(leagueData, action, payload = {}) {
   const requestId = "CEXT" + counter++;
   const TIMEOUT_MS = 60000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "contract-extension-action");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2417,7 +2807,7 @@ function runContractExtensionAction(leagueData, action, payload = {}) {
     pending.set(requestId, {
       resolve: (value) => {
         clearTimeout(timer);
-        resolve(value);
+        resolve(hotLeague.restore(value));
       },
       reject: (error) => {
         clearTimeout(timer);
@@ -2430,7 +2820,7 @@ function runContractExtensionAction(leagueData, action, payload = {}) {
       type: "contract-extension-action",
       requestId,
       action,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: deepSanitize(payload),
     });
   });
@@ -2496,6 +2886,8 @@ export function getLockerRoomMoods(
   const requestId = "PMOOD" + counter++;
   const TIMEOUT_MS = 15000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "get-locker-room-moods");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2506,7 +2898,7 @@ export function getLockerRoomMoods(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2518,7 +2910,7 @@ export function getLockerRoomMoods(
     worker.postMessage({
       type: "get-locker-room-moods",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
         teamName,
       },
@@ -2531,6 +2923,8 @@ export function runDraftLottery(leagueData, payload = {}) {
   const requestId = "DL" + counter++;
   const TIMEOUT_MS = 20000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "run-draft-lottery");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2541,7 +2935,7 @@ export function runDraftLottery(leagueData, payload = {}) {
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2553,7 +2947,7 @@ export function runDraftLottery(leagueData, payload = {}) {
     worker.postMessage({
       type: "run-draft-lottery",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: deepSanitize(payload),
     });
   });
@@ -2564,6 +2958,8 @@ function runDraftAction(action, leagueData, payload = {}) {
   const requestId = "DR" + counter++;
   const TIMEOUT_MS = action === "sim_rest_of_draft" ? 180000 : 60000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "run-draft-action");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2574,7 +2970,7 @@ function runDraftAction(action, leagueData, payload = {}) {
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2587,7 +2983,7 @@ function runDraftAction(action, leagueData, payload = {}) {
       type: "run-draft-action",
       requestId,
       action,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: deepSanitize(payload),
     });
   });
@@ -2618,6 +3014,8 @@ function runTeamRosterAction(action, leagueData, payload = {}) {
   const requestId = "TR" + counter++;
   const TIMEOUT_MS = 60000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "run-team-roster-action");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2628,7 +3026,7 @@ function runTeamRosterAction(action, leagueData, payload = {}) {
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2641,7 +3039,7 @@ function runTeamRosterAction(action, leagueData, payload = {}) {
       type: "run-team-roster-action",
       requestId,
       action,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: deepSanitize(payload),
     });
   });
@@ -2682,6 +3080,8 @@ export function runPlayerRetirements(
   const requestId = "RET" + counter++;
   const TIMEOUT_MS = 15000;
 
+  const hotLeague = buildHotLeaguePayload(leagueData, "run-player-retirements");
+
   return new Promise((resolve, reject) => {
     const timer = setTimeout(() => {
       if (!pending.has(requestId)) return;
@@ -2692,7 +3092,7 @@ export function runPlayerRetirements(
     pending.set(requestId, {
       resolve: (v) => {
         clearTimeout(timer);
-        resolve(v);
+        resolve(hotLeague.restore(v));
       },
       reject: (e) => {
         clearTimeout(timer);
@@ -2704,13 +3104,200 @@ export function runPlayerRetirements(
     worker.postMessage({
       type: "run-player-retirements",
       requestId,
-      leagueData: deepSanitize(leagueData),
+      leagueData: hotLeague.leagueData,
       payload: {
-        statsByKey: deepSanitize(statsByKey),
+        statsByKey: packSeasonStatsColumns(deepSanitize(statsByKey)),
         settings: deepSanitize(settings),
         seasonYear: meta?.seasonYear ?? null,
         seed: meta?.seed ?? null,
       },
     });
   });
-}
\ No newline at end of file
+}
+
+
+// ------------------------------------------------------------
+// PUBLIC API - RESIDENT LEAGUE SESSION
+// ------------------------------------------------------------
+// loadLeagueSession() ships the league to the worker once. Engine calls made
+// through runLeagueSessionAction() then send only action + payload and
+// resolve with { ok, result, delta, revision }; merge the delta with
+// applyLeagueSessionDelta() from utils/leagueSessionDelta.js.
+function postLeagueSessionRequest(op, message = {}, timeoutMs = 60000) {
+  startWorker();
+  const requestId = "LS" + counter++;
+
+  return new Promise((resolve, reject) => {
+    const timer = setTimeout(() => {
+      if (!pending.has(requestId)) return;
+      pending.delete(requestId);
+      reject(new Error("LEAGUE_SESSION_TIMEOUT"));
+    }, timeoutMs);
+
+    pending.set(requestId, {
+      resolve: (v) => {
+        clearTimeout(timer);
+        resolve(v);
+      },
+      reject: (e) => {
+        clearTimeout(timer);
+        reject(e);
+      },
+      timer,
+    });
+
+    worker.postMessage({
+      type: "league-session",
+      requestId,
+      op,
+      ...message,
+    });
+  });
+}
+
+export function loadLeagueSession(leagueData) {
+  freeAgencySessionLeague = null;
+  return postLeagueSessionRequest("load", { leagueData: deepSanitize(leagueData) });
+}
+
+export function patchLeagueSession(ops = []) {
+  freeAgencySessionLeague = null;
+  return postLeagueSessionRequest("patch", { ops: deepSanitize(ops) });
+}
+
+export function runLeagueSessionAction(engine, action, payload = {}) {
+  freeAgencySessionLeague = null;
+  return postLeagueSessionRequest("action", {
+    engine,
+    action,
+    payload: deepSanitize(payload),
+  });
+}
+
+export function clearLeagueSession() {
+  freeAgencySessionLeague = null;
+  return postLeagueSessionRequest("clear");
+}
+
+
+// ------------------------------------------------------------
+// PUBLIC API - PYTHON MODULE LOAD DIAGNOSTICS
+// ------------------------------------------------------------
+// Per-engine cold/warm load times from public/python/module_registry.py.
+export function getPythonModuleLoadStats() {
+  startWorker();
+  const requestId = "MOD" + counter++;
+  const TIMEOUT_MS = 15000;
+
+  return new Promise((resolve, reject) => {
+    const timer = setTimeout(() => {
+      if (!pending.has(requestId)) return;
+      pending.delete(requestId);
+      reject(new Error("MODULE_LOAD_STATS_TIMEOUT"));
+    }, TIMEOUT_MS);
+
+    pending.set(requestId, {
+      resolve: (v) => {
+        clearTimeout(timer);
+        resolve(v);
+      },
+      reject: (e) => {
+        clearTimeout(timer);
+        reject(e);
+      },
+      timer,
+    });
+
+    worker.postMessage({
+      type: "get-module-load-stats",
+      requestId,
+    });
+  });
+}
+
+// ------------------------------------------------------------
+// PUBLIC API - ENGINE BACKENDS
+// ------------------------------------------------------------
+// Both engines default to pure Python. "numpy" loads NumPy into the worker
+// first; the answer is the backend actually active ("python" when NumPy is
+// unavailable). The box-score engine is set on every sim pool worker,
+// including extras that finish booting later; progression only runs on the
+// main worker.
+function handleEngineBackendSet(msg) {
+  const entry = pending.get(msg.requestId);
+  if (!entry) return;
+  pending.delete(msg.requestId);
+  if (entry.timer) clearTimeout(entry.timer);
+  if (msg.error) entry.reject(new Error(msg.error));
+  else entry.resolve(msg.backend);
+}
+
+function postEngineBackend(targetWorker, type, backend) {
+  const requestId = "BACKEND" + counter++;
+  const TIMEOUT_MS = 60000;
+
+  return new Promise((resolve, reject) => {
+    const timer = setTimeout(() => {
+      if (!pending.has(requestId)) return;
+      pending.delete(requestId);
+      reject(new Error("ENGINE_BACKEND_TIMEOUT"));
+    }, TIMEOUT_MS);
+
+    pending.set(requestId, { resolve, reject, timer });
+    targetWorker.postMessage({ type, requestId, backend });
+  });
+}
+
+export async function setBoxScoreBackend(backend = "python") {
+  ensureSimPool();
+  simPool.boxScoreBackend = backend === "numpy" ? "numpy" : "python";
+  const [active] = await Promise.all(
+    forEachReadyPythonPoolWorker((poolWorker) => postEngineBackend(poolWorker, "set-box-score-backend", simPool.boxScoreBackend))
+  );
+  return active;
+}
+
+export function setProgressionBackend(backend = "python") {
+  startWorker();
+  return postEngineBackend(worker, "set-progression-backend", backend === "numpy" ? "numpy" : "python");
+}
+
+// ------------------------------------------------------------
+// PUBLIC API - PYTHON PROFILING
+// ------------------------------------------------------------
+// Profile every engine request in the shared worker (cProfile); each result
+// then carries pythonProfile, a top-N table of functions by cumulative (or
+// self) time, which is also logged to window.__bmPyProfileRuns.
+export function setPythonProfiling({ enabled = true, topN = null, sortBy = null } = {}) {
+  startWorker();
+  const requestId = "PROF" + counter++;
+  const TIMEOUT_MS = 15000;
+
+  return new Promise((resolve, reject) => {
+    const timer = setTimeout(() => {
+      if (!pending.has(requestId)) return;
+      pending.delete(requestId);
+      reject(new Error("PYTHON_PROFILING_TIMEOUT"));
+    }, TIMEOUT_MS);
+
+    pending.set(requestId, {
+      resolve: (v) => {
+        clearTimeout(timer);
+        resolve(v);
+      },
+      reject: (e) => {
+        clearTimeout(timer);
+        reject(e);
+      },
+      timer,
+    });
+
+    worker.postMessage({
+      type: "set-python-profiling",
+      requestId,
+      enabled: Boolean(enabled),
+      topN,
+      sortBy,
+    });
+  });
+}
@@ -507,14 +507,85 @@ function starBoostFromTopTwo(top, starExp) {
   return pull ** TR_STAR_OUT_EXP;
 }
 
+// Team ratings depend only on the rotation (who plays, their ratings/stamina/
+// positions and the minutes map), so results are memoized by a rotation
+// signature, mirroring compute_team_ratings in public/python/game_sim.py.
+// The two sides keep their own formulas (the JS one adds the positional
+// allocator), so each caches its own results under the same key shape.
+// Injuries, trades and gameplan edits change the signature; use
+// invalidateTeamRatings() after editing a roster object in place. Cached
+// results are shared between callers and must be treated as read-only.
+const TEAM_RATING_CACHE_MAX = 512;
+const teamRatingCache = new Map();
+const teamRatingCacheStats = { hits: 0, misses: 0, invalidations: 0 };
+
+function teamRatingSignature(team, minsObj, variant) {
+  const players = Array.isArray(team?.players) ? team.players : [];
+  let key = `${variant}|${team?.name ?? ""}`;
+  for (let i = 0; i < players.length; i += 1) {
+    const p = players[i];
+    if (!p) continue;
+    const m = Math.max(0, +(minsObj?.[p.name] || 0));
+    if (m <= 0) continue;
+    key += `#${p.id ?? ""}|${p.name}|${m}|${p.pos || ""}|${p.secondaryPos || ""}|${p.overall ?? 75}|${p.offRating ?? 75}|${p.defRating ?? 75}|${p.stamina ?? 75}`;
+    // rosterOut carries attrs, so the full variant keys on them as well.
+    if (variant === "full" && Array.isArray(p.attrs)) key += `|${p.attrs.join(",")}`;
+  }
+  return key;
+}
+
+function cachedTeamRatings(team, key, compute) {
+  const cached = teamRatingCache.get(key);
+  if (cached !== undefined) {
+    teamRatingCacheStats.hits += 1;
+    return cached.result;
+  }
+  teamRatingCacheStats.misses += 1;
+  const result = compute();
+  if (teamRatingCache.size >= TEAM_RATING_CACHE_MAX) {
+    teamRatingCache.delete(teamRatingCache.keys().next().value);
+  }
+  teamRatingCache.set(key, { teamName: team?.name ?? "", result });
+  return result;
+}
+
+export function invalidateTeamRatings(teamName = null) {
+  let dropped = 0;
+  if (teamName === null || teamName === undefined) {
+    dropped = teamRatingCache.size;
+    teamRatingCache.clear();
+  } else {
+    for (const [key, entry] of [...teamRatingCache.entries()]) {
+      if (entry.teamName === teamName) {
+        teamRatingCache.delete(key);
+        dropped += 1;
+      }
+    }
+  }
+  teamRatingCacheStats.invalidations += dropped;
+  return dropped;
+}
+
+export function getTeamRatingCacheStats() {
+  const lookups = teamRatingCacheStats.hits + teamRatingCacheStats.misses;
+  return {
+    ...teamRatingCacheStats,
+    size: teamRatingCache.size,
+    hitRate: lookups ? Math.round((teamRatingCacheStats.hits / lookups) * 10000) / 10000 : 0,
+  };
+}
+
 // Internal exact numeric fast path for callers that only need ratings and do not
 // consume rosterOut. It preserves the same player order, fatigue, star boost,
 // positional allocator, scaling, and 4-decimal rounding as computeTeamRatings.
 // Any unusual roster shape falls back to the public implementation.
+//
+// Not memoized: rotation search calls this with a new minutes map almost every
+// time, and building the signature costs more than the computation itself.
 export function computeTeamRatingsNumeric(team, minsObj) {
   const prepared = prepareFastNoRosterOut(team, minsObj);
   if (!prepared) {
-    const ratings = computeTeamRatings(team, minsObj, { includeRosterOut: false });
+    const ratings = computeTeamRatingsUncached(team, minsObj, false);
     return {
       overall: ratings.overall,
       off: ratings.off,
@@ -983,6 +1054,14 @@ const scaleRange = (raw, kind = "overall") => {
 
 export function computeTeamRatings(team, minsObj, options = {}) {
   const includeRosterOut = options?.includeRosterOut !== false;
+  return cachedTeamRatings(
+    team,
+    teamRatingSignature(team, minsObj, includeRosterOut ? "full" : "lite"),
+    () => computeTeamRatingsUncached(team, minsObj, includeRosterOut)
+  );
+}
+
+function computeTeamRatingsUncached(team, minsObj, includeRosterOut) {
   const { roster, posMin, total, coveragePenalty } = minutesWeighted(team, minsObj, includeRosterOut);
 
   if (!total) {
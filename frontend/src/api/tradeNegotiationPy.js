@@ -1,12 +1,19 @@
 // tradeNegotiationPy.js
 // Small dedicated API wrapper for CPU trade negotiation.
-// Uses /public/workers/tradeWorker.js and /public/python/*.py.
+// Runs as jobs on the shared Pyodide pool (pythonWorkerPool.js, the same
+// simWorkerV2 hosts simEnginePy sims on) and /public/python/trade_*.py, so a
+// trade request and the games in flight run on different workers.
 //
 // Public functions:
 // - evaluateTradeProposal(proposal): Trade Builder exact accept/counter/reject.
 // - findTradeOffers(search): Trade Finder offers using the same Python CPU logic.
+//
+// No page imports this module at present: Trade Finder runs the JS offer
+// engines (utils/tradeFinderOfferEngine.js, reverseTradeFinderOfferEngine.js).
+
+import { dispatchPythonPoolJob, releasePythonPoolJob } from "./pythonWorkerPool.js";
+import { PLAYER_HISTORY_KEYS } from "../utils/leagueHistorySplit.js";
 
-let worker = null;
 let counter = 0;
 const pending = new Map();
 
@@ -22,6 +29,9 @@ const pending = new Map();
  *
  * This version uses a WeakMap clone cache instead. Repeated references now point
  * to the same sanitized clone instead of becoming null.
+ *
+ * Player career history is dropped: trade_*.py never reads it, and it is most
+ * of each player's payload (see utils/leagueHistorySplit.js).
  */
 function deepSanitize(value, seen = new WeakMap()) {
   if (value === null || value === undefined) return null;
@@ -51,6 +61,7 @@ function deepSanitize(value, seen = new WeakMap()) {
 
     for (const [key, item] of Object.entries(value)) {
       if (key.startsWith("__react") || key === "_reactInternals") continue;
+      if (PLAYER_HISTORY_KEYS.includes(key)) continue;
       out[key] = deepSanitize(item, seen);
     }
 
@@ -60,59 +71,59 @@ function deepSanitize(value, seen = new WeakMap()) {
   return null;
 }
 
-function startWorker() {
-  if (worker) return;
-
-  worker = new Worker("/workers/tradeWorker.js");
-
-  worker.onmessage = (event) => {
-    const msg = event.data || {};
-
-    if (msg.type === "trade-evaluate-result" || msg.type === "trade-find-offers-result") {
-      const entry = pending.get(msg.requestId);
-      if (!entry) return;
-      pending.delete(msg.requestId);
-      clearTimeout(entry.timer);
-      entry.resolve(msg.payload || null);
-      return;
-    }
-
-    if (msg.type === "trade-evaluate-error" || msg.type === "trade-find-offers-error") {
-      const entry = pending.get(msg.requestId);
-      if (!entry) return;
-      pending.delete(msg.requestId);
-      clearTimeout(entry.timer);
-      entry.reject(new Error(msg.error || "Trade CPU worker failed"));
-    }
-  };
+const RESULT_TYPES = new Set([
+  "trade-evaluate-result",
+  "trade-find-offers-result",
+  "trade-evaluate-error",
+  "trade-find-offers-error",
+]);
+
+function handleTradeWorkerMessage(msg) {
+  const entry = pending.get(msg.requestId);
+  if (!entry) return;
+  pending.delete(msg.requestId);
+  clearTimeout(entry.timer);
+
+  if (msg.type === "trade-evaluate-result" || msg.type === "trade-find-offers-result") {
+    entry.resolve(msg.payload || null);
+    return;
+  }
 
-  worker.onerror = (error) => {
-    console.error("[tradeNegotiationPy] worker error", error);
-  };
+  entry.reject(new Error(msg.error || "Trade CPU worker failed"));
 }
 
 function requestFromWorker({ type, payloadKey, payload, timeoutMs = 30000 }) {
-  startWorker();
-
   const requestId = `TRD${counter++}`;
+  const message = {
+    type,
+    requestId,
+    [payloadKey]: deepSanitize(payload),
+  };
 
   return new Promise((resolve, reject) => {
-    const timer = setTimeout(() => {
-      if (!pending.has(requestId)) return;
-      pending.delete(requestId);
-      reject(new Error("TRADE_CPU_TIMEOUT"));
-    }, timeoutMs);
-
-    pending.set(requestId, {
-      resolve,
-      reject,
-      timer,
-    });
-
-    worker.postMessage({
-      type,
-      requestId,
-      [payloadKey]: deepSanitize(payload),
+    const entry = { resolve, reject, timer: null };
+    pending.set(requestId, entry);
+
+    dispatchPythonPoolJob({
+      id: requestId,
+      // The timeout starts once a ready pool worker takes the request, like
+      // the sim pool's per-game timers. A late reply still frees the worker.
+      post: (poolWorker) => {
+        clearTimeout(entry.timer);
+        entry.timer = setTimeout(() => {
+          if (!pending.has(requestId)) return;
+          pending.delete(requestId);
+          reject(new Error("TRADE_CPU_TIMEOUT"));
+        }, timeoutMs);
+        poolWorker.postMessage(message);
+      },
+      onMessage: (msg) => {
+        if (msg.requestId !== requestId || !RESULT_TYPES.has(msg.type)) return false;
+        releasePythonPoolJob(requestId);
+        handleTradeWorkerMessage(msg);
+        return true;
+      },
+      fail: (reason) => handleTradeWorkerMessage({ type: `${type}-error`, requestId, error: reason }),
     });
   });
 }
@@ -7,6 +7,10 @@ import { getUserTradeRuleSettings, stampFreeAgentSigningRestrictions } from "../
 import { useNavigate } from "react-router-dom";
 import {
   simulateOneGame,
+  simulateGamesBatch,
+  deriveGameSeed,
+  gameSeedSalt,
+  getSimWorkerPoolSize,
   computeSeasonAwards,
   computeAllStars,
   repairCpuTeamsToMinRoster,
@@ -434,7 +438,21 @@ function getSimulationBlockMessageThroughDate(scheduleByDate, teams, endDate = n
 /* -------------------------------------------------------------------------- */
 /*                              SIMULATION WRAPPER                             */
 /* -------------------------------------------------------------------------- */
-async function simOneSafe(game, leagueData, teams, runtime = null, currentDate = null) {
+// Game-day copy of a roster: blank secondary positions become null and the
+// minutes are the injury-safe gameplan for currentDate.
+function buildSimTeamObject(source, currentDate) {
+  const team = structuredClone(source);
+  for (const p of team.players || []) {
+    if (!p.secondaryPos || String(p.secondaryPos).trim() === "") {
+      p.secondaryPos = null;
+    }
+  }
+  ensureTeamGameplanInjurySafe(source, currentDate);
+  team.minutes = readInjurySafeGameplanMinutes(source, currentDate);
+  return team;
+}
+
+async function simOneSafe(game, leagueData, teams, runtime = null, currentDate = null, attempt = 0) {
   if (window.__debugSimLogs) {
     window.__lastGame = game;
     console.log("⏳ simOneSafe starting:", game.home, "vs", game.away);
@@ -454,27 +472,10 @@ if (simBlockMessage) {
 }
 
   const multiYearCloneStartedAt = isMultiYearSpeedDiagnosticsEnabled() ? performance.now() : 0;
-  const homeTeamObj = structuredClone(homeSource);
-  const awayTeamObj = structuredClone(awaySource);
+  const homeTeamObj = buildSimTeamObject(homeSource, currentDate);
+  const awayTeamObj = buildSimTeamObject(awaySource, currentDate);
   const multiYearTeamCloneMs = multiYearCloneStartedAt ? performance.now() - multiYearCloneStartedAt : 0;
 
-  for (const p of homeTeamObj.players || []) {
-    if (!p.secondaryPos || String(p.secondaryPos).trim() === "") {
-      p.secondaryPos = null;
-    }
-  }
-
-  for (const p of awayTeamObj.players || []) {
-    if (!p.secondaryPos || String(p.secondaryPos).trim() === "") {
-      p.secondaryPos = null;
-    }
-  }
-
-  ensureTeamGameplanInjurySafe(homeSource, currentDate);
-  ensureTeamGameplanInjurySafe(awaySource, currentDate);
-  homeTeamObj.minutes = readInjurySafeGameplanMinutes(homeSource, currentDate);
-  awayTeamObj.minutes = readInjurySafeGameplanMinutes(awaySource, currentDate);
-
   if (window.__debugSimLogs) {
     console.log("[simOneSafe] home minutes keys =", Object.keys(homeTeamObj.minutes || {}));
     console.log("[simOneSafe] away minutes keys =", Object.keys(awayTeamObj.minutes || {}));
@@ -484,6 +485,8 @@ if (simBlockMessage) {
     homeTeam: homeTeamObj,
     awayTeam: awayTeamObj,
     leagueData,
+    seed: deriveGameSeed(game.id, gameSeedSalt(leagueData), getCalendarLeagueSeasonYear(leagueData), attempt),
+    gameId: game.id,
     diagnostics: {
       seasonYear: getCalendarLeagueSeasonYear(leagueData),
       phase: "regular_season",
@@ -531,8 +534,10 @@ function captureMultiYearCpuTradeCheckpoint(leagueData, seasonYear, checkpoint)
 }
 // ---------------------------------------------------------------------------
 // Helper: run ONE game with retries, using simOneSafe + queueSim
+// firstAttempt is the seed attempt of the first try: a game whose batch run
+// (attempt 0's seed) failed starts at 1 so it does not replay the same game.
 // ---------------------------------------------------------------------------
-async function runGameWithRetries(game, leagueData, teams, maxRetries = 3, runtime = null, currentDate = null) {
+async function runGameWithRetries(game, leagueData, teams, maxRetries = 3, runtime = null, currentDate = null, firstAttempt = 0) {
   let lastFull = null;
 
   for (let attempt = 1; attempt <= maxRetries; attempt++) {
@@ -540,7 +545,9 @@ async function runGameWithRetries(game, leagueData, teams, maxRetries = 3, runti
       console.log(`[RetrySim] Game ${game.id} (${game.away} @ ${game.home}) attempt`, attempt, "of", maxRetries);
     }
 
-    lastFull = await simOneSafe(game, leagueData, teams, runtime, currentDate);
+    // A retry with the same seed would replay the same game; later attempts
+    // draw a new stream.
+    lastFull = await simOneSafe(game, leagueData, teams, runtime, currentDate, firstAttempt + attempt - 1);
 
     if (isBadFullResult(lastFull)) {
   window.__lastBad = {
@@ -587,6 +594,81 @@ async function runGameWithRetries(game, leagueData, teams, maxRetries = 3, runti
 
 
 
+// ---------------------------------------------------------------------------
+// Helper: start every pending game of one date on the sim worker pool at once.
+// A team plays at most once per date, so an earlier game's injuries never
+// touch a later game's rosters and every game can be built from the day-start
+// state. Callers still consume the results (save, stats, injuries) one by one
+// in schedule order. Returns an empty map (sequential path) for a single
+// pending game, or if a team shows up twice in the slate.
+// ---------------------------------------------------------------------------
+function prefetchDayGameResults(dayGames, leagueData, teams, runtime, currentDate, isAlreadyPlayed) {
+  const prefetched = new Map();
+
+  const teamsToday = new Set();
+  const pendingGames = [];
+  for (const g of dayGames || []) {
+    if (!g || isAlreadyPlayed(g)) continue;
+    if (teamsToday.has(g.home) || teamsToday.has(g.away)) return prefetched;
+    teamsToday.add(g.home);
+    teamsToday.add(g.away);
+    pendingGames.push(g);
+  }
+  if (pendingGames.length < 2) return prefetched;
+
+  // The slate is split into one native batch per sim worker: every roster
+  // crosses the bridge once and each worker runs its share in a single call.
+  // Games the batch cannot take (blocked or unknown teams) and games it
+  // answers badly go through runGameWithRetries, which reports them.
+  const activeRuntime = runtime || buildSimulationRuntime(leagueData, teams);
+  const seasonYear = getCalendarLeagueSeasonYear(leagueData);
+  const seedSalt = gameSeedSalt(leagueData);
+  const batchable = [];
+  for (const g of pendingGames) {
+    const homeSource = activeRuntime.teamById.get(g.homeId);
+    const awaySource = activeRuntime.teamById.get(g.awayId);
+    if (!homeSource || !awaySource || getSimulationBlockMessageForGame(g, teams)) {
+      const run = runGameWithRetries(g, leagueData, teams, 3, activeRuntime, currentDate);
+      run.catch(() => {});
+      prefetched.set(g.id, run);
+      continue;
+    }
+    batchable.push({ game: g, homeSource, awaySource });
+  }
+
+  const slateCount = Math.min(getSimWorkerPoolSize(), batchable.length);
+  for (let s = 0; s < slateCount; s++) {
+    const slate = batchable.filter((_, i) => i % slateCount === s);
+    const teamsByName = {};
+    const matchups = slate.map(({ game, homeSource, awaySource }) => {
+      teamsByName[game.home] = buildSimTeamObject(homeSource, currentDate);
+      teamsByName[game.away] = buildSimTeamObject(awaySource, currentDate);
+      return {
+        id: game.id,
+        home: game.home,
+        away: game.away,
+        seed: deriveGameSeed(game.id, seedSalt, seasonYear),
+      };
+    });
+    const batch = simulateGamesBatch(teamsByName, matchups);
+
+    for (const { game } of slate) {
+      const run = batch.then((res) => {
+        const row = (res?.results || []).find((r) => r.id === game.id);
+        if (row && !isBadFullResult(row.result)) return row.result;
+        if (window.__debugSimLogs) {
+          console.warn("[SlateSim] batch result unusable, retrying one by one", game.id, res?.error || row?.result);
+        }
+        return runGameWithRetries(game, leagueData, teams, 3, activeRuntime, currentDate, 1);
+      });
+      // Surfaced when the day loop awaits it; a stop/pause may never await it.
+      run.catch(() => {});
+      prefetched.set(game.id, run);
+    }
+  }
+  return prefetched;
+}
+
 
 /* -------------------------------------------------------------------------- */
 /*                                 DATE UTILS                                 */
@@ -6866,6 +6948,15 @@ for (const d of sorted) {
   const dayResultUpdates = {};
   let dayChanged = false;
 
+      const prefetchedDayGames = prefetchDayGameResults(
+        dayGames,
+        activeLeagueData,
+        activeTeams,
+        simRuntime,
+        d,
+        (g) => hasUsableStoredResult(loadOneResultV3(g.id)) || hasUsableStoredResult(newResults?.[g.id])
+      );
+
       for (let i = 0; i < dayGames.length; i++) {
         // ✅ allow stop between games
         if (stopRef.current) break;
@@ -6895,7 +6986,10 @@ for (const d of sorted) {
         });
 
         try {
-          const full = await runGameWithRetries(g, activeLeagueData, activeTeams, 3, simRuntime, d);
+          const full = await (
+            prefetchedDayGames.get(g.id) ||
+            runGameWithRetries(g, activeLeagueData, activeTeams, 3, simRuntime, d)
+          );
 
           // ✅ if user clicked stop while this game was running, bail after it finishes
           if (stopRef.current) {
@@ -7450,6 +7544,15 @@ for (let di = 0; di < dates.length; di++) {
         console.log("📅 Processing date", di + 1, "of", dates.length, date, "games:", dayGames.length);
       }
 
+      const prefetchedDayGames = prefetchDayGameResults(
+        dayGames,
+        activeLeagueData,
+        activeTeams,
+        simRuntime,
+        date,
+        (g) => hasUsableStoredResult(loadOneResultV3(g.id)) || hasUsableStoredResult(results?.[g.id])
+      );
+
       for (let i = 0; i < dayGames.length; i++) {
         if (stopRef.current) { stopped = true; break; }
 
@@ -7481,7 +7584,10 @@ for (let di = 0; di < dates.length; di++) {
         });
 
         try {
-          const full = await runGameWithRetries(g, activeLeagueData, activeTeams, 3, simRuntime, date);
+          const full = await (
+            prefetchedDayGames.get(g.id) ||
+            runGameWithRetries(g, activeLeagueData, activeTeams, 3, simRuntime, date)
+          );
           if (!full) {
             simulationPerf.gameErrors += 1;
             finishSimulationGameOrderEvent(gameOrderEvent, "no_result");
@@ -513,6 +513,7 @@ function normalizeOddsRows(result = null, leagueData = null) {
         pickChange: Number(row?.pickChange || 0),
         resultTag: row?.resultTag || "",
         simulationCount: Number(row?.simulationCount || result?.oddsSimulationCount || result?.meta?.oddsSimulationCount || 0),
+        oddsMode: row?.oddsMode || result?.oddsMode || result?.meta?.oddsMode || "",
       };
     });
   }
@@ -677,6 +678,7 @@ function PickRow({ pick, animationIndex = 0, oddsRow = null, showMovement = true
 function LotteryOddsTable({ rows = [], firstRoundRevealed = false }) {
   if (!rows.length) return null;
   const simulationCount = rows.find((row) => Number(row?.simulationCount || 0) > 0)?.simulationCount;
+  const exactOdds = rows.some((row) => row?.oddsMode === "exact");
 
   return (
     <div className="bmTablePanel rounded-3xl bg-neutral-900 border border-white/10 overflow-hidden shadow-2xl mb-6">
@@ -689,7 +691,11 @@ function LotteryOddsTable({ rows = [], firstRoundRevealed = false }) {
               : "Pre-reveal odds. Green in the matrix marks each team's expected pick; actual results stay hidden until reveal."}
           </p>
         </div>
-        {simulationCount ? <div className="text-xs text-white/40">Matrix from {Number(simulationCount).toLocaleString()} sims</div> : null}
+        {exactOdds ? (
+          <div className="text-xs text-white/40">Exact odds</div>
+        ) : simulationCount ? (
+          <div className="text-xs text-white/40">Matrix from {Number(simulationCount).toLocaleString()} sims</div>
+        ) : null}
       </div>
 
       <div className="bmOrangeScrollbar overflow-auto max-h-[520px]">
@@ -195,8 +195,11 @@ async function runSingles(worker, games, seed, trialIndex) {
       {
         type: "simulate-single",
         id,
+        gameId: game.id,
         home: game.home,
         away: game.away,
+        // Games keyed by id get their own stream, so single/batch runs compare game for game.
+        masterSeed: Math.trunc(finiteNumber(seed, 1)),
         multiYearDiagnostics: true,
       },
       (payload) => payload?.type === "result-single" && payload?.id === id
@@ -228,6 +231,7 @@ async function runBatch(worker, games, seed, trialIndex) {
     {
       type: "simulate-batch",
       batchId,
+      masterSeed: Math.trunc(finiteNumber(seed, 1)),
       multiYearDiagnostics: true,
       games: games.map((game) => ({ id: game.id, home: game.home, away: game.away })),
     },
@@ -0,0 +1,225 @@
+// Hot/cold split of leagueData for worker payloads.
+//
+// Per-player career history (player.history / careerHistory) is most of each
+// player's size, but game_sim, free agency, the draft, roster and trade
+// engines never read it. splitLeagueHistory() gives the worker a "hot" league
+// whose players carry no history (or only the sections the engine reads) and
+// keeps the "cold" history here, keyed by player. restoreLeagueHistory*()
+// puts it back on whatever league comes back from Python.
+//
+// Cold history is append-only from the engines' side: rows an engine writes
+// into a section it was not sent (e.g. history.transactions from roster or
+// extension moves) are appended to the cold rows, replacing a row with the
+// same id. Sections an engine was sent are read-only copies and are ignored.
+
+export const PLAYER_HISTORY_KEYS = ["history", "careerHistory"];
+const TEAM_PLAYER_LIST_KEYS = ["players", "twoWayPlayers", "stashPlayers"];
+
+// Same key as leagueSessionPlayerKey (utils/leagueSessionDelta.js), which
+// imports this module.
+function playerKey(player) {
+  const id = player.id;
+  if (id !== null && id !== undefined && id !== "") return `id:${id}`;
+  return `name:${player.name ?? ""}`;
+}
+
+// Sections each history-reading worker request needs. Anything not listed
+// gets no history at all.
+export const HISTORY_SECTIONS_BY_REQUEST = {
+  // player_mood_logic: current live season row, consecutive team seasons and
+  // title history.
+  "get-locker-room-moods": ["seasons", "awards"],
+  // contract_extension_logic asks player_mood_logic for locker-room moods.
+  "contract-extension-action": ["seasons", "awards"],
+};
+
+function pickSections(history, sections) {
+  if (!history || typeof history !== "object" || Array.isArray(history)) return history;
+  const out = {};
+  for (const section of sections) {
+    if (section in history) out[section] = history[section];
+  }
+  return out;
+}
+
+function stripPlayer(player, cold, sections) {
+  if (!player || typeof player !== "object") return player;
+  if (!PLAYER_HISTORY_KEYS.some((key) => key in player)) return player;
+
+  const next = { ...player };
+  const entry = {};
+  for (const key of PLAYER_HISTORY_KEYS) {
+    if (!(key in next)) continue;
+    entry[key] = next[key];
+    delete next[key];
+  }
+  cold.set(playerKey(player), entry);
+  if (sections.length && entry.history !== undefined) {
+    next.history = pickSections(entry.history, sections);
+  }
+  return next;
+}
+
+function stripTeam(team, cold, sections) {
+  if (!team || typeof team !== "object") return team;
+  let next = team;
+  for (const listKey of TEAM_PLAYER_LIST_KEYS) {
+    if (!Array.isArray(team[listKey])) continue;
+    if (next === team) next = { ...team };
+    next[listKey] = team[listKey].map((player) => stripPlayer(player, cold, sections));
+  }
+  return next;
+}
+
+function mapLeaguePlayers(leagueData, mapTeam, mapPlayer) {
+  const next = { ...leagueData };
+  if (leagueData.conferences && typeof leagueData.conferences === "object") {
+    next.conferences = Object.fromEntries(
+      Object.entries(leagueData.conferences).map(([name, teams]) => [
+        name,
+        Array.isArray(teams) ? teams.map(mapTeam) : teams,
+      ])
+    );
+  }
+  if (Array.isArray(leagueData.teams)) next.teams = leagueData.teams.map(mapTeam);
+  if (Array.isArray(leagueData.freeAgents)) next.freeAgents = leagueData.freeAgents.map(mapPlayer);
+  return next;
+}
+
+/**
+ * Split leagueData into { hot, cold, sections }. `hot` shares every object
+ * except the teams and players it had to copy; `sections` lists the history
+ * sections left on hot players (none by default).
+ */
+export function splitLeagueHistory(leagueData, sections = []) {
+  const cold = new Map();
+  if (!leagueData || typeof leagueData !== "object") {
+    return { hot: leagueData, cold, sections };
+  }
+  const hot = mapLeaguePlayers(
+    leagueData,
+    (team) => stripTeam(team, cold, sections),
+    (player) => stripPlayer(player, cold, sections)
+  );
+  return { hot, cold, sections };
+}
+
+/** Team payload (e.g. for game_sim) with its players' history removed. */
+export function stripTeamHistory(team) {
+  return stripTeam(team, new Map(), []);
+}
+
+function upsertRows(coldRows, writtenRows) {
+  const rows = Array.isArray(coldRows) ? [...coldRows] : [];
+  const indexById = new Map();
+  rows.forEach((row, index) => {
+    const id = row && typeof row === "object" ? row.id : null;
+    if (id !== null && id !== undefined && id !== "") indexById.set(String(id), index);
+  });
+  for (const row of writtenRows) {
+    const id = row && typeof row === "object" ? row.id : null;
+    const index = id !== null && id !== undefined && id !== "" ? indexById.get(String(id)) : undefined;
+    if (index === undefined) {
+      if (id !== null && id !== undefined && id !== "") indexById.set(String(id), rows.length);
+      rows.push(row);
+    } else {
+      rows[index] = row;
+    }
+  }
+  return rows;
+}
+
+/** Cold history plus whatever an engine wrote into the sections it was not sent. */
+export function mergePlayerHistory(coldHistory, writtenHistory, sentSections = []) {
+  if (!writtenHistory || typeof writtenHistory !== "object" || Array.isArray(writtenHistory)) {
+    return coldHistory;
+  }
+  if (!coldHistory || typeof coldHistory !== "object" || Array.isArray(coldHistory)) {
+    return writtenHistory;
+  }
+  let merged = coldHistory;
+  for (const [section, value] of Object.entries(writtenHistory)) {
+    if (sentSections.includes(section)) continue;
+    if (merged === coldHistory) merged = { ...coldHistory };
+    merged[section] = Array.isArray(value) ? upsertRows(coldHistory[section], value) : value;
+  }
+  return merged;
+}
+
+function restorePlayer(player, split) {
+  if (!player || typeof player !== "object") return player;
+  const entry = split.cold.get(playerKey(player));
+  if (!entry) return player;
+  const next = { ...player };
+  for (const key of PLAYER_HISTORY_KEYS) {
+    if (!(key in entry)) continue;
+    next[key] = mergePlayerHistory(entry[key], player[key], key === "history" ? split.sections : []);
+  }
+  return next;
+}
+
+function restoreTeam(team, split) {
+  if (!team || typeof team !== "object") return team;
+  let next = team;
+  for (const listKey of TEAM_PLAYER_LIST_KEYS) {
+    if (!Array.isArray(team[listKey])) continue;
+    if (next === team) next = { ...team };
+    next[listKey] = team[listKey].map((player) => restorePlayer(player, split));
+  }
+  return next;
+}
+
+// Retirement builds its retired-player records from the hot player, so new
+// records come back with an empty history; fill them from the cold copy.
+function isEmptyHistory(history) {
+  return !history || (typeof history === "object" && Object.keys(history).length === 0);
+}
+
+function restoreRetiredRecord(record, split) {
+  if (!record || typeof record !== "object" || !isEmptyHistory(record.history)) return record;
+  const entry = split.cold.get(playerKey(record));
+  const coldHistory = isEmptyHistory(entry?.history) ? entry?.careerHistory : entry.history;
+  return isEmptyHistory(coldHistory) ? record : { ...record, history: coldHistory };
+}
+
+/** Put the cold history back on a league that came back from the worker. */
+export function restoreLeagueHistory(leagueData, split) {
+  if (!leagueData || typeof leagueData !== "object" || !split?.cold?.size) return leagueData;
+  const next = mapLeaguePlayers(
+    leagueData,
+    (team) => restoreTeam(team, split),
+    (player) => restorePlayer(player, split)
+  );
+  if (Array.isArray(leagueData.retiredPlayersHistory)) {
+    next.retiredPlayersHistory = leagueData.retiredPlayersHistory.map((record) => restoreRetiredRecord(record, split));
+  }
+  return next;
+}
+
+/**
+ * restoreLeagueHistory() for an engine response: its leagueData / league,
+ * a targeted roster-repair leaguePatch, and retirement's retiredPlayers.
+ */
+export function restoreLeagueHistoryInResult(result, split) {
+  if (!result || typeof result !== "object" || Array.isArray(result) || !split?.cold?.size) return result;
+  const next = { ...result };
+  for (const key of ["leagueData", "league"]) {
+    if (result[key] && typeof result[key] === "object") next[key] = restoreLeagueHistory(result[key], split);
+  }
+  const patch = result.leaguePatch;
+  if (patch && typeof patch === "object") {
+    next.leaguePatch = {
+      ...patch,
+      ...(Array.isArray(patch.teamPatches)
+        ? { teamPatches: patch.teamPatches.map((row) => (row?.team ? { ...row, team: restoreTeam(row.team, split) } : row)) }
+        : {}),
+      ...(Array.isArray(patch.topLevel?.freeAgents)
+        ? { topLevel: { ...patch.topLevel, freeAgents: patch.topLevel.freeAgents.map((player) => restorePlayer(player, split)) } }
+        : {}),
+    };
+  }
+  if (Array.isArray(result.retiredPlayers)) {
+    next.retiredPlayers = result.retiredPlayers.map((record) => restoreRetiredRecord(record, split));
+  }
+  return next;
+}
@@ -0,0 +1,170 @@
+// Merge a resident-league-session delta (public/python/league_session.py)
+// into the JS copy of leagueData. Untouched teams, players and state keys
+// keep their object identity, so React memo/selectors only see what changed.
+//
+// The session league is hot-only (league_history_store.py): players in a
+// delta carry no career history, so it is carried over from the JS copy and
+// delta.historyAppends is merged in with the same rules as the one-shot
+// worker path (utils/leagueHistorySplit.js).
+
+import { PLAYER_HISTORY_KEYS, mergePlayerHistory } from "./leagueHistorySplit.js";
+
+const CONFERENCE_NAMES = ["East", "West"];
+const TEAM_PLAYER_LIST_KEYS = ["players", "twoWayPlayers", "stashPlayers"];
+
+export function leagueSessionPlayerKey(player) {
+  if (!player || typeof player !== "object") return "";
+  const id = player.id;
+  if (id !== null && id !== undefined && id !== "") return `id:${id}`;
+  return `name:${player.name ?? ""}`;
+}
+
+// Key of a player within one list delta (list_key in league_session.py): the
+// id, or the position in the list for a player without one, so two id-less
+// players never collapse into one entry.
+export function leagueSessionListKey(player, index) {
+  const id = player && typeof player === "object" ? player.id : null;
+  if (id !== null && id !== undefined && id !== "") return `id:${id}`;
+  return `idx:${index}`;
+}
+
+function applyPlayerListDelta(list, listDelta) {
+  if (!listDelta) return list;
+  const rows = Array.isArray(list) ? list : [];
+  const upserts = listDelta.upserts || {};
+
+  if (!Array.isArray(listDelta.order)) {
+    return rows.map((player, i) => upserts[leagueSessionListKey(player, i)] ?? player);
+  }
+
+  const byKey = new Map(rows.map((player, i) => [leagueSessionListKey(player, i), player]));
+  return listDelta.order.map((key) => upserts[key] ?? byKey.get(key)).filter(Boolean);
+}
+
+function applyTeamDelta(team, teamDelta) {
+  if (!teamDelta) return team;
+  if (teamDelta.replace) return teamDelta.replace;
+
+  const next = { ...team, ...(teamDelta.fields || {}) };
+  for (const key of teamDelta.removedFields || []) delete next[key];
+  for (const key of TEAM_PLAYER_LIST_KEYS) {
+    if (teamDelta[key]) next[key] = applyPlayerListDelta(team?.[key], teamDelta[key]);
+  }
+  return next;
+}
+
+function collectPlayersByKey(leagueData) {
+  const byKey = new Map();
+  const add = (player) => {
+    if (player && typeof player === "object") byKey.set(leagueSessionPlayerKey(player), player);
+  };
+  for (const teams of Object.values(leagueData?.conferences || {})) {
+    for (const team of teams || []) {
+      for (const key of TEAM_PLAYER_LIST_KEYS) (team?.[key] || []).forEach(add);
+    }
+  }
+  (leagueData?.freeAgents || []).forEach(add);
+  return byKey;
+}
+
+function carryPlayerHistory(player, previousByKey, appends) {
+  if (!player || typeof player !== "object") return player;
+  const key = leagueSessionPlayerKey(player);
+  const previous = previousByKey.get(key);
+  const appended = appends[key];
+  const missing = previous && previous !== player && PLAYER_HISTORY_KEYS.some((k) => k in previous && !(k in player));
+  if (!missing && !appended) return player;
+
+  const next = { ...player };
+  if (missing) {
+    for (const k of PLAYER_HISTORY_KEYS) {
+      if (k in previous && !(k in next)) next[k] = previous[k];
+    }
+  }
+  if (appended) next.history = mergePlayerHistory(next.history, appended);
+  return next;
+}
+
+function carryLeagueHistory(next, previousLeague, appends) {
+  const previousByKey = collectPlayersByKey(previousLeague);
+  const carryList = (list) => {
+    if (!Array.isArray(list)) return list;
+    const mapped = list.map((player) => carryPlayerHistory(player, previousByKey, appends));
+    return mapped.some((player, i) => player !== list[i]) ? mapped : list;
+  };
+
+  const conferences = next.conferences || {};
+  let nextConferences = conferences;
+  for (const [confName, teams] of Object.entries(conferences)) {
+    const mappedTeams = (teams || []).map((team) => {
+      let nextTeam = team;
+      for (const key of TEAM_PLAYER_LIST_KEYS) {
+        const list = carryList(team?.[key]);
+        if (list === team?.[key]) continue;
+        if (nextTeam === team) nextTeam = { ...team };
+        nextTeam[key] = list;
+      }
+      return nextTeam;
+    });
+    if (mappedTeams.some((team, i) => team !== teams[i])) {
+      if (nextConferences === conferences) nextConferences = { ...conferences };
+      nextConferences[confName] = mappedTeams;
+    }
+  }
+  if (next.conferences) next.conferences = nextConferences;
+  if (Array.isArray(next.freeAgents)) next.freeAgents = carryList(next.freeAgents);
+  return next;
+}
+
+export function isEmptyLeagueSessionDelta(delta) {
+  if (!delta) return true;
+  return (
+    Object.keys(delta.historyAppends || {}).length === 0 &&
+    Object.keys(delta.teams || {}).length === 0 &&
+    Object.keys(delta.state || {}).length === 0 &&
+    (delta.removedStateKeys || []).length === 0 &&
+    !delta.teamOrder &&
+    !delta.freeAgents
+  );
+}
+
+export function applyLeagueSessionDelta(leagueData, delta) {
+  if (!leagueData || isEmptyLeagueSessionDelta(delta)) return leagueData;
+
+  const next = { ...leagueData, ...(delta.state || {}) };
+  for (const key of delta.removedStateKeys || []) delete next[key];
+
+  const teamDeltas = delta.teams || {};
+  const hasTeamChanges = Object.keys(teamDeltas).length > 0 || delta.teamOrder;
+  if (hasTeamChanges) {
+    const conferences = leagueData.conferences || {};
+    const teamsByName = new Map();
+    for (const confName of CONFERENCE_NAMES) {
+      for (const team of conferences[confName] || []) {
+        if (team?.name) teamsByName.set(team.name, team);
+      }
+    }
+
+    const nextConferences = { ...conferences };
+    for (const confName of CONFERENCE_NAMES) {
+      const names = delta.teamOrder
+        ? delta.teamOrder[confName] || []
+        : (conferences[confName] || []).map((team) => team?.name);
+      nextConferences[confName] = names.map((name) => {
+        const team = teamsByName.get(name);
+        return teamDeltas[name] ? applyTeamDelta(team, teamDeltas[name]) : team;
+      }).filter(Boolean);
+    }
+    next.conferences = nextConferences;
+  }
+
+  if (delta.freeAgents) {
+    next.freeAgents = applyPlayerListDelta(leagueData.freeAgents, delta.freeAgents);
+  }
+
+  if (hasTeamChanges || delta.freeAgents || delta.historyAppends) {
+    carryLeagueHistory(next, leagueData, delta.historyAppends || {});
+  }
+
+  return next;
+}
@@ -0,0 +1,85 @@
+// Columnar season stats payload for the Python engines
+// (public/python/season_stats_store.py). One array per stat instead of one
+// object per "Player__Team" row, so awards / all-stars / progression /
+// retirement requests clone a few flat arrays across the worker bridge and
+// Python reads totals without probing alias keys on every row.
+
+export const SEASON_STATS_COLUMNS_FORMAT = "season-stats-columns-v1";
+
+export const SEASON_STAT_FIELDS = [
+  "gp", "min", "pts", "reb", "ast", "stl", "blk",
+  "fgm", "fga", "tpm", "tpa", "ftm", "fta", "to", "pf",
+  "started", "sixth",
+];
+
+// Same alias order as STAT_ALIASES in season_stats_store.py.
+const SEASON_STAT_ALIASES = {
+  gp: ["gp", "gamesPlayed", "games", "g"],
+  min: ["min", "mins", "minutes", "totMinutes", "totalMinutes"],
+  pts: ["pts", "points"],
+  reb: ["reb", "rebounds"],
+  ast: ["ast", "assists"],
+  stl: ["stl", "steals"],
+  blk: ["blk", "blocks"],
+  tpm: ["tpm", "threesMade"],
+  tpa: ["tpa", "threesAttempted"],
+  to: ["to", "tov", "turnovers"],
+  pf: ["pf", "fouls"],
+};
+
+// Rows that only carry per-game rates are scaled back to totals by gp.
+const SEASON_STAT_PER_GAME = {
+  min: ["mpg", "minutesPerGame"],
+  pts: ["ppg", "pointsPerGame"],
+};
+
+function statValue(row, field) {
+  for (const key of SEASON_STAT_ALIASES[field] || [field]) {
+    const value = row?.[key];
+    if (value === null || value === undefined || value === "") continue;
+    if (field === "min" && typeof value === "string" && value.includes(":")) {
+      const [mins, secs] = value.split(":").map(Number);
+      return (Number.isFinite(mins) ? mins : 0) + (Number.isFinite(secs) ? secs : 0) / 60;
+    }
+    const n = Number(value);
+    return Number.isFinite(n) ? n : 0;
+  }
+  for (const key of SEASON_STAT_PER_GAME[field] || []) {
+    const rate = Number(row?.[key]);
+    if (row?.[key] !== null && row?.[key] !== undefined && row?.[key] !== "" && Number.isFinite(rate)) {
+      return rate * statValue(row, "gp");
+    }
+  }
+  return 0;
+}
+
+export function isSeasonStatsColumns(value) {
+  return value?.format === SEASON_STATS_COLUMNS_FORMAT;
+}
+
+// statsByKey: { "Player__Team": totals row } or an array of totals rows.
+export function packSeasonStatsColumns(statsByKey) {
+  if (isSeasonStatsColumns(statsByKey)) return statsByKey;
+
+  const entries = Array.isArray(statsByKey)
+    ? statsByKey.map((row) => [`${row?.player ?? row?.name ?? ""}__${row?.team ?? ""}`, row])
+    : Object.entries(statsByKey || {});
+
+  const keys = [];
+  const players = [];
+  const teams = [];
+  const columns = Object.fromEntries(SEASON_STAT_FIELDS.map((field) => [field, []]));
+
+  for (const [key, row] of entries) {
+    if (!row || typeof row !== "object") continue;
+    const cut = String(key).indexOf("__");
+    const keyPlayer = cut >= 0 ? String(key).slice(0, cut) : "";
+    const keyTeam = cut >= 0 ? String(key).slice(cut + 2) : "";
+    keys.push(String(key));
+    players.push(String(row.player ?? row.name ?? row.playerName ?? keyPlayer).trim());
+    teams.push(String(row.team ?? row.teamName ?? keyTeam).trim());
+    for (const field of SEASON_STAT_FIELDS) columns[field].push(statValue(row, field));
+  }
+
+  return { format: SEASON_STATS_COLUMNS_FORMAT, keys, players, teams, columns, gamesRecorded: 0 };
+}